@@ -0,0 +1,390 @@
+# backend/core/checkpoint.py
+"""
+Strategy Checkpoints - Compact snapshots of strategy runtime state.
+
+After a restart a strategy would otherwise re-warm its indicators and
+re-derive open ExecutionGroups/Orders from minutes of history. Checkpoints
+capture that state periodically so a restart restores it in milliseconds
+and only replays the journal tail recorded after the checkpoint.
+
+Capture is copy-on-write: on the strategy thread, containers are copied
+shallowly, frozen DTOs are shared by reference and only mutable DTOs
+(ExecutionGroup, Order) are copied. Serialization, compression and the
+atomic file write happen on a background thread.
+
+File layout (little-endian):
+    header: magic (8s) + version (H) + anchor_ns (q) + journal_sequence (Q)
+            + crc32 of body (I)
+    body:   zlib-compressed JSON document
+
+@layer: Backend (Core Services)
+@dependencies: [importlib, json, os, struct, threading, zlib, concurrent.futures,
+                pydantic, pydantic_core, backend.core.interfaces, backend.dtos,
+                backend.utils.clock]
+@responsibilities:
+    - Capture StrategyCache, worker and execution state (copy-on-write)
+    - Write compact binary checkpoints asynchronously and atomically
+    - Load the latest checkpoint and restore it into cache and workers
+"""
+
+# Standard library
+import importlib
+import json
+import logging
+import os
+import re
+import struct
+import threading
+import zlib
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+# Third-party
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+# Project modules
+from backend.core.interfaces.strategy_cache import IStrategyCache, RunAnchor, StrategyCacheType
+from backend.core.interfaces.worker import ICheckpointableWorker
+from backend.dtos.execution.execution_group import ExecutionGroup
+from backend.dtos.state.fill import Fill
+from backend.dtos.state.order import Order
+from backend.utils.clock import Clock, get_clock
+
+__all__ = ["CheckpointError", "CheckpointManager", "StrategyCheckpoint"]
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"ST3CKPT1"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHqQI")
+_SUFFIX = ".st3ckpt"
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+class CheckpointError(Exception):
+    """Raised when a checkpoint cannot be written, read or restored."""
+
+
+@dataclass(frozen=True)
+class StrategyCheckpoint:
+    """
+    Restorable runtime state of one strategy.
+
+    Attributes:
+        strategy_id: Strategy instance identifier
+        anchor: RunAnchor of the last completed tick
+        journal_sequence: Last journal sequence included in the checkpoint;
+            only entries after it need replaying
+        cache: StrategyCache contents (DTO type → DTO)
+        worker_state: Declared worker state by worker name
+        execution_groups: Open ExecutionGroups
+        orders: Orders
+        fills: Fills
+    """
+
+    strategy_id: str
+    anchor: RunAnchor
+    journal_sequence: int = 0
+    cache: StrategyCacheType = field(default_factory=dict)
+    worker_state: dict[str, dict[str, Any]] = field(default_factory=dict)
+    execution_groups: tuple[ExecutionGroup, ...] = ()
+    orders: tuple[Order, ...] = ()
+    fills: tuple[Fill, ...] = ()
+
+    def restore_into(
+        self,
+        strategy_cache: IStrategyCache,
+        workers: Iterable[ICheckpointableWorker] = (),
+    ) -> None:
+        """
+        Restore cache and worker state.
+
+        Starts a strategy run at the checkpoint anchor with a copy of the
+        checkpointed cache, then hands each worker its declared state.
+        ExecutionGroups, Orders and Fills are returned to the caller via
+        the attributes (they are owned by the ledger, not by the cache).
+
+        Args:
+            strategy_cache: Cache to configure
+            workers: Workers whose state should be restored
+
+        Raises:
+            CheckpointError: If a worker in the checkpoint is not provided
+        """
+        by_name = {worker.name: worker for worker in workers}
+        missing = sorted(set(self.worker_state) - set(by_name))
+        if missing:
+            raise CheckpointError(f"Checkpoint contains state for unknown workers: {missing}")
+        strategy_cache.start_new_strategy_run(dict(self.cache), self.anchor.timestamp)
+        for name, state in self.worker_state.items():
+            by_name[name].restore_state(state)
+
+
+class CheckpointManager:
+    """
+    Periodic, asynchronous checkpoint writer and loader.
+
+    **Usage:**
+        >>> manager = CheckpointManager(Path(".st3/checkpoints"), interval_s=30)
+        >>> # after each tick, on the strategy thread:
+        >>> manager.maybe_checkpoint("STR_A", cache, workers, groups, orders, fills, seq)
+        >>> # after a restart:
+        >>> checkpoint = manager.load_latest("STR_A")
+        >>> checkpoint.restore_into(cache, workers)
+        >>> journal.replay(after=checkpoint.journal_sequence)
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        interval_s: float = 60.0,
+        keep: int = 3,
+        clock: Clock | None = None,
+    ) -> None:
+        """
+        Configure manager.
+
+        Args:
+            directory: Root directory (one subdirectory per strategy)
+            interval_s: Minimum seconds between periodic checkpoints
+            keep: Checkpoints retained per strategy (older ones are pruned)
+            clock: Time source for the interval (None = process-wide clock)
+
+        Raises:
+            ValueError: If interval_s or keep is not positive
+        """
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be positive, got: {interval_s}")
+        if keep < 1:
+            raise ValueError(f"keep must be >= 1, got: {keep}")
+        self._directory = Path(directory)
+        self._interval_s = interval_s
+        self._keep = keep
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="st3-checkpoint")
+        self._lock = threading.Lock()
+        self._last_capture: dict[str, float] = {}
+        self._clock = clock
+
+    def maybe_checkpoint(
+        self,
+        strategy_id: str,
+        strategy_cache: IStrategyCache,
+        workers: Iterable[object] = (),
+        execution_groups: Iterable[ExecutionGroup] = (),
+        orders: Iterable[Order] = (),
+        fills: Iterable[Fill] = (),
+        journal_sequence: int = 0,
+    ) -> Future[Path] | None:
+        """
+        Checkpoint if interval_s has elapsed since the last checkpoint.
+
+        Returns:
+            Future of the written path, or None if not due yet
+        """
+        now = self._monotonic()
+        with self._lock:
+            last = self._last_capture.get(strategy_id)
+            if last is not None and now - last < self._interval_s:
+                return None
+        return self.checkpoint(
+            strategy_id, strategy_cache, workers, execution_groups, orders, fills, journal_sequence
+        )
+
+    def checkpoint(
+        self,
+        strategy_id: str,
+        strategy_cache: IStrategyCache,
+        workers: Iterable[object] = (),
+        execution_groups: Iterable[ExecutionGroup] = (),
+        orders: Iterable[Order] = (),
+        fills: Iterable[Fill] = (),
+        journal_sequence: int = 0,
+    ) -> Future[Path]:
+        """
+        Capture state now and write it asynchronously.
+
+        Must be called on the strategy thread between ticks. Only the
+        capture runs synchronously; workers not implementing
+        ICheckpointableWorker are skipped.
+
+        Args:
+            strategy_id: Strategy instance identifier
+            strategy_cache: Cache with an active run
+            workers: Strategy workers
+            execution_groups: ExecutionGroups to persist
+            orders: Orders to persist
+            fills: Fills to persist
+            journal_sequence: Last journal sequence reflected in this state
+
+        Returns:
+            Future resolving to the checkpoint path
+
+        Raises:
+            ValueError: If strategy_id is not a safe file name
+            NoActiveRunError: If the cache has no active run
+        """
+        directory = self._strategy_dir(strategy_id)
+        checkpoint = StrategyCheckpoint(
+            strategy_id=strategy_id,
+            anchor=strategy_cache.get_run_anchor(),
+            journal_sequence=journal_sequence,
+            cache=strategy_cache.snapshot(),
+            worker_state={
+                worker.name: dict(worker.checkpoint_state())
+                for worker in workers
+                if isinstance(worker, ICheckpointableWorker)
+            },
+            execution_groups=tuple(_cow(group) for group in execution_groups),
+            orders=tuple(_cow(order) for order in orders),
+            fills=tuple(fills),
+        )
+        with self._lock:
+            self._last_capture[strategy_id] = self._monotonic()
+        return self._executor.submit(self._write, directory, checkpoint)
+
+    def load_latest(self, strategy_id: str) -> StrategyCheckpoint | None:
+        """
+        Load the newest checkpoint for a strategy.
+
+        Returns:
+            Decoded checkpoint, or None if none exists
+
+        Raises:
+            CheckpointError: If the newest checkpoint is corrupt
+        """
+        paths = self._list(self._strategy_dir(strategy_id))
+        return self.load(paths[-1]) if paths else None
+
+    @staticmethod
+    def load(path: Path | str) -> StrategyCheckpoint:
+        """
+        Decode a checkpoint file.
+
+        Raises:
+            CheckpointError: If the file is truncated, corrupt or of an
+                unknown version, or references unknown DTO types
+        """
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise CheckpointError(f"Checkpoint {path} is truncated")
+        magic, version, anchor_ns, journal_sequence, crc = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise CheckpointError(f"Checkpoint {path} has unknown format/version")
+        body = data[_HEADER.size :]
+        if zlib.crc32(body) != crc:
+            raise CheckpointError(f"Checkpoint {path} failed CRC check")
+        document = json.loads(zlib.decompress(body))
+
+        seconds, nanos = divmod(anchor_ns, 1_000_000_000)
+        anchor = datetime.fromtimestamp(seconds, UTC).replace(microsecond=nanos // 1000)
+        cache: StrategyCacheType = {}
+        for type_path, payload in document["cache"]:
+            dto_type = _resolve_dto_type(type_path)
+            cache[dto_type] = dto_type.model_validate(payload)
+        return StrategyCheckpoint(
+            strategy_id=document["strategy_id"],
+            anchor=RunAnchor(timestamp=anchor),
+            journal_sequence=journal_sequence,
+            cache=cache,
+            worker_state=document["workers"],
+            execution_groups=tuple(
+                ExecutionGroup.model_validate(item) for item in document["execution_groups"]
+            ),
+            orders=tuple(Order.model_validate(item) for item in document["orders"]),
+            fills=tuple(Fill.model_validate(item) for item in document["fills"]),
+        )
+
+    def flush(self) -> None:
+        """Block until all pending checkpoint writes have finished."""
+        self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Finish pending writes and stop the writer thread."""
+        self._executor.shutdown(wait=True)
+
+    def _monotonic(self) -> float:
+        """Monotonic seconds from the configured (or process-wide) clock."""
+        return (self._clock or get_clock()).monotonic_ns() / 1e9
+
+    def _strategy_dir(self, strategy_id: str) -> Path:
+        """Per-strategy directory (strategy_id is used as a path component)."""
+        if not _SAFE_ID.match(strategy_id):
+            raise ValueError(f"strategy_id is not a safe file name: {strategy_id!r}")
+        return self._directory / strategy_id
+
+    @staticmethod
+    def _list(directory: Path) -> list[Path]:
+        """Checkpoint files in a directory, oldest first."""
+        if not directory.is_dir():
+            return []
+        return sorted(directory.glob(f"*{_SUFFIX}"))
+
+    def _write(self, directory: Path, checkpoint: StrategyCheckpoint) -> Path:
+        """Serialize, compress and atomically write one checkpoint (writer thread)."""
+        document = {
+            "strategy_id": checkpoint.strategy_id,
+            "cache": [[_type_path(dto_type), dto] for dto_type, dto in checkpoint.cache.items()],
+            "workers": checkpoint.worker_state,
+            "execution_groups": checkpoint.execution_groups,
+            "orders": checkpoint.orders,
+            "fills": checkpoint.fills,
+        }
+        body = zlib.compress(to_json(document), level=6)
+        anchor_ns = _to_ns(checkpoint.anchor.timestamp)
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, anchor_ns, checkpoint.journal_sequence, zlib.crc32(body)
+        )
+
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{anchor_ns:020d}-{checkpoint.journal_sequence:012d}{_SUFFIX}"
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_bytes(header + body)
+        os.replace(tmp_path, path)
+
+        for stale in self._list(directory)[: -self._keep]:
+            try:
+                stale.unlink()
+            except OSError:
+                logger.warning("Could not prune checkpoint %s", stale)
+        return path
+
+
+def _cow(model: _ModelT) -> _ModelT:
+    """Copy mutable DTOs at capture time; share frozen ones."""
+    if model.model_config.get("frozen"):
+        return model
+    return model.model_copy(deep=True)
+
+
+def _type_path(dto_type: type[BaseModel]) -> str:
+    """Importable path of a DTO type."""
+    return f"{dto_type.__module__}:{dto_type.__qualname__}"
+
+
+def _resolve_dto_type(type_path: str) -> type[BaseModel]:
+    """Resolve a path produced by _type_path back to the DTO type."""
+    module_name, _, qualname = type_path.partition(":")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+    except (ImportError, AttributeError) as e:
+        raise CheckpointError(f"Unknown DTO type in checkpoint: {type_path}") from e
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        raise CheckpointError(f"Checkpoint type is not a DTO: {type_path}")
+    return target
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """Datetime (naive = UTC) → UTC epoch nanoseconds (microsecond precision)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    delta = timestamp - datetime(1970, 1, 1, tzinfo=UTC)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
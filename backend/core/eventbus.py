@@ -6,21 +6,35 @@ Implements the IEventBus protocol with thread-safe N-to-N event communication,
 flexible scoping, and critical error handling.
 
 @layer: Core (Singletons)
-@dependencies: [threading, logging, uuid, pydantic, backend.core.interfaces.eventbus]
+@dependencies: [threading, logging, time, uuid, datetime, pydantic,
+                backend.core.interfaces.eventbus, backend.core.eventbus_metrics,
+                backend.core.handler_watchdog, backend.core.pipeline_tracer,
+                backend.core.strategy_interner, backend.dtos.shared, backend.utils.clock]
 """
 
 # Standard Library Imports
 import logging
 import threading
+import time
 import uuid
 from collections.abc import Callable
+from contextlib import nullcontext
 from dataclasses import dataclass
 
 # Third-Party Imports
 from pydantic import BaseModel
 
 # Our Application Imports
+from backend.core.eventbus_metrics import EventBusMetrics, handler_name
+from backend.core.handler_watchdog import HandlerWatchdog, WatchdogVerdict
 from backend.core.interfaces.eventbus import IEventBus, ScopeLevel, SubscriptionScope
+from backend.core.pipeline_tracer import PipelineTracer
+from backend.core.strategy_interner import ALL_STRATEGIES, StrategyIdInterner
+from backend.dtos.shared.strategy_quarantined import (
+    STRATEGY_QUARANTINED_EVENT,
+    StrategyQuarantined,
+)
+from backend.utils.clock import Clock, get_clock
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -56,6 +70,9 @@ class Subscription:
         handler: Callback function
         scope: Filtering rules
         is_critical: Error handling mode
+        deadline_ns: Watchdog deadline per invocation (None = unwatched)
+        strategy_mask: scope encoded as a strategy bitmask (see
+            SubscriptionScope.strategy_mask)
     """
 
     subscription_id: str
@@ -63,6 +80,8 @@ class Subscription:
     handler: Callable[[BaseModel], None]
     scope: SubscriptionScope
     is_critical: bool
+    deadline_ns: int | None = None
+    strategy_mask: int = 0
 
 
 class EventBus(IEventBus):
@@ -98,13 +117,63 @@ class EventBus(IEventBus):
     **Error Handling:**
         - Non-critical handlers (is_critical=False): Log + continue
         - Critical handlers (is_critical=True): Raise CriticalEventHandlerError
+
+    **Instrumentation (opt-in):**
+        Pass an EventBusMetrics to record queue wait / handler duration
+        histograms and failure counts per (event, subscription, handler).
+        Without metrics, the clock is never read.
+
+    **Deadlines (opt-in):**
+        With a HandlerWatchdog, non-critical subscriptions may declare
+        deadline_ms at subscribe() time. Overrunning handlers are abandoned
+        so later subscribers still run; repeated overruns quarantine the
+        strategy (all its non-critical subscriptions are removed and
+        STRATEGY_QUARANTINED is published at PLATFORM scope).
+
+    **Tracing (opt-in):**
+        With a PipelineTracer, each publish and handler invocation becomes
+        a span. Publishing a payload that carries an ``origin`` (e.g.
+        PlatformDataDTO) opens the trace for that origin when none is
+        active, so nested publishes are attributed to the same origin.
+
+    **Scope matching:**
+        Strategy instance IDs are interned to dense bits (pass the
+        bootstrap StrategyIdInterner to share it). Each subscription stores
+        its scope as a bitmask at subscribe() time, so matching a
+        strategy-scoped publish is one ``mask & bit`` per subscription.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty event bus with thread lock."""
+    def __init__(
+        self,
+        metrics: EventBusMetrics | None = None,
+        watchdog: HandlerWatchdog | None = None,
+        tracer: PipelineTracer | None = None,
+        interner: StrategyIdInterner | None = None,
+        clock: Clock | None = None,
+    ) -> None:
+        """
+        Initialize empty event bus with thread lock.
+
+        Args:
+            metrics: Optional metrics registry (None = instrumentation disabled)
+            watchdog: Optional deadline watchdog (None = deadlines unsupported)
+            tracer: Optional pipeline tracer (None = tracing disabled)
+            interner: Strategy ID interner (None = private, interns lazily)
+            clock: Time source for event timestamps (None = process-wide clock)
+        """
         self._subscriptions: dict[str, list[Subscription]] = {}
         self._subscription_index: dict[str, Subscription] = {}
         self._lock = threading.RLock()  # Reentrant lock for nested calls
+        self._metrics = metrics
+        self._watchdog = watchdog
+        self._tracer = tracer
+        self._clock = clock
+        self._interner = interner if interner is not None else StrategyIdInterner()
+
+    @property
+    def metrics(self) -> EventBusMetrics | None:
+        """Metrics registry (None when instrumentation is disabled)."""
+        return self._metrics
 
     def publish(
         self,
@@ -136,18 +205,74 @@ class EventBus(IEventBus):
         if scope == ScopeLevel.STRATEGY and strategy_instance_id is None:
             raise ValueError("strategy_instance_id is required when scope=STRATEGY")
 
+        # Queue wait is measured from here (only when instrumented)
+        published_ns = time.monotonic_ns() if self._metrics is not None else None
+
         # Lock ONLY for reading subscription list
         with self._lock:
             all_subscriptions = self._subscriptions.get(event_name, [])
-            matching_subscriptions = [
-                sub
-                for sub in all_subscriptions
-                if sub.scope.should_receive_event(scope, strategy_instance_id)
-            ]
+            if scope == ScopeLevel.PLATFORM:
+                # Platform-scoped events → everyone receives
+                matching_subscriptions = list(all_subscriptions)
+            else:
+                assert strategy_instance_id is not None
+                # Lookup only: interning every published ID would grow the
+                # interner (and every mask) for unknown / short-lived strategies
+                bit = self._interner.lookup_bit(strategy_instance_id)
+                if bit is None:
+                    # Never subscribed to, so only unrestricted scopes match
+                    matching_subscriptions = [
+                        sub for sub in all_subscriptions if sub.strategy_mask == ALL_STRATEGIES
+                    ]
+                else:
+                    matching_subscriptions = [
+                        sub for sub in all_subscriptions if sub.strategy_mask & bit
+                    ]
 
         # Release lock BEFORE invoking handlers (avoid deadlocks)
-        for subscription in matching_subscriptions:
-            self._invoke_handler(subscription, payload)
+        if self._tracer is None:
+            self._dispatch(matching_subscriptions, payload, published_ns)
+            return
+
+        origin = getattr(payload, "origin", None)
+        origin_id = getattr(origin, "id", None)
+        tracer = self._tracer
+        with (
+            tracer.origin(origin_id, strategy_instance_id)
+            if isinstance(origin_id, str)
+            else nullcontext(),
+            tracer.span(
+                event_name,
+                "eventbus",
+                strategy_instance_id,
+                subscribers=str(len(matching_subscriptions)),
+            ),
+        ):
+            self._dispatch(matching_subscriptions, payload, published_ns)
+
+    def _dispatch(
+        self,
+        subscriptions: list[Subscription],
+        payload: BaseModel,
+        published_ns: int | None,
+    ) -> None:
+        """Invoke matching subscriptions in order (outside the lock)."""
+        for subscription in subscriptions:
+            if (
+                self._watchdog is not None
+                and subscription.subscription_id not in self._subscription_index
+            ):
+                continue  # Quarantined earlier in this publish
+            if self._tracer is None:
+                self._invoke_handler(subscription, payload, published_ns)
+                continue
+            with self._tracer.span(
+                handler_name(subscription.handler),
+                "handler",
+                subscription.scope.strategy_instance_id,
+                subscription_id=subscription.subscription_id,
+            ):
+                self._invoke_handler(subscription, payload, published_ns)
 
     def subscribe(
         self,
@@ -155,6 +280,7 @@ class EventBus(IEventBus):
         handler: Callable[[BaseModel], None],
         scope: SubscriptionScope,
         is_critical: bool = False,
+        deadline_ms: float | None = None,
     ) -> str:
         """
         Register event handler with flexible scoping.
@@ -164,13 +290,29 @@ class EventBus(IEventBus):
             handler: Callback function
             scope: Filtering rules
             is_critical: Error handling mode
+            deadline_ms: Per-invocation deadline enforced by the watchdog
+                (non-critical subscriptions only; None = unwatched)
 
         Returns:
             subscription_id: Unique ID for unsubscribe
 
+        Raises:
+            ValueError: If deadline_ms is not positive, is set on a critical
+                subscription, or no HandlerWatchdog is configured
+
         Thread-Safety:
             Can subscribe while events are being published
         """
+        deadline_ns: int | None = None
+        if deadline_ms is not None:
+            if deadline_ms <= 0:
+                raise ValueError(f"deadline_ms must be positive, got: {deadline_ms}")
+            if is_critical:
+                raise ValueError("deadline_ms is only supported for non-critical subscriptions")
+            if self._watchdog is None:
+                raise ValueError("deadline_ms requires an EventBus with a HandlerWatchdog")
+            deadline_ns = int(deadline_ms * 1_000_000)
+
         with self._lock:
             # Generate unique subscription ID
             subscription_id = f"SUB_{uuid.uuid4().hex[:12].upper()}"
@@ -182,6 +324,8 @@ class EventBus(IEventBus):
                 handler=handler,
                 scope=scope,
                 is_critical=is_critical,
+                deadline_ns=deadline_ns,
+                strategy_mask=scope.strategy_mask(self._interner),
             )
 
             # Add to event index
@@ -225,7 +369,15 @@ class EventBus(IEventBus):
             # Remove from ID index
             del self._subscription_index[subscription_id]
 
-    def _invoke_handler(self, subscription: Subscription, payload: BaseModel) -> None:
+        if self._watchdog is not None and subscription.deadline_ns is not None:
+            self._watchdog.forget(subscription_id)
+
+    def _invoke_handler(
+        self,
+        subscription: Subscription,
+        payload: BaseModel,
+        published_ns: int | None = None,
+    ) -> None:
         """
         Invoke subscription handler with error handling.
 
@@ -236,14 +388,22 @@ class EventBus(IEventBus):
         Args:
             subscription: Subscription to invoke
             payload: Event payload
+            published_ns: monotonic_ns() at publish entry (None = not instrumented)
 
         Raises:
             CriticalEventHandlerError: If critical handler fails
         """
+        started_ns = time.monotonic_ns() if self._metrics is not None else 0
+        verdict: WatchdogVerdict | None = None
         try:
-            subscription.handler(payload)
+            if subscription.deadline_ns is None:
+                subscription.handler(payload)
+            else:
+                verdict = self._invoke_watched(subscription, payload)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # We catch all exceptions for handler isolation - we don't know what handlers throw
+            if self._metrics is not None:
+                self._record_metrics(subscription, published_ns, started_ns, failed=True)
             if subscription.is_critical:
                 # Platform singleton failure = STOP EVERYTHING
                 logger.critical(  # pylint: disable=logging-fstring-interpolation
@@ -273,3 +433,114 @@ class EventBus(IEventBus):
                 },
             )
             # Continue to next handler (no raise)
+        else:
+            if self._metrics is not None:
+                self._record_metrics(subscription, published_ns, started_ns, failed=False)
+            # Outside the try: quarantine event handlers must not be swallowed
+            if verdict is not None and verdict.quarantine:
+                self._quarantine(subscription, verdict)
+
+    def _invoke_watched(self, subscription: Subscription, payload: BaseModel) -> WatchdogVerdict:
+        """
+        Invoke handler under its watchdog deadline.
+
+        Args:
+            subscription: Subscription with deadline_ns set
+            payload: Event payload
+
+        Returns:
+            Watchdog verdict (overran / quarantine)
+        """
+        assert self._watchdog is not None and subscription.deadline_ns is not None
+        return self._watchdog.run(
+            subscription.subscription_id,
+            subscription.handler,
+            payload,
+            subscription.deadline_ns,
+        )
+
+    def _quarantine(self, subscription: Subscription, verdict: WatchdogVerdict) -> None:
+        """
+        Remove an overrunning strategy and announce it.
+
+        All non-critical subscriptions of the subscription's strategy are
+        removed (only the subscription itself when it has no strategy).
+
+        Args:
+            subscription: Subscription whose overruns hit the limit
+            verdict: Watchdog verdict that requested the quarantine
+        """
+        assert self._watchdog is not None and subscription.deadline_ns is not None
+        strategy_id = subscription.scope.strategy_instance_id
+        # Read before unsubscribing drops the subscription's watchdog state
+        p99_handler_ms = self._watchdog.p99_ms(subscription.subscription_id)
+
+        with self._lock:
+            if strategy_id is None:
+                victims = [subscription.subscription_id]
+            else:
+                victims = [
+                    sub.subscription_id
+                    for sub in self._subscription_index.values()
+                    if sub.scope.strategy_instance_id == strategy_id and not sub.is_critical
+                ]
+            removed = [sub_id for sub_id in victims if sub_id in self._subscription_index]
+            for sub_id in removed:
+                self.unsubscribe(sub_id)
+
+        logger.error(  # pylint: disable=logging-fstring-interpolation
+            f"Strategy {strategy_id} quarantined after repeated handler overruns",
+            extra={
+                "subscription_id": subscription.subscription_id,
+                "event_name": subscription.event_name,
+                "strategy_instance_id": strategy_id,
+                "removed_subscription_ids": removed,
+            },
+        )
+        self.publish(
+            STRATEGY_QUARANTINED_EVENT,
+            StrategyQuarantined(
+                strategy_instance_id=strategy_id,
+                trigger_subscription_id=subscription.subscription_id,
+                event_name=subscription.event_name,
+                handler=handler_name(subscription.handler),
+                removed_subscription_ids=removed,
+                consecutive_overruns=verdict.consecutive_overruns,
+                deadline_ms=subscription.deadline_ns / 1e6,
+                p99_handler_ms=p99_handler_ms,
+                quarantined_at=(self._clock or get_clock()).now(),
+            ),
+            ScopeLevel.PLATFORM,
+        )
+
+    def _record_metrics(
+        self,
+        subscription: Subscription,
+        published_ns: int | None,
+        started_ns: int,
+        *,
+        failed: bool,
+    ) -> None:
+        """
+        Record one handler invocation in the metrics registry.
+
+        Args:
+            subscription: Invoked subscription
+            published_ns: monotonic_ns() at publish entry (None = direct invoke)
+            started_ns: monotonic_ns() at handler start
+            failed: Handler raised an exception
+        """
+        assert self._metrics is not None
+        finished_ns = time.monotonic_ns()
+        queue_wait_ns = started_ns - published_ns if published_ns is not None else 0
+        self._metrics.record(
+            (
+                subscription.event_name,
+                subscription.subscription_id,
+                handler_name(subscription.handler),
+            ),
+            queue_wait_ns,
+            finished_ns - started_ns,
+            failed=failed,
+            critical=subscription.is_critical,
+        )
@@ -0,0 +1,465 @@
+# backend/core/eventbus_metrics.py
+"""
+EventBus Metrics - Opt-in latency instrumentation for event dispatch.
+
+Records per-handler queue wait and handler duration in HDR-style
+log-linear histograms, plus failure counters, keyed by
+(event_name, subscription_id, handler).
+
+Instrumentation is opt-in: an EventBus constructed without an
+EventBusMetrics instance never reads the clock, so the disabled path
+costs a single ``is None`` check per handler.
+
+@layer: Core (Singletons)
+@dependencies: [threading, time, json, os, pathlib]
+@responsibilities:
+    - Record queue wait and handler duration samples (monotonic_ns)
+    - Count failed and critical handler invocations
+    - Provide point-in-time snapshots (dict / JSON / Prometheus text)
+    - Periodically export snapshots to a local file
+"""
+
+# Standard Library Imports
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EventBusMetrics",
+    "EventBusMetricsExporter",
+    "HandlerKey",
+    "HandlerStats",
+    "LatencyHistogram",
+    "handler_name",
+]
+
+# Type alias for the per-handler metrics key
+HandlerKey = tuple[str, str, str]
+
+ExportFormat = Literal["json", "prometheus"]
+
+_SNAPSHOT_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99, 0.999)
+
+
+def handler_name(handler: Callable[..., object]) -> str:
+    """
+    Resolve a stable, human-readable name for a handler callable.
+
+    Bound methods resolve to ``Class.method``; callables without a
+    ``__qualname__`` (e.g. functools.partial) fall back to their type name.
+    """
+    return getattr(handler, "__qualname__", None) or type(handler).__name__
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear latency histogram (nanosecond samples).
+
+    Values below ``2**precision_bits`` are stored exactly; larger values are
+    bucketed per power of two into ``2**(precision_bits - 1)`` linear
+    sub-buckets, which bounds the relative error to
+    ``1 / 2**(precision_bits - 1)`` (~1.6% at the default of 7 bits)
+    across the full dynamic range. Buckets are stored sparsely.
+
+    Not thread-safe on its own - EventBusMetrics serializes access.
+
+    Example:
+        >>> hist = LatencyHistogram()
+        >>> hist.record(1_500_000)
+        >>> hist.percentile(0.99) >= 1_500_000
+        True
+    """
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        """
+        Initialize empty histogram.
+
+        Args:
+            precision_bits: Sub-bucket resolution (2..16); higher is more precise
+
+        Raises:
+            ValueError: If precision_bits is out of range
+        """
+        if not 2 <= precision_bits <= 16:
+            raise ValueError(f"precision_bits must be in [2, 16], got: {precision_bits}")
+        self._precision_bits = precision_bits
+        self._sub_bucket_count = 1 << precision_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _bucket_index(self, value: int) -> int:
+        """Map a value to its bucket index."""
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self._precision_bits
+        return (
+            self._sub_bucket_count
+            + (shift - 1) * self._half_count
+            + ((value >> shift) - self._half_count)
+        )
+
+    def _bucket_upper_bound(self, index: int) -> int:
+        """Map a bucket index to the highest value it can contain."""
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._half_count + 1
+        sub_bucket = offset % self._half_count + self._half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Record a single sample.
+
+        Args:
+            value: Sample in nanoseconds (negative values are clamped to 0)
+        """
+        value = max(value, 0)
+        index = self._bucket_index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, quantile: float) -> int:
+        """
+        Get value at quantile (upper bucket bound, clamped to observed max).
+
+        Args:
+            quantile: Quantile in [0.0, 1.0] (e.g., 0.99 for p99)
+
+        Returns:
+            Value in nanoseconds (0 if histogram is empty)
+
+        Raises:
+            ValueError: If quantile is outside [0.0, 1.0]
+        """
+        if not 0.0 <= quantile <= 1.0:
+            raise ValueError(f"quantile must be in [0.0, 1.0], got: {quantile}")
+        if self.count == 0:
+            return 0
+
+        target = max(1, int(quantile * self.count + 0.5))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of recorded samples (0.0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Summarize histogram state.
+
+        Returns:
+            Dict with count, sum, min, max, mean and p50/p90/p99/p999 (ns)
+        """
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "sum_ns": self.total,
+            "min_ns": self.min,
+            "max_ns": self.max,
+            "mean_ns": self.mean,
+        }
+        for quantile in _SNAPSHOT_QUANTILES:
+            summary[f"p{_quantile_label(quantile)}_ns"] = self.percentile(quantile)
+        return summary
+
+
+@dataclass
+class HandlerStats:
+    """
+    Accumulated dispatch statistics for one (event, subscription, handler).
+
+    Attributes:
+        queue_wait: Time from publish() entry until the handler started
+        duration: Handler execution time
+        invocations: Total handler calls
+        failures: Calls that raised (critical and non-critical)
+        critical_failures: Calls of critical handlers that raised
+    """
+
+    queue_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    invocations: int = 0
+    failures: int = 0
+    critical_failures: int = 0
+
+
+class EventBusMetrics:
+    """
+    Thread-safe registry of per-handler dispatch metrics.
+
+    Injected into EventBus to enable instrumentation:
+
+    **Usage:**
+        >>> metrics = EventBusMetrics()
+        >>> bus = EventBus(metrics=metrics)
+        >>> ...  # publish events
+        >>> metrics.snapshot()["handlers"][0]["duration"]["p99_ns"]
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty registry."""
+        self._stats: dict[HandlerKey, HandlerStats] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    def record(
+        self,
+        key: HandlerKey,
+        queue_wait_ns: int,
+        duration_ns: int,
+        *,
+        failed: bool = False,
+        critical: bool = False,
+    ) -> None:
+        """
+        Record one handler invocation.
+
+        Args:
+            key: (event_name, subscription_id, handler) tuple
+            queue_wait_ns: Publish-to-start latency
+            duration_ns: Handler execution time
+            failed: Handler raised an exception
+            critical: Handler is critical (only counted when failed)
+        """
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = HandlerStats()
+            stats.queue_wait.record(queue_wait_ns)
+            stats.duration.record(duration_ns)
+            stats.invocations += 1
+            if failed:
+                stats.failures += 1
+                if critical:
+                    stats.critical_failures += 1
+
+    def get_stats(self, key: HandlerKey) -> HandlerStats | None:
+        """Get live stats for a key (None if never recorded)."""
+        with self._lock:
+            return self._stats.get(key)
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._stats.clear()
+            self._started_at = time.time()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Take a consistent point-in-time snapshot.
+
+        Returns:
+            Dict with ``started_at``/``taken_at`` (epoch seconds) and a
+            ``handlers`` list sorted by (event_name, subscription_id, handler)
+        """
+        with self._lock:
+            handlers = [
+                {
+                    "event_name": event_name,
+                    "subscription_id": subscription_id,
+                    "handler": name,
+                    "invocations": stats.invocations,
+                    "failures": stats.failures,
+                    "critical_failures": stats.critical_failures,
+                    "queue_wait": stats.queue_wait.snapshot(),
+                    "duration": stats.duration.snapshot(),
+                }
+                for (event_name, subscription_id, name), stats in sorted(self._stats.items())
+            ]
+            return {
+                "started_at": self._started_at,
+                "taken_at": time.time(),
+                "handlers": handlers,
+            }
+
+    def to_json(self) -> str:
+        """Render snapshot as JSON text."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Render snapshot in Prometheus text exposition format (v0.0.4).
+
+        Latencies are exported as summaries in seconds; failures as counters.
+        """
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        for metric, attr, help_text in (
+            (
+                "eventbus_handler_queue_wait_seconds",
+                "queue_wait",
+                "Time from publish until handler start",
+            ),
+            (
+                "eventbus_handler_duration_seconds",
+                "duration",
+                "Handler execution time",
+            ),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} summary")
+            for entry in snapshot["handlers"]:
+                labels = _prometheus_labels(entry)
+                summary = entry[attr]
+                for quantile in _SNAPSHOT_QUANTILES:
+                    value = summary[f"p{_quantile_label(quantile)}_ns"] / 1e9
+                    lines.append(f'{metric}{{{labels},quantile="{quantile}"}} {value:.9f}')
+                lines.append(f"{metric}_sum{{{labels}}} {summary['sum_ns'] / 1e9:.9f}")
+                lines.append(f"{metric}_count{{{labels}}} {summary['count']}")
+
+        for metric, attr, help_text in (
+            ("eventbus_handler_invocations_total", "invocations", "Handler invocations"),
+            ("eventbus_handler_failures_total", "failures", "Handler invocations that raised"),
+            (
+                "eventbus_handler_critical_failures_total",
+                "critical_failures",
+                "Critical handler invocations that raised",
+            ),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for entry in snapshot["handlers"]:
+                lines.append(f"{metric}{{{_prometheus_labels(entry)}}} {entry[attr]}")
+
+        return "\n".join(lines) + "\n"
+
+
+class EventBusMetricsExporter:
+    """
+    Periodic exporter writing EventBusMetrics snapshots to a local file.
+
+    Runs a daemon thread that rewrites ``path`` every ``interval_s`` seconds.
+    Writes are atomic (temp file + os.replace) so scrapers never observe a
+    partially written file.
+
+    **Usage:**
+        >>> exporter = EventBusMetricsExporter(
+        ...     metrics, Path(".logs/eventbus.prom"), fmt="prometheus"
+        ... )
+        >>> exporter.start()
+        >>> ...
+        >>> exporter.stop()  # writes a final snapshot
+    """
+
+    def __init__(
+        self,
+        metrics: EventBusMetrics,
+        path: Path | str,
+        fmt: ExportFormat = "json",
+        interval_s: float = 10.0,
+    ) -> None:
+        """
+        Configure exporter.
+
+        Args:
+            metrics: Registry to export
+            path: Target file
+            fmt: "json" or "prometheus"
+            interval_s: Seconds between exports
+
+        Raises:
+            ValueError: If fmt is unknown or interval_s is not positive
+        """
+        if fmt not in ("json", "prometheus"):
+            raise ValueError(f"Unknown export format: {fmt}")
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be positive, got: {interval_s}")
+
+        self._metrics = metrics
+        self._path = Path(path)
+        self._fmt = fmt
+        self._interval_s = interval_s
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def export(self) -> Path:
+        """
+        Write one snapshot to the target file.
+
+        Returns:
+            Path written
+        """
+        content = (
+            self._metrics.to_prometheus() if self._fmt == "prometheus" else self._metrics.to_json()
+        )
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f".{self._path.name}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, self._path)
+        return self._path
+
+    def start(self) -> None:
+        """Start the background export thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="eventbus-metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, final_export: bool = True) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            final_export: Write one last snapshot after stopping
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if final_export:
+            self.export()
+
+    def _run(self) -> None:
+        """Export loop - never lets an I/O error kill the thread."""
+        while not self._stop_event.wait(self._interval_s):
+            try:
+                self.export()
+            except OSError:
+                logger.exception("EventBus metrics export failed: %s", self._path)
+
+
+def _quantile_label(quantile: float) -> str:
+    """Format quantile as percentile label (0.5 → '50', 0.999 → '999')."""
+    return f"{quantile * 100:g}".replace(".", "")
+
+
+def _prometheus_labels(entry: dict[str, Any]) -> str:
+    """Build escaped Prometheus label set for a snapshot entry."""
+    pairs = (
+        ("event", entry["event_name"]),
+        ("subscription_id", entry["subscription_id"]),
+        ("handler", entry["handler"]),
+    )
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,250 @@
+# backend/core/exposure_aggregator.py
+"""
+ExposureAggregator - Cross-strategy exposure with an incremental per-symbol index.
+
+Platform singleton (AggregatedLedger-style, subscribed with
+``SubscriptionScope(PLATFORM, target_strategy_ids=None)``) that keeps net
+position, notional and open (planned) risk per (symbol, strategy). Every
+Fill / SizePlan updates the per-(symbol, strategy) cell and the running
+per-symbol, per-base-asset and platform totals by the same delta, so
+pre-trade risk queries ("total BTC exposure across all strategies") are
+O(1) lookups instead of rescans of order state.
+
+Fills carry no symbol/side/strategy, so orders are registered first
+(track_order); fills for unknown orders are rejected. Applied fill IDs are
+kept per order and dropped with it (forget_order), so memory is bounded by
+the open orders rather than every fill ever seen.
+
+@layer: Core (Singletons)
+@dependencies: [threading, dataclasses, decimal, backend.dtos.state, backend.dtos.strategy]
+@responsibilities:
+    - Track order → (strategy, symbol, side) for fill attribution
+    - Apply Fill deltas to net position and notional (idempotent per fill_id)
+    - Track open risk per SizePlan (replace / release)
+    - Answer O(1) exposure queries per symbol, strategy, base asset and platform
+"""
+
+# Standard Library Imports
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+
+# Our Application Imports
+from backend.dtos.state.fill import Fill
+from backend.dtos.state.order import Order
+from backend.dtos.strategy.size_plan import SizePlan
+
+__all__ = ["ExposureAggregator", "ExposureSnapshot", "UnknownOrderError"]
+
+_ZERO = Decimal(0)
+
+
+class UnknownOrderError(KeyError):
+    """Raised when a fill references an order that was never tracked."""
+
+
+@dataclass(frozen=True)
+class ExposureSnapshot:
+    """
+    Exposure of one (symbol, strategy) cell or an aggregate of cells.
+
+    Attributes:
+        net_quantity: Signed base-asset position (BUY +, SELL -)
+        notional: net_quantity × last fill price of the symbol
+        open_risk: Sum of risk_amount of open SizePlans (quote asset)
+    """
+
+    net_quantity: Decimal = _ZERO
+    notional: Decimal = _ZERO
+    open_risk: Decimal = _ZERO
+
+
+@dataclass(frozen=True)
+class _TrackedOrder:
+    """Attribution data for fills of one order."""
+
+    strategy_instance_id: str
+    symbol: str
+    sign: int
+
+
+class _Cell:
+    """Mutable running totals (net quantity + open risk)."""
+
+    __slots__ = ("net_quantity", "open_risk")
+
+    def __init__(self) -> None:
+        self.net_quantity = _ZERO
+        self.open_risk = _ZERO
+
+
+class ExposureAggregator:
+    """
+    Incrementally maintained cross-strategy exposure index.
+
+    **Usage:**
+        >>> exposure = ExposureAggregator()
+        >>> exposure.track_order("STR_A", order)
+        >>> exposure.on_fill(fill)
+        >>> exposure.on_size_plan("STR_A", "BTC_USDT", size_plan)
+        >>> exposure.asset_net_quantity("BTC")        # all strategies, all BTC pairs
+        >>> exposure.symbol_exposure("BTC_USDT").open_risk
+
+    **Thread Safety:**
+        All methods take one internal lock; updates and queries are O(1).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty index."""
+        self._lock = threading.Lock()
+        self._orders: dict[str, _TrackedOrder] = {}
+        self._applied_fills: dict[str, set[str]] = {}
+        self._plans: dict[str, tuple[str, str, Decimal]] = {}
+        self._cells: dict[tuple[str, str], _Cell] = {}
+        self._symbols: dict[str, _Cell] = {}
+        self._assets: dict[str, Decimal] = {}
+        self._marks: dict[str, Decimal] = {}
+        self._total_open_risk = _ZERO
+
+    # === Updates ===
+
+    def track_order(self, strategy_instance_id: str, order: Order) -> None:
+        """
+        Register an order so its fills can be attributed.
+
+        Args:
+            strategy_instance_id: Strategy that owns the order
+            order: Order DTO (symbol and side are used)
+        """
+        with self._lock:
+            self._orders[order.order_id] = _TrackedOrder(
+                strategy_instance_id, order.symbol, 1 if order.side == "BUY" else -1
+            )
+            self._applied_fills.setdefault(order.order_id, set())
+
+    def forget_order(self, order_id: str) -> None:
+        """
+        Drop attribution data and applied fill IDs of a terminal order (no-op if unknown).
+
+        Fills arriving for the order afterwards are rejected as untracked.
+        """
+        with self._lock:
+            self._orders.pop(order_id, None)
+            self._applied_fills.pop(order_id, None)
+
+    def on_fill(self, fill: Fill) -> None:
+        """
+        Apply a fill (EventBus handler signature; duplicates are ignored).
+
+        Args:
+            fill: Fill DTO of a tracked order
+
+        Raises:
+            UnknownOrderError: If the parent order was never tracked
+        """
+        with self._lock:
+            tracked = self._orders.get(fill.parent_order_id)
+            if tracked is None:
+                raise UnknownOrderError(
+                    f"Fill {fill.fill_id} references untracked order {fill.parent_order_id}"
+                )
+            applied = self._applied_fills[fill.parent_order_id]
+            if fill.fill_id in applied:
+                return
+            applied.add(fill.fill_id)
+
+            delta = fill.filled_quantity * tracked.sign
+            symbol = tracked.symbol
+            self._cell(symbol, tracked.strategy_instance_id).net_quantity += delta
+            self._symbol(symbol).net_quantity += delta
+            asset = _base_asset(symbol)
+            self._assets[asset] = self._assets.get(asset, _ZERO) + delta
+            self._marks[symbol] = fill.fill_price
+
+    def update_mark(self, symbol: str, price: Decimal) -> None:
+        """Set the mark price used for notional (defaults to last fill price)."""
+        with self._lock:
+            self._marks[symbol] = price
+
+    def on_size_plan(self, strategy_instance_id: str, symbol: str, plan: SizePlan) -> None:
+        """
+        Add (or replace, by plan_id) the open risk of a SizePlan.
+
+        Args:
+            strategy_instance_id: Strategy that produced the plan
+            symbol: Symbol the plan sizes
+            plan: SizePlan DTO (risk_amount is used)
+        """
+        with self._lock:
+            self._release(plan.plan_id)
+            self._plans[plan.plan_id] = (strategy_instance_id, symbol, plan.risk_amount)
+            self._add_risk(strategy_instance_id, symbol, plan.risk_amount)
+
+    def release_plan(self, plan_id: str) -> None:
+        """Remove a plan's open risk (closed, cancelled or fully stopped out)."""
+        with self._lock:
+            self._release(plan_id)
+
+    # === O(1) queries ===
+
+    def symbol_exposure(self, symbol: str) -> ExposureSnapshot:
+        """Exposure of one symbol across all strategies."""
+        with self._lock:
+            cell = self._symbols.get(symbol)
+            return self._snapshot(symbol, cell)
+
+    def strategy_exposure(self, symbol: str, strategy_instance_id: str) -> ExposureSnapshot:
+        """Exposure of one strategy in one symbol."""
+        with self._lock:
+            return self._snapshot(symbol, self._cells.get((symbol, strategy_instance_id)))
+
+    def asset_net_quantity(self, asset: str) -> Decimal:
+        """Net base-asset quantity across all strategies and quote currencies."""
+        with self._lock:
+            return self._assets.get(asset, _ZERO)
+
+    def total_open_risk(self) -> Decimal:
+        """Open risk across the platform (quote asset)."""
+        with self._lock:
+            return self._total_open_risk
+
+    # === Internals (lock held) ===
+
+    def _cell(self, symbol: str, strategy_instance_id: str) -> _Cell:
+        key = (symbol, strategy_instance_id)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = _Cell()
+        return cell
+
+    def _symbol(self, symbol: str) -> _Cell:
+        cell = self._symbols.get(symbol)
+        if cell is None:
+            cell = self._symbols[symbol] = _Cell()
+        return cell
+
+    def _add_risk(self, strategy_instance_id: str, symbol: str, amount: Decimal) -> None:
+        self._cell(symbol, strategy_instance_id).open_risk += amount
+        self._symbol(symbol).open_risk += amount
+        self._total_open_risk += amount
+
+    def _release(self, plan_id: str) -> None:
+        previous = self._plans.pop(plan_id, None)
+        if previous is not None:
+            strategy_instance_id, symbol, amount = previous
+            self._add_risk(strategy_instance_id, symbol, -amount)
+
+    def _snapshot(self, symbol: str, cell: _Cell | None) -> ExposureSnapshot:
+        if cell is None:
+            return ExposureSnapshot()
+        mark = self._marks.get(symbol, _ZERO)
+        return ExposureSnapshot(
+            net_quantity=cell.net_quantity,
+            notional=cell.net_quantity * mark,
+            open_risk=cell.open_risk,
+        )
+
+
+def _base_asset(symbol: str) -> str:
+    """Base asset of a trading pair (BTC_USDT → BTC)."""
+    return symbol.split("_", 1)[0]
@@ -8,7 +8,7 @@ FlowInitiator is a Platform-within-Strategy worker that:
 3. Returns CONTINUE disposition to trigger worker pipeline
 
 @layer: Backend (Core)
-@dependencies: [backend.core.interfaces, backend.dtos.shared]
+@dependencies: [backend.core.interfaces, backend.core.pipeline_tracer, backend.dtos.shared]
 @responsibilities:
     - Initialize StrategyCache with RunAnchor
     - Store provider DTOs in cache by TYPE
@@ -33,6 +33,7 @@ from backend.dtos.shared.disposition_envelope import DispositionEnvelope
 
 if TYPE_CHECKING:
     from backend.core.interfaces.strategy_cache import IStrategyCache
+    from backend.core.pipeline_tracer import PipelineTracer
     from backend.dtos.shared.platform_data import PlatformDataDTO
 
 
@@ -68,6 +69,7 @@ class FlowInitiator(IWorker, IWorkerLifecycle):
         self._name = name
         self._cache: IStrategyCache | None = None
         self._dto_types: dict[str, type[BaseModel]] = {}
+        self._tracer: PipelineTracer | None = None
 
     @property
     def name(self) -> str:
@@ -84,6 +86,8 @@ class FlowInitiator(IWorker, IWorkerLifecycle):
             strategy_cache: StrategyCache instance (REQUIRED - Platform-within-Strategy)
             **capabilities: Required capabilities:
                 - dto_types: Dict[str, Type[BaseModel]] - DTO type mappings
+                Optional capabilities:
+                - tracer: PipelineTracer - opens the origin trace per run
 
         Raises:
             WorkerInitializationError: If strategy_cache is None or dto_types missing
@@ -103,6 +107,7 @@ class FlowInitiator(IWorker, IWorkerLifecycle):
 
         self._cache = strategy_cache
         self._dto_types = capabilities["dto_types"]
+        self._tracer = capabilities.get("tracer")  # type: ignore[assignment]
 
     def on_data_ready(self, data: PlatformDataDTO) -> DispositionEnvelope:
         """
@@ -126,6 +131,18 @@ class FlowInitiator(IWorker, IWorkerLifecycle):
         # Type narrowing: cache is guaranteed non-None after initialize()
         assert self._cache is not None, "FlowInitiator not initialized (call initialize() first)"
 
+        if self._tracer is not None:
+            with (
+                self._tracer.origin(data.origin.id),
+                self._tracer.span(self._name, "flow", origin_type=data.origin.type.value),
+            ):
+                return self._start_run(data)
+        return self._start_run(data)
+
+    def _start_run(self, data: PlatformDataDTO) -> DispositionEnvelope:
+        """Initialize the run and store the payload (see on_data_ready)."""
+        assert self._cache is not None
+
         # 1. Initialize StrategyCache with timestamp
         self._cache.start_new_strategy_run({}, data.timestamp)
 
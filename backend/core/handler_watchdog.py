@@ -0,0 +1,436 @@
+# backend/core/handler_watchdog.py
+"""
+HandlerWatchdog - Deadline enforcement for non-critical event handlers.
+
+Runs handlers under a per-subscription deadline so one hanging strategy
+cannot stall every later subscriber of the same publish() call.
+
+Synchronous handlers execute on a small worker pool while the publishing
+thread waits at most ``deadline``, counted from the moment a worker starts
+the handler (time spent queued for a worker is not an overrun). A handler
+that overruns is abandoned (Python threads cannot be interrupted): it keeps
+running on its worker, its late exception is only logged, and the worker
+stops counting towards the pool size so a replacement can be started. A
+subscription is not dispatched again while its abandoned call is still
+running; such skipped calls count as overruns. Async handlers are cancelled
+instead (``run_async``, a standalone API for asyncio dispatchers: EventBus
+publishes synchronously and only uses ``run``).
+
+Repeated overruns (``overrun_limit`` consecutive) produce a quarantine
+verdict; EventBus reacts by unsubscribing the strategy and publishing
+STRATEGY_QUARANTINED.
+
+@layer: Core (Singletons)
+@dependencies: [asyncio, queue, threading, time, logging,
+                backend.core.eventbus_metrics]
+@responsibilities:
+    - Enforce per-invocation deadlines (abandon sync / cancel async)
+    - Track overruns and consecutive overrun streaks per subscription
+    - Decide quarantine after repeated overruns
+    - Report handler duration percentiles (p99)
+    - Drop the bookkeeping of removed subscriptions
+"""
+
+# Standard Library Imports
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Third-Party Imports
+from pydantic import BaseModel
+
+# Our Application Imports
+from backend.core.eventbus_metrics import LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+__all__ = ["HandlerWatchdog", "WatchdogVerdict"]
+
+
+@dataclass(frozen=True)
+class WatchdogVerdict:
+    """
+    Outcome of one watched handler invocation.
+
+    Attributes:
+        overran: Handler did not finish within its deadline
+        quarantine: Overrun streak reached the limit - caller must quarantine
+        consecutive_overruns: Current overrun streak for the subscription
+    """
+
+    overran: bool = False
+    quarantine: bool = False
+    consecutive_overruns: int = 0
+
+
+_ON_TIME = WatchdogVerdict()
+
+
+@dataclass
+class _SubscriptionState:
+    """Mutable per-subscription watchdog bookkeeping."""
+
+    deadline_ns: int
+    durations: LatencyHistogram = field(default_factory=LatencyHistogram)
+    invocations: int = 0
+    overruns: int = 0
+    consecutive_overruns: int = 0
+    quarantined: bool = False
+    abandoned_running: bool = False
+
+
+class _Invocation:
+    """One synchronous handler call handed to a worker thread."""
+
+    def __init__(
+        self,
+        subscription_id: str,
+        state: _SubscriptionState,
+        handler: Callable[[BaseModel], object],
+        payload: BaseModel,
+    ) -> None:
+        self.subscription_id = subscription_id
+        self.state = state
+        self.handler = handler
+        self.payload = payload
+        self.started = threading.Event()
+        self.finished = threading.Event()
+        self.error: BaseException | None = None
+        self.abandoned = False
+        self.lock = threading.Lock()
+
+
+class HandlerWatchdog:
+    """
+    Deadline enforcement and overrun tracking for event handlers.
+
+    **Usage:**
+        >>> watchdog = HandlerWatchdog(overrun_limit=3)
+        >>> bus = EventBus(watchdog=watchdog)
+        >>> bus.subscribe("TICK", worker.on_tick, scope, deadline_ms=150)
+        >>> watchdog.report()["SUB_..."]["p99_ms"]
+
+    **Thread Safety:**
+        All public methods are thread-safe.
+    """
+
+    def __init__(self, overrun_limit: int = 3, max_workers: int = 8) -> None:
+        """
+        Configure watchdog.
+
+        Args:
+            overrun_limit: Consecutive overruns before quarantine
+            max_workers: Worker threads for synchronous handlers. Abandoned
+                (hanging) handlers keep their thread until they return but no
+                longer count towards this limit.
+
+        Raises:
+            ValueError: If overrun_limit or max_workers is not positive
+        """
+        if overrun_limit < 1:
+            raise ValueError(f"overrun_limit must be >= 1, got: {overrun_limit}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got: {max_workers}")
+
+        self._overrun_limit = overrun_limit
+        self._max_workers = max_workers
+        self._queue: queue.SimpleQueue[_Invocation | None] = queue.SimpleQueue()
+        self._workers = 0
+        self._idle_workers = 0
+        self._spawned = 0
+        self._closed = False
+        self._states: dict[str, _SubscriptionState] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def overrun_limit(self) -> int:
+        """Consecutive overruns that trigger quarantine."""
+        return self._overrun_limit
+
+    def run(
+        self,
+        subscription_id: str,
+        handler: Callable[[BaseModel], object],
+        payload: BaseModel,
+        deadline_ns: int,
+    ) -> WatchdogVerdict:
+        """
+        Invoke a synchronous handler under a deadline.
+
+        Handler exceptions raised within the deadline propagate unchanged.
+        The deadline starts when a worker starts the handler. While an
+        earlier, abandoned call of the subscription is still running the
+        handler is not invoked and the call counts as an overrun.
+        Nested invocations (a watched handler publishing an event whose
+        handlers are also watched) run inline under the outer deadline.
+
+        Args:
+            subscription_id: Subscription being invoked
+            handler: Handler callable
+            payload: Event payload
+            deadline_ns: Maximum handler runtime
+
+        Returns:
+            WatchdogVerdict (overran / quarantine)
+
+        Raises:
+            RuntimeError: If the watchdog has been shut down
+        """
+        state = self._state_for(subscription_id, deadline_ns)
+
+        if getattr(self._local, "active", False):
+            self._execute(state, handler, payload)
+            return self._register_on_time(state)
+
+        with self._lock:
+            still_running = state.abandoned_running
+        if still_running:
+            return self._register_overrun(subscription_id, state, outcome="skipped")
+
+        invocation = _Invocation(subscription_id, state, handler, payload)
+        self._submit(invocation)
+        invocation.started.wait()
+        if not invocation.finished.wait(deadline_ns / 1e9):
+            with invocation.lock:
+                invocation.abandoned = not invocation.finished.is_set()
+            if invocation.abandoned:
+                with self._lock:
+                    state.abandoned_running = True
+                    # The worker stays busy with the handler; free its slot
+                    self._workers -= 1
+                return self._register_overrun(subscription_id, state)
+
+        self._register_on_time(state)
+        if invocation.error is not None:
+            raise invocation.error
+        return _ON_TIME
+
+    async def run_async(
+        self,
+        subscription_id: str,
+        handler: Callable[[BaseModel], Awaitable[object]],
+        payload: BaseModel,
+        deadline_ns: int,
+    ) -> WatchdogVerdict:
+        """
+        Invoke an async handler under a deadline, cancelling it on overrun.
+
+        Standalone API for asyncio dispatchers (EventBus only calls ``run``);
+        callers call ``forget`` when they drop the subscription.
+
+        Args:
+            subscription_id: Subscription being invoked
+            handler: Coroutine function
+            payload: Event payload
+            deadline_ns: Maximum handler runtime
+
+        Returns:
+            WatchdogVerdict (overran / quarantine)
+        """
+        state = self._state_for(subscription_id, deadline_ns)
+        started_ns = time.monotonic_ns()
+        deadline = asyncio.timeout(deadline_ns / 1e9)
+        try:
+            async with deadline:
+                await handler(payload)
+        except TimeoutError:
+            self._record_duration(state, time.monotonic_ns() - started_ns)
+            if not deadline.expired():
+                # Handler itself raised TimeoutError - not a deadline overrun
+                self._register_on_time(state)
+                raise
+            return self._register_overrun(subscription_id, state, outcome="cancelled")
+        except BaseException:
+            self._record_duration(state, time.monotonic_ns() - started_ns)
+            self._register_on_time(state)
+            raise
+        self._record_duration(state, time.monotonic_ns() - started_ns)
+        return self._register_on_time(state)
+
+    def p99_ms(self, subscription_id: str) -> float:
+        """
+        Get p99 handler duration for a subscription.
+
+        Args:
+            subscription_id: Watched subscription
+
+        Returns:
+            p99 in milliseconds (0.0 if unknown)
+        """
+        with self._lock:
+            state = self._states.get(subscription_id)
+            return state.durations.percentile(0.99) / 1e6 if state else 0.0
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarize all watched subscriptions.
+
+        Returns:
+            Mapping subscription_id → deadline_ms, invocations, overruns,
+            consecutive_overruns, p50_ms, p99_ms, max_ms, quarantined
+        """
+        with self._lock:
+            return {
+                subscription_id: {
+                    "deadline_ms": state.deadline_ns / 1e6,
+                    "invocations": state.invocations,
+                    "overruns": state.overruns,
+                    "consecutive_overruns": state.consecutive_overruns,
+                    "p50_ms": state.durations.percentile(0.5) / 1e6,
+                    "p99_ms": state.durations.percentile(0.99) / 1e6,
+                    "max_ms": state.durations.max / 1e6,
+                    "quarantined": state.quarantined,
+                }
+                for subscription_id, state in self._states.items()
+            }
+
+    def forget(self, subscription_id: str) -> None:
+        """
+        Drop the bookkeeping of a removed subscription (no-op if unknown).
+
+        An abandoned call that is still running finishes on its own state.
+
+        Args:
+            subscription_id: Subscription that will not be invoked again
+        """
+        with self._lock:
+            self._states.pop(subscription_id, None)
+
+    def shutdown(self) -> None:
+        """Stop accepting work; queued calls fail, abandoned handlers are not waited for."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = self._workers
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pending is not None:
+                pending.error = RuntimeError("HandlerWatchdog is shut down")
+                pending.started.set()
+                pending.finished.set()
+        for _ in range(workers):
+            self._queue.put(None)
+
+    def _submit(self, invocation: _Invocation) -> None:
+        """Queue an invocation, starting a worker when none is idle."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HandlerWatchdog is shut down")
+            name: str | None = None
+            if self._idle_workers == 0 and self._workers < self._max_workers:
+                self._workers += 1
+                self._spawned += 1
+                name = f"eventbus-watchdog_{self._spawned}"
+        if name is not None:
+            threading.Thread(target=self._work, name=name, daemon=True).start()
+        self._queue.put(invocation)
+
+    def _work(self) -> None:
+        """Worker loop; exits on shutdown or after finishing an abandoned call."""
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            invocation = self._queue.get()
+            with self._lock:
+                self._idle_workers -= 1
+            if invocation is None:
+                return
+
+            invocation.started.set()
+            error: BaseException | None = None
+            try:
+                self._execute(invocation.state, invocation.handler, invocation.payload)
+            except BaseException as exc:  # pylint: disable=broad-exception-caught
+                error = exc
+            with invocation.lock:
+                invocation.error = error
+                invocation.finished.set()
+                abandoned = invocation.abandoned
+            if abandoned:
+                self._finish_abandoned(invocation)
+                # A replacement worker has taken this thread's slot
+                return
+
+    def _state_for(self, subscription_id: str, deadline_ns: int) -> _SubscriptionState:
+        """Get or create state, counting the invocation."""
+        with self._lock:
+            state = self._states.get(subscription_id)
+            if state is None:
+                state = self._states[subscription_id] = _SubscriptionState(deadline_ns)
+            state.invocations += 1
+            return state
+
+    def _execute(
+        self,
+        state: _SubscriptionState,
+        handler: Callable[[BaseModel], object],
+        payload: BaseModel,
+    ) -> None:
+        """Run handler on the current thread, recording its duration."""
+        nested = getattr(self._local, "active", False)
+        self._local.active = True
+        started_ns = time.monotonic_ns()
+        try:
+            handler(payload)
+        finally:
+            self._record_duration(state, time.monotonic_ns() - started_ns)
+            self._local.active = nested
+
+    def _record_duration(self, state: _SubscriptionState, duration_ns: int) -> None:
+        """Record a handler duration sample."""
+        with self._lock:
+            state.durations.record(duration_ns)
+
+    def _register_on_time(self, state: _SubscriptionState) -> WatchdogVerdict:
+        """Reset the overrun streak after an in-deadline completion."""
+        with self._lock:
+            state.consecutive_overruns = 0
+        return _ON_TIME
+
+    def _register_overrun(
+        self,
+        subscription_id: str,
+        state: _SubscriptionState,
+        outcome: str = "abandoned",
+    ) -> WatchdogVerdict:
+        """Count an overrun and decide on quarantine."""
+        with self._lock:
+            state.overruns += 1
+            state.consecutive_overruns += 1
+            streak = state.consecutive_overruns
+            quarantine = streak >= self._overrun_limit and not state.quarantined
+            if quarantine:
+                state.quarantined = True
+
+        logger.warning(  # pylint: disable=logging-fstring-interpolation
+            f"Handler exceeded deadline for subscription {subscription_id} ({outcome})",
+            extra={
+                "subscription_id": subscription_id,
+                "deadline_ms": state.deadline_ns / 1e6,
+                "consecutive_overruns": streak,
+            },
+        )
+        return WatchdogVerdict(overran=True, quarantine=quarantine, consecutive_overruns=streak)
+
+    def _finish_abandoned(self, invocation: _Invocation) -> None:
+        """Re-enable dispatch and log the late outcome of an abandoned handler."""
+        with self._lock:
+            invocation.state.abandoned_running = False
+        if isinstance(invocation.error, Exception):
+            logger.error(  # pylint: disable=logging-fstring-interpolation
+                "Abandoned handler failed after deadline for subscription "
+                f"{invocation.subscription_id}",
+                exc_info=invocation.error,
+                extra={"subscription_id": invocation.subscription_id},
+            )
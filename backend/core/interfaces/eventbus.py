@@ -6,11 +6,12 @@ Defines the contract for the thread-safe event bus singleton that enables
 N-to-N communication between strategies and platform services.
 
 @layer: Core (Interfaces)
-@dependencies: [typing, pydantic, backend.core.enums]
+@dependencies: [typing, pydantic, backend.core.enums, backend.core.strategy_interner]
 """
 
 # Standard Library Imports
 from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from enum import Enum
 from typing import Protocol
@@ -18,6 +19,9 @@ from typing import Protocol
 # Third-Party Imports
 from pydantic import BaseModel
 
+# Our Application Imports
+from backend.core.strategy_interner import ALL_STRATEGIES, StrategyIdInterner
+
 
 class ScopeLevel(Enum):
     """
@@ -76,12 +80,21 @@ class SubscriptionScope:
         strategy_instance_id: Required for STRATEGY level
         target_strategy_ids: Optional filter for PLATFORM level
             - None = unrestricted (all strategies)
-            - Set = selective (only specified strategies)
+            - Set = selective (only specified strategies); stored as a
+              frozenset so the scope cannot drift from the strategy mask
+              EventBus computes at subscribe time
     """
 
     level: ScopeLevel
     strategy_instance_id: str | None = None
-    target_strategy_ids: set[str] | None = None
+    target_strategy_ids: AbstractSet[str] | None = None
+
+    def __post_init__(self) -> None:
+        """Freeze target_strategy_ids (callers may pass a mutable set)."""
+        if self.target_strategy_ids is not None and not isinstance(
+            self.target_strategy_ids, frozenset
+        ):
+            object.__setattr__(self, "target_strategy_ids", frozenset(self.target_strategy_ids))
 
     def should_receive_event(
         self, publish_scope: ScopeLevel, publish_strategy_id: str | None
@@ -133,6 +146,33 @@ class SubscriptionScope:
 
         return False
 
+    def strategy_mask(self, interner: StrategyIdInterner) -> int:
+        """
+        Encode which strategy-scoped events this scope receives as a bitmask.
+
+        Equivalent to should_receive_event() for STRATEGY publishes:
+        ``bool(mask & interner.bit(publish_strategy_id))``. Platform-scoped
+        events are received regardless of the mask.
+
+        Args:
+            interner: Strategy ID interner shared with the publisher
+
+        Returns:
+            Bitmask of accepted strategies (ALL_STRATEGIES if unrestricted)
+
+        Examples:
+            >>> interner = StrategyIdInterner(["STR_A", "STR_B"])
+            >>> SubscriptionScope(ScopeLevel.STRATEGY, "STR_B").strategy_mask(interner)
+            2
+        """
+        if self.level == ScopeLevel.STRATEGY:
+            if self.strategy_instance_id is None:
+                return 0
+            return interner.bit(self.strategy_instance_id)
+        if self.target_strategy_ids is None:
+            return ALL_STRATEGIES
+        return interner.mask(self.target_strategy_ids)
+
 
 class IEventBus(Protocol):
     """
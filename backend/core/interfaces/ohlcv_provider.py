@@ -0,0 +1,84 @@
+# backend/core/interfaces/ohlcv_provider.py
+"""
+OHLCV Provider Interface - Point-in-time historical window queries.
+
+Workers request historical bars relative to the run anchor
+(IStrategyCache.get_run_anchor()). Providers must never return bars newer
+than the requested end_time.
+
+@layer: Backend (Core Protocols)
+@dependencies: [typing, datetime]
+@responsibilities:
+    - Define IOhlcvProvider protocol
+    - Define the minimal TimestampedBar contract for window items
+    - Provide PointInTimeViolationError exception
+"""
+
+# Standard library
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+
+
+class TimestampedBar(Protocol):
+    """Minimal contract for bars returned by an OHLCV provider."""
+
+    @property
+    def timestamp(self) -> datetime:
+        """Bar close time (UTC)."""
+        ...
+
+
+class IOhlcvProvider(Protocol):
+    """
+    Historical OHLCV data access for workers.
+
+    Both queries return bars in ascending timestamp order with every
+    timestamp <= end_time.
+    """
+
+    def get_window(
+        self, symbol: str, timeframe: str, end_time: datetime, lookback: int
+    ) -> Sequence[TimestampedBar]:
+        """
+        Get the last ``lookback`` bars at or before end_time.
+
+        Args:
+            symbol: Trading pair (e.g., BTC_USDT)
+            timeframe: Bar timeframe (e.g., 1h)
+            end_time: Point-in-time upper bound (inclusive)
+            lookback: Maximum number of bars
+
+        Returns:
+            Up to lookback bars, oldest first
+
+        Example:
+            >>> anchor = self.strategy_cache.get_run_anchor()
+            >>> ohlcv = self.ohlcv_provider.get_window(
+            ...     "BTC_USDT", "1h", end_time=anchor.timestamp, lookback=100
+            ... )
+        """
+        ...
+
+    def get_range(
+        self, symbol: str, timeframe: str, after: datetime, end_time: datetime
+    ) -> Sequence[TimestampedBar]:
+        """
+        Get all bars with after < timestamp <= end_time.
+
+        Used to extend a previously fetched window incrementally.
+
+        Args:
+            symbol: Trading pair
+            timeframe: Bar timeframe
+            after: Exclusive lower bound
+            end_time: Inclusive upper bound
+
+        Returns:
+            Bars in the range, oldest first
+        """
+        ...
+
+
+class PointInTimeViolationError(Exception):
+    """Raised when data newer than the point-in-time anchor is requested or returned."""
@@ -121,6 +121,20 @@ class IStrategyCache(Protocol):
         """
         ...
 
+    def snapshot(self) -> StrategyCacheType:
+        """
+        Return every DTO of the active run.
+
+        Used to persist the whole run (e.g. checkpoints), not by workers.
+
+        Returns:
+            Shallow copy of the cache (DTO type → instance)
+
+        Raises:
+            NoActiveRunError: If no strategy run is active
+        """
+        ...
+
     def set_result_dto(self, producing_worker: IWorker, result_dto: BaseModel) -> None:
         """
         Add worker-produced DTO to cache.
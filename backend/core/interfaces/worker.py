@@ -10,11 +10,12 @@ It includes the two-phase initialization pattern via IWorkerLifecycle.
 @responsibilities:
     - Define IWorker protocol (minimal name property)
     - Define IWorkerLifecycle protocol (two-phase initialization)
+    - Define ICheckpointableWorker protocol (declared runtime state)
     - Provide WorkerInitializationError exception
 """
 
 # Standard library
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 # Third-party
 # (none)
@@ -24,7 +25,12 @@ if TYPE_CHECKING:
     from backend.core.interfaces.strategy_cache import IStrategyCache
 
 
-__all__ = ["IWorker", "IWorkerLifecycle", "WorkerInitializationError"]
+__all__ = [
+    "ICheckpointableWorker",
+    "IWorker",
+    "IWorkerLifecycle",
+    "WorkerInitializationError",
+]
 
 
 @runtime_checkable
@@ -167,6 +173,44 @@ class IWorkerLifecycle(Protocol):
         ...
 
 
+@runtime_checkable
+class ICheckpointableWorker(Protocol):
+    """
+    Protocol for workers that declare state worth checkpointing.
+
+    Stateful workers (indicator warm-up buffers, running aggregates) expose
+    their state so a restart can restore it instead of re-warming from
+    history. Stateless workers simply don't implement this protocol.
+
+    The returned state must be JSON-serializable (DTOs, str, numbers,
+    lists, dicts) and must not be mutated after it is returned: the
+    checkpoint is serialized asynchronously.
+    """
+
+    @property
+    def name(self) -> str:
+        """Worker name (checkpoint key)."""
+        ...
+
+    def checkpoint_state(self) -> dict[str, Any]:
+        """
+        Capture the worker's declared state.
+
+        Returns:
+            JSON-serializable state snapshot
+        """
+        ...
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """
+        Restore state previously returned by checkpoint_state().
+
+        Args:
+            state: Decoded state snapshot
+        """
+        ...
+
+
 class WorkerInitializationError(Exception):
     """
     Exception raised when worker initialization fails.
@@ -0,0 +1,366 @@
+# backend/core/market_data_ring.py
+"""
+MarketDataRing - Shared-memory market data ring for cross-process workers.
+
+A single writer (the data provider process) publishes fixed-layout market
+data records into a ring buffer in ``multiprocessing.shared_memory``; any
+number of strategy processes attach and read the same bytes. Publishing a
+tick is one slot write regardless of the number of readers, instead of
+pickling a PlatformDataDTO once per process.
+
+Consistency uses a per-slot sequence lock:
+    writer: seq = 2*index + 1 (odd, write in progress) → fields → seq = 2*index + 2
+    reader: read seq → fields → re-read seq; retry if odd or changed
+The sequence also identifies which record index currently occupies a slot,
+so readers detect being lapped by the writer. Sequence words are 8-byte
+aligned so their stores are single machine words.
+
+@layer: Core (Singletons)
+@dependencies: [struct, datetime, multiprocessing.shared_memory, pydantic,
+                backend.dtos.shared, backend.utils.shared_memory]
+@responsibilities:
+    - Define the MarketDataRecord layout
+    - Single-writer publish with per-slot seqlock
+    - Multi-reader polling with lap detection
+    - Lazily materialize records as MarketDataSnapshot payload DTOs
+"""
+
+# Standard library
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+# Project modules
+from backend.dtos.shared.market_data import MarketDataSnapshot
+from backend.dtos.shared.origin import Origin
+from backend.dtos.shared.platform_data import PlatformDataDTO
+from backend.utils.shared_memory import (
+    attach_shared_memory,
+    create_shared_memory,
+    destroy_shared_memory,
+    shared_buffer,
+)
+
+__all__ = [
+    "LazyMarketData",
+    "MarketDataReader",
+    "MarketDataRecord",
+    "MarketDataRing",
+    "RingFormatError",
+]
+
+_MAGIC = b"ST3RING1"
+_HEADER = struct.Struct("<8sQQ")  # magic, capacity, published count
+_CURSOR = struct.Struct("<Q")
+_CURSOR_OFFSET = 16
+_SEQ = struct.Struct("<Q")
+_FIELDS = struct.Struct("<qq9d")
+_SLOT_SIZE = _SEQ.size + _FIELDS.size  # 96 bytes, keeps seq words 8-byte aligned
+_MAX_SPINS = 1000
+
+
+class RingFormatError(Exception):
+    """Raised when a shared memory block does not contain a market data ring."""
+
+
+class MarketDataRecord(NamedTuple):
+    """
+    Fixed-layout market data record.
+
+    Attributes:
+        timestamp_ns: Snapshot time (UTC epoch nanoseconds)
+        symbol_id: Index into the bootstrap symbol table
+        open/high/low/close/volume: Bar values
+        bid_price/bid_size/ask_price/ask_size: Top of book
+    """
+
+    timestamp_ns: int
+    symbol_id: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    bid_price: float
+    bid_size: float
+    ask_price: float
+    ask_size: float
+
+
+def _slot_offset(index: int, capacity: int) -> int:
+    """Byte offset of the slot holding record ``index``."""
+    return _HEADER.size + (index % capacity) * _SLOT_SIZE
+
+
+class MarketDataRing:
+    """
+    Single-writer side of the ring (owns the shared memory block).
+
+    Exactly one process may publish. Readers attach with
+    MarketDataReader.attach(ring.name).
+
+    **Usage:**
+        >>> ring = MarketDataRing(capacity=4096)
+        >>> ring.publish(MarketDataRecord(ts, 0, o, h, l, c, v, bp, bs, ap, az))
+        >>> ...
+        >>> ring.unlink()
+    """
+
+    def __init__(self, capacity: int = 4096, name: str | None = None) -> None:
+        """
+        Create the ring.
+
+        Args:
+            capacity: Slots in the ring (records retained for slow readers)
+            name: Optional shared memory name (random if None)
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got: {capacity}")
+        self._capacity = capacity
+        # Fresh blocks are zero-filled: every slot starts with seq 0 (empty)
+        self._shm = create_shared_memory(_HEADER.size + capacity * _SLOT_SIZE, name)
+        self._buf = shared_buffer(self._shm)
+        _HEADER.pack_into(self._buf, 0, _MAGIC, capacity, 0)
+        self._published = 0
+
+    @property
+    def name(self) -> str:
+        """Shared memory name used by readers to attach."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots."""
+        return self._capacity
+
+    @property
+    def published(self) -> int:
+        """Total records published (index of the next record)."""
+        return self._published
+
+    def publish(self, record: MarketDataRecord) -> int:
+        """
+        Publish one record (O(1), independent of reader count).
+
+        Args:
+            record: Record to publish
+
+        Returns:
+            Sequence index assigned to the record
+        """
+        index = self._published
+        buf = self._buf
+        offset = _slot_offset(index, self._capacity)
+        _SEQ.pack_into(buf, offset, 2 * index + 1)  # odd: write in progress
+        _FIELDS.pack_into(buf, offset + _SEQ.size, *record)
+        _SEQ.pack_into(buf, offset, 2 * index + 2)  # even: record complete
+        self._published = index + 1
+        _CURSOR.pack_into(buf, _CURSOR_OFFSET, self._published)
+        return index
+
+    def close(self) -> None:
+        """Detach without destroying the block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Close and destroy the block."""
+        destroy_shared_memory(self._shm)
+
+
+class MarketDataReader:
+    """
+    Reader side of the ring (one per consuming process / worker).
+
+    Each reader tracks its own cursor. If the writer laps a slow reader,
+    the reader skips ahead to the oldest retained record and counts the
+    skipped records in ``dropped``.
+    """
+
+    def __init__(self, shm: SharedMemory, capacity: int, start: int) -> None:
+        """
+        Wrap an attached block (use attach()).
+
+        Args:
+            shm: Attached shared memory block
+            capacity: Ring capacity from the header
+            start: First record index this reader will return
+        """
+        self._shm = shm
+        self._buf = shared_buffer(shm)
+        self._capacity = capacity
+        self._cursor = start
+        self.dropped = 0
+
+    @classmethod
+    def attach(cls, name: str, from_start: bool = False) -> MarketDataReader:
+        """
+        Attach to a ring created by another process.
+
+        Args:
+            name: Shared memory name (MarketDataRing.name)
+            from_start: Start at the oldest retained record instead of
+                only receiving records published after attaching
+
+        Returns:
+            Reader positioned at its start cursor
+
+        Raises:
+            FileNotFoundError: If no block with that name exists
+            RingFormatError: If the block is not a market data ring
+        """
+        shm = attach_shared_memory(name)
+        magic, capacity, published = _HEADER.unpack_from(shared_buffer(shm), 0)
+        if magic != _MAGIC:
+            shm.close()
+            raise RingFormatError(f"Shared memory '{name}' is not a market data ring")
+        start = max(0, published - capacity) if from_start else published
+        return cls(shm, capacity, start)
+
+    @property
+    def cursor(self) -> int:
+        """Index of the next record this reader will return."""
+        return self._cursor
+
+    def published(self) -> int:
+        """Total records published by the writer so far."""
+        return int(_CURSOR.unpack_from(self._buf, _CURSOR_OFFSET)[0])
+
+    def read(self, index: int) -> MarketDataRecord | None:
+        """
+        Read record ``index`` consistently.
+
+        Args:
+            index: Record sequence index
+
+        Returns:
+            The record, or None if it is not published yet, has been
+            overwritten, or the writer stalled mid-write
+        """
+        buf = self._buf
+        offset = _slot_offset(index, self._capacity)
+        expected = 2 * index + 2
+        for _ in range(_MAX_SPINS):
+            before = _SEQ.unpack_from(buf, offset)[0]
+            if before & 1:
+                continue  # write in progress
+            if before != expected:
+                return None  # not yet written, or lapped
+            fields = _FIELDS.unpack_from(buf, offset + _SEQ.size)
+            if _SEQ.unpack_from(buf, offset)[0] == before:
+                return MarketDataRecord._make(fields)
+        return None
+
+    def poll(self, max_records: int | None = None) -> Iterator[MarketDataRecord]:
+        """
+        Yield all records published since the last poll.
+
+        Args:
+            max_records: Optional cap per poll
+
+        Yields:
+            Records in publish order
+        """
+        published = self.published()
+        oldest = max(0, published - self._capacity)
+        if self._cursor < oldest:
+            self.dropped += oldest - self._cursor
+            self._cursor = oldest
+
+        remaining = published - self._cursor
+        if max_records is not None:
+            remaining = min(remaining, max_records)
+        for _ in range(remaining):
+            record = self.read(self._cursor)
+            if record is None:
+                # Lapped during the poll: resynchronize on the next call
+                return
+            self._cursor += 1
+            yield record
+
+    def close(self) -> None:
+        """Detach from the ring."""
+        self._shm.close()
+
+
+class LazyMarketData:
+    """
+    Worker-facing view of a ring record with a lazily built payload DTO.
+
+    Hot-path workers read raw fields via ``record`` (no allocation); the
+    MarketDataSnapshot DTO and its PlatformDataDTO envelope are only built
+    when first requested and then cached.
+
+    **Usage:**
+        >>> view = LazyMarketData(record, symbols)
+        >>> if view.record.close > threshold:
+        ...     cache.set_result_dto(worker, view.payload)
+    """
+
+    __slots__ = ("_payload", "_symbols", "record")
+
+    def __init__(self, record: MarketDataRecord, symbols: Sequence[str]) -> None:
+        """
+        Wrap a record.
+
+        Args:
+            record: Raw ring record
+            symbols: Bootstrap symbol table (symbol_id → symbol)
+        """
+        self.record = record
+        self._symbols = symbols
+        self._payload: MarketDataSnapshot | None = None
+
+    @property
+    def symbol(self) -> str:
+        """Symbol resolved from the bootstrap table."""
+        return self._symbols[self.record.symbol_id]
+
+    @property
+    def timestamp(self) -> datetime:
+        """Record timestamp as an aware UTC datetime."""
+        seconds, nanos = divmod(self.record.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, UTC).replace(microsecond=nanos // 1000)
+
+    @property
+    def payload(self) -> MarketDataSnapshot:
+        """
+        Materialize (once) the MarketDataSnapshot DTO.
+
+        The record layout is fixed and produced by trusted platform code,
+        so the DTO is built with model_construct (no re-validation).
+        """
+        if self._payload is None:
+            record = self.record
+            self._payload = MarketDataSnapshot.model_construct(
+                symbol=self.symbol,
+                timestamp=self.timestamp,
+                open=record.open,
+                high=record.high,
+                low=record.low,
+                close=record.close,
+                volume=record.volume,
+                bid_price=record.bid_price,
+                bid_size=record.bid_size,
+                ask_price=record.ask_price,
+                ask_size=record.ask_size,
+            )
+        return self._payload
+
+    def to_platform_data(self, origin: Origin) -> PlatformDataDTO:
+        """
+        Wrap the payload in a PlatformDataDTO for FlowInitiator.
+
+        Args:
+            origin: Origin of this tick (TCK_...)
+
+        Returns:
+            PlatformDataDTO with this record's timestamp and payload
+        """
+        return PlatformDataDTO(origin=origin, timestamp=self.timestamp, payload=self.payload)
@@ -0,0 +1,225 @@
+# backend/core/ohlcv_cache.py
+"""
+CachedOhlcvProvider - Point-in-time caching layer for IOhlcvProvider.
+
+Every worker of a strategy run asks for the same historical window
+(``end_time=anchor.timestamp``). This layer collapses those requests to a
+single upstream fetch per tick and, on the next tick, extends the previous
+window with only the newly closed bars instead of refetching all of it.
+
+Caching:
+    - LRU keyed by (symbol, timeframe, end_time, lookback)
+    - Sliding window per (symbol, timeframe, lookback): previous window +
+      get_range(after=previous end_time), trimmed to lookback
+
+Point-in-time guards:
+    - end_time later than the active RunAnchor is rejected
+    - Upstream bars newer than end_time (or out of order) are rejected,
+      so a cached window can never contain data from the future
+
+@layer: Backend (Core Services)
+@dependencies: [threading, collections, datetime, backend.core.interfaces]
+@responsibilities:
+    - Implement IOhlcvProvider on top of another IOhlcvProvider
+    - LRU + sliding-window caching of window queries
+    - Enforce point-in-time consistency with the run anchor
+"""
+
+# Standard library
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime
+
+# Project modules
+from backend.core.interfaces.ohlcv_provider import (
+    IOhlcvProvider,
+    PointInTimeViolationError,
+    TimestampedBar,
+)
+from backend.core.interfaces.strategy_cache import IStrategyCache
+
+Window = tuple[TimestampedBar, ...]
+_WindowKey = tuple[str, str, datetime, int]
+_SeriesKey = tuple[str, str, int]
+
+
+class CachedOhlcvProvider:
+    """
+    Caching, point-in-time safe wrapper around an IOhlcvProvider.
+
+    Windows are returned as immutable tuples, so one cached window can be
+    shared by every worker of a run. Upstream calls happen under the cache
+    lock: concurrent requests for the same window wait for the first fetch
+    instead of issuing their own.
+
+    **Usage:**
+        >>> provider = CachedOhlcvProvider(exchange_provider, strategy_cache)
+        >>> bars = provider.get_anchored_window("BTC_USDT", "1h", lookback=100)
+    """
+
+    def __init__(
+        self,
+        provider: IOhlcvProvider,
+        strategy_cache: IStrategyCache | None = None,
+        maxsize: int = 256,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            provider: Upstream provider
+            strategy_cache: Optional cache whose RunAnchor bounds all queries
+            maxsize: Maximum number of cached windows (LRU eviction)
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got: {maxsize}")
+        self._provider = provider
+        self._strategy_cache = strategy_cache
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._windows: OrderedDict[_WindowKey, Window] = OrderedDict()
+        self._latest: dict[_SeriesKey, tuple[datetime, Window]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._slides = 0
+
+    def get_window(self, symbol: str, timeframe: str, end_time: datetime, lookback: int) -> Window:
+        """
+        Get the last ``lookback`` bars at or before end_time (cached).
+
+        Args:
+            symbol: Trading pair
+            timeframe: Bar timeframe
+            end_time: Point-in-time upper bound (inclusive)
+            lookback: Maximum number of bars
+
+        Returns:
+            Up to lookback bars, oldest first
+
+        Raises:
+            ValueError: If lookback is not positive
+            PointInTimeViolationError: If end_time is later than the run
+                anchor, or the upstream provider returns future bars
+        """
+        if lookback < 1:
+            raise ValueError(f"lookback must be >= 1, got: {lookback}")
+        self._check_anchor(end_time)
+
+        key = (symbol, timeframe, end_time, lookback)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None:
+                self._windows.move_to_end(key)
+                self._hits += 1
+                return window
+
+            self._misses += 1
+            window = self._slide(symbol, timeframe, end_time, lookback)
+            if window is None:
+                window = tuple(self._provider.get_window(symbol, timeframe, end_time, lookback))
+                _validate(window, None, end_time)
+                window = window[-lookback:]
+
+            self._windows[key] = window
+            if len(self._windows) > self._maxsize:
+                self._windows.popitem(last=False)
+            series = (symbol, timeframe, lookback)
+            latest = self._latest.get(series)
+            if latest is None or latest[0] < end_time:
+                self._latest[series] = (end_time, window)
+            return window
+
+    def get_range(self, symbol: str, timeframe: str, after: datetime, end_time: datetime) -> Window:
+        """
+        Get all bars with after < timestamp <= end_time (not cached).
+
+        Raises:
+            PointInTimeViolationError: If end_time is later than the run
+                anchor, or the upstream provider returns out-of-range bars
+        """
+        self._check_anchor(end_time)
+        bars = tuple(self._provider.get_range(symbol, timeframe, after, end_time))
+        _validate(bars, after, end_time)
+        return bars
+
+    def get_anchored_window(self, symbol: str, timeframe: str, lookback: int) -> Window:
+        """
+        Get the window ending at the active run anchor.
+
+        Raises:
+            ValueError: If no strategy cache was configured
+            NoActiveRunError: If no strategy run is active
+        """
+        if self._strategy_cache is None:
+            raise ValueError("get_anchored_window() requires a strategy_cache")
+        end_time = self._strategy_cache.get_run_anchor().timestamp
+        return self.get_window(symbol, timeframe, end_time, lookback)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict with hits, misses, slides (misses served incrementally)
+            and cached window count
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "slides": self._slides,
+                "size": len(self._windows),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached windows (counters are kept)."""
+        with self._lock:
+            self._windows.clear()
+            self._latest.clear()
+
+    def _check_anchor(self, end_time: datetime) -> None:
+        """Reject queries beyond the active run anchor."""
+        if self._strategy_cache is None:
+            return
+        anchor = self._strategy_cache.get_run_anchor().timestamp
+        if end_time > anchor:
+            raise PointInTimeViolationError(
+                f"Requested end_time {end_time.isoformat()} is after run anchor "
+                f"{anchor.isoformat()}"
+            )
+
+    def _slide(
+        self, symbol: str, timeframe: str, end_time: datetime, lookback: int
+    ) -> Window | None:
+        """Extend the newest earlier window for this series, if any."""
+        latest = self._latest.get((symbol, timeframe, lookback))
+        if latest is None or latest[0] >= end_time:
+            return None
+        previous_end, previous = latest
+        new_bars = tuple(self._provider.get_range(symbol, timeframe, previous_end, end_time))
+        _validate(new_bars, previous_end, end_time)
+        self._slides += 1
+        if len(new_bars) >= lookback:
+            return new_bars[-lookback:]
+        return (previous + new_bars)[-lookback:]
+
+
+def _validate(bars: Sequence[TimestampedBar], after: datetime | None, end_time: datetime) -> None:
+    """Ensure bars are ascending and within (after, end_time]."""
+    previous = after
+    for bar in bars:
+        timestamp = bar.timestamp
+        if timestamp > end_time:
+            raise PointInTimeViolationError(
+                f"Provider returned bar at {timestamp.isoformat()} after end_time "
+                f"{end_time.isoformat()}"
+            )
+        if previous is not None and timestamp <= previous:
+            raise PointInTimeViolationError(
+                f"Provider returned out-of-order bar at {timestamp.isoformat()}"
+            )
+        previous = timestamp
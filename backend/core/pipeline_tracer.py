@@ -0,0 +1,307 @@
+# backend/core/pipeline_tracer.py
+"""
+PipelineTracer - Sampled enter/exit spans for the worker pipeline.
+
+Records where an origin (e.g. a TCK_ tick) spends its time end to end:
+FlowInitiator, EventBus dispatch and every handler invocation become
+spans tagged with the origin ID and strategy_instance_id. Spans export as
+Chrome Trace Event JSON (chrome://tracing, Perfetto) or speedscope files.
+
+Sampling is per origin: an origin is traced if crc32(origin_id) % N == 0,
+so every process and strategy makes the same decision for the same
+origin. Unsampled origins cost one context-variable lookup per span, so
+tracing can stay enabled in production.
+
+Trace context is carried in a ContextVar (thread- and task-local). Work
+handed to other threads (e.g. HandlerWatchdog pool) is measured by the
+enclosing handler span but not broken down further.
+
+@layer: Core (Singletons)
+@dependencies: [contextvars, threading, time, zlib, json, os, pathlib]
+@responsibilities:
+    - Decide per-origin sampling and carry trace context
+    - Record enter/exit spans into a bounded buffer
+    - Export Chrome Trace Event JSON and speedscope documents
+"""
+
+# Standard Library Imports
+import json
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+__all__ = ["PipelineTracer", "TraceFormat", "TraceSpan"]
+
+TraceFormat = Literal["chrome", "speedscope"]
+
+_SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+@dataclass(frozen=True, slots=True)
+class TraceSpan:
+    """
+    One completed span.
+
+    Attributes:
+        name: Span name (e.g. handler qualname)
+        category: Span category (flow, eventbus, handler, ...)
+        origin_id: Origin being traced (TCK_/NWS_/SCH_...)
+        strategy_instance_id: Strategy the work belongs to (None = platform)
+        start_ns: perf_counter_ns() at enter
+        duration_ns: Span duration
+        thread_id: Thread that executed the span
+        args: Extra key/value annotations
+    """
+
+    name: str
+    category: str
+    origin_id: str
+    strategy_instance_id: str | None
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class _TraceContext:
+    """Active trace for the current thread / task (sampled=False = no-op)."""
+
+    origin_id: str
+    strategy_instance_id: str | None
+    sampled: bool
+
+
+_NOT_SAMPLED = _TraceContext("", None, False)
+_active: ContextVar[_TraceContext | None] = ContextVar("st3_pipeline_trace", default=None)
+
+
+class PipelineTracer:
+    """
+    Sampled span recorder with Chrome trace / speedscope export.
+
+    **Usage:**
+        >>> tracer = PipelineTracer(sample_every=100)
+        >>> bus = EventBus(tracer=tracer)
+        >>> ...  # run the platform
+        >>> tracer.write(Path(".logs/pipeline.trace.json"), fmt="chrome")
+    """
+
+    def __init__(self, sample_every: int = 1, max_spans: int = 100_000) -> None:
+        """
+        Configure tracer.
+
+        Args:
+            sample_every: Trace 1 in N origins (1 = every origin)
+            max_spans: Spans retained (oldest are dropped first)
+
+        Raises:
+            ValueError: If sample_every or max_spans is not positive
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got: {sample_every}")
+        if max_spans < 1:
+            raise ValueError(f"max_spans must be >= 1, got: {max_spans}")
+        self._sample_every = sample_every
+        self._spans: deque[TraceSpan] = deque(maxlen=max_spans)
+        self._spans_lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def sample_every(self) -> int:
+        """Sampling divisor (1 in N origins)."""
+        return self._sample_every
+
+    def is_sampled(self, origin_id: str) -> bool:
+        """Deterministic per-origin sampling decision."""
+        if self._sample_every == 1:
+            return True
+        return zlib.crc32(origin_id.encode()) % self._sample_every == 0
+
+    @contextmanager
+    def origin(
+        self, origin_id: str, strategy_instance_id: str | None = None
+    ) -> Generator[bool, None, None]:
+        """
+        Open the trace for an origin (no-op if a trace is already active).
+
+        Args:
+            origin_id: Origin ID (PlatformDataDTO.origin.id)
+            strategy_instance_id: Strategy the origin is processed for
+
+        Yields:
+            True if spans for this origin are recorded
+        """
+        current = _active.get()
+        if current is not None:
+            yield current.sampled
+            return
+        context = (
+            _TraceContext(origin_id, strategy_instance_id, True)
+            if self.is_sampled(origin_id)
+            else _NOT_SAMPLED
+        )
+        token = _active.set(context)
+        try:
+            yield context.sampled
+        finally:
+            _active.reset(token)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        strategy_instance_id: str | None = None,
+        **args: str,
+    ) -> Generator[None, None, None]:
+        """
+        Record an enter/exit span within the active origin trace.
+
+        Outside a sampled origin this is a no-op.
+
+        Args:
+            name: Span name
+            category: Span category
+            strategy_instance_id: Overrides the origin's strategy ID
+            **args: Extra annotations
+        """
+        context = _active.get()
+        if context is None or not context.sampled:
+            yield
+            return
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            recorded = TraceSpan(
+                name=name,
+                category=category,
+                origin_id=context.origin_id,
+                strategy_instance_id=strategy_instance_id or context.strategy_instance_id,
+                start_ns=started,
+                duration_ns=time.perf_counter_ns() - started,
+                thread_id=threading.get_ident(),
+                args=args,
+            )
+            with self._spans_lock:
+                self._spans.append(recorded)
+
+    def spans(self) -> list[TraceSpan]:
+        """Recorded spans, oldest first (copy; safe while other threads record)."""
+        with self._spans_lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        with self._spans_lock:
+            self._spans.clear()
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Build a Chrome Trace Event document (complete "X" events).
+
+        Returns:
+            Dict with traceEvents (timestamps in microseconds)
+        """
+        events = []
+        for span in self.spans():
+            args = {"origin_id": span.origin_id, **span.args}
+            if span.strategy_instance_id is not None:
+                args["strategy_instance_id"] = span.strategy_instance_id
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": self._pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """
+        Build a speedscope document (one evented profile per origin/thread).
+
+        Returns:
+            Dict in speedscope file format (nanosecond units)
+        """
+        frames: list[dict[str, str]] = []
+        frame_index: dict[str, int] = {}
+        groups: dict[tuple[str, int], list[TraceSpan]] = {}
+        for span in self.spans():
+            groups.setdefault((span.origin_id, span.thread_id), []).append(span)
+
+        profiles = []
+        for (origin_id, thread_id), spans in groups.items():
+            events: list[tuple[int, int, str, int, int]] = []
+            for span in spans:
+                label = f"{span.category}:{span.name}"
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    frames.append({"name": label})
+                end = span.start_ns + span.duration_ns
+                # Sort key: time, closes before opens, then outer before inner
+                events.append((span.start_ns, 1, "O", frame_index[label], -end))
+                events.append((end, 0, "C", frame_index[label], -span.start_ns))
+            events.sort()
+            start = min(span.start_ns for span in spans)
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"{origin_id} (thread {thread_id})",
+                    "unit": "nanoseconds",
+                    "startValue": start,
+                    "endValue": max(span.start_ns + span.duration_ns for span in spans),
+                    "events": [
+                        {"type": kind, "frame": frame, "at": at}
+                        for at, _order, kind, frame, _nest in events
+                    ],
+                }
+            )
+        return {
+            "$schema": _SPEEDSCOPE_SCHEMA,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": "S1mpleTrader pipeline trace",
+            "exporter": "backend.core.pipeline_tracer",
+        }
+
+    def write(self, path: Path | str, fmt: TraceFormat = "chrome") -> Path:
+        """
+        Atomically write the recorded spans to a file.
+
+        Args:
+            path: Target file
+            fmt: "chrome" or "speedscope"
+
+        Returns:
+            Path written
+
+        Raises:
+            ValueError: If fmt is unknown
+        """
+        if fmt == "chrome":
+            document = self.to_chrome_trace()
+        elif fmt == "speedscope":
+            document = self.to_speedscope()
+        else:
+            raise ValueError(f"Unknown trace format: {fmt}")
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{target.name}.tmp")
+        tmp_path.write_text(json.dumps(document), encoding="utf-8")
+        os.replace(tmp_path, target)
+        return target
@@ -0,0 +1,225 @@
+# backend/core/signal_confluence.py
+"""
+SignalConfluenceJoin - Streaming K-of-N join of Signal events.
+
+Several SignalDetectors can confirm the same setup; CausalityChain.signal_ids
+is a list for exactly that reason. Instead of every StrategyPlanner buffering
+signals itself, this operator keeps a time-windowed buffer per
+(symbol, direction) holding the latest signal of each detector, and emits a
+SignalConfluence as soon as ``required`` of the configured detectors agree
+within ``window``.
+
+Detectors are identified by Signal.signal_type. Time is signal time
+(Signal.timestamp), so backtests and live runs join identically.
+
+Complexity:
+    Each signal costs O(log n): one push on the symbol's expiry min-heap,
+    plus amortized pops of expired entries. Heap entries are invalidated
+    lazily (a newer signal of the same detector supersedes the old entry).
+
+@layer: Core (Singletons)
+@dependencies: [heapq, itertools, threading, dataclasses, datetime,
+                backend.dtos.strategy.signal]
+@responsibilities:
+    - Buffer signals per symbol / direction / detector within a time window
+    - Expire stale signals via a per-symbol min-heap
+    - Emit a SignalConfluence once K of N detectors agree (then reset)
+"""
+
+# Standard Library Imports
+import heapq
+import itertools
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Literal
+
+# Our Application Imports
+from backend.dtos.strategy.signal import Signal
+
+__all__ = ["SignalConfluence", "SignalConfluenceJoin"]
+
+Direction = Literal["long", "short"]
+# (expires_at, tie-breaker, direction, detector, signal_id)
+_HeapEntry = tuple[datetime, int, Direction, str, str]
+
+
+@dataclass(frozen=True)
+class SignalConfluence:
+    """
+    K-of-N agreement of detectors on one symbol and direction.
+
+    Attributes:
+        symbol: Trading pair all signals refer to
+        direction: Agreed direction
+        signals: Contributing signals, oldest first (one per detector)
+        timestamp: Timestamp of the signal that completed the confluence
+    """
+
+    symbol: str
+    direction: Direction
+    signals: tuple[Signal, ...]
+    timestamp: datetime
+
+    @property
+    def signal_ids(self) -> list[str]:
+        """Signal IDs for CausalityChain.extend(signal_ids=...)."""
+        return [signal.signal_id for signal in self.signals]
+
+    @property
+    def detectors(self) -> frozenset[str]:
+        """Detectors (signal types) that agreed."""
+        return frozenset(signal.signal_type for signal in self.signals)
+
+
+class _SymbolBuffer:
+    """Per-symbol state: latest signal per (direction, detector) + expiry heap."""
+
+    __slots__ = ("heap", "latest", "watermark")
+
+    def __init__(self) -> None:
+        self.latest: dict[Direction, dict[str, Signal]] = {"long": {}, "short": {}}
+        self.heap: list[_HeapEntry] = []
+        self.watermark: datetime | None = None
+
+
+class SignalConfluenceJoin:
+    """
+    Streaming join emitting a SignalConfluence when K of N detectors agree.
+
+    After emitting, the contributing signals are consumed, so one setup
+    yields one confluence; later signals start a new one.
+
+    **Usage:**
+        >>> join = SignalConfluenceJoin(
+        ...     detectors=["FVG_BREAKOUT", "MSS_REVERSAL", "EMA_CROSS"],
+        ...     required=2,
+        ...     window=timedelta(minutes=15),
+        ... )
+        >>> confluence = join.on_signal(signal)
+        >>> if confluence is not None:
+        ...     chain = chain.extend(signal_ids=confluence.signal_ids)
+
+    **Thread Safety:**
+        on_signal() and queries take one internal lock.
+    """
+
+    def __init__(
+        self,
+        detectors: Iterable[str],
+        required: int,
+        window: timedelta,
+        on_confluence: Callable[[SignalConfluence], None] | None = None,
+    ) -> None:
+        """
+        Configure join.
+
+        Args:
+            detectors: Signal types taking part in the join (N)
+            required: Detectors that must agree (K, 1 <= K <= N)
+            window: Maximum age of a signal relative to the newest signal
+                of the same symbol
+            on_confluence: Optional callback invoked with each confluence
+                (e.g. an EventBus publish)
+
+        Raises:
+            ValueError: If required is out of range or window is not positive
+        """
+        self._detectors = frozenset(detectors)
+        if not 1 <= required <= len(self._detectors):
+            raise ValueError(
+                f"required must be between 1 and {len(self._detectors)}, got: {required}"
+            )
+        if window <= timedelta(0):
+            raise ValueError(f"window must be positive, got: {window}")
+        self._required = required
+        self._window = window
+        self._on_confluence = on_confluence
+        self._buffers: dict[str, _SymbolBuffer] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def on_signal(self, signal: Signal) -> SignalConfluence | None:
+        """
+        Add a signal (EventBus handler signature).
+
+        Signals of other detectors, and late signals already outside the
+        window of the newest signal of their symbol, are ignored.
+
+        Args:
+            signal: Signal from a SignalDetector
+
+        Returns:
+            The confluence completed by this signal, or None
+        """
+        if signal.signal_type not in self._detectors:
+            return None
+        with self._lock:
+            buffer = self._buffers.get(signal.symbol)
+            if buffer is None:
+                buffer = self._buffers[signal.symbol] = _SymbolBuffer()
+            expires_at = signal.timestamp + self._window
+            if buffer.watermark is not None:
+                if expires_at <= buffer.watermark:
+                    return None  # arrived after its window closed
+                buffer.watermark = max(buffer.watermark, signal.timestamp)
+            else:
+                buffer.watermark = signal.timestamp
+            self._expire(buffer, buffer.watermark)
+
+            agreeing = buffer.latest[signal.direction]
+            previous = agreeing.get(signal.signal_type)
+            if previous is not None and previous.timestamp > signal.timestamp:
+                return None  # a newer signal of this detector is buffered
+            agreeing[signal.signal_type] = signal
+            heapq.heappush(
+                buffer.heap,
+                (
+                    expires_at,
+                    next(self._counter),
+                    signal.direction,
+                    signal.signal_type,
+                    signal.signal_id,
+                ),
+            )
+            if len(agreeing) < self._required:
+                return None
+
+            signals = tuple(sorted(agreeing.values(), key=lambda s: s.timestamp))
+            agreeing.clear()
+            confluence = SignalConfluence(
+                symbol=signal.symbol,
+                direction=signal.direction,
+                signals=signals,
+                timestamp=signal.timestamp,
+            )
+        if self._on_confluence is not None:
+            self._on_confluence(confluence)
+        return confluence
+
+    def pending(self, symbol: str, direction: Direction) -> frozenset[str]:
+        """Detectors currently buffered (not yet expired or consumed)."""
+        with self._lock:
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                return frozenset()
+            return frozenset(buffer.latest[direction])
+
+    def clear(self) -> None:
+        """Drop all buffered signals."""
+        with self._lock:
+            self._buffers.clear()
+
+    # === Internals (lock held) ===
+
+    @staticmethod
+    def _expire(buffer: _SymbolBuffer, now: datetime) -> None:
+        """Pop heap entries that expired at or before ``now``."""
+        heap = buffer.heap
+        while heap and heap[0][0] <= now:
+            _expires_at, _seq, direction, detector, signal_id = heapq.heappop(heap)
+            current = buffer.latest[direction].get(detector)
+            # Lazy invalidation: superseded or consumed entries are skipped
+            if current is not None and current.signal_id == signal_id:
+                del buffer.latest[direction][detector]
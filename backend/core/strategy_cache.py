@@ -67,6 +67,12 @@ class StrategyCache:
 
         return dict(self._current_cache)
 
+    def snapshot(self) -> StrategyCacheType:
+        """Return a shallow copy of all DTOs of the active run."""
+        if self._current_cache is None:
+            raise NoActiveRunError("No active strategy run. Call start_new_strategy_run() first.")
+        return dict(self._current_cache)
+
     def set_result_dto(self, _producing_worker: object, result_dto: BaseModel) -> None:
         """
         Add worker-produced DTO to cache.
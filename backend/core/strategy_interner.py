@@ -0,0 +1,114 @@
+# backend/core/strategy_interner.py
+"""
+StrategyIdInterner - Dense integer IDs for strategy instance IDs.
+
+Strategy instance IDs are interned once (at bootstrap, or lazily on first
+use) to consecutive integers. Each strategy is then one bit in a Python
+int, so subscription scopes become bitmasks and matching a strategy event
+is a single ``mask & bit`` instead of string hashing per subscription.
+
+Interning is append-only: a strategy keeps its index for the lifetime of
+the interner, so masks computed earlier stay valid.
+
+@layer: Core (Singletons)
+@dependencies: [threading, collections.abc]
+@responsibilities:
+    - Map strategy_instance_id → dense index / bit (append-only)
+    - Build bitmasks for sets of strategies
+"""
+
+# Standard Library Imports
+import threading
+from collections.abc import Iterable
+
+__all__ = ["ALL_STRATEGIES", "StrategyIdInterner"]
+
+# Mask with every bit set (Python ints are unbounded: -1 & bit == bit)
+ALL_STRATEGIES = -1
+
+
+class StrategyIdInterner:
+    """
+    Append-only strategy_instance_id → bit registry.
+
+    **Usage:**
+        >>> interner = StrategyIdInterner(["STR_A", "STR_B"])  # bootstrap
+        >>> mask = interner.mask({"STR_A"})
+        >>> bool(mask & interner.bit("STR_B"))
+        False
+
+    **Thread Safety:**
+        Lookups of known IDs are lock-free dict reads; interning a new ID
+        takes an internal lock.
+    """
+
+    def __init__(self, strategy_ids: Iterable[str] = ()) -> None:
+        """
+        Create interner, optionally pre-interning the bootstrap strategies.
+
+        Args:
+            strategy_ids: Strategy instance IDs known at bootstrap
+        """
+        self._index: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._lock = threading.Lock()
+        for strategy_id in strategy_ids:
+            self.intern(strategy_id)
+
+    def intern(self, strategy_id: str) -> int:
+        """
+        Return the dense index of a strategy (assigning the next one if new).
+
+        Args:
+            strategy_id: Strategy instance ID
+
+        Returns:
+            Index in [0, len(self))
+        """
+        index = self._index.get(strategy_id)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._index.get(strategy_id)
+            if index is None:
+                index = len(self._ids)
+                self._ids.append(strategy_id)
+                self._index[strategy_id] = index
+            return index
+
+    def bit(self, strategy_id: str) -> int:
+        """Single-bit mask of a strategy (interned if new)."""
+        return 1 << self.intern(strategy_id)
+
+    def lookup_bit(self, strategy_id: str) -> int | None:
+        """Single-bit mask of an already interned strategy (None if unknown; never interns)."""
+        index = self._index.get(strategy_id)
+        return None if index is None else 1 << index
+
+    def mask(self, strategy_ids: Iterable[str]) -> int:
+        """Bitmask of a set of strategies (interned if new)."""
+        mask = 0
+        for strategy_id in strategy_ids:
+            mask |= 1 << self.intern(strategy_id)
+        return mask
+
+    def strategy_ids(self, mask: int) -> list[str]:
+        """
+        Decode a bitmask back to strategy IDs (index order).
+
+        Args:
+            mask: Bitmask (ALL_STRATEGIES decodes to every interned ID)
+
+        Returns:
+            Strategy instance IDs whose bits are set
+        """
+        ids = self._ids[:]
+        return [strategy_id for index, strategy_id in enumerate(ids) if mask >> index & 1]
+
+    def __len__(self) -> int:
+        """Number of interned strategies."""
+        return len(self._ids)
+
+    def __contains__(self, strategy_id: object) -> bool:
+        """True if the strategy has been interned."""
+        return strategy_id in self._index
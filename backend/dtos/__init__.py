@@ -0,0 +1,7 @@
+"""
+Data transfer objects.
+
+Every DTO model sets ``defer_build``: pydantic builds its core schema on the
+first validation instead of at import, so importing the DTO packages (which
+every spawned pool worker does) stays cheap. Keep it on new models.
+"""
@@ -3,20 +3,148 @@
 CausalityChain - ID-only causality tracking DTO.
 
 Verzamelt ALLEEN IDs voor Journal causality reconstruction in FlowTerminator.
-Flows through entire pipeline, workers extend via model_copy(update={...}).
+Flows through entire pipeline, workers extend via extend(...).
 
 Design: Single Responsibility - NO business data, NO timestamps, ONLY IDs.
 
+The ID lists are IdTrail values: persistent append-only sequences that
+share structure with the chain they were extended from. Extending a chain
+is O(1) per ID and a long-lived trade with many fills stores each fill ID
+once instead of one full list copy per fill. They serialize as plain
+lists, so the JSON schema is unchanged.
+
 @layer: DTO (Domain Transfer Objects)
-@dependencies: [pydantic]
+@dependencies: [pydantic, pydantic_core]
 """
 
+# Standard Library Imports
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any, overload
+
 # Third-Party Imports
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 # Our Application Imports
 from backend.dtos.shared import Origin
 
+# Guards the "is this trail the spine's tip?" check-and-push in IdTrail.append
+_spine_lock = threading.Lock()
+
+
+class IdTrail(Sequence[str]):
+    """
+    Persistent append-only sequence of IDs.
+
+    A trail is a view of the first ``len`` IDs of a backing list. Appending
+    to the newest trail of a spine pushes onto that list in place, so a
+    chain of N extends shares one list of N IDs however often it is read;
+    only appending to an older trail (a branch) copies its prefix into a
+    new list. len() and append() on the spine are O(1). Compares equal to
+    any sequence with the same IDs, so ``chain.fill_ids == ["FIL_..."]``
+    keeps working.
+    """
+
+    __slots__ = ("_len", "_spine")
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        """
+        Create a root trail.
+
+        Args:
+            ids: Initial IDs (copied once)
+        """
+        self._spine: list[str] = list(ids)
+        self._len = len(self._spine)
+
+    @classmethod
+    def of(cls, ids: Iterable[str]) -> "IdTrail":
+        """Return ids as an IdTrail (no copy if it already is one)."""
+        return ids if isinstance(ids, IdTrail) else cls(ids)
+
+    def append(self, id_: str) -> "IdTrail":
+        """
+        Return a new trail with id_ appended (self is unchanged).
+
+        Args:
+            id_: ID to append
+        """
+        with _spine_lock:
+            if self._len == len(self._spine):
+                spine = self._spine
+                spine.append(id_)
+            else:
+                spine = self._spine[: self._len]
+                spine.append(id_)
+        node = IdTrail.__new__(IdTrail)
+        node._spine = spine
+        node._len = self._len + 1
+        return node
+
+    def _ids(self) -> list[str]:
+        """Copy of this trail's IDs (the spine may extend past them)."""
+        return self._spine[: self._len]
+
+    def __len__(self) -> int:
+        """Number of IDs."""
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[str, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> str | tuple[str, ...]:
+        """Index or slice."""
+        if isinstance(index, slice):
+            return tuple(self._ids()[index])
+        if not -self._len <= index < self._len:
+            raise IndexError("IdTrail index out of range")
+        return self._spine[index % self._len]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate oldest first."""
+        return islice(self._spine, self._len)
+
+    def __contains__(self, value: object) -> bool:
+        """Membership test."""
+        return value in self._ids()
+
+    def __eq__(self, other: object) -> bool:
+        """Equal to any list/tuple/IdTrail with the same IDs."""
+        if isinstance(other, IdTrail | list | tuple):
+            return len(other) == self._len and list(other) == self._ids()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash of the ID tuple."""
+        return hash(tuple(self._ids()))
+
+    def __repr__(self) -> str:
+        """Debug representation (list-like)."""
+        return repr(self._ids())
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Validate from list/tuple/IdTrail, serialize as a plain list[str]."""
+        from_list = core_schema.no_info_after_validator_function(
+            cls.of, handler.generate_schema(list[str])
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_list,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_list]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=handler.generate_schema(list[str])
+            ),
+        )
+
 
 class CausalityChain(BaseModel):
     """
@@ -35,14 +163,13 @@ class CausalityChain(BaseModel):
     - Event metadata (Risk/CriticalEvent have that)
 
     **Design Pattern:**
-    Workers use model_copy(update={...}) to extend chain:
+    Workers use extend(...) to extend chain (structure is shared with the
+    input chain; list fields are appended to, scalar fields are set):
     ```python
-    from backend.dtos.shared import Origin, OriginType
-
-    # Origin copied from PlatformDataDTO
-    extended = input_dto.causality.model_copy(update={
-        "strategy_directive_id": "STR_20251026_100002_abc1d2e3"
-    })
+    extended = input_dto.causality.extend(
+        strategy_directive_id="STR_20251026_100002_abc1d2e3"
+    )
+    with_fill = extended.extend(fill_ids="FIL_20251026_100009_abc1d2e3")
     output_dto.causality = extended
     ```
 
@@ -76,10 +203,12 @@ class CausalityChain(BaseModel):
     )
 
     # === Worker Output IDs (Toegevoegd tijdens pipeline flow) ===
-    signal_ids: list[str] = Field(
-        default_factory=list, description="Signal IDs - multiple signals mogelijk (confluence)"
+    signal_ids: IdTrail = Field(
+        default_factory=IdTrail, description="Signal IDs - multiple signals mogelijk (confluence)"
+    )
+    risk_ids: IdTrail = Field(
+        default_factory=IdTrail, description="Risk IDs (critical risk events)"
     )
-    risk_ids: list[str] = Field(default_factory=list, description="Risk IDs (critical risk events)")
     strategy_directive_id: str | None = Field(
         default=None, description="StrategyDirective ID - planning bridge"
     )
@@ -96,12 +225,12 @@ class CausalityChain(BaseModel):
     execution_command_id: str | None = Field(
         default=None, description="ExecutionCommand ID - final aggregated execution instruction"
     )
-    order_ids: list[str] = Field(
-        default_factory=list,
+    order_ids: IdTrail = Field(
+        default_factory=IdTrail,
         description="Order IDs - execution intent (toegevoegd door ExecutionHandler)",
     )
-    fill_ids: list[str] = Field(
-        default_factory=list,
+    fill_ids: IdTrail = Field(
+        default_factory=IdTrail,
         description=(
             "Fill IDs - execution reality (toegevoegd door ExchangeConnector, "
             "kan verschillen van orders bij partial fills)"
@@ -109,6 +238,7 @@ class CausalityChain(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "frozen": True,  # Immutable - origin field cannot be changed after creation
         "str_strip_whitespace": True,
         "validate_assignment": True,
@@ -140,3 +270,44 @@ class CausalityChain(BaseModel):
             ]
         },
     }
+
+    def extend(self, **ids: str | Iterable[str]) -> "CausalityChain":
+        """
+        Return a new chain with IDs added, sharing structure with this one.
+
+        List fields (signal_ids, risk_ids, order_ids, fill_ids) accept one
+        ID or an iterable of IDs and are appended to in O(1) per ID. Scalar
+        ID fields are set. This chain is left unchanged.
+
+        Args:
+            **ids: Field name → ID (or IDs for list fields)
+
+        Returns:
+            Extended CausalityChain
+
+        Raises:
+            ValueError: If a field is unknown, is origin, or gets a non-string ID
+        """
+        update: dict[str, Any] = {}
+        for field_name, value in ids.items():
+            if field_name in _TRAIL_FIELDS:
+                trail = IdTrail.of(getattr(self, field_name))
+                for id_ in (value,) if isinstance(value, str) else value:
+                    trail = trail.append(_checked_id(field_name, id_))
+                update[field_name] = trail
+            elif field_name in _SCALAR_FIELDS:
+                update[field_name] = _checked_id(field_name, value)
+            else:
+                raise ValueError(f"Cannot extend CausalityChain field: {field_name}")
+        return self.model_copy(update=update)
+
+
+_TRAIL_FIELDS = frozenset({"signal_ids", "risk_ids", "order_ids", "fill_ids"})
+_SCALAR_FIELDS = frozenset(CausalityChain.model_fields) - _TRAIL_FIELDS - {"origin"}
+
+
+def _checked_id(field_name: str, value: object) -> str:
+    """Ensure an extension value is a non-empty ID string."""
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{field_name} expects non-empty ID strings, got: {value!r}")
+    return value.strip()
@@ -1,14 +1,23 @@
 # backend/dtos/execution/__init__.py
-"""Execution DTOs - Final execution instructions."""
+"""
+Execution DTOs - Final execution instructions.
 
-from backend.core.enums import ExecutionMode
-from backend.dtos.execution.execution_command import (
-    ExecutionCommand,
-    ExecutionCommandBatch,
-)
-from backend.dtos.execution.execution_group import (
-    ExecutionGroup,
-)
+Exports are loaded lazily (PEP 562) on first access.
+"""
+
+from typing import TYPE_CHECKING
+
+from backend.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from backend.core.enums import ExecutionMode
+    from backend.dtos.execution.execution_command import (
+        ExecutionCommand,
+        ExecutionCommandBatch,
+    )
+    from backend.dtos.execution.execution_group import (
+        ExecutionGroup,
+    )
 
 __all__ = [
     "ExecutionCommand",
@@ -16,3 +25,13 @@ __all__ = [
     "ExecutionMode",
     "ExecutionGroup",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ExecutionCommand": "backend.dtos.execution.execution_command",
+        "ExecutionCommandBatch": "backend.dtos.execution.execution_command",
+        "ExecutionMode": "backend.core.enums",
+        "ExecutionGroup": "backend.dtos.execution.execution_group",
+    },
+)
@@ -74,6 +74,7 @@ class ExecutionCommand(BaseModel):
     execution_plan: ExecutionPlan | None = None
 
     model_config = {
+        "defer_build": True,
         "frozen": True,
         "extra": "forbid",
         "str_strip_whitespace": True,
@@ -200,6 +201,7 @@ class ExecutionCommandBatch(BaseModel):
     """
 
     model_config = {
+        "defer_build": True,
         "frozen": True,  # IMMUTABLE - batch integrity during execution
         "json_schema_extra": {
             "examples": [
@@ -60,6 +60,7 @@ class ExecutionGroup(BaseModel):
     """
 
     model_config = {
+        "defer_build": True,
         "frozen": False,  # MUTABLE - status/timestamps/filled_quantity evolve
         "json_schema_extra": {
             "examples": [
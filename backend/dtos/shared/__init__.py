@@ -1,6 +1,36 @@
-# backend/dtos/shared/__init__.py
-"""Shared DTO exports."""
+"""
+Shared DTO exports.
 
-from backend.dtos.shared.origin import Origin, OriginType
+Exports are loaded lazily (PEP 562) on first access.
+"""
 
-__all__ = ["Origin", "OriginType"]
+from typing import TYPE_CHECKING
+
+from backend.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from backend.dtos.shared.market_data import MarketDataSnapshot
+    from backend.dtos.shared.origin import Origin, OriginType
+    from backend.dtos.shared.strategy_quarantined import (
+        STRATEGY_QUARANTINED_EVENT,
+        StrategyQuarantined,
+    )
+
+__all__ = [
+    "MarketDataSnapshot",
+    "Origin",
+    "OriginType",
+    "STRATEGY_QUARANTINED_EVENT",
+    "StrategyQuarantined",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MarketDataSnapshot": "backend.dtos.shared.market_data",
+        "Origin": "backend.dtos.shared.origin",
+        "OriginType": "backend.dtos.shared.origin",
+        "STRATEGY_QUARANTINED_EVENT": "backend.dtos.shared.strategy_quarantined",
+        "StrategyQuarantined": "backend.dtos.shared.strategy_quarantined",
+    },
+)
@@ -128,6 +128,7 @@ class DispositionEnvelope(BaseModel):
         return self
 
     model_config = {
+        "defer_build": True,
         "frozen": True,  # Immutable after creation
         "extra": "forbid",  # No additional fields allowed
         "json_schema_extra": {
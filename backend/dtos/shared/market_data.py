@@ -0,0 +1,75 @@
+# backend/dtos/shared/market_data.py
+"""
+MarketDataSnapshot DTO: Fixed-layout market data payload.
+
+Provider payload carrying one bar (OHLCV) plus the top of the order book
+for a single symbol. This is the DTO form of a MarketDataRing record and
+is delivered to FlowInitiator inside PlatformDataDTO.payload.
+
+@layer: DTO (Shared)
+@dependencies: [pydantic, datetime]
+@responsibilities: [market data payload contract]
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+__all__ = ["MarketDataSnapshot"]
+
+
+class MarketDataSnapshot(BaseModel):
+    """
+    OHLCV bar plus best bid/ask for one symbol at one point in time.
+
+    Prices are floats (provider data, not accounting values); Decimal
+    conversion happens in planning DTOs where precision matters.
+
+    Attributes:
+        symbol: Trading pair (e.g., BTC_USDT)
+        timestamp: Bar / snapshot timestamp (UTC)
+        open: Open price
+        high: High price
+        low: Low price
+        close: Close price
+        volume: Traded volume
+        bid_price: Best bid price
+        bid_size: Best bid size
+        ask_price: Best ask price
+        ask_size: Best ask size
+    """
+
+    symbol: str = Field(description="Trading pair (e.g., BTC_USDT)")
+    timestamp: datetime = Field(description="Snapshot timestamp (UTC)")
+    open: float = Field(ge=0, description="Open price")
+    high: float = Field(ge=0, description="High price")
+    low: float = Field(ge=0, description="Low price")
+    close: float = Field(ge=0, description="Close price")
+    volume: float = Field(ge=0, description="Traded volume")
+    bid_price: float = Field(ge=0, description="Best bid price")
+    bid_size: float = Field(ge=0, description="Best bid size")
+    ask_price: float = Field(ge=0, description="Best ask price")
+    ask_size: float = Field(ge=0, description="Best ask size")
+
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "symbol": "BTC_USDT",
+                    "timestamp": "2025-11-09T14:30:00Z",
+                    "open": 50000.0,
+                    "high": 50120.5,
+                    "low": 49980.0,
+                    "close": 50100.0,
+                    "volume": 12.5,
+                    "bid_price": 50099.5,
+                    "bid_size": 0.8,
+                    "ask_price": 50100.5,
+                    "ask_size": 1.2,
+                }
+            ]
+        },
+    }
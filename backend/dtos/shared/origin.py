@@ -44,6 +44,7 @@ class Origin(BaseModel):
     type: OriginType
 
     model_config = {
+        "defer_build": True,
         "frozen": True,
         "json_schema_extra": {
             "examples": [
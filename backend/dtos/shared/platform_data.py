@@ -55,6 +55,7 @@ class PlatformDataDTO(BaseModel):
     )
 
     model_config = ConfigDict(
+        defer_build=True,
         frozen=True,
         json_schema_extra={
             "examples": [
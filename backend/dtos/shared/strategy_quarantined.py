@@ -0,0 +1,74 @@
+# backend/dtos/shared/strategy_quarantined.py
+"""
+StrategyQuarantined DTO: Watchdog quarantine notification.
+
+Published by EventBus (PLATFORM scope) when HandlerWatchdog quarantines a
+strategy after repeated handler deadline overruns. All non-critical
+subscriptions of the strategy have been removed at publish time.
+
+@layer: DTO (Shared)
+@dependencies: [pydantic, datetime]
+@responsibilities: [quarantine notification contract]
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+__all__ = ["STRATEGY_QUARANTINED_EVENT", "StrategyQuarantined"]
+
+# Event name used by EventBus to announce a quarantine
+STRATEGY_QUARANTINED_EVENT = "STRATEGY_QUARANTINED"
+
+
+class StrategyQuarantined(BaseModel):
+    """
+    Notification that a strategy was auto-unsubscribed by the watchdog.
+
+    Attributes:
+        strategy_instance_id: Quarantined strategy (None for a platform-level
+            non-critical subscription, which is quarantined on its own)
+        trigger_subscription_id: Subscription whose overruns triggered quarantine
+        event_name: Event the triggering handler was subscribed to
+        handler: Qualified name of the triggering handler
+        removed_subscription_ids: All subscriptions removed by the quarantine
+        consecutive_overruns: Overrun streak that reached the limit
+        deadline_ms: Deadline configured at subscribe() time
+        p99_handler_ms: p99 handler duration observed by the watchdog
+        quarantined_at: When the quarantine was applied (UTC)
+    """
+
+    strategy_instance_id: str | None = Field(
+        default=None, description="Quarantined strategy (None = single platform subscription)"
+    )
+    trigger_subscription_id: str = Field(description="Subscription that exceeded its deadline")
+    event_name: str = Field(description="Event the triggering handler listened to")
+    handler: str = Field(description="Qualified name of the triggering handler")
+    removed_subscription_ids: list[str] = Field(
+        default_factory=list, description="Subscriptions removed by the quarantine"
+    )
+    consecutive_overruns: int = Field(ge=1, description="Overrun streak that hit the limit")
+    deadline_ms: float = Field(gt=0, description="Per-invocation deadline (ms)")
+    p99_handler_ms: float = Field(ge=0, description="Observed p99 handler duration (ms)")
+    quarantined_at: datetime = Field(description="When the quarantine was applied (UTC)")
+
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "strategy_instance_id": "STR_A",
+                    "trigger_subscription_id": "SUB_1A2B3C4D5E6F",
+                    "event_name": "TICK",
+                    "handler": "SlowDetector.on_tick",
+                    "removed_subscription_ids": ["SUB_1A2B3C4D5E6F", "SUB_7A8B9C0D1E2F"],
+                    "consecutive_overruns": 3,
+                    "deadline_ms": 150.0,
+                    "p99_handler_ms": 412.7,
+                    "quarantined_at": "2025-11-09T14:30:00Z",
+                }
+            ]
+        },
+    }
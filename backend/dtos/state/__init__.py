@@ -3,13 +3,26 @@
 State DTOs - Ledger-owned containers for tracking execution state.
 
 These DTOs represent the state of orders and fills, owned exclusively
-by StrategyLedger.
+by StrategyLedger. Exports are loaded lazily (PEP 562) on first access.
 """
 
-from backend.dtos.state.fill import Fill
-from backend.dtos.state.order import Order
+from typing import TYPE_CHECKING
+
+from backend.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from backend.dtos.state.fill import Fill
+    from backend.dtos.state.order import Order
 
 __all__ = [
     "Fill",
     "Order",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Fill": "backend.dtos.state.fill",
+        "Order": "backend.dtos.state.order",
+    },
+)
@@ -90,6 +90,7 @@ class Fill(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "frozen": True,  # Immutable - fills are historical facts
         "extra": "forbid",
         "str_strip_whitespace": True,
@@ -110,6 +110,7 @@ class Order(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "frozen": False,  # Mutable for status updates
         "extra": "forbid",
         "str_strip_whitespace": True,
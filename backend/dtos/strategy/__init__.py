@@ -1,16 +1,26 @@
-"""Strategy DTOs."""
+"""
+Strategy DTOs.
 
-from backend.core.enums import DirectiveScope, ExecutionAction
-from backend.dtos.strategy.entry_plan import EntryPlan
-from backend.dtos.strategy.execution_plan import ExecutionPlan
-from backend.dtos.strategy.exit_plan import ExitPlan
-from backend.dtos.strategy.risk import Risk
-from backend.dtos.strategy.signal import Signal
-from backend.dtos.strategy.size_plan import SizePlan
-from backend.dtos.strategy.strategy_directive import (
-    ExecutionPolicy,
-    StrategyDirective,
-)
+Exports are loaded lazily (PEP 562): a model's module is imported on first
+access, so worker processes only pay for the DTOs they use.
+"""
+
+from typing import TYPE_CHECKING
+
+from backend.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from backend.core.enums import DirectiveScope, ExecutionAction
+    from backend.dtos.strategy.entry_plan import EntryPlan
+    from backend.dtos.strategy.execution_plan import ExecutionPlan
+    from backend.dtos.strategy.exit_plan import ExitPlan
+    from backend.dtos.strategy.risk import Risk
+    from backend.dtos.strategy.signal import Signal
+    from backend.dtos.strategy.size_plan import SizePlan
+    from backend.dtos.strategy.strategy_directive import (
+        ExecutionPolicy,
+        StrategyDirective,
+    )
 
 __all__ = [
     "DirectiveScope",
@@ -24,3 +34,19 @@ __all__ = [
     "StrategyDirective",
     "Risk",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DirectiveScope": "backend.core.enums",
+        "EntryPlan": "backend.dtos.strategy.entry_plan",
+        "ExecutionAction": "backend.core.enums",
+        "ExecutionPlan": "backend.dtos.strategy.execution_plan",
+        "ExecutionPolicy": "backend.dtos.strategy.strategy_directive",
+        "ExitPlan": "backend.dtos.strategy.exit_plan",
+        "Signal": "backend.dtos.strategy.signal",
+        "SizePlan": "backend.dtos.strategy.size_plan",
+        "StrategyDirective": "backend.dtos.strategy.strategy_directive",
+        "Risk": "backend.dtos.strategy.risk",
+    },
+)
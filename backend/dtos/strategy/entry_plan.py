@@ -94,6 +94,7 @@ class EntryPlan(BaseModel):
     stop_price: Decimal | None = Field(None, description="Stop price for STOP_LIMIT orders")
 
     model_config = {
+        "defer_build": True,
         "frozen": False,  # Mutable for updates
         "str_strip_whitespace": True,
         "validate_assignment": True,
@@ -201,6 +201,7 @@ class ExecutionPlan(BaseModel):
         return v
 
     model_config = {
+        "defer_build": True,
         "frozen": True,
         "extra": "forbid",
         "json_schema_extra": {
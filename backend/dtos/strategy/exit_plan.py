@@ -102,6 +102,7 @@ class ExitPlan(BaseModel):
         return v
 
     model_config = {
+        "defer_build": True,
         "frozen": True,
         "extra": "forbid",
         "json_schema_extra": {
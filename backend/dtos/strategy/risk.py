@@ -98,6 +98,7 @@ class Risk(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "frozen": True,
         "extra": "forbid",
         "json_schema_extra": {
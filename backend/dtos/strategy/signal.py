@@ -134,6 +134,7 @@ class Signal(BaseModel):
         return v.astimezone(UTC)
 
     model_config = {
+        "defer_build": True,
         "frozen": True,
         "extra": "forbid",
         "json_schema_extra": {
@@ -98,6 +98,7 @@ class SizePlan(BaseModel):
         return v
 
     model_config = {
+        "defer_build": True,
         "frozen": False,  # Mutable for updates
         "str_strip_whitespace": True,
         "validate_assignment": True,
@@ -3,7 +3,7 @@
 StrategyDirective and sub-directive DTOs for quant-driven trade planning.
 
 @layer: Strategy
-@dependencies: backend.utils.id_generators, backend.core.enums
+@dependencies: backend.utils.id_generators, backend.utils.clock, backend.core.enums
 @responsibilities:
     - Bridge detection framework (Signal, Risk)
       and Planning Layer (EntryPlan, SizePlan, ExitPlan, ExecutionPlan)
@@ -13,7 +13,7 @@ StrategyDirective and sub-directive DTOs for quant-driven trade planning.
 """
 
 # Standard library imports
-from datetime import UTC, datetime
+from datetime import datetime
 from decimal import Decimal
 from typing import Annotated
 
@@ -23,6 +23,7 @@ from pydantic import BaseModel, Field, ValidationInfo, field_validator
 # Application imports
 from backend.core.enums import BatchExecutionMode, DirectiveScope
 from backend.dtos.causality import CausalityChain
+from backend.utils.clock import get_clock
 from backend.utils.id_generators import generate_strategy_directive_id
 
 
@@ -54,6 +55,8 @@ class EntryDirective(BaseModel):
         description=("Maximum acceptable slippage as decimal (e.g., 0.001 = 0.1%)"),
     )
 
+    model_config = {"defer_build": True}
+
 
 class SizeDirective(BaseModel):
     """
@@ -79,6 +82,8 @@ class SizeDirective(BaseModel):
         description=("Maximum account risk as decimal (e.g., 0.02 = 2% of account)"),
     )
 
+    model_config = {"defer_build": True}
+
 
 class ExitDirective(BaseModel):
     """
@@ -110,6 +115,8 @@ class ExitDirective(BaseModel):
         description=("Stop loss distance as decimal (e.g., 0.015 = 1.5% from entry)"),
     )
 
+    model_config = {"defer_build": True}
+
 
 class ExecutionDirective(BaseModel):
     """
@@ -138,6 +145,8 @@ class ExecutionDirective(BaseModel):
         description=("Maximum total slippage across all executions as decimal (e.g., 0.01 = 1%)"),
     )
 
+    model_config = {"defer_build": True}
+
 
 class ExecutionPolicy(BaseModel):
     """
@@ -183,6 +192,7 @@ class ExecutionPolicy(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "frozen": True,  # Immutable after creation
         "str_strip_whitespace": True,
     }
@@ -387,7 +397,7 @@ class StrategyDirective(BaseModel):
         ..., description="ID of StrategyPlanner that produced this directive"
     )
     decision_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=lambda: get_clock().now(),
         description="Auto-set UTC timestamp of directive creation",
     )
     causality: CausalityChain = Field(
@@ -462,6 +472,7 @@ class StrategyDirective(BaseModel):
         return v
 
     model_config = {
+        "defer_build": True,
         "frozen": True,  # Immutable after creation - strategic decisions don't change
         "str_strip_whitespace": True,
         "json_schema_extra": {
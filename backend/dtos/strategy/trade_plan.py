@@ -33,7 +33,12 @@ class TradePlan(BaseModel):
     status: TradeStatus = Field(..., description="Current lifecycle state.")
     created_at: datetime = Field(..., description="Creation timestamp (UTC).")
 
-    model_config = {"frozen": False, "str_strip_whitespace": True, "validate_assignment": True}
+    model_config = {
+        "defer_build": True,
+        "frozen": False,
+        "str_strip_whitespace": True,
+        "validate_assignment": True,
+    }
 
     @field_validator("plan_id")
     @classmethod
@@ -0,0 +1,19 @@
+"""Replay infrastructure - shared historical data and parameter sweeps."""
+
+from backend.replay.shared_frames import FrameFormatError, ReplayBar, SharedBarFrame
+from backend.replay.sweep_runner import (
+    ParameterSweepRunner,
+    StrategyFactory,
+    SweepResult,
+    SweepStrategy,
+)
+
+__all__ = [
+    "FrameFormatError",
+    "ParameterSweepRunner",
+    "ReplayBar",
+    "SharedBarFrame",
+    "StrategyFactory",
+    "SweepResult",
+    "SweepStrategy",
+]
@@ -0,0 +1,596 @@
+# backend/replay/analytics_store.py
+"""
+ColumnarAnalyticsSink - Typed column buffers for post-run DTO analysis.
+
+After a backtest, PnL / slippage / hit-rate analysis over thousands of
+StrategyDirective, ExecutionCommand and Fill objects should not iterate
+pydantic models. This sink appends pipeline DTOs into typed column buffers
+(``array.array``), one table per DTO class, and writes them to disk as
+column files that load back without any DTO construction.
+
+Column encoding (derived once per DTO class from its field annotations):
+    decimal   → int64, scaled by 10**scale (ROUND_HALF_EVEN)
+    timestamp → int64, UTC epoch nanoseconds
+    int       → int64
+    bool      → int8
+    float     → float64 (None → NaN)
+    category  → int32 dictionary codes (str, Enum, Literal)
+    json      → int32 dictionary codes of JSON text (lists, dicts, other)
+Nested models are flattened into dotted columns (``causality.origin.id``).
+Integer nulls are the NULL_INT sentinel, dictionary nulls are code -1.
+
+Buffers support the buffer protocol, so ``numpy.frombuffer(column, "<i8")``
+or ``pyarrow.py_buffer(column)`` wrap them without copying. With pyarrow
+installed (optional), tables also export to Arrow / Parquet / Feather.
+
+File format (``.st3col``, little-endian):
+    magic (8s) + header length (I) + JSON header + raw column buffers
+
+@layer: Backend (Replay)
+@dependencies: [array, decimal, json, struct, threading, pydantic, pydantic_core,
+                pyarrow (optional)]
+@responsibilities:
+    - Infer a column schema per DTO class
+    - Append DTOs into typed column buffers
+    - Write / read compact column files
+    - Decode columns and export to Arrow when available
+"""
+
+# Standard library
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import threading
+import types
+import typing
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_HALF_EVEN, Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Generic, Literal, TypeAlias, TypeVar, cast
+
+# Third-party
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+__all__ = [
+    "NULL_INT",
+    "ColumnSpec",
+    "ColumnTable",
+    "ColumnarAnalyticsSink",
+    "ColumnFormatError",
+]
+
+NULL_INT = -(2**63)
+
+ColumnKind = Literal["decimal", "timestamp", "int", "bool", "float", "category", "json"]
+
+# Float columns hold float64, every other kind integers (values or codes)
+_Buffer: TypeAlias = "array[int] | array[float]"
+_Value = TypeVar("_Value", int, float)
+
+_MAGIC = b"ST3COL01"
+_PREAMBLE = struct.Struct("<8sI")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_TYPECODES: dict[str, str] = {
+    "decimal": "q",
+    "timestamp": "q",
+    "int": "q",
+    "bool": "b",
+    "float": "d",
+    "category": "i",
+    "json": "i",
+}
+
+
+class ColumnFormatError(Exception):
+    """Raised when a file is not a valid column file."""
+
+
+@dataclass
+class ColumnSpec:
+    """
+    One column of a DTO table.
+
+    Attributes:
+        name: Dotted field path (e.g. ``causality.origin.id``)
+        kind: Encoding (see module docstring)
+        scale: Decimal places kept for decimal columns
+        dictionary: Distinct values of category/json columns (code = index)
+    """
+
+    name: str
+    kind: ColumnKind
+    scale: int = 0
+    dictionary: list[str] = field(default_factory=list)
+
+
+# === Schema inference ===
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Strip Annotated and Optional wrappers."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _unwrap(typing.get_args(annotation)[0])
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _unwrap(args[0])
+    return annotation
+
+
+def _kind_of(annotation: Any) -> ColumnKind:
+    """Column kind for a (non-model) field annotation."""
+    if typing.get_origin(annotation) is Literal:
+        return "category"
+    if not isinstance(annotation, type):
+        return "json"
+    if issubclass(annotation, bool):
+        return "bool"
+    if issubclass(annotation, Decimal):
+        return "decimal"
+    if issubclass(annotation, datetime):
+        return "timestamp"
+    if issubclass(annotation, int):
+        return "int"
+    if issubclass(annotation, float):
+        return "float"
+    if issubclass(annotation, str | Enum):
+        return "category"
+    return "json"
+
+
+def _infer(
+    model: type[BaseModel], scale: int, prefix: tuple[str, ...] = ()
+) -> list[tuple[tuple[str, ...], ColumnSpec]]:
+    """Flatten a model's fields into (attribute path, column spec) pairs."""
+    columns = []
+    for name, info in model.model_fields.items():
+        annotation = _unwrap(info.annotation)
+        path = (*prefix, name)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            columns.extend(_infer(annotation, scale, path))
+            continue
+        kind = _kind_of(annotation)
+        columns.append((path, ColumnSpec(".".join(path), kind, scale if kind == "decimal" else 0)))
+    return columns
+
+
+# === Encoding ===
+
+
+def _getter(path: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Attribute path getter that yields None past a None parent."""
+    if len(path) == 1:
+        attribute = path[0]
+        return lambda obj: getattr(obj, attribute)
+
+    def get(obj: Any) -> Any:
+        for attribute in path:
+            if obj is None:
+                return None
+            obj = getattr(obj, attribute)
+        return obj
+
+    return get
+
+
+def _to_ns(value: datetime) -> int:
+    """Aware (or UTC-naive) datetime → epoch nanoseconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+class _Column(Generic[_Value]):
+    """Buffer + encoder for one column (``_Column[float]`` for float columns only)."""
+
+    __slots__ = ("codes", "data", "encode", "get", "pending", "spec")
+
+    def __init__(self, path: tuple[str, ...], spec: ColumnSpec) -> None:
+        self.spec = spec
+        self.get = _getter(path)
+        self.data: array[_Value] = array(_TYPECODES[spec.kind])
+        self.codes: dict[str, int] = {}
+        self.encode: Callable[[Any], _Value] = getattr(self, f"_encode_{spec.kind}")
+        self.pending: _Value | None = None
+
+    def stage(self, dto: BaseModel) -> None:
+        """Encode this column's value of *dto* (raises before anything is appended)."""
+        self.pending = self.encode(self.get(dto))
+
+    def commit(self) -> None:
+        """Append the staged value."""
+        assert self.pending is not None
+        self.data.append(self.pending)
+
+    def _encode_decimal(self, value: Any) -> int:
+        if value is None:
+            return NULL_INT
+        scaled = (Decimal(value) * (10**self.spec.scale)).to_integral_value(ROUND_HALF_EVEN)
+        return self._checked_int(int(scaled))
+
+    def _encode_timestamp(self, value: Any) -> int:
+        return NULL_INT if value is None else _to_ns(value)
+
+    def _encode_int(self, value: Any) -> int:
+        return NULL_INT if value is None else self._checked_int(int(value))
+
+    def _encode_bool(self, value: Any) -> int:
+        return -1 if value is None else int(bool(value))
+
+    def _encode_float(self, value: Any) -> float:
+        return float("nan") if value is None else float(value)
+
+    def _encode_category(self, value: Any) -> int:
+        if value is None:
+            return -1
+        text = str(value.value) if isinstance(value, Enum) else str(value)
+        return self._code(text)
+
+    def _encode_json(self, value: Any) -> int:
+        if value is None:
+            return -1
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            value = list(value)  # e.g. IdTrail
+        return self._code(to_json(value).decode())
+
+    def _checked_int(self, value: int) -> int:
+        if not NULL_INT < value < 2**63:
+            raise OverflowError(f"Column '{self.spec.name}': {value} does not fit in int64")
+        return value
+
+    def _code(self, text: str) -> int:
+        code = self.codes.get(text)
+        if code is None:
+            code = self.codes[text] = len(self.spec.dictionary)
+            self.spec.dictionary.append(text)
+        return code
+
+
+class _Table:
+    """Column buffers of one DTO class."""
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, model: type[BaseModel], scale: int) -> None:
+        self.columns: list[_Column[int] | _Column[float]] = [
+            _Column[float](path, spec) if spec.kind == "float" else _Column[int](path, spec)
+            for path, spec in _infer(model, scale)
+        ]
+        self.rows = 0
+
+    def append(self, dto: BaseModel) -> None:
+        # Encode the whole row first so a failing value leaves no partial row
+        for column in self.columns:
+            column.stage(dto)
+        for column in self.columns:
+            column.commit()
+        self.rows += 1
+
+
+# === Sink ===
+
+
+class ColumnarAnalyticsSink:
+    """
+    Appends pipeline DTOs into typed column buffers, one table per DTO class.
+
+    **Usage:**
+        >>> sink = ColumnarAnalyticsSink()
+        >>> bus.subscribe("FILL_RECEIVED", sink.append, platform_scope)
+        >>> ...  # run the backtest
+        >>> sink.write(Path("results/run_42"))   # Fill.st3col, ...
+        >>> fills = ColumnTable.read(Path("results/run_42/Fill.st3col"))
+        >>> sum(fills.decimals("filled_quantity"))
+
+    **Thread Safety:**
+        append() and write() take an internal lock.
+    """
+
+    def __init__(self, decimal_scale: int = 8) -> None:
+        """
+        Configure sink.
+
+        Args:
+            decimal_scale: Decimal places kept in decimal columns (0-18)
+
+        Raises:
+            ValueError: If decimal_scale is out of range
+        """
+        if not 0 <= decimal_scale <= 18:
+            raise ValueError(f"decimal_scale must be between 0 and 18, got: {decimal_scale}")
+        self._scale = decimal_scale
+        self._tables: dict[type[BaseModel], _Table] = {}
+        self._parts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def append(self, dto: BaseModel) -> None:
+        """
+        Append one DTO (EventBus handler signature).
+
+        Raises:
+            OverflowError: If a scaled decimal does not fit in int64
+        """
+        with self._lock:
+            table = self._tables.get(type(dto))
+            if table is None:
+                table = self._tables[type(dto)] = _Table(type(dto), self._scale)
+            table.append(dto)
+
+    def extend(self, dtos: Iterable[BaseModel]) -> None:
+        """Append many DTOs."""
+        for dto in dtos:
+            self.append(dto)
+
+    def rows(self, model: type[BaseModel]) -> int:
+        """Buffered rows of a DTO class."""
+        with self._lock:
+            table = self._tables.get(model)
+            return 0 if table is None else table.rows
+
+    def table(self, model: type[BaseModel]) -> ColumnTable:
+        """Snapshot of the buffered rows of a DTO class (copies buffers)."""
+        with self._lock:
+            table = self._tables.get(model)
+            if table is None:
+                return ColumnTable(model.__name__, 0, [], {})
+            return _snapshot(model.__name__, table)
+
+    def write(self, directory: Path | str) -> list[Path]:
+        """
+        Write every non-empty table and reset the buffers.
+
+        The first write of a class produces ``<Class>.st3col``; later writes
+        produce ``<Class>.<n>.st3col`` parts.
+
+        Args:
+            directory: Target directory (created if missing)
+
+        Returns:
+            Paths written
+        """
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            snapshots = [
+                _snapshot(model.__name__, table)
+                for model, table in self._tables.items()
+                if table.rows
+            ]
+            self._tables.clear()
+            paths = []
+            for snapshot in snapshots:
+                part = self._parts.get(snapshot.dto, 0)
+                self._parts[snapshot.dto] = part + 1
+                suffix = ".st3col" if part == 0 else f".{part}.st3col"
+                paths.append(snapshot.write(target / f"{snapshot.dto}{suffix}"))
+        return paths
+
+
+def _snapshot(dto: str, table: _Table) -> ColumnTable:
+    """Copy a live table into an immutable ColumnTable."""
+    specs = [
+        ColumnSpec(c.spec.name, c.spec.kind, c.spec.scale, list(c.spec.dictionary))
+        for c in table.columns
+    ]
+    data: dict[str, _Buffer] = {c.spec.name: array(c.data.typecode, c.data) for c in table.columns}
+    return ColumnTable(dto, table.rows, specs, data)
+
+
+# === Tables ===
+
+
+class ColumnTable:
+    """
+    Decoded-on-demand columns of one DTO class.
+
+    Raw buffers (``column(name)``) are what vectorized analysis should use;
+    the decode helpers return Python values for convenience.
+    """
+
+    def __init__(
+        self, dto: str, rows: int, specs: list[ColumnSpec], data: dict[str, _Buffer]
+    ) -> None:
+        """
+        Wrap column buffers (use ColumnarAnalyticsSink.table() or read()).
+
+        Args:
+            dto: DTO class name
+            rows: Row count
+            specs: Column specs in field order
+            data: Column name → buffer
+        """
+        self.dto = dto
+        self.rows = rows
+        self.specs = {spec.name: spec for spec in specs}
+        self._data = data
+
+    @property
+    def column_names(self) -> list[str]:
+        """Column names in field order."""
+        return list(self.specs)
+
+    def column(self, name: str) -> _Buffer:
+        """Raw column buffer (int64 / int8 / float64 / int32 codes)."""
+        return self._data[name]
+
+    def _ints(self, name: str) -> array[int]:
+        """Buffer of an integer-coded column (every kind except float)."""
+        return cast("array[int]", self._data[name])
+
+    def decimals(self, name: str) -> list[Decimal | None]:
+        """Decode a decimal column."""
+        spec = self._spec(name, "decimal")
+        return [None if v == NULL_INT else Decimal(v).scaleb(-spec.scale) for v in self._ints(name)]
+
+    def timestamps(self, name: str) -> list[datetime | None]:
+        """Decode a timestamp column (microsecond precision)."""
+        self._spec(name, "timestamp")
+        return [
+            None if v == NULL_INT else _EPOCH + timedelta(microseconds=v // 1000)
+            for v in self._ints(name)
+        ]
+
+    def values(self, name: str) -> list[Any]:
+        """Decode any column to Python values."""
+        spec = self.specs[name]
+        if spec.kind == "float":
+            return list(self._data[name])
+        data = self._ints(name)
+        if spec.kind == "decimal":
+            return self.decimals(name)
+        if spec.kind == "timestamp":
+            return self.timestamps(name)
+        if spec.kind == "int":
+            return [None if v == NULL_INT else v for v in data]
+        if spec.kind == "bool":
+            return [None if v < 0 else bool(v) for v in data]
+        if spec.kind == "category":
+            return [None if v < 0 else spec.dictionary[v] for v in data]
+        return [None if v < 0 else json.loads(spec.dictionary[v]) for v in data]
+
+    def _spec(self, name: str, kind: ColumnKind) -> ColumnSpec:
+        spec = self.specs[name]
+        if spec.kind != kind:
+            raise TypeError(f"Column '{name}' is {spec.kind}, not {kind}")
+        return spec
+
+    # === Files ===
+
+    def write(self, path: Path | str) -> Path:
+        """
+        Atomically write the table as a column file.
+
+        Args:
+            path: Target file
+
+        Returns:
+            Path written
+        """
+        header = {
+            "dto": self.dto,
+            "rows": self.rows,
+            "columns": [
+                {
+                    "name": spec.name,
+                    "kind": spec.kind,
+                    "scale": spec.scale,
+                    "dictionary": spec.dictionary,
+                }
+                for spec in self.specs.values()
+            ],
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode()
+        target = Path(path)
+        tmp_path = target.with_name(f".{target.name}.tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(_PREAMBLE.pack(_MAGIC, len(header_bytes)))
+            handle.write(header_bytes)
+            for name in self.specs:
+                handle.write(_little_endian(self._data[name]).tobytes())
+        os.replace(tmp_path, target)
+        return target
+
+    @classmethod
+    def read(cls, path: Path | str) -> ColumnTable:
+        """
+        Load a column file.
+
+        Raises:
+            ColumnFormatError: If the file is not a valid column file
+        """
+        raw = Path(path).read_bytes()
+        if len(raw) < _PREAMBLE.size:
+            raise ColumnFormatError(f"{path}: file too short")
+        magic, header_len = _PREAMBLE.unpack_from(raw)
+        if magic != _MAGIC:
+            raise ColumnFormatError(f"{path}: not a column file")
+        offset = _PREAMBLE.size + header_len
+        header = json.loads(raw[_PREAMBLE.size : offset])
+        rows = header["rows"]
+        specs: list[ColumnSpec] = []
+        data: dict[str, _Buffer] = {}
+        for column in header["columns"]:
+            spec = ColumnSpec(column["name"], column["kind"], column["scale"], column["dictionary"])
+            buffer: _Buffer = array(_TYPECODES[spec.kind])
+            end = offset + rows * buffer.itemsize
+            if end > len(raw):
+                raise ColumnFormatError(f"{path}: column '{spec.name}' truncated")
+            buffer.frombytes(raw[offset:end])
+            specs.append(spec)
+            data[spec.name] = _little_endian(buffer)
+            offset = end
+        return cls(header["dto"], rows, specs, data)
+
+    # === Arrow (optional dependency) ===
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to a pyarrow Table (decimals as decimal128, categories as
+        dictionary arrays, timestamps as ns UTC).
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = _pyarrow()
+        arrays = []
+        for name, spec in self.specs.items():
+            if spec.kind == "float":
+                arrays.append(pa.array(list(self._data[name]), pa.float64()))
+                continue
+            data = self._ints(name)
+            if spec.kind == "decimal":
+                arrays.append(pa.array(self.decimals(name), pa.decimal128(38, spec.scale)))
+            elif spec.kind == "timestamp":
+                values = [None if v == NULL_INT else v for v in data]
+                arrays.append(pa.array(values, pa.timestamp("ns", tz="UTC")))
+            elif spec.kind in ("category", "json"):
+                codes = pa.array([None if v < 0 else v for v in data], pa.int32())
+                dictionary = pa.array(spec.dictionary, pa.string())
+                arrays.append(pa.DictionaryArray.from_arrays(codes, dictionary))
+            else:
+                arrays.append(pa.array(self.values(name)))
+        return pa.Table.from_arrays(arrays, names=list(self.specs))
+
+    def write_parquet(self, path: Path | str) -> Path:
+        """Write as Parquet (requires pyarrow)."""
+        _pyarrow()
+        import pyarrow.parquet as pq  # noqa: PLC0415 # pyright: ignore[reportMissingImports]
+
+        pq.write_table(self.to_arrow(), str(path))
+        return Path(path)
+
+    def write_feather(self, path: Path | str) -> Path:
+        """Write as Feather v2 (requires pyarrow)."""
+        _pyarrow()
+        from pyarrow import feather  # noqa: PLC0415 # pyright: ignore[reportMissingImports]
+
+        feather.write_feather(self.to_arrow(), str(path))
+        return Path(path)
+
+
+def _little_endian(buffer: _Buffer) -> _Buffer:
+    """Buffers are stored little-endian; swap on big-endian hosts."""
+    if sys.byteorder == "big":
+        buffer = array(buffer.typecode, buffer)
+        buffer.byteswap()
+    return buffer
+
+
+def _pyarrow() -> Any:
+    """Import pyarrow or explain how to get it."""
+    try:
+        import pyarrow  # noqa: PLC0415 # pyright: ignore[reportMissingImports]
+    except ModuleNotFoundError as e:
+        raise ImportError(
+            "Arrow/Parquet/Feather export requires pyarrow: pip install -e '.[analytics]'"
+        ) from e
+    return pyarrow
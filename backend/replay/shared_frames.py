@@ -0,0 +1,236 @@
+# backend/replay/shared_frames.py
+"""
+SharedBarFrame - Decode-once historical bar stream in shared memory.
+
+Packs a historical OHLCV stream into a fixed-layout binary frame inside a
+``multiprocessing.shared_memory`` block. The frame is built once by the
+parent process; sweep workers attach by name and read records in place,
+so no per-process decoding, pickling or DTO construction is needed.
+
+Layout (little-endian):
+    header: magic (8s) + record count (Q)
+    record: timestamp_ns (q) + symbol_id (q) + open/high/low/close/volume (5d)
+
+@layer: Backend (Replay)
+@dependencies: [struct, multiprocessing.shared_memory, backend.utils.shared_memory]
+@responsibilities:
+    - Define the ReplayBar record and its binary layout
+    - Create / attach / release shared-memory bar frames
+    - Provide zero-DTO iteration over (a window of) the frame
+"""
+
+# Standard library
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable, Iterator
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import NamedTuple
+
+# Project modules
+from backend.utils.shared_memory import (
+    attach_shared_memory,
+    create_shared_memory,
+    destroy_shared_memory,
+    shared_buffer,
+)
+
+__all__ = ["FrameFormatError", "ReplayBar", "SharedBarFrame"]
+
+_MAGIC = b"ST3BAR01"
+_HEADER = struct.Struct("<8sQ")
+_RECORD = struct.Struct("<qq5d")
+_ITER_CHUNK = 4096  # records copied out per iteration step
+
+
+class FrameFormatError(Exception):
+    """Raised when a shared memory block does not contain a bar frame."""
+
+
+class ReplayBar(NamedTuple):
+    """
+    Single historical bar as read from a SharedBarFrame.
+
+    Attributes:
+        timestamp_ns: Bar timestamp (UTC epoch nanoseconds)
+        symbol_id: Interned symbol identifier
+        open: Open price
+        high: High price
+        low: Low price
+        close: Close price
+        volume: Traded volume
+    """
+
+    timestamp_ns: int
+    symbol_id: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class SharedBarFrame:
+    """
+    Read-mostly shared-memory container for a historical bar stream.
+
+    The creating process owns the block and must ``unlink()`` it; attached
+    processes only ``close()``. Attached frames expose read APIs only.
+
+    **Usage:**
+        >>> with SharedBarFrame.create(bars) as frame:
+        ...     worker_frame = SharedBarFrame.attach(frame.name)  # other process
+        ...     for bar in worker_frame:
+        ...         strategy.on_bar(bar)
+    """
+
+    def __init__(self, shm: SharedMemory, count: int, owner: bool) -> None:
+        """
+        Wrap an initialized shared memory block (use create/attach).
+
+        Args:
+            shm: Shared memory block containing header + records
+            count: Number of records in the frame
+            owner: True if this process created (and must unlink) the block
+        """
+        self._shm = shm
+        self._buf = shared_buffer(shm)
+        self._count = count
+        self._owner = owner
+        self._closed = False
+
+    @classmethod
+    def create(cls, bars: Iterable[ReplayBar], name: str | None = None) -> SharedBarFrame:
+        """
+        Decode a bar stream once into a new shared memory block.
+
+        Args:
+            bars: Historical bars (materialized once to size the block)
+            name: Optional shared memory name (random if None)
+
+        Returns:
+            Owning SharedBarFrame
+        """
+        records = bars if isinstance(bars, list) else list(bars)
+        size = _HEADER.size + max(len(records), 1) * _RECORD.size
+        shm = create_shared_memory(size, name)
+        buf = shared_buffer(shm)
+        _HEADER.pack_into(buf, 0, _MAGIC, len(records))
+        offset = _HEADER.size
+        for bar in records:
+            _RECORD.pack_into(buf, offset, *bar)
+            offset += _RECORD.size
+        return cls(shm, len(records), owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedBarFrame:
+        """
+        Attach to an existing frame created by another process.
+
+        The attachment is not registered with the resource tracker, so a
+        worker exiting never unlinks the parent's block.
+
+        Args:
+            name: Shared memory name (SharedBarFrame.name of the owner)
+
+        Returns:
+            Non-owning SharedBarFrame
+
+        Raises:
+            FileNotFoundError: If no block with that name exists
+            FrameFormatError: If the block is not a bar frame
+        """
+        shm = attach_shared_memory(name)
+        magic, count = _HEADER.unpack_from(shared_buffer(shm), 0)
+        if magic != _MAGIC:
+            shm.close()
+            raise FrameFormatError(f"Shared memory '{name}' is not a bar frame")
+        return cls(shm, count, owner=False)
+
+    @property
+    def name(self) -> str:
+        """Shared memory name used by workers to attach."""
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by header + records."""
+        return _HEADER.size + self._count * _RECORD.size
+
+    def __len__(self) -> int:
+        """Number of bars in the frame."""
+        return self._count
+
+    def __getitem__(self, index: int) -> ReplayBar:
+        """
+        Read a single bar.
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"bar index out of range: {index}")
+        return ReplayBar._make(_RECORD.unpack_from(self._buf, _HEADER.size + index * _RECORD.size))
+
+    def __iter__(self) -> Iterator[ReplayBar]:
+        """Iterate over all bars."""
+        return self.iter_bars()
+
+    def iter_bars(self, start: int = 0, stop: int | None = None) -> Iterator[ReplayBar]:
+        """
+        Iterate over bars [start, stop) in chunks.
+
+        Chunks are copied out of shared memory so no buffer export outlives
+        a step (the frame can always be closed).
+
+        Args:
+            start: First bar index
+            stop: End index (exclusive, None = end of frame)
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        make = ReplayBar._make
+        for chunk_start in range(start, stop, _ITER_CHUNK):
+            chunk_stop = min(chunk_start + _ITER_CHUNK, stop)
+            begin = _HEADER.size + chunk_start * _RECORD.size
+            end = _HEADER.size + chunk_stop * _RECORD.size
+            with self._buf[begin:end] as view:
+                data = bytes(view)
+            for fields in _RECORD.iter_unpack(data):
+                yield make(fields)
+
+    def close(self) -> None:
+        """Detach from the block (idempotent)."""
+        if not self._closed:
+            self._shm.close()
+            self._closed = True
+
+    def unlink(self) -> None:
+        """
+        Destroy the block (owner only, idempotent on repeated calls).
+
+        Raises:
+            PermissionError: If called on an attached (non-owning) frame
+        """
+        if not self._owner:
+            raise PermissionError("Only the creating process may unlink a bar frame")
+        self._closed = True
+        destroy_shared_memory(self._shm)
+
+    def __enter__(self) -> SharedBarFrame:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close (and unlink when owning) on exit."""
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
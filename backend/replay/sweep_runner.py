@@ -0,0 +1,236 @@
+# backend/replay/sweep_runner.py
+"""
+ParameterSweepRunner - Parallel strategy parameter sweeps over shared replay data.
+
+Runs the same historical window under many parameter sets. The bar stream
+is decoded once into a SharedBarFrame; worker processes attach to it
+read-only at start-up (one attach per process, not per parameter set) and
+each evaluate a stream of parameter sets. Summary metrics are streamed
+back to the caller as runs complete.
+
+Work is distributed with ``imap_unordered`` so fast and slow parameter
+sets balance across cores; with the default ``fork`` start method worker
+start-up is near-instant and throughput scales with the number of cores.
+
+@layer: Backend (Replay)
+@dependencies: [multiprocessing, os, time, backend.replay.shared_frames]
+@responsibilities:
+    - Define the SweepStrategy contract and SweepResult record
+    - Attach worker processes to the shared bar frame once
+    - Distribute parameter sets and stream summary metrics back
+    - Isolate per-parameter-set failures (log + continue)
+"""
+
+# Standard library
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+# Project modules
+from backend.replay.shared_frames import ReplayBar, SharedBarFrame
+
+__all__ = ["ParameterSweepRunner", "StrategyFactory", "SweepResult", "SweepStrategy"]
+
+
+class SweepStrategy(Protocol):
+    """
+    Strategy under test in a parameter sweep.
+
+    Implementations receive raw ReplayBar records (no DTO construction per
+    bar) and report summary metrics once the window has been replayed.
+    """
+
+    def on_bar(self, bar: ReplayBar) -> None:
+        """Process the next historical bar."""
+        ...
+
+    def summary(self) -> Mapping[str, float]:
+        """Return summary metrics (e.g. pnl, trades, max_drawdown)."""
+        ...
+
+
+# Builds one strategy per parameter set. Must be picklable (module-level)
+# when a non-fork start method is used.
+StrategyFactory = Callable[[Mapping[str, Any]], SweepStrategy]
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Outcome of one parameter set.
+
+    Attributes:
+        index: Position of the parameter set in the submitted sequence
+        params: Parameter set
+        metrics: Strategy summary metrics (empty on error)
+        bars_processed: Bars replayed before completion/failure
+        elapsed_s: Wall-clock time for this parameter set
+        worker_pid: Process that evaluated the parameter set
+        error: Error description if the run failed, else None
+    """
+
+    index: int
+    params: dict[str, Any]
+    metrics: dict[str, float]
+    bars_processed: int
+    elapsed_s: float
+    worker_pid: int
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the run completed without error."""
+        return self.error is None
+
+
+class ParameterSweepRunner:
+    """
+    Evaluates parameter sets in parallel over a shared bar frame.
+
+    **Usage:**
+        >>> with SharedBarFrame.create(load_bars()) as frame:
+        ...     runner = ParameterSweepRunner(frame, build_strategy, processes=8)
+        ...     for result in runner.run(param_grid):
+        ...         print(result.params, result.metrics["pnl"])
+    """
+
+    def __init__(
+        self,
+        frame: SharedBarFrame,
+        strategy_factory: StrategyFactory,
+        processes: int | None = None,
+        chunk_size: int = 1,
+        start_method: str | None = None,
+    ) -> None:
+        """
+        Configure runner.
+
+        Args:
+            frame: Owning SharedBarFrame with the historical window
+            strategy_factory: Builds a strategy for a parameter set
+            processes: Worker processes (None = os.cpu_count(); 1 = in-process)
+            chunk_size: Parameter sets handed to a worker per dispatch
+            start_method: multiprocessing start method (None = fork if available)
+
+        Raises:
+            ValueError: If processes or chunk_size is not positive
+        """
+        if processes is not None and processes < 1:
+            raise ValueError(f"processes must be >= 1, got: {processes}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got: {chunk_size}")
+
+        self._frame = frame
+        self._factory = strategy_factory
+        self._processes = processes or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "fork" if "fork" in methods else "spawn"
+        self._start_method = start_method
+
+    @property
+    def processes(self) -> int:
+        """Number of worker processes used by run()."""
+        return self._processes
+
+    def run(self, param_sets: Sequence[Mapping[str, Any]]) -> Iterator[SweepResult]:
+        """
+        Evaluate parameter sets, yielding results as they complete.
+
+        Results arrive in completion order; use SweepResult.index to
+        correlate with the submitted sequence.
+
+        Args:
+            param_sets: Parameter sets to evaluate
+
+        Yields:
+            SweepResult per parameter set
+        """
+        tasks = list(enumerate(dict(params) for params in param_sets))
+        if not tasks:
+            return
+
+        if self._processes == 1:
+            for task in tasks:
+                yield _evaluate(self._frame, self._factory, task)
+            return
+
+        context = multiprocessing.get_context(self._start_method)
+        with context.Pool(
+            processes=min(self._processes, len(tasks)),
+            initializer=_init_worker,
+            initargs=(self._frame.name, self._factory),
+        ) as pool:
+            yield from pool.imap_unordered(_run_task, tasks, chunksize=self._chunk_size)
+
+    def run_all(self, param_sets: Sequence[Mapping[str, Any]]) -> list[SweepResult]:
+        """
+        Evaluate parameter sets and return results in submission order.
+
+        Args:
+            param_sets: Parameter sets to evaluate
+
+        Returns:
+            SweepResults ordered by index
+        """
+        return sorted(self.run(param_sets), key=lambda result: result.index)
+
+
+# === Worker process side ===
+
+_worker_frame: SharedBarFrame | None = None
+_worker_factory: StrategyFactory | None = None
+
+
+def _init_worker(frame_name: str, factory: StrategyFactory) -> None:
+    """Pool initializer: attach to the shared frame once per process."""
+    global _worker_frame, _worker_factory  # noqa: PLW0603 - per-process worker state
+    _worker_frame = SharedBarFrame.attach(frame_name)
+    _worker_factory = factory
+
+
+def _run_task(task: tuple[int, dict[str, Any]]) -> SweepResult:
+    """Pool task: evaluate one parameter set against the attached frame."""
+    assert _worker_frame is not None and _worker_factory is not None
+    return _evaluate(_worker_frame, _worker_factory, task)
+
+
+def _evaluate(
+    frame: SharedBarFrame, factory: StrategyFactory, task: tuple[int, dict[str, Any]]
+) -> SweepResult:
+    """Replay the frame through one strategy instance and summarize it."""
+    index, params = task
+    started = time.perf_counter()
+    processed = 0
+    try:
+        strategy = factory(params)
+        on_bar = strategy.on_bar
+        for bar in frame:
+            on_bar(bar)
+            processed += 1
+        metrics = {key: float(value) for key, value in strategy.summary().items()}
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # One failing parameter set must not abort the whole sweep
+        return SweepResult(
+            index=index,
+            params=params,
+            metrics={},
+            bars_processed=processed,
+            elapsed_s=time.perf_counter() - started,
+            worker_pid=os.getpid(),
+            error=f"{type(e).__name__}: {e}",
+        )
+    return SweepResult(
+        index=index,
+        params=params,
+        metrics=metrics,
+        bars_processed=processed,
+        elapsed_s=time.perf_counter() - started,
+        worker_pid=os.getpid(),
+    )
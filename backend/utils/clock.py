@@ -0,0 +1,212 @@
+# backend/utils/clock.py
+"""
+Clock - Pluggable time source for the backend.
+
+Every place that reads the current time (ID generation, DTO timestamp
+defaults, EventBus quarantine events, checkpoint intervals) asks a Clock
+instead of calling ``datetime.now()`` / ``time.monotonic()`` directly.
+
+Implementations:
+    WallClock: Real UTC wall time, real monotonic time, uuid4 ID salt
+    VirtualClock: Replay time that only moves when advanced; sleep()
+        returns immediately and ID salts are a seeded counter, so a replay
+        runs as fast as the CPU allows and produces identical IDs and
+        timestamps on every run
+
+Components take an optional ``clock`` argument; without one they use the
+process-wide clock (get_clock(), WallClock by default). A replay harness
+installs its VirtualClock with ``use_clock(...)``.
+
+@layer: Backend (Utils)
+@dependencies: [datetime, threading, time, uuid, contextlib]
+@responsibilities:
+    - Define the Clock protocol
+    - Provide wall-clock and virtual (replay) implementations
+    - Hold the process-wide clock used when none is injected
+"""
+
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Protocol, runtime_checkable
+from uuid import uuid4
+
+__all__ = ["Clock", "VirtualClock", "WallClock", "get_clock", "set_clock", "use_clock"]
+
+
+@runtime_checkable
+class Clock(Protocol):
+    """Source of time (and of ID uniqueness salt)."""
+
+    def now(self) -> datetime:
+        """Current time as an aware UTC datetime."""
+        ...
+
+    def monotonic_ns(self) -> int:
+        """Monotonic nanoseconds for measuring intervals."""
+        ...
+
+    def sleep(self, seconds: float) -> None:
+        """Wait (or, for virtual clocks, advance) ``seconds``."""
+        ...
+
+    def token(self) -> str:
+        """Uniqueness salt for generated IDs."""
+        ...
+
+
+class WallClock:
+    """Real time: datetime.now(UTC), time.monotonic_ns(), uuid4 salts."""
+
+    def now(self) -> datetime:
+        """Current UTC wall time."""
+        return datetime.now(UTC)
+
+    def monotonic_ns(self) -> int:
+        """Process monotonic clock."""
+        return time.monotonic_ns()
+
+    def sleep(self, seconds: float) -> None:
+        """Block the calling thread."""
+        time.sleep(seconds)
+
+    def token(self) -> str:
+        """Random salt."""
+        return uuid4().hex
+
+
+class VirtualClock:
+    """
+    Deterministic replay clock.
+
+    Time only moves through advance() / advance_to() / sleep(), and never
+    backwards. token() returns ``"{seed}:{n}"`` for n = 0, 1, 2, ... so the
+    same replay generates the same IDs every run.
+
+    **Usage:**
+        >>> clock = VirtualClock(datetime(2025, 1, 1, tzinfo=UTC), seed="run-1")
+        >>> with use_clock(clock):
+        ...     for tick in ticks:
+        ...         clock.advance_to(tick.timestamp)
+        ...         flow_initiator.on_data_ready(tick)
+
+    **Thread Safety:**
+        All methods take an internal lock.
+    """
+
+    def __init__(self, start: datetime, seed: str = "") -> None:
+        """
+        Create clock.
+
+        Args:
+            start: Initial time (naive values are taken as UTC)
+            seed: Prefix of ID salts (distinguishes replays)
+        """
+        self._start = _as_utc(start)
+        self._elapsed = timedelta(0)
+        self._seed = seed
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        """Current virtual time."""
+        with self._lock:
+            return self._start + self._elapsed
+
+    def monotonic_ns(self) -> int:
+        """Virtual nanoseconds elapsed since start."""
+        with self._lock:
+            return self._elapsed // timedelta(microseconds=1) * 1000
+
+    def sleep(self, seconds: float) -> None:
+        """Advance instantly instead of blocking."""
+        self.advance(timedelta(seconds=seconds))
+
+    def token(self) -> str:
+        """Next deterministic salt."""
+        with self._lock:
+            value = f"{self._seed}:{self._tokens}"
+            self._tokens += 1
+            return value
+
+    def advance(self, delta: timedelta) -> datetime:
+        """
+        Move time forward.
+
+        Args:
+            delta: Non-negative step
+
+        Returns:
+            New current time
+
+        Raises:
+            ValueError: If delta is negative
+        """
+        if delta < timedelta(0):
+            raise ValueError(f"VirtualClock cannot move backwards (delta={delta})")
+        with self._lock:
+            self._elapsed += delta
+            return self._start + self._elapsed
+
+    def advance_to(self, target: datetime) -> datetime:
+        """
+        Move time forward to ``target`` (no-op if already there).
+
+        Args:
+            target: New time (naive values are taken as UTC)
+
+        Returns:
+            New current time
+
+        Raises:
+            ValueError: If target is earlier than the current time
+        """
+        target = _as_utc(target)
+        with self._lock:
+            current = self._start + self._elapsed
+            if target < current:
+                raise ValueError(f"VirtualClock cannot move backwards ({current} -> {target})")
+            self._elapsed = target - self._start
+            return target
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize to an aware UTC datetime."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+_clock: Clock = WallClock()
+
+
+def get_clock() -> Clock:
+    """Process-wide clock (WallClock unless replaced)."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Replace the process-wide clock.
+
+    Args:
+        clock: New clock
+
+    Returns:
+        The previous clock (to restore later)
+    """
+    global _clock  # noqa: PLW0603 - process-wide default by design
+    previous, _clock = _clock, clock
+    return previous
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Generator[Clock, None, None]:
+    """Install ``clock`` process-wide for the duration of the block."""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
@@ -54,7 +54,7 @@ Causal Traceability Examples:
           → EXE_20251026_100010_efg123 (DirectiveAssembler)
 
 @layer: Backend (Utils)
-@dependencies: [datetime, hashlib]
+@dependencies: [datetime, hashlib, backend.utils.clock]
 @responsibilities:
     - Generate typed IDs with consistent military datetime format
     - Extract ID type from typed ID string
@@ -63,7 +63,8 @@ Causal Traceability Examples:
 
 from datetime import UTC, datetime
 from hashlib import sha256
-from uuid import uuid4
+
+from backend.utils.clock import get_clock
 
 __all__ = [
     "generate_tick_id",
@@ -93,6 +94,9 @@ def _generate_id(prefix: str) -> str:
 
     Format: {PREFIX}_{YYYYMMDD}_{HHMMSS}_{hash}
 
+    Time and hash salt come from the process-wide Clock, so IDs are
+    reproducible under a VirtualClock.
+
     Args:
         prefix: 3-letter type identifier (e.g., 'TCK', 'OPP', 'STR')
 
@@ -103,12 +107,13 @@ def _generate_id(prefix: str) -> str:
         >>> _generate_id('TCK')
         'TCK_20251026_143052_a1b2c3d4'
     """
-    now = datetime.now(UTC)
+    clock = get_clock()
+    now = clock.now()
     date_str = now.strftime("%Y%m%d")
     time_str = now.strftime("%H%M%S")
 
     # Generate 8-char hash for uniqueness
-    hash_input = f"{prefix}{now.isoformat()}{uuid4()}".encode()
+    hash_input = f"{prefix}{now.isoformat()}{clock.token()}".encode()
     hash_hex = sha256(hash_input).hexdigest()[:8]
 
     return f"{prefix}_{date_str}_{time_str}_{hash_hex}"
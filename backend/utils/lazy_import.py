@@ -0,0 +1,58 @@
+# backend/utils/lazy_import.py
+"""
+Lazy package exports (PEP 562).
+
+DTO packages re-export their models for convenience, but importing every
+DTO module eagerly makes each spawned worker process pay for models it
+never uses. ``lazy_exports`` gives a package ``__getattr__``/``__dir__``
+hooks that import the defining module on first attribute access and cache
+the value in the package namespace, so later lookups are plain global
+reads.
+
+Packages keep ``from x import Y`` under ``if TYPE_CHECKING:`` so type
+checkers and IDEs still see the re-exports.
+
+@layer: Backend (Utils)
+@dependencies: [importlib, sys]
+@responsibilities:
+    - Resolve package attributes from a name → module map on first access
+    - Expose the lazy names through dir()
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build PEP 562 ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: Package ``__name__``
+        exports: Exported name → fully qualified module defining it
+
+    Returns:
+        (__getattr__, __dir__) to assign at package module level
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"Fill": "backend.dtos.state.fill"})
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807 - PEP 562 hook name
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)  # cache: next lookup skips __getattr__
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807 - PEP 562 hook name
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
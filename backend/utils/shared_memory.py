@@ -0,0 +1,103 @@
+# backend/utils/shared_memory.py
+"""
+Shared memory helpers.
+
+Thin wrappers around ``multiprocessing.shared_memory`` that make the
+owner/attacher split explicit: the creating process stays registered with
+the resource tracker (so a crashed owner does not leak the block), while
+attaching processes are never tracked (so a worker exiting never unlinks
+the owner's block).
+
+@layer: Backend (Utils)
+@dependencies: [multiprocessing.shared_memory, multiprocessing.resource_tracker]
+@responsibilities:
+    - Create tracked shared memory blocks
+    - Attach untracked to existing blocks (all supported Python versions)
+    - Destroy owned blocks idempotently
+    - Expose an open block's buffer as a plain memoryview
+"""
+
+import contextlib
+import os
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+__all__ = [
+    "attach_shared_memory",
+    "create_shared_memory",
+    "destroy_shared_memory",
+    "shared_buffer",
+]
+
+# Blocks created by this process (their tracker registration must be kept)
+_OWNED_NAMES: set[str] = set()
+
+
+def create_shared_memory(size: int, name: str | None = None) -> SharedMemory:
+    """
+    Create a zero-filled shared memory block owned by this process.
+
+    Args:
+        size: Block size in bytes
+        name: Optional block name (random if None)
+
+    Returns:
+        Owned SharedMemory block
+    """
+    shm = SharedMemory(name=name, create=True, size=size)
+    _OWNED_NAMES.add(shm.name)
+    return shm
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Attach to an existing block without resource tracking.
+
+    Args:
+        name: Block name
+
+    Returns:
+        Attached SharedMemory block
+
+    Raises:
+        FileNotFoundError: If no block with that name exists
+    """
+    try:
+        return SharedMemory(name=name, create=False, track=False)  # type: ignore[call-arg]
+    except TypeError:  # Python < 3.13: no track parameter
+        shm = SharedMemory(name=name, create=False)
+        # Only POSIX blocks are tracked, under their "/"-prefixed shm_open name
+        if os.name == "posix" and shm.name not in _OWNED_NAMES:
+            resource_tracker.unregister(f"/{shm.name.lstrip('/')}", "shared_memory")
+        return shm
+
+
+def shared_buffer(shm: SharedMemory) -> memoryview:
+    """
+    Return the buffer of an open block.
+
+    ``SharedMemory.buf`` is typed Optional because it is None once the block
+    is closed; callers bind it once while the block is open.
+
+    Args:
+        shm: Open block
+
+    Returns:
+        The block's memoryview
+    """
+    buf = shm.buf
+    assert buf is not None, f"Shared memory '{shm.name}' is closed"
+    return buf
+
+
+def destroy_shared_memory(shm: SharedMemory) -> None:
+    """
+    Close and unlink an owned block (idempotent).
+
+    Args:
+        shm: Block created with create_shared_memory()
+    """
+    shm.close()
+    with contextlib.suppress(FileNotFoundError):
+        shm.unlink()
+    _OWNED_NAMES.discard(shm.name)
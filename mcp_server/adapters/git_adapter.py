@@ -23,6 +23,7 @@ from typing import Any
 
 from git import InvalidGitRepositoryError, Repo
 
+from mcp_server.adapters.git_repository_cache import GitRepositoryCache
 from mcp_server.config.settings import Settings
 from mcp_server.core import logging as core_logging
 from mcp_server.core.exceptions import ExecutionError, MCPSystemError
@@ -407,7 +408,13 @@ class GitAdapter:
             raise ExecutionError(f"Failed to get diff stat: {e}") from e
 
     def get_recent_commits(self, limit: int = 5) -> list[str]:
-        """Get recent commit messages."""
+        """Get recent commit messages (memoized per HEAD SHA)."""
+        result = GitRepositoryCache.for_path(self.repo_path).git(
+            ["log", "-z", f"--max-count={limit}", "--format=%B"], refs=("HEAD",)
+        )
+        if result.returncode == 0:
+            messages = result.stdout.removesuffix("\0").split("\0") if result.stdout else []
+            return [message.split("\n", maxsplit=1)[0] for message in messages]
         try:
             commits = list(self.repo.iter_commits(max_count=limit))
             return [str(commit.message).split("\n", maxsplit=1)[0] for commit in commits]
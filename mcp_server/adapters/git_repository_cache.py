@@ -0,0 +1,263 @@
+# mcp_server/adapters/git_repository_cache.py
+"""
+Git Repository Cache — in-process reads of HEAD/refs and memoized git queries.
+
+HEAD, the current branch and ref SHAs are read straight from the ``.git``
+directory (loose refs and packed-refs), so hot request paths such as the
+enforcement branch check no longer fork ``git``. Read-only git queries whose
+output depends only on commits (log of a ref, diff name lists between refs)
+are memoized on the SHAs their refs resolve to: moving HEAD or a branch
+changes the key, so no explicit invalidation is needed. Queries whose refs
+cannot be resolved locally (short SHAs, ``HEAD~1``, reftable repositories)
+run uncached.
+
+@layer: Backend (Adapters)
+@dependencies: [collections, os, pathlib, subprocess, threading]
+@responsibilities:
+    - Locate the git dir (including worktree ``.git`` files) for a workspace
+    - Resolve HEAD, branch and ref names to SHAs without spawning git
+    - Memoize successful read-only git commands keyed on resolved ref SHAs
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+_MAX_CACHED_RESULTS = 256
+# current_branch() runs on every enforced tool call; its git fallback must not hang it
+_BRANCH_FALLBACK_TIMEOUT_SECONDS = 2
+
+
+def _git_command_env() -> dict[str, str]:
+    """Build a non-interactive environment for git commands in request paths."""
+    env = os.environ.copy()
+    env.setdefault("GIT_TERMINAL_PROMPT", "0")
+    env.setdefault("GIT_PAGER", "cat")
+    env.setdefault("PAGER", "cat")
+    return env
+
+
+class GitRepositoryCache:
+    """Shared per-repository cache; obtain instances via :meth:`for_path`."""
+
+    _instances: dict[Path, GitRepositoryCache] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+        self._git_dir, self._common_dir = self._find_git_dirs(repo_path)
+        self._results: OrderedDict[tuple[object, ...], subprocess.CompletedProcess[str]] = (
+            OrderedDict()
+        )
+        self._packed_refs: tuple[tuple[int, int], dict[str, str]] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, repo_path: Path | str | None = None) -> GitRepositoryCache:
+        """Return the shared cache for *repo_path* (defaults to the process cwd)."""
+        key = Path(repo_path if repo_path is not None else Path.cwd()).resolve()
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls(key)
+                cls._instances[key] = cache
+            return cache
+
+    # ------------------------------------------------------------------
+    # Direct .git reads
+    # ------------------------------------------------------------------
+
+    def head_sha(self) -> str | None:
+        """Return the HEAD commit SHA, or None outside a repository / unborn branch."""
+        if self._ensure_git_dir() is None:
+            return None
+        sha = self.resolve_ref("HEAD")
+        if sha is not None:
+            return sha
+        result = self.git(["rev-parse", "HEAD"])
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def current_branch(self) -> str | None:
+        """Return the checked-out branch name, or None on detached HEAD / error / timeout."""
+        git_dir = self._ensure_git_dir()
+        if git_dir is None:
+            return None
+        head = self._read_text(git_dir / "HEAD")
+        if head is not None and head.startswith("ref: refs/heads/"):
+            return head.removeprefix("ref: refs/heads/")
+        if head is not None and _SHA_PATTERN.match(head):
+            return None
+        try:
+            result = self.git(
+                ["rev-parse", "--abbrev-ref", "HEAD"], timeout=_BRANCH_FALLBACK_TIMEOUT_SECONDS
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        name = result.stdout.strip()
+        return name if result.returncode == 0 and name and name != "HEAD" else None
+
+    def resolve_ref(self, ref: str) -> str | None:
+        """Resolve HEAD, a full SHA or a ref name to a SHA without running git.
+
+        Returns None when the ref is unknown or uses syntax this reader does
+        not handle (abbreviated SHAs, ``~``/``^`` suffixes, ranges).
+        """
+        git_dir = self._ensure_git_dir()
+        if git_dir is None:
+            return None
+        if _SHA_PATTERN.match(ref):
+            return ref
+        if ref == "HEAD":
+            return self._read_symbolic(git_dir / "HEAD", depth=0)
+        if not self._is_plain_ref_name(ref):
+            return None
+        for candidate in (
+            ref,
+            f"refs/{ref}",
+            f"refs/tags/{ref}",
+            f"refs/heads/{ref}",
+            f"refs/remotes/{ref}",
+            f"refs/remotes/{ref}/HEAD",
+        ):
+            sha = self._lookup_ref(candidate, depth=0)
+            if sha is not None:
+                return sha
+        return None
+
+    # ------------------------------------------------------------------
+    # Memoized git commands
+    # ------------------------------------------------------------------
+
+    def git(
+        self,
+        args: list[str],
+        *,
+        refs: tuple[str, ...] = (),
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run ``git <args>`` in the repository, memoizing on the SHAs of *refs*.
+
+        Only pass *refs* for read-only commands whose output is fully
+        determined by those commits. Successful results are cached while every
+        ref resolves; failures and unresolvable refs always run git.
+
+        Raises:
+            subprocess.TimeoutExpired: When git exceeds *timeout*.
+            OSError: When git cannot be started.
+        """
+        key: tuple[object, ...] | None = None
+        if refs:
+            shas = [self.resolve_ref(ref) for ref in refs]
+            if all(sha is not None for sha in shas):
+                key = (tuple(args), tuple(shas))
+                with self._lock:
+                    cached = self._results.get(key)
+                    if cached is not None:
+                        self._results.move_to_end(key)
+                        return cached
+
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.repo_path,
+            env=_git_command_env(),
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=timeout,
+        )
+        if key is not None and result.returncode == 0:
+            with self._lock:
+                self._results[key] = result
+                while len(self._results) > _MAX_CACHED_RESULTS:
+                    self._results.popitem(last=False)
+        return result
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ensure_git_dir(self) -> Path | None:
+        """Return the git dir; discovery is retried until one exists (e.g. after git init)."""
+        if self._git_dir is None:
+            self._git_dir, self._common_dir = self._find_git_dirs(self.repo_path)
+        return self._git_dir
+
+    @staticmethod
+    def _is_plain_ref_name(ref: str) -> bool:
+        """A ref name without revision syntax (``~``, ``^``, ``..``, ``@{``) or path escapes."""
+        return (
+            bool(ref)
+            and not ref.startswith(("/", "-"))
+            and ".." not in ref
+            and not any(ch in ref for ch in "~^:@{ \\")
+        )
+
+    @staticmethod
+    def _find_git_dirs(start: Path) -> tuple[Path | None, Path | None]:
+        """Locate (git_dir, common_dir) like ``git rev-parse`` does from *start*."""
+        for directory in (start, *start.parents):
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                return dot_git, dot_git
+            if dot_git.is_file():
+                text = GitRepositoryCache._read_text(dot_git) or ""
+                if not text.startswith("gitdir:"):
+                    return None, None
+                git_dir = (directory / text.removeprefix("gitdir:").strip()).resolve()
+                common = GitRepositoryCache._read_text(git_dir / "commondir")
+                common_dir = (git_dir / common).resolve() if common else git_dir
+                return git_dir, common_dir
+        return None, None
+
+    @staticmethod
+    def _read_text(path: Path) -> str | None:
+        try:
+            return path.read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _read_symbolic(self, path: Path, depth: int) -> str | None:
+        content = self._read_text(path)
+        if content is None:
+            return None
+        if content.startswith("ref: "):
+            return self._lookup_ref(content.removeprefix("ref: "), depth + 1)
+        return content if _SHA_PATTERN.match(content) else None
+
+    def _lookup_ref(self, name: str, depth: int) -> str | None:
+        if depth > 5 or self._git_dir is None or self._common_dir is None:
+            return None
+        # Per-worktree refs (HEAD-like) live in git_dir, shared refs in common_dir
+        for base in (self._git_dir, self._common_dir):
+            loose = base / name
+            if loose.is_file():
+                return self._read_symbolic(loose, depth)
+        return self._read_packed_refs().get(name)
+
+    def _read_packed_refs(self) -> dict[str, str]:
+        assert self._common_dir is not None
+        path = self._common_dir / "packed-refs"
+        try:
+            stat = path.stat()
+        except OSError:
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._packed_refs
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        refs: dict[str, str] = {}
+        for line in (self._read_text(path) or "").splitlines():
+            if not line or line.startswith(("#", "^")):
+                continue
+            sha, _, name = line.partition(" ")
+            if _SHA_PATTERN.match(sha):
+                refs[name.strip()] = sha
+        self._packed_refs = (stamp, refs)
+        return refs
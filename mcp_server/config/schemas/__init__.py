@@ -33,6 +33,7 @@ from mcp_server.config.schemas.project_structure_config import (
 from mcp_server.config.schemas.quality_config import (
     ArtifactLoggingConfig,
     CapabilitiesMetadata,
+    DaemonConfig,
     ExecutionConfig,
     GateScope,
     JsonViolationsParsing,
@@ -61,6 +62,7 @@ __all__ = [
     "CommentPattern",
     "ContributorConfig",
     "ContributorEntry",
+    "DaemonConfig",
     "DirectoryPolicy",
     "EnforcementAction",
     "EnforcementConfig",
@@ -75,12 +75,27 @@ class TextViolationsParsing(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
 
+class DaemonConfig(BaseModel):
+    """Warm dmypy backend for a mypy gate (opt-in, used when the MCP server runs).
+
+    ``dmypy run`` is given the gate's own mypy flags and prints the same
+    diagnostics, which the gate's parsing strategy reads unchanged. Any daemon
+    failure falls back to running ``execution.command``.
+    """
+
+    backend: Literal["dmypy"] = Field(default="dmypy")
+    idle_timeout_seconds: int = Field(default=1800, gt=0)
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
 class ExecutionConfig(BaseModel):
     """How to execute a gate tool."""
 
     command: list[str] = Field(..., min_length=1)
     timeout_seconds: int = Field(..., gt=0)
     working_dir: str | None = Field(default=None)
+    daemon: DaemonConfig | None = Field(default=None)
 
     model_config = ConfigDict(extra="forbid", frozen=True)
 
@@ -130,6 +145,8 @@ class CapabilitiesMetadata(BaseModel):
 
     file_types: list[str] = Field(..., min_length=1)
     supports_autofix: bool
+    # Per-file results depend only on that file's content (safe to cache by hash)
+    cacheable: bool = Field(default=False)
     parsing_strategy: Literal["json_violations", "text_violations"] | None = Field(default=None)
     json_violations: JsonViolationsParsing | None = Field(default=None)
     text_violations: TextViolationsParsing | None = Field(default=None)
@@ -146,6 +163,8 @@ class QualityGate(BaseModel):
     success: SuccessCriteria
     capabilities: CapabilitiesMetadata
     scope: GateScope | None = Field(default=None)
+    depends_on: list[str] = Field(default_factory=list)
+    exclusive: bool = Field(default=False)
 
     model_config = ConfigDict(extra="forbid", frozen=True)
 
@@ -168,5 +187,34 @@ class QualityConfig(BaseModel):
     artifact_logging: ArtifactLoggingConfig = Field(...)
     project_scope: GateScope | None = Field(default=None)
     gates: dict[str, QualityGate] = Field(..., min_length=1)
+    max_parallel_gates: int = Field(default=1, ge=1)
+
+    @model_validator(mode="after")
+    def _validate_gate_dependencies(self) -> QualityConfig:
+        for gate_id, gate in self.gates.items():
+            unknown = [dep for dep in gate.depends_on if dep not in self.gates]
+            if unknown:
+                raise ValueError(
+                    f"Gate '{gate_id}' depends_on unknown gate(s): {', '.join(unknown)}"
+                )
+
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(gate_id: str, path: list[str]) -> None:
+            if gate_id in visited:
+                return
+            if gate_id in visiting:
+                cycle = " -> ".join([*path[path.index(gate_id) :], gate_id])
+                raise ValueError(f"Gate dependency cycle: {cycle}")
+            visiting.add(gate_id)
+            for dep in self.gates[gate_id].depends_on:
+                visit(dep, [*path, gate_id])
+            visiting.discard(gate_id)
+            visited.add(gate_id)
+
+        for gate_id in self.gates:
+            visit(gate_id, [])
+        return self
 
     model_config = ConfigDict(extra="forbid", frozen=True)
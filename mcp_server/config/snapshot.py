@@ -0,0 +1,213 @@
+# mcp_server/config/snapshot.py
+"""
+Compiled config snapshot for fast MCP server startup.
+
+Loads every YAML config the server composes, runs the startup
+cross-validation once, and pickles the validated value objects under
+``.st3/cache/``. The next start reuses the snapshot when its fingerprint still
+matches; the fingerprint hashes every config file plus the schema/loader
+sources, so editing either invalidates it.
+
+@layer: Backend (Config)
+@dependencies: [hashlib, pickle, pydantic, mcp_server.config.loader,
+    mcp_server.config.validator]
+@responsibilities:
+    - Load and cross-validate the server's config set (cold path)
+    - Fingerprint config files and the code that interprets them
+    - Persist / restore validated configs as a pickle snapshot
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pydantic
+
+from mcp_server.config.loader import ConfigLoader
+from mcp_server.config.schemas import (
+    ArtifactRegistryConfig,
+    ContributorConfig,
+    EnforcementConfig,
+    GitConfig,
+    IssueConfig,
+    LabelConfig,
+    MilestoneConfig,
+    OperationPoliciesConfig,
+    PhaseContractsConfig,
+    ProjectStructureConfig,
+    QualityConfig,
+    ScopeConfig,
+    WorkflowConfig,
+    WorkphasesConfig,
+)
+from mcp_server.config.validator import ConfigValidator
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Every file ConfigLoader reads for the server's config set
+CONFIG_FILES = (
+    "git.yaml",
+    "workflows.yaml",
+    "workphases.yaml",
+    "quality.yaml",
+    "labels.yaml",
+    "issues.yaml",
+    "scopes.yaml",
+    "milestones.yaml",
+    "contributors.yaml",
+    "artifacts.yaml",
+    "project_structure.yaml",
+    "policies.yaml",
+    "enforcement.yaml",
+    "phase_contracts.yaml",
+)
+
+# Sources whose changes alter how the YAML above is interpreted
+_CONFIG_CODE_DIR = Path(__file__).resolve().parent
+
+
+@dataclass(frozen=True)
+class ServerConfigs:
+    """Validated config value objects composed by MCPServer."""
+
+    git: GitConfig
+    workflow: WorkflowConfig
+    workphases: WorkphasesConfig
+    quality: QualityConfig
+    label: LabelConfig
+    issue: IssueConfig
+    scope: ScopeConfig
+    milestone: MilestoneConfig
+    contributor: ContributorConfig
+    artifact_registry: ArtifactRegistryConfig
+    project_structure: ProjectStructureConfig
+    operation_policies: OperationPoliciesConfig
+    enforcement: EnforcementConfig
+    phase_contracts: PhaseContractsConfig
+
+
+class ConfigSnapshot:
+    """Load ServerConfigs, reusing a pickled snapshot while its inputs are unchanged."""
+
+    def __init__(self, config_loader: ConfigLoader, snapshot_path: Path | None = None) -> None:
+        self._loader = config_loader
+        self._snapshot_path = snapshot_path
+
+    def load(self) -> ServerConfigs:
+        """Return validated configs from the snapshot, or load and snapshot them."""
+        if self._snapshot_path is None:
+            return self.load_fresh()
+
+        fingerprint = self.fingerprint()
+        cached = self._read_snapshot(self._snapshot_path, fingerprint)
+        if cached is not None:
+            return cached
+
+        configs = self.load_fresh()
+        self._write_snapshot(self._snapshot_path, fingerprint, configs)
+        return configs
+
+    def load_fresh(self) -> ServerConfigs:
+        """Parse and validate every config file, then cross-validate the set."""
+        loader = self._loader
+        git_config = loader.load_git_config()
+        workflow_config = loader.load_workflow_config()
+        workphases_config = loader.load_workphases_config()
+        workflow_config = ConfigLoader._inject_terminal_phase(  # pyright: ignore[reportPrivateUsage]
+            workflow_config, workphases_config
+        )
+        quality_config = loader.load_quality_config()
+        label_config = loader.load_label_config()
+        issue_config = loader.load_issue_config()
+        scope_config = loader.load_scope_config()
+        milestone_config = loader.load_milestone_config()
+        contributor_config = loader.load_contributor_config()
+        artifact_registry = loader.load_artifact_registry_config()
+        configs = ServerConfigs(
+            git=git_config,
+            workflow=workflow_config,
+            workphases=workphases_config,
+            quality=quality_config,
+            label=label_config,
+            issue=issue_config,
+            scope=scope_config,
+            milestone=milestone_config,
+            contributor=contributor_config,
+            artifact_registry=artifact_registry,
+            project_structure=loader.load_project_structure_config(
+                artifact_registry=artifact_registry
+            ),
+            operation_policies=loader.load_operation_policies_config(
+                workflow_config=workflow_config
+            ),
+            enforcement=loader.load_enforcement_config(),
+            phase_contracts=loader.load_phase_contracts_config(),
+        )
+        ConfigValidator().validate_startup(
+            policies=configs.operation_policies,
+            workflow=configs.workflow,
+            structure=configs.project_structure,
+            artifact=configs.artifact_registry,
+            phase_contracts=configs.phase_contracts,
+            workphases=configs.workphases,
+        )
+        return configs
+
+    def fingerprint(self) -> str:
+        """Hash config file contents, config code and the runtime versions."""
+        digest = hashlib.sha256()
+        digest.update(f"{SNAPSHOT_VERSION}|{sys.version_info[:2]}|{pydantic.VERSION}".encode())
+        sources = sorted(_CONFIG_CODE_DIR.rglob("*.py"))
+        inputs = [(path.relative_to(_CONFIG_CODE_DIR).as_posix(), path) for path in sources]
+        inputs += [(f"config/{name}", self._loader.config_root / name) for name in CONFIG_FILES]
+        for label, path in inputs:
+            digest.update(label.encode())
+            try:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+            except OSError:
+                digest.update(b"<missing>")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_snapshot(path: Path, fingerprint: str) -> ServerConfigs | None:
+        try:
+            with path.open("rb") as handle:
+                stored = pickle.load(handle)  # noqa: S301 - workspace-local cache we wrote
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # noqa: BLE001 - any unreadable snapshot means reload
+            logger.info("Ignoring unreadable config snapshot %s: %s", path, exc)
+            return None
+        if not isinstance(stored, dict) or stored.get("fingerprint") != fingerprint:
+            return None
+        configs = stored.get("configs")
+        if not isinstance(configs, ServerConfigs):
+            return None
+        return configs
+
+    @staticmethod
+    def _write_snapshot(path: Path, fingerprint: str, configs: ServerConfigs) -> None:
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("wb") as handle:
+                pickle.dump(
+                    {"fingerprint": fingerprint, "configs": configs},
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+            # Startup continues from the freshly loaded configs
+            logger.warning("Could not write config snapshot %s: %s", path, exc)
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
@@ -0,0 +1,188 @@
+# mcp_server/core/tool_metrics.py
+"""
+Tool Metrics - in-memory per-tool call counters and latency histograms.
+
+MCPServer records every tool call here: the outcome (ok / error /
+cancelled) and the latency of each dispatch stage (argument validation,
+pre-enforcement, execute, post-enforcement) plus the call total. Latencies
+go into fixed-bucket histograms, so recording is O(1) and memory stays
+bounded however many calls are made. The snapshot is served as the
+``st3://metrics`` resource and flushed to a JSON file under ``.logs/``.
+
+@layer: Core
+@dependencies: [bisect, threading, time, mcp_server.utils.atomic_json_writer]
+@responsibilities:
+    - Count calls, errors and cancellations per tool
+    - Keep per-stage latency histograms per tool
+    - Render a JSON-ready snapshot, slowest tools first
+    - Flush the snapshot to disk at most once per interval
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import os
+import threading
+import time
+from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from mcp_server.utils.atomic_json_writer import AtomicJsonWriter
+
+STAGES = ("validation", "pre_enforcement", "execute", "post_enforcement", "total")
+
+# Upper bounds (ms) of the histogram buckets; a final bucket catches the rest
+BUCKET_BOUNDS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+CallOutcome = Literal["ok", "error", "cancelled"]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def quantile_ms(self, quantile: float) -> float:
+        """Upper bound of the bucket holding *quantile* (the max for the open bucket)."""
+        if self.count == 0:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return float(min(BUCKET_BOUNDS_MS[index], self.max_ms))
+                break
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile_ms(0.5),
+            "p95_ms": self.quantile_ms(0.95),
+            "buckets": list(self.buckets),
+        }
+
+
+class _ToolStats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.stages: dict[str, LatencyHistogram] = {}
+
+
+class ToolMetrics:
+    """Process-wide metrics for MCP tool calls.
+
+    Args:
+        flush_path: JSON file the snapshot is written to; ``None`` keeps it in memory.
+        flush_interval: Minimum seconds between two :meth:`maybe_flush` writes.
+    """
+
+    def __init__(self, flush_path: Path | None = None, flush_interval: float = 60.0) -> None:
+        self._flush_path = flush_path
+        self._flush_interval = flush_interval
+        self._tools: dict[str, _ToolStats] = {}
+        self._since = datetime.now(UTC)
+        self._last_flush = time.monotonic()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def observe(self, tool_name: str, stage: str, duration_ms: float) -> None:
+        """Record the latency of one dispatch *stage* of *tool_name*."""
+        with self._lock:
+            stats = self._tools.setdefault(tool_name, _ToolStats())
+            stats.stages.setdefault(stage, LatencyHistogram()).observe(duration_ms)
+            self._dirty = True
+
+    @contextlib.contextmanager
+    def stage(self, tool_name: str, stage: str) -> Generator[None, None, None]:
+        """Time the enclosed block as *stage*, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(tool_name, stage, (time.perf_counter() - start) * 1000.0)
+
+    def record_call(self, tool_name: str, duration_ms: float, outcome: CallOutcome) -> None:
+        """Count one finished call and record its total latency."""
+        with self._lock:
+            stats = self._tools.setdefault(tool_name, _ToolStats())
+            stats.calls += 1
+            if outcome == "error":
+                stats.errors += 1
+            elif outcome == "cancelled":
+                stats.cancelled += 1
+            stats.stages.setdefault("total", LatencyHistogram()).observe(duration_ms)
+            self._dirty = True
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as JSON-ready data, tools ordered by total time spent."""
+        with self._lock:
+            ranked = sorted(
+                self._tools.items(),
+                key=lambda item: (
+                    -item[1].stages["total"].sum_ms if "total" in item[1].stages else 0.0
+                ),
+            )
+            tools = {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "cancelled": stats.cancelled,
+                    "stages": {
+                        stage: stats.stages[stage].to_dict()
+                        for stage in STAGES
+                        if stage in stats.stages
+                    },
+                }
+                for name, stats in ranked
+            }
+        return {
+            "since": self._since.isoformat(),
+            "generated_at": datetime.now(UTC).isoformat(),
+            "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+            "tools": tools,
+        }
+
+    def maybe_flush(self) -> bool:
+        """Flush when the interval has elapsed since the last write; return whether it did."""
+        if time.monotonic() - self._last_flush < self._flush_interval:
+            return False
+        return self.flush()
+
+    def flush(self) -> bool:
+        """Write the snapshot to the flush path when anything changed since the last write."""
+        if self._flush_path is None or not self._dirty:
+            return False
+        self._last_flush = time.monotonic()
+        self._dirty = False
+        try:
+            AtomicJsonWriter().write_json(
+                self._flush_path,
+                self.snapshot(),
+                temp_name=f"{self._flush_path.name}.{os.getpid()}.tmp",
+            )
+        except OSError:
+            # Metrics stay in memory; the next flush retries
+            self._dirty = True
+            return False
+        return True
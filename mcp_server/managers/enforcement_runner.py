@@ -10,14 +10,13 @@ from __future__ import annotations
 
 import json
 import logging
-import os
-import subprocess
 from collections.abc import Callable
 from dataclasses import dataclass
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import cast
 
+from mcp_server.adapters.git_repository_cache import GitRepositoryCache
 from mcp_server.core.exceptions import ConfigError, ValidationError
 from mcp_server.core.interfaces import IPRStatusReader, PRStatus
 from mcp_server.core.operation_notes import (
@@ -28,7 +27,6 @@ from mcp_server.schemas import EnforcementAction, EnforcementConfig, Enforcement
 from mcp_server.tools.tool_result import ToolResult
 
 _ENFORCEMENT_DISPLAY_PATH = ".st3/config/enforcement.yaml"
-_GIT_TIMEOUT_SECONDS = 2
 logger = logging.getLogger(__name__)
 
 # Known tool_category values; config validation fails fast for any unlisted value.
@@ -45,50 +43,16 @@ def _read_current_phase(workspace_root: Path) -> str | None:
     return str(raw) if raw else None
 
 
-def _git_command_env() -> dict[str, str]:
-    """Build a non-interactive environment for git commands in request paths."""
-    env = os.environ.copy()
-    env.setdefault("GIT_TERMINAL_PROMPT", "0")
-    env.setdefault("GIT_PAGER", "cat")
-    env.setdefault("PAGER", "cat")
-    return env
-
+def _get_current_git_branch(workspace_root: Path) -> str | None:
+    """Return the active git branch name, or None on detached HEAD / error.
 
-def _run_git_command(
-    workspace_root: Path,
-    args: list[str],
-    failure_context: str,
-) -> subprocess.CompletedProcess[str]:
-    """Run a git subcommand non-interactively and return the CompletedProcess."""
+    Read from .git/HEAD in-process; runs on every enforced tool call.
+    """
     try:
-        return subprocess.run(
-            ["git", *args],
-            cwd=workspace_root,
-            env=_git_command_env(),
-            stdin=subprocess.DEVNULL,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=_GIT_TIMEOUT_SECONDS,
-        )
-    except (OSError, subprocess.TimeoutExpired) as exc:
-        logger.warning("git command failed (%s): %s", failure_context, exc)
-        return subprocess.CompletedProcess(
-            args=["git", *args], returncode=1, stdout="", stderr=str(exc)
-        )
-
-
-def _get_current_git_branch(workspace_root: Path) -> str | None:
-    """Return the active git branch name, or None on detached HEAD / error."""
-    result = _run_git_command(
-        workspace_root,
-        ["rev-parse", "--abbrev-ref", "HEAD"],
-        failure_context="git rev-parse --abbrev-ref HEAD",
-    )
-    if result.returncode != 0:
+        return GitRepositoryCache.for_path(workspace_root).current_branch()
+    except OSError as exc:
+        logger.warning("git branch lookup failed: %s", exc)
         return None
-    name = result.stdout.strip()
-    return name if name and name != "HEAD" else None
 
 
 __all__ = [
@@ -0,0 +1,197 @@
+"""Warm dmypy backends for mypy quality gates.
+
+A mypy gate with ``execution.daemon`` configured is served by ``dmypy run``
+instead of a cold ``mypy`` process. The dmypy server keeps mypy's
+fine-grained dependency state between runs, so re-checking after an edit
+costs the incremental analysis only (about 0.25s instead of 4s for one
+mcp_server module).
+
+``dmypy run`` prints the same diagnostics as the gate's ``execution.command``,
+so the output goes through the gate's own ``parsing_strategy`` unchanged; only
+dmypy's status lines are dropped and its exit code is mapped back to mypy's.
+
+@layer: Backend (Managers)
+@dependencies: [atexit, re, subprocess, threading, mcp_server.config.schemas]
+@responsibilities:
+    - Derive the dmypy client command and mypy flags from a gate command
+    - Keep one warm dmypy server per gate, addressed by its status file
+    - Return (returncode, stdout, stderr) exactly as the mypy CLI would
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import logging
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+from mcp_server.config.schemas import DaemonConfig
+
+logger = logging.getLogger(__name__)
+
+# Lines the dmypy client prints about the server itself, not about the code
+_STATUS_PREFIXES = ("Daemon started", "Daemon stopped", "Restarting: ")
+_ERROR_LINE = re.compile(r"^.+: error: ", re.MULTILINE)
+_STOP_TIMEOUT_SECONDS = 10
+
+
+class GateDaemonError(RuntimeError):
+    """The daemon could not start or answer; callers fall back to the CLI run."""
+
+
+def dmypy_command(mypy_command: list[str]) -> tuple[list[str], list[str]]:
+    """Split a resolved mypy gate command into the dmypy client and the mypy flags.
+
+    Accepts ``<python> -m mypy <flags>`` and ``<path>/mypy <flags>``.
+
+    Raises:
+        GateDaemonError: If the command does not run mypy.
+    """
+    if len(mypy_command) >= 3 and mypy_command[1:3] == ["-m", "mypy"]:
+        return [mypy_command[0], "-m", "mypy.dmypy"], mypy_command[3:]
+    if mypy_command and Path(mypy_command[0]).stem == "mypy":
+        executable = Path(mypy_command[0])
+        client = executable.with_name(f"dmypy{executable.suffix}")
+        return [str(client) if executable.parent != Path() else client.name], mypy_command[1:]
+    raise GateDaemonError(f"Not a mypy command: {' '.join(mypy_command)}")
+
+
+class DmypyGateDaemon:
+    """One dmypy server serving a mypy gate, addressed through its status file.
+
+    ``dmypy run`` starts the server on first use and restarts it by itself
+    when the mypy configuration (e.g. ``[tool.mypy]`` in pyproject.toml)
+    changes. Runs of one gate are
+    serialized, as the server checks one build at a time.
+    """
+
+    def __init__(
+        self, client: list[str], flags: list[str], status_file: Path, config: DaemonConfig
+    ) -> None:
+        self.client = client
+        self.flags = flags
+        self._status_file = status_file
+        self.config = config
+        self._lock = threading.Lock()
+
+    def check(self, files: list[str], timeout: float, cwd: str | None) -> tuple[int, str, str]:
+        """Type-check *files* on the warm server.
+
+        Returns:
+            (returncode, stdout, stderr) as ``mypy <flags> <files>`` would produce them.
+
+        Raises:
+            GateDaemonError: If dmypy failed or timed out.
+        """
+        cmd = [
+            *self.client,
+            "--status-file",
+            str(self._status_file),
+            "run",
+            "--timeout",
+            str(self.config.idle_timeout_seconds),
+            "--",
+            *self.flags,
+            *files,
+        ]
+        with self._lock:
+            try:
+                proc = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    check=False,
+                    cwd=cwd,
+                )
+            except subprocess.TimeoutExpired as exc:
+                raise GateDaemonError(f"dmypy run timed out after {timeout}s") from exc
+            except OSError as exc:
+                raise GateDaemonError(f"Cannot run {self.client[0]}: {exc}") from exc
+
+        stdout = "".join(
+            line
+            for line in (proc.stdout or "").splitlines(keepends=True)
+            if not line.startswith(_STATUS_PREFIXES)
+        )
+        has_errors = _ERROR_LINE.search(stdout) is not None
+        if proc.returncode == 2 and has_errors:
+            # Blocking errors (e.g. syntax errors): mypy exits 2 as well
+            return 2, stdout, proc.stderr or ""
+        if proc.returncode not in (0, 1):
+            detail = (proc.stderr or proc.stdout or "").strip()
+            raise GateDaemonError(f"dmypy run failed with exit code {proc.returncode}: {detail}")
+        # dmypy exits 1 on any output; mypy only on errors (notes alone pass)
+        return (1 if has_errors else 0), stdout, proc.stderr or ""
+
+    def stop(self) -> None:
+        """Stop the server (no-op when it never started)."""
+        if not self._status_file.exists():
+            return
+        for action in ("stop", "kill"):
+            with contextlib.suppress(OSError, subprocess.TimeoutExpired):
+                subprocess.run(
+                    [*self.client, "--status-file", str(self._status_file), action],
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    timeout=_STOP_TIMEOUT_SECONDS,
+                    check=False,
+                )
+            if not self._status_file.exists():
+                return
+        logger.warning("Could not stop dmypy server (%s)", self._status_file)
+
+
+class GateDaemonPool:
+    """Warm dmypy servers keyed by gate id.
+
+    Status files live under ``<workspace>/.st3/cache/dmypy``. When a gate's
+    command or daemon settings change, its old server is stopped and the next
+    run starts a fresh one.
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self._status_dir = workspace_root / ".st3" / "cache" / "dmypy"
+        self._daemons: dict[str, DmypyGateDaemon] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def get(self, gate_id: str, command: list[str], config: DaemonConfig) -> DmypyGateDaemon:
+        """Return the daemon serving *gate_id* for the resolved mypy *command*."""
+        client, flags = dmypy_command(command)
+        with self._lock:
+            current = self._daemons.get(gate_id)
+            if current is not None and (current.client, current.flags, current.config) == (
+                client,
+                flags,
+                config,
+            ):
+                return current
+            if current is not None:
+                current.stop()
+            try:
+                self._status_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                raise GateDaemonError(f"Cannot create {self._status_dir}: {exc}") from exc
+            daemon = DmypyGateDaemon(client, flags, self._status_dir / f"{gate_id}.json", config)
+            self._daemons[gate_id] = daemon
+            return daemon
+
+    def discard(self, gate_id: str) -> None:
+        """Stop and forget a daemon (after it failed a request)."""
+        with self._lock:
+            daemon = self._daemons.pop(gate_id, None)
+        if daemon is not None:
+            daemon.stop()
+
+    def close(self) -> None:
+        """Stop every daemon."""
+        with self._lock:
+            daemons = list(self._daemons.values())
+            self._daemons.clear()
+        for daemon in daemons:
+            daemon.stop()
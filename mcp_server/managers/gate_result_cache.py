@@ -0,0 +1,138 @@
+"""Content-hash cache of per-file quality gate results.
+
+Entries are stored per gate under a fingerprint of the gate configuration and
+tool version; a changed command, parser setting or tool upgrade invalidates
+the whole gate. Within a gate, a file's cached issues are reused while its
+content hash is unchanged.
+
+@layer: Backend (Managers)
+@dependencies: [hashlib, json, pathlib, mcp_server.schemas, mcp_server.utils.atomic_json_writer]
+@responsibilities:
+    - Fingerprint gate configuration + tool version
+    - Split a gate's file list into cache hits and misses by content hash
+    - Persist per-file issues to a JSON file under .st3/
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mcp_server.schemas import QualityGate
+from mcp_server.utils.atomic_json_writer import AtomicJsonWriter
+
+CACHE_SCHEMA_VERSION = 1
+
+
+@dataclass
+class GateCacheLookup:
+    """Result of splitting a gate's files into cached and stale entries."""
+
+    fingerprint: str
+    hits: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    misses: list[str] = field(default_factory=list)
+    hashes: dict[str, str] = field(default_factory=dict)
+
+
+class GateResultCache:
+    """Persistent ``gate_id → fingerprint → file → (sha256, issues)`` store."""
+
+    def __init__(self, cache_path: Path, workspace_root: Path) -> None:
+        self._path = cache_path
+        self._root = workspace_root.resolve()
+        self._data = self._load(cache_path)
+        self._dirty = False
+
+    @staticmethod
+    def fingerprint(gate_id: str, gate: QualityGate, tool_version: str) -> str:
+        """Hash everything that can change a gate's per-file output."""
+        payload = json.dumps(
+            {
+                "gate_id": gate_id,
+                "gate": gate.model_dump(mode="json"),
+                "tool_version": tool_version,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def content_hash(file_path: str) -> str | None:
+        """Return the SHA-256 of a file's bytes, or ``None`` when unreadable."""
+        try:
+            return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def lookup(self, gate_id: str, fingerprint: str, files: list[str]) -> GateCacheLookup:
+        """Split *files* into hits (cached issues) and misses (must be re-run).
+
+        Content hashes are taken here, before the gate runs, so a file edited
+        while the gate executes is stored under its old hash and re-checked later.
+        """
+        result = GateCacheLookup(fingerprint=fingerprint)
+        entry = self._data["gates"].get(gate_id, {})
+        cached_files: dict[str, Any] = (
+            entry.get("files", {}) if entry.get("fingerprint") == fingerprint else {}
+        )
+        for file_path in files:
+            digest = self.content_hash(file_path)
+            record = cached_files.get(self._key(file_path))
+            if digest is not None and record is not None and record.get("sha256") == digest:
+                result.hits[file_path] = list(record.get("issues", []))
+                continue
+            result.misses.append(file_path)
+            if digest is not None:
+                result.hashes[file_path] = digest
+        return result
+
+    def store(
+        self,
+        gate_id: str,
+        lookup: GateCacheLookup,
+        issues_by_file: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Record issues for files that were re-run (keyed by their lookup hash)."""
+        entry: dict[str, Any] | None = self._data["gates"].get(gate_id)
+        if entry is None or entry.get("fingerprint") != lookup.fingerprint:
+            entry = {"fingerprint": lookup.fingerprint, "files": {}}
+            self._data["gates"][gate_id] = entry
+        for file_path, issues in issues_by_file.items():
+            digest = lookup.hashes.get(file_path)
+            if digest is None:
+                continue
+            entry["files"][self._key(file_path)] = {"sha256": digest, "issues": issues}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk when it changed."""
+        if not self._dirty:
+            return
+        AtomicJsonWriter().write_json(self._path, self._data, temp_name=f"{self._path.name}.tmp")
+        self._dirty = False
+
+    def _key(self, file_path: str) -> str:
+        resolved = Path(file_path).resolve()
+        try:
+            return resolved.relative_to(self._root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    @staticmethod
+    def _load(cache_path: Path) -> dict[str, Any]:
+        """Read the cache file; start empty when absent, malformed or outdated."""
+        empty: dict[str, Any] = {"version": CACHE_SCHEMA_VERSION, "gates": {}}
+        if not cache_path.exists():
+            return empty
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return empty
+        if not isinstance(data, dict) or data.get("version") != CACHE_SCHEMA_VERSION:
+            return empty
+        if not isinstance(data.get("gates"), dict):
+            return empty
+        return data
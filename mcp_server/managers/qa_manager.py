@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
 import os
@@ -10,11 +12,19 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+import weakref
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from mcp_server.adapters.git_repository_cache import GitRepositoryCache
+from mcp_server.managers.gate_daemon import GateDaemonError, GateDaemonPool
+from mcp_server.managers.gate_result_cache import GateCacheLookup, GateResultCache
 from mcp_server.schemas import (
     JsonViolationsParsing,
     QualityConfig,
@@ -31,6 +41,33 @@ MAX_OUTPUT_LINES = 50
 MAX_OUTPUT_BYTES = 5120
 
 
+@dataclass(frozen=True)
+class _GateJob:
+    """A gate that resolved to a subprocess run (not skipped, not missing)."""
+
+    gate_number: int
+    gate_id: str
+    gate: QualityGate
+    files: list[str]
+    cache: GateCacheLookup | None = None
+
+
+@dataclass
+class _GateRunPlan:
+    """Result skeleton plus the gates a run still has to execute."""
+
+    results: dict[str, Any]
+    complete: bool = False  # early exit: no gate will execute
+    ordered: list[dict[str, Any] | _GateJob] = field(default_factory=list)
+    result_cache: GateResultCache | None = None
+    max_parallel: int = 1
+    started: float = 0.0
+
+    @property
+    def jobs(self) -> list[_GateJob]:
+        return [entry for entry in self.ordered if isinstance(entry, _GateJob)]
+
+
 def _venv_script_path(script_name: str) -> str:
     """Return a best-effort path to a venv script.
 
@@ -66,12 +103,23 @@ class QAManager:
 
     QA_LOG_MAX_FILES = DEFAULT_ARTIFACT_LOG_MAX_FILES
 
+    # Serializes artifact-log retention cleanup between concurrently running gates
+    _artifact_log_lock = threading.Lock()
+
     def __init__(
         self,
         workspace_root: Path | None = None,
         quality_config: QualityConfig | None = None,
+        gate_daemons: GateDaemonPool | None = None,
     ) -> None:
-        """Initialize QA Manager with injected quality configuration."""
+        """Initialize QA Manager with injected quality configuration.
+
+        Args:
+            workspace_root: Workspace root for baseline state and the result cache.
+            quality_config: Quality gate configuration.
+            gate_daemons: Warm daemon pool serving gates with ``execution.daemon``;
+                without it every gate runs its CLI command.
+        """
         # Runtime configuration (lowercase for instance mutability)
         self.qa_log_dir = self.QA_LOG_DIR
         self.qa_log_enabled = self.QA_LOG_ENABLED
@@ -79,6 +127,12 @@ class QAManager:
         # Optional workspace root: used for baseline state persistence in .st3/state.json
         self.workspace_root = workspace_root
         self._quality_config = quality_config
+        # asyncio primitives bind to one event loop, so each loop gets its own semaphore
+        self._process_slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._process_slots_lock = threading.Lock()
+        self._gate_daemons = gate_daemons
 
     def run_quality_gates(
         self,
@@ -93,7 +147,38 @@ class QAManager:
             - Gate catalog and active gates are defined in `.st3/config/quality.yaml`.
             - Each gate filters files by its configured `capabilities.file_types`.
             - Some gates (e.g., pytest) are repo-scoped and ignore file lists.
+            - Blocks the calling thread; async callers use `run_quality_gates_async`.
+        """
+        plan = self._plan_quality_gates(files, run_started=time.monotonic())
+        if plan.complete:
+            return plan.results
+        executed = self._run_gate_jobs(plan.jobs, plan.max_parallel)
+        return self._complete_quality_gates(plan, executed, files, effective_scope)
+
+    async def run_quality_gates_async(
+        self,
+        files: list[str],
+        effective_scope: str = "auto",
+    ) -> dict[str, Any]:
+        """Run quality gates without blocking the event loop.
+
+        Same result as `run_quality_gates`, but gate tools run as asyncio
+        subprocesses and the remaining blocking work (file hashing, version
+        probes, state files) runs in worker threads. Cancelling the awaiting
+        task kills the running gate processes.
         """
+        plan = await asyncio.to_thread(
+            self._plan_quality_gates, files, run_started=time.monotonic()
+        )
+        if plan.complete:
+            return plan.results
+        executed = await self._run_gate_jobs_async(plan.jobs, plan.max_parallel)
+        return await asyncio.to_thread(
+            self._complete_quality_gates, plan, executed, files, effective_scope
+        )
+
+    def _plan_quality_gates(self, files: list[str], run_started: float) -> _GateRunPlan:
+        """Build the v2.0 result skeleton and resolve which gates must execute."""
         mode = "file-specific" if files else "project-level"
 
         # Initialize v2.0 response schema
@@ -127,7 +212,7 @@ class QAManager:
                     "issues": [{"message": f"File not found: {f}"} for f in missing_files],
                 },
             )
-            return results
+            return _GateRunPlan(results, complete=True)
 
         python_files = list(existing_files)
 
@@ -152,15 +237,26 @@ class QAManager:
                     ],
                 },
             )
-            return results
+            return _GateRunPlan(results, complete=True)
 
         gate_catalog = quality_config.gates
+        result_cache = self._open_result_cache()
+        # Tool version probes, memoized for this run only (cache fingerprints)
+        tool_versions: dict[tuple[str, ...], str] = {}
+        plan = _GateRunPlan(
+            results,
+            result_cache=result_cache,
+            max_parallel=quality_config.max_parallel_gates,
+            started=run_started,
+        )
 
+        # Resolve catalog lookups and file scoping up front; only the remaining
+        # jobs spawn subprocesses. Results are appended in active_gates order.
+        ordered = plan.ordered
         for idx, gate_id in enumerate(quality_config.active_gates, start=1):
             gate = gate_catalog.get(gate_id)
             if gate is None:
-                self._update_summary_and_append_gate(
-                    results,
+                ordered.append(
                     {
                         "gate_number": idx,
                         "name": gate_id,
@@ -171,15 +267,14 @@ class QAManager:
                                 "message": f"Active gate not found in catalog: {gate_id}",
                             }
                         ],
-                    },
+                    }
                 )
                 continue
 
             gate_files = self._files_for_gate(gate, python_files)
             skip_reason = "Skipped (no matching files)" if not gate_files else None
             if skip_reason is not None:
-                self._update_summary_and_append_gate(
-                    results,
+                ordered.append(
                     {
                         "gate_number": idx,
                         "id": idx,
@@ -189,18 +284,54 @@ class QAManager:
                         "skip_reason": skip_reason,
                         "score": skip_reason,
                         "issues": [],
-                    },
+                    }
+                )
+                continue
+
+            lookup: GateCacheLookup | None = None
+            if result_cache is not None and gate.capabilities.cacheable:
+                fingerprint = result_cache.fingerprint(
+                    gate_id, gate, self._tool_version(gate, tool_versions)
                 )
+                lookup = result_cache.lookup(gate_id, fingerprint, gate_files)
+                if not lookup.misses:
+                    ordered.append(self._build_cached_gate_result(gate_id, gate, idx, lookup))
+                    continue
+                gate_files = lookup.misses
+            ordered.append(_GateJob(idx, gate_id, gate, gate_files, lookup))
+        return plan
+
+    def _complete_quality_gates(
+        self,
+        plan: _GateRunPlan,
+        executed: dict[int, dict[str, Any]],
+        files: list[str],
+        effective_scope: str,
+    ) -> dict[str, Any]:
+        """Merge executed gates into the plan, then update timings, cache and baseline."""
+        results = plan.results
+        result_cache = plan.result_cache
+        for entry in plan.ordered:
+            if not isinstance(entry, _GateJob):
+                self._update_summary_and_append_gate(results, entry)
                 continue
-            gate_result = self._execute_gate(gate, gate_files, gate_number=idx, gate_id=gate_id)
+            gate_result = executed[entry.gate_number]
+            if result_cache is not None and entry.cache is not None:
+                issues_by_file = self._issues_by_file(entry.gate, entry.files, gate_result)
+                if issues_by_file is not None:
+                    result_cache.store(entry.gate_id, entry.cache, issues_by_file)
+                self._merge_cached_issues(entry, gate_result)
             self._update_summary_and_append_gate(results, gate_result)
+        if result_cache is not None:
+            result_cache.save()
 
-        # Build top-level timing breakdown (Improvement E)
+        # Build top-level timing breakdown (Improvement E). Gates may overlap, so
+        # "total" is the wall-clock time of the run, not the sum of gate durations.
         timings: dict[str, int] = {}
         for gate_result in results["gates"]:
             gate_id_key = str(gate_result.get("gate_number", gate_result.get("id", "?")))
             timings[gate_id_key] = gate_result.get("duration_ms", 0)
-        timings["total"] = sum(timings.values())
+        timings["total"] = round((time.monotonic() - plan.started) * 1000)
         results["timings"] = timings
 
         # Persist baseline state only for auto-scope lifecycle runs.
@@ -213,6 +344,197 @@ class QAManager:
 
         return results
 
+    def _run_gate_jobs(self, jobs: list[_GateJob], max_parallel: int) -> dict[int, dict[str, Any]]:
+        """Execute gate jobs, up to ``max_parallel`` at a time.
+
+        Gates are started in active_gates order as soon as their ``depends_on``
+        gates have finished and a slot is free; an ``exclusive`` gate waits for
+        running gates to drain and runs alone. With ``max_parallel == 1`` the
+        gates run inline on the calling thread.
+
+        Returns:
+            Gate results keyed by gate_number.
+        """
+        pending = list(jobs)
+        results: dict[int, dict[str, Any]] = {}
+
+        if max_parallel <= 1:
+            while pending:
+                job = self._startable_gate_jobs(pending, [], 1)[0]
+                pending.remove(job)
+                results[job.gate_number] = self._execute_gate(
+                    job.gate, job.files, gate_number=job.gate_number, gate_id=job.gate_id
+                )
+            return results
+
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="qa-gate") as pool:
+            running: dict[Future[dict[str, Any]], _GateJob] = {}
+            while pending or running:
+                for job in self._startable_gate_jobs(pending, list(running.values()), max_parallel):
+                    pending.remove(job)
+                    future = pool.submit(
+                        self._execute_gate,
+                        job.gate,
+                        job.files,
+                        gate_number=job.gate_number,
+                        gate_id=job.gate_id,
+                    )
+                    running[future] = job
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    results[job.gate_number] = future.result()
+        return results
+
+    async def _run_gate_jobs_async(
+        self, jobs: list[_GateJob], max_parallel: int
+    ) -> dict[int, dict[str, Any]]:
+        """Async counterpart of `_run_gate_jobs` (same scheduling rules).
+
+        If the caller is cancelled, the running gate tasks are cancelled too,
+        which kills their child processes.
+        """
+        pending = list(jobs)
+        results: dict[int, dict[str, Any]] = {}
+        running: dict[asyncio.Task[dict[str, Any]], _GateJob] = {}
+        try:
+            while pending or running:
+                for job in self._startable_gate_jobs(pending, list(running.values()), max_parallel):
+                    pending.remove(job)
+                    task = asyncio.create_task(
+                        self._execute_gate_async(
+                            job.gate, job.files, gate_number=job.gate_number, gate_id=job.gate_id
+                        )
+                    )
+                    running[task] = job
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    job = running.pop(task)
+                    results[job.gate_number] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        return results
+
+    @staticmethod
+    def _startable_gate_jobs(
+        pending: Sequence[_GateJob], running: Sequence[_GateJob], capacity: int
+    ) -> list[_GateJob]:
+        """Select pending jobs that may start now (see _run_gate_jobs)."""
+        if any(job.gate.exclusive for job in running):
+            return []
+        unfinished = {job.gate_id for job in (*pending, *running)}
+        busy = len(running)
+        startable: list[_GateJob] = []
+        for job in pending:
+            if busy >= capacity:
+                break
+            if unfinished.intersection(job.gate.depends_on):
+                continue
+            if job.gate.exclusive:
+                if busy == 0:
+                    startable.append(job)
+                # Later gates must not overtake a waiting exclusive gate
+                break
+            startable.append(job)
+            busy += 1
+        return startable
+
+    # ------------------------------------------------------------------
+    # Incremental result cache
+    # ------------------------------------------------------------------
+
+    def _open_result_cache(self) -> GateResultCache | None:
+        """Load the per-file result cache (.st3/cache/quality_gates.json).
+
+        Only available when workspace_root is set; gates opt in through
+        ``capabilities.cacheable``.
+        """
+        if self.workspace_root is None:
+            return None
+        cache_path = self.workspace_root / ".st3" / "cache" / "quality_gates.json"
+        return GateResultCache(cache_path, self.workspace_root)
+
+    def _tool_version(self, gate: QualityGate, tool_versions: dict[tuple[str, ...], str]) -> str:
+        """Return the gate tool's ``--version`` line, probed once per tool into *tool_versions*."""
+        cmd = self._resolve_command(gate.execution.command, [])
+        key = tuple(cmd[:3])
+        if key not in tool_versions:
+            environment = self._collect_environment_metadata(cmd)
+            tool_versions[key] = environment.get("tool_version", "")
+        return tool_versions[key]
+
+    def _issues_by_file(
+        self, gate: QualityGate, files: list[str], gate_result: dict[str, Any]
+    ) -> dict[str, list[dict[str, Any]]] | None:
+        """Attribute a gate run's issues to its input files.
+
+        Returns ``None`` (do not cache) when the tool did not complete normally
+        or an issue cannot be attributed to exactly one input file.
+        """
+        command = gate_result.get("command")
+        if not isinstance(command, dict):
+            return None  # timeout / tool not found
+        exit_ok = command.get("exit_code") in gate.success.exit_codes_ok
+        issues: list[dict[str, Any]] = gate_result.get("issues", [])
+
+        if gate.capabilities.parsing_strategy is None:
+            return {file_path: [] for file_path in files} if exit_ok else None
+        if not exit_ok and not issues:
+            return None  # tool failed without reporting violations (e.g. crashed)
+
+        cwd = Path(gate.execution.working_dir or ".")
+        by_resolved = {(cwd / file_path).resolve(): file_path for file_path in files}
+        issues_by_file: dict[str, list[dict[str, Any]]] = {file_path: [] for file_path in files}
+        for issue in issues:
+            issue_file = issue.get("file")
+            owner = by_resolved.get((cwd / issue_file).resolve()) if issue_file else None
+            if owner is None:
+                return None
+            issues_by_file[owner].append(issue)
+        return issues_by_file
+
+    def _build_cached_gate_result(
+        self, gate_id: str, gate: QualityGate, gate_number: int, lookup: GateCacheLookup
+    ) -> dict[str, Any]:
+        """Build a gate result entirely from cached per-file issues (no subprocess)."""
+        result: dict[str, Any] = {
+            "gate_number": gate_number,
+            "id": gate_number,
+            "name": gate.name,
+            "passed": True,
+            "status": "passed",
+            "skip_reason": None,
+            "score": "Pass",
+            "issues": [],
+            "duration_ms": 0,
+        }
+        self._merge_cached_issues(_GateJob(gate_number, gate_id, gate, [], lookup), result)
+        return result
+
+    def _merge_cached_issues(self, job: _GateJob, gate_result: dict[str, Any]) -> None:
+        """Fold cached issues of unchanged files into a (partial) gate result."""
+        lookup = job.cache
+        if lookup is None:
+            return
+        gate_result["cache"] = {"hits": len(lookup.hits), "misses": len(lookup.misses)}
+        cached_issues = [issue for issues in lookup.hits.values() for issue in issues]
+        if not cached_issues:
+            return
+
+        issues = [*gate_result.get("issues", []), *cached_issues]
+        gate_result["issues"] = issues
+        if gate_result.get("score") in {"Timeout", "Not Found"}:
+            return
+        gate_result["passed"] = False
+        gate_result["status"] = "failed"
+        gate_result["score"] = f"Fail ({len(issues)} violations)"
+        gate_result["hints"] = self._gate_hints(
+            job.gate_id, job.gate, [*lookup.misses, *lookup.hits]
+        )
+
     def _update_summary_and_append_gate(
         self, results: dict[str, Any], gate_result: dict[str, Any]
     ) -> None:
@@ -331,18 +653,9 @@ class QAManager:
     def _get_head_sha(self) -> str | None:
         """Return the current git HEAD commit SHA, or None on error."""
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                stdin=subprocess.DEVNULL,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            return GitRepositoryCache.for_path(self.workspace_root).head_sha()
         except OSError:
-            pass
-        return None
+            return None
 
     @staticmethod
     def _load_state_json(state_path: Path) -> dict[str, Any]:
@@ -452,12 +765,10 @@ class QAManager:
         """
         diff_ref = f"{base_ref}...HEAD" if use_merge_base else f"{base_ref}..HEAD"
         try:
-            result = subprocess.run(
-                ["git", "diff", "--name-only", "--diff-filter=d", diff_ref],
-                stdin=subprocess.DEVNULL,
-                capture_output=True,
-                text=True,
-                check=False,
+            # Memoized on the (base, HEAD) SHAs: repeated scope resolution is in-process
+            result = GitRepositoryCache.for_path(self.workspace_root).git(
+                ["diff", "--name-only", "--diff-filter=d", diff_ref],
+                refs=(base_ref, "HEAD"),
             )
             if result.returncode != 0:
                 return []
@@ -881,7 +1192,8 @@ class QAManager:
 
             artifact_body = json.dumps(payload, ensure_ascii=False, indent=2)
             artifact_path.write_text(artifact_body, encoding="utf-8")
-            self._cleanup_artifact_logs()
+            with self._artifact_log_lock:
+                self._cleanup_artifact_logs()
             return artifact_path.as_posix()
         except OSError:
             return None
@@ -891,7 +1203,159 @@ class QAManager:
     ) -> dict[str, Any]:
         """Execute a single gate using its configured parsing strategy."""
 
-        result: dict[str, Any] = {
+        result = self._new_gate_result(gate, gate_number)
+        cmd: list[str] = []
+        try:
+            cmd = self._resolve_command(gate.execution.command, files)
+            start_time = time.monotonic()
+            served = self._run_gate_daemon(gate, files, gate_id)
+            if served is None:
+                proc = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=gate.execution.timeout_seconds,
+                    check=False,
+                    cwd=gate.execution.working_dir,
+                )
+                served = (proc.returncode, proc.stdout or "", proc.stderr or "")
+            returncode, stdout, stderr = served
+            duration_ms = round((time.monotonic() - start_time) * 1000)
+            self._apply_gate_output(
+                result,
+                gate,
+                cmd,
+                returncode=returncode,
+                stdout=stdout,
+                stderr=stderr,
+                duration_ms=duration_ms,
+                environment=self._collect_environment_metadata(cmd),
+            )
+        except subprocess.TimeoutExpired:
+            self._apply_gate_error(result, "Timeout", f"{gate.name} timed out")
+        except FileNotFoundError as e:
+            self._apply_gate_error(result, "Not Found", f"Tool not found: {e}")
+
+        return self._finalize_gate_result(result, gate, cmd, files, gate_number, gate_id)
+
+    async def _execute_gate_async(
+        self, gate: QualityGate, files: list[str], gate_number: int, gate_id: str | None = None
+    ) -> dict[str, Any]:
+        """Async counterpart of `_execute_gate` (asyncio subprocess, same result shape)."""
+        result = self._new_gate_result(gate, gate_number)
+        cmd: list[str] = []
+        try:
+            cmd = self._resolve_command(gate.execution.command, files)
+            start_time = time.monotonic()
+            async with self._gate_process_slots():
+                served = await asyncio.to_thread(self._run_gate_daemon, gate, files, gate_id)
+                if served is None:
+                    served = await self._run_gate_process(
+                        cmd, gate.execution.timeout_seconds, gate.execution.working_dir
+                    )
+            returncode, stdout, stderr = served
+            duration_ms = round((time.monotonic() - start_time) * 1000)
+            environment = await asyncio.to_thread(self._collect_environment_metadata, cmd)
+            self._apply_gate_output(
+                result,
+                gate,
+                cmd,
+                returncode=returncode,
+                stdout=stdout,
+                stderr=stderr,
+                duration_ms=duration_ms,
+                environment=environment,
+            )
+        except TimeoutError:
+            self._apply_gate_error(result, "Timeout", f"{gate.name} timed out")
+        except FileNotFoundError as e:
+            self._apply_gate_error(result, "Not Found", f"Tool not found: {e}")
+
+        return await asyncio.to_thread(
+            self._finalize_gate_result, result, gate, cmd, files, gate_number, gate_id
+        )
+
+    def _run_gate_daemon(
+        self, gate: QualityGate, files: list[str], gate_id: str | None
+    ) -> tuple[int, str, str] | None:
+        """Check *files* on the gate's warm dmypy server instead of a cold mypy run.
+
+        Returns:
+            (returncode, stdout, stderr) as the gate's CLI command would produce
+            them, or ``None`` when the gate has no daemon or the daemon failed;
+            the caller then runs the CLI command instead.
+        """
+        daemon_config = gate.execution.daemon
+        if self._gate_daemons is None or daemon_config is None or not files or not gate_id:
+            return None
+        try:
+            daemon = self._gate_daemons.get(
+                gate_id, self._resolve_command(gate.execution.command, []), daemon_config
+            )
+            return daemon.check(
+                files, timeout=gate.execution.timeout_seconds, cwd=gate.execution.working_dir
+            )
+        except GateDaemonError as exc:
+            logger.warning("Gate daemon for %s unavailable, running CLI: %s", gate_id, exc)
+            self._gate_daemons.discard(gate_id)
+            return None
+
+    def _gate_process_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrently running gate processes of this manager.
+
+        Shared by all concurrent `run_quality_gates_async` calls on the running
+        event loop, sized by ``max_parallel_gates``. Each loop gets its own
+        semaphore (asyncio primitives cannot be shared across loops), so
+        consecutive ``asyncio.run`` calls on one manager keep working.
+        """
+        loop = asyncio.get_running_loop()
+        with self._process_slots_lock:
+            slots = self._process_slots.get(loop)
+            if slots is None:
+                slots = asyncio.Semaphore(self._require_quality_config().max_parallel_gates)
+                self._process_slots[loop] = slots
+            return slots
+
+    @staticmethod
+    async def _run_gate_process(
+        cmd: list[str], timeout_seconds: int, cwd: str | None
+    ) -> tuple[int, str, str]:
+        """Run a gate command; kill it on timeout or cancellation.
+
+        Returns:
+            (returncode, stdout, stderr)
+
+        Raises:
+            TimeoutError: When the command exceeds ``timeout_seconds``.
+            FileNotFoundError: When the executable does not exist.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout_seconds)
+        except BaseException:
+            # Timeout or task cancellation: never leave the tool running
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+            raise
+        returncode = proc.returncode if proc.returncode is not None else -1
+        return (
+            returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    @staticmethod
+    def _new_gate_result(gate: QualityGate, gate_number: int) -> dict[str, Any]:
+        return {
             "gate_number": gate_number,
             "id": gate_number,
             "name": gate.name,
@@ -902,111 +1366,113 @@ class QAManager:
             "issues": [],
         }
 
-        cmd: list[str] = []
-        try:
-            cmd = self._resolve_command(gate.execution.command, files)
-            start_time = time.monotonic()
-            proc = subprocess.run(
-                cmd,
-                stdin=subprocess.DEVNULL,
-                capture_output=True,
-                text=True,
-                timeout=gate.execution.timeout_seconds,
-                check=False,
-                cwd=gate.execution.working_dir,
+    @staticmethod
+    def _apply_gate_error(result: dict[str, Any], score: str, message: str) -> None:
+        result["passed"] = False
+        result["score"] = score
+        result["issues"] = [{"message": message}]
+
+    def _apply_gate_output(
+        self,
+        result: dict[str, Any],
+        gate: QualityGate,
+        cmd: list[str],
+        *,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        duration_ms: int,
+        environment: dict[str, str],
+    ) -> None:
+        """Fill a gate result from a finished tool run (parsing strategy / exit code)."""
+        result["duration_ms"] = duration_ms
+        result["command"] = {
+            "executable": cmd[0] if cmd else "",
+            "args": cmd[1:] if len(cmd) > 1 else [],
+            "cwd": gate.execution.working_dir,
+            "exit_code": returncode,
+            "environment": environment,
+        }
+
+        if gate.capabilities.parsing_strategy == "json_violations":
+            assert gate.capabilities.json_violations is not None, (
+                "json_violations capabilities required when parsing_strategy='json_violations'"
             )
-            duration_ms = round((time.monotonic() - start_time) * 1000)
+            raw: list[dict[str, Any]] | dict[str, Any] = json.loads(stdout or "[]")
+            violations = self._parse_json_violations(
+                self._extract_violations_array(raw, gate.capabilities.json_violations),
+                gate.capabilities.json_violations,
+            )
+            result["issues"] = [
+                {
+                    "message": v.message,
+                    "file": v.file,
+                    "line": v.line,
+                    "col": v.col,
+                    "rule": v.rule,
+                    "severity": v.severity,
+                    "fixable": v.fixable,
+                }
+                for v in violations
+            ]
+            result["passed"] = len(violations) == 0
+            result["score"] = "Pass" if result["passed"] else f"Fail ({len(violations)} violations)"
 
-            result["duration_ms"] = duration_ms
-            result["command"] = {
-                "executable": cmd[0] if cmd else "",
-                "args": cmd[1:] if len(cmd) > 1 else [],
-                "cwd": gate.execution.working_dir,
-                "exit_code": proc.returncode,
-                "environment": self._collect_environment_metadata(cmd),
-            }
+        elif gate.capabilities.parsing_strategy == "text_violations":
+            assert gate.capabilities.text_violations is not None, (
+                "text_violations capabilities required when parsing_strategy='text_violations'"
+            )
+            text_violations = self._parse_text_violations(
+                stdout,
+                gate.capabilities.text_violations,
+                gate.capabilities.supports_autofix,
+            )
+            result["issues"] = [
+                {
+                    "message": v.message,
+                    "file": v.file,
+                    "line": v.line,
+                    "col": v.col,
+                    "rule": v.rule,
+                    "severity": v.severity,
+                    "fixable": v.fixable,
+                }
+                for v in text_violations
+            ]
+            result["passed"] = len(text_violations) == 0
+            result["score"] = (
+                "Pass" if result["passed"] else f"Fail ({len(text_violations)} violations)"
+            )
 
-            if gate.capabilities.parsing_strategy == "json_violations":
-                assert gate.capabilities.json_violations is not None, (
-                    "json_violations capabilities required when parsing_strategy='json_violations'"
-                )
-                raw: list[dict[str, Any]] | dict[str, Any] = json.loads(proc.stdout or "[]")
-                violations = self._parse_json_violations(
-                    self._extract_violations_array(raw, gate.capabilities.json_violations),
-                    gate.capabilities.json_violations,
-                )
-                result["issues"] = [
-                    {
-                        "message": v.message,
-                        "file": v.file,
-                        "line": v.line,
-                        "col": v.col,
-                        "rule": v.rule,
-                        "severity": v.severity,
-                        "fixable": v.fixable,
-                    }
-                    for v in violations
-                ]
-                result["passed"] = len(violations) == 0
-                result["score"] = (
-                    "Pass" if result["passed"] else f"Fail ({len(violations)} violations)"
-                )
+        else:  # no parsing_strategy → pass/fail on exit code
+            ok_codes = set(gate.success.exit_codes_ok)
 
-            elif gate.capabilities.parsing_strategy == "text_violations":
-                assert gate.capabilities.text_violations is not None, (
-                    "text_violations capabilities required when parsing_strategy='text_violations'"
-                )
-                text_violations = self._parse_text_violations(
-                    proc.stdout or "",
-                    gate.capabilities.text_violations,
-                    gate.capabilities.supports_autofix,
-                )
+            if returncode in ok_codes:
+                result["passed"] = True
+                result["score"] = "Pass"
+                result["issues"] = []
+            else:
+                result["passed"] = False
+                result["score"] = f"Fail (exit={returncode})"
+                output_capture = self._build_output_capture(stdout, stderr)
+                result["output"] = output_capture
                 result["issues"] = [
                     {
-                        "message": v.message,
-                        "file": v.file,
-                        "line": v.line,
-                        "col": v.col,
-                        "rule": v.rule,
-                        "severity": v.severity,
-                        "fixable": v.fixable,
+                        "message": f"Gate failed with exit code {returncode}",
+                        "details": output_capture["details"],
                     }
-                    for v in text_violations
                 ]
-                result["passed"] = len(text_violations) == 0
-                result["score"] = (
-                    "Pass" if result["passed"] else f"Fail ({len(text_violations)} violations)"
-                )
-
-            else:  # no parsing_strategy → pass/fail on exit code
-                ok_codes = set(gate.success.exit_codes_ok)
-
-                if proc.returncode in ok_codes:
-                    result["passed"] = True
-                    result["score"] = "Pass"
-                    result["issues"] = []
-                else:
-                    result["passed"] = False
-                    result["score"] = f"Fail (exit={proc.returncode})"
-                    output_capture = self._build_output_capture(
-                        proc.stdout or "", proc.stderr or ""
-                    )
-                    result["output"] = output_capture
-                    result["issues"] = [
-                        {
-                            "message": f"Gate failed with exit code {proc.returncode}",
-                            "details": output_capture["details"],
-                        }
-                    ]
-        except subprocess.TimeoutExpired:
-            result["passed"] = False
-            result["score"] = "Timeout"
-            result["issues"] = [{"message": f"{gate.name} timed out"}]
-        except FileNotFoundError as e:
-            result["passed"] = False
-            result["score"] = "Not Found"
-            result["issues"] = [{"message": f"Tool not found: {e}"}]
 
+    def _finalize_gate_result(
+        self,
+        result: dict[str, Any],
+        gate: QualityGate,
+        cmd: list[str],
+        files: list[str],
+        gate_number: int,
+        gate_id: str | None,
+    ) -> dict[str, Any]:
+        """Mark failures, write the artifact log and attach re-run hints."""
         if not result["passed"]:
             result["status"] = "failed"
             artifact_path = self._write_artifact_log(gate_number, gate.name, cmd, files, result)
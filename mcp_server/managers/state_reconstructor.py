@@ -14,12 +14,12 @@ from __future__ import annotations
 
 # Standard library
 import logging
-import os
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 
 # Project modules
+from mcp_server.adapters.git_repository_cache import GitRepositoryCache
 from mcp_server.core.phase_detection import ScopeDecoder
 from mcp_server.managers.project_manager import ProjectManager
 from mcp_server.managers.state_repository import BranchState
@@ -108,27 +108,17 @@ class StateReconstructor:
         return fallback_phase
 
     def _get_git_commits(self, branch: str, limit: int = 50) -> list[str]:
-        """Return recent commit subjects for one branch."""
+        """Return recent commit subjects for one branch (memoized per branch SHA)."""
         try:
-            env = os.environ.copy()
-            env.setdefault("GIT_TERMINAL_PROMPT", "0")
-            env.setdefault("GIT_PAGER", "cat")
-            env.setdefault("PAGER", "cat")
-
-            result = subprocess.run(
-                ["git", "log", f"--max-count={limit}", "--pretty=%s", branch],
-                cwd=self._workspace_root,
-                stdin=subprocess.DEVNULL,
-                capture_output=True,
-                text=True,
-                check=True,
+            result = GitRepositoryCache.for_path(self._workspace_root).git(
+                ["log", f"--max-count={limit}", "--pretty=%s", branch],
+                refs=(branch,),
                 timeout=2,
-                env=env,
             )
+            if result.returncode != 0:
+                msg = f"Git log failed: {result.stderr}"
+                raise RuntimeError(msg)
             return [line.strip() for line in result.stdout.splitlines() if line.strip()]
-        except subprocess.CalledProcessError as exc:
-            msg = f"Git log failed: {exc.stderr}"
-            raise RuntimeError(msg) from exc
         except subprocess.TimeoutExpired as exc:
             msg = "Git log command timed out"
             raise RuntimeError(msg) from exc
@@ -0,0 +1,20 @@
+"""Resource for per-tool call metrics."""
+
+import json
+
+from mcp_server.core.tool_metrics import ToolMetrics
+from mcp_server.resources.base import BaseResource
+
+
+class MetricsResource(BaseResource):
+    """Exposes tool call counts, errors and stage latency histograms."""
+
+    uri_pattern = "st3://metrics"
+    description = "Per-tool call counts, errors and latency histograms by dispatch stage"
+
+    def __init__(self, metrics: ToolMetrics) -> None:
+        self._metrics = metrics
+
+    async def read(self, uri: str) -> str:  # noqa: ARG002
+        """Read the current metrics snapshot."""
+        return json.dumps(self._metrics.snapshot(), indent=2)
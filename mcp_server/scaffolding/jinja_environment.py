@@ -0,0 +1,125 @@
+# mcp_server/scaffolding/jinja_environment.py
+"""
+Shared Jinja2 environments for scaffold templates.
+
+Renderers, the template analyzer and the introspector all ask this module
+for their Environment, so each template root is loaded and compiled once per
+process instead of once per caller. Once the server has configured its
+workspace (:func:`configure_bytecode_cache`), compiled templates are also
+persisted in a FileSystemBytecodeCache under ``<workspace>/.st3/cache/jinja``:
+Jinja keys each entry on template name and file path and rejects it when the
+source checksum differs, while ``auto_reload`` re-checks the file mtime, so
+edited templates are recompiled on their next use.
+
+Only template roots inside the configured workspace or the bundled package
+templates get the on-disk cache; other roots (e.g. temporary test
+directories) are shared in memory only, so they do not leave stale entries
+behind.
+
+@layer: Backend (Scaffolding)
+@dependencies: [jinja2, threading]
+@responsibilities:
+    - Hand out one Environment per template root
+    - Persist compiled templates in the configured workspace's bytecode cache
+    - Precompile all templates of a root ahead of first use
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIX = ".jinja2"
+
+_PACKAGE_TEMPLATES = (Path(__file__).parent / "templates").resolve()
+
+_environments: dict[Path, Environment] = {}
+_workspace: tuple[Path, Path] | None = None
+_lock = threading.Lock()
+
+
+def configure_bytecode_cache(workspace_root: Path | None, cache_dir: Path | None = None) -> None:
+    """Set the workspace whose templates are cached on disk, and where.
+
+    Environments handed out earlier are dropped, so later callers pick up
+    the new cache. ``None`` keeps every environment in memory only.
+
+    Args:
+        workspace_root: Server workspace root (``settings.server.workspace_root``).
+        cache_dir: Bytecode cache directory; defaults to
+            ``<workspace_root>/.st3/cache/jinja``.
+    """
+    global _workspace
+    with _lock:
+        if workspace_root is None:
+            _workspace = None
+        else:
+            root = Path(workspace_root).resolve()
+            _workspace = (root, Path(cache_dir or root / ".st3" / "cache" / "jinja").resolve())
+        _environments.clear()
+
+
+def _bytecode_cache_for(root: Path) -> FileSystemBytecodeCache | None:
+    if _workspace is None:
+        return None
+    workspace, cache_dir = _workspace
+    if not (root.is_relative_to(workspace) or root.is_relative_to(_PACKAGE_TEMPLATES)):
+        return None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def get_environment(template_root: Path) -> Environment:
+    """Return the process-wide Environment for *template_root*.
+
+    Args:
+        template_root: Directory the templates are loaded from.
+
+    Returns:
+        Environment with scaffold rendering options, shared by all callers.
+    """
+    root = Path(template_root).resolve()
+    with _lock:
+        env = _environments.get(root)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(str(root)),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                keep_trailing_newline=True,
+                auto_reload=True,
+                bytecode_cache=_bytecode_cache_for(root),
+            )
+            _environments[root] = env
+        return env
+
+
+def precompile_templates(template_root: Path) -> int:
+    """Compile every template under *template_root* into the shared environment.
+
+    Templates that fail to compile are skipped; their errors surface again
+    when they are rendered.
+
+    Returns:
+        Number of templates compiled.
+    """
+    root = Path(template_root)
+    env = get_environment(root)
+    compiled = 0
+    for path in sorted(root.rglob(f"*{TEMPLATE_SUFFIX}")):
+        name = path.relative_to(root).as_posix()
+        try:
+            env.get_template(name)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Skipping precompile of %s: %s", name, e)
+            continue
+        compiled += 1
+    return compiled
@@ -3,9 +3,10 @@
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, TemplateNotFound
 
 from mcp_server.core.exceptions import ExecutionError
+from mcp_server.scaffolding.jinja_environment import get_environment
 
 
 class JinjaRenderer:
@@ -24,19 +25,10 @@ class JinjaRenderer:
             parent = Path(__file__).parent.parent
             self.template_dir = parent / "templates"
 
-        self._env: Environment | None = None
-
     @property
     def env(self) -> Environment:
-        """Get or create the Jinja2 environment."""
-        if self._env is None:
-            self._env = Environment(
-                loader=FileSystemLoader(str(self.template_dir)),
-                trim_blocks=True,
-                lstrip_blocks=True,
-                keep_trailing_newline=True,
-            )
-        return self._env
+        """Get the shared Jinja2 environment for the template directory."""
+        return get_environment(self.template_dir)
 
     def get_template(self, template_name: str) -> Any:  # noqa: ANN401
         """Load a template by name.
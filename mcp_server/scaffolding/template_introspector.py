@@ -21,6 +21,7 @@ import jinja2
 from jinja2 import meta, nodes
 
 from mcp_server.core.exceptions import ExecutionError
+from mcp_server.scaffolding.jinja_environment import get_environment
 from mcp_server.validation.template_analyzer import TemplateAnalyzer
 
 # System fields injected by ArtifactManager - NOT agent responsibility
@@ -218,7 +219,7 @@ def introspect_template_with_inheritance(template_root: Path, template_path: str
         )
 
     chain = TemplateAnalyzer(template_root).get_inheritance_chain(full_path)
-    env = jinja2.Environment(loader=jinja2.FileSystemLoader(template_root))
+    env = get_environment(template_root)
 
     all_vars: set[str] = set()
     for template_file in chain:
@@ -1,14 +1,18 @@
 # pyright: reportMissingImports=false
 """MCP Server Entrypoint."""
 
+from __future__ import annotations
+
 import asyncio
 import json
 import sys
+import threading
 import time
 import uuid
+from functools import cached_property
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import anyio
 from mcp.server import Server
@@ -26,96 +30,95 @@ from pydantic import AnyUrl, BaseModel, ValidationError
 # Config
 from mcp_server.config.loader import ConfigLoader, resolve_config_root
 from mcp_server.config.settings import Settings
-from mcp_server.config.validator import ConfigValidator
+from mcp_server.config.snapshot import ConfigSnapshot
 from mcp_server.core.exceptions import MCPError
 from mcp_server.core.logging import get_logger, setup_logging
 from mcp_server.core.operation_notes import NoteContext
-from mcp_server.core.phase_detection import ScopeDecoder
-from mcp_server.managers.artifact_manager import ArtifactManager
-from mcp_server.managers.deliverable_checker import DeliverableChecker
-from mcp_server.managers.enforcement_runner import EnforcementContext, EnforcementRunner
-from mcp_server.managers.git_manager import GitManager
-from mcp_server.managers.github_manager import GitHubManager
-from mcp_server.managers.phase_contract_resolver import (
-    MergeReadinessContext,
-    PhaseConfigContext,
-    PhaseContractResolver,
-)
-from mcp_server.managers.phase_state_engine import PhaseStateEngine
-from mcp_server.managers.project_manager import ProjectManager
-from mcp_server.managers.pytest_runner import PytestRunner
-from mcp_server.managers.qa_manager import QAManager
-from mcp_server.managers.state_reconstructor import StateReconstructor
-from mcp_server.managers.state_repository import FileStateRepository
-from mcp_server.managers.workflow_gate_runner import WorkflowGateRunner
-from mcp_server.resources.github import GitHubIssuesResource
+from mcp_server.core.tool_metrics import CallOutcome, ToolMetrics
 
 # Resources
+from mcp_server.resources.base import BaseResource
+from mcp_server.resources.metrics import MetricsResource
 from mcp_server.resources.standards import StandardsResource
 from mcp_server.resources.status import StatusResource
 
-# Scaffolding infrastructure (Issue #72)
-from mcp_server.scaffolding.template_registry import TemplateRegistry
-from mcp_server.state.pr_status_cache import PRStatusCache
-from mcp_server.tools.admin_tools import RestartServerTool
-from mcp_server.tools.base import BaseTool
-from mcp_server.tools.code_tools import CreateFileTool
-from mcp_server.tools.cycle_tools import ForceCycleTransitionTool, TransitionCycleTool
-from mcp_server.tools.discovery_tools import GetWorkContextTool, SearchDocumentationTool
-from mcp_server.tools.git_analysis_tools import GitDiffTool, GitListBranchesTool
-from mcp_server.tools.git_fetch_tool import GitFetchTool
-from mcp_server.tools.git_pull_tool import GitPullTool
-from mcp_server.tools.git_tools import (
-    CreateBranchTool,
-    GetParentBranchTool,
-    GitCheckoutTool,
-    GitCommitTool,
-    GitDeleteBranchTool,
-    GitMergeTool,
-    GitPushTool,
-    GitRestoreTool,
-    GitStashTool,
-    GitStatusTool,
-    build_commit_type_resolver,
-    build_phase_guard,
-)
-from mcp_server.tools.health_tools import HealthCheckTool
-
 # Tools
-from mcp_server.tools.issue_tools import (
-    CloseIssueTool,
-    CreateIssueTool,
-    GetIssueTool,
-    ListIssuesTool,
-    UpdateIssueTool,
-)
-from mcp_server.tools.label_tools import (
-    AddLabelsTool,
-    CreateLabelTool,
-    DeleteLabelTool,
-    ListLabelsTool,
-    RemoveLabelsTool,
-)
-from mcp_server.tools.milestone_tools import (
-    CloseMilestoneTool,
-    CreateMilestoneTool,
-    ListMilestonesTool,
-)
-from mcp_server.tools.phase_tools import ForcePhaseTransitionTool, TransitionPhaseTool
-from mcp_server.tools.pr_tools import ListPRsTool, MergePRTool, SubmitPRTool
-from mcp_server.tools.project_tools import (
-    GetProjectPlanTool,
-    InitializeProjectTool,
-    SavePlanningDeliverablesTool,
-    UpdatePlanningDeliverablesTool,
-)
-from mcp_server.tools.quality_tools import RunQualityGatesTool
-from mcp_server.tools.safe_edit_tool import SafeEditTool
-from mcp_server.tools.scaffold_artifact import ScaffoldArtifactTool
-from mcp_server.tools.template_validation_tool import TemplateValidationTool
-from mcp_server.tools.test_tools import RunTestsTool
+from mcp_server.tools.base import BaseTool
+from mcp_server.tools.tool_registry import ToolRegistry, ToolSpec
 from mcp_server.tools.tool_result import ToolResult
-from mcp_server.tools.validation_tools import ValidateDTOTool, ValidationTool
+
+# Managers, tool modules and the GitHub client are imported on first use
+# (see the manager properties and ToolSpec targets) so that the server can
+# answer initialize/list_tools before any of them is loaded.
+if TYPE_CHECKING:
+    from mcp_server.managers.artifact_manager import ArtifactManager
+    from mcp_server.managers.enforcement_runner import EnforcementRunner
+    from mcp_server.managers.gate_daemon import GateDaemonPool
+    from mcp_server.managers.git_manager import GitManager
+    from mcp_server.managers.github_manager import GitHubManager
+    from mcp_server.managers.phase_contract_resolver import PhaseContractResolver
+    from mcp_server.managers.phase_state_engine import PhaseStateEngine
+    from mcp_server.managers.project_manager import ProjectManager
+    from mcp_server.managers.qa_manager import QAManager
+    from mcp_server.managers.state_reconstructor import StateReconstructor
+    from mcp_server.managers.workflow_gate_runner import WorkflowGateRunner
+    from mcp_server.scaffolding.template_registry import TemplateRegistry
+    from mcp_server.state.pr_status_cache import PRStatusCache
+
+    # Tool classes parametrize the ToolSpec catalogue; ruff does not see string type arguments
+    from mcp_server.tools.admin_tools import RestartServerTool  # noqa: F401
+    from mcp_server.tools.code_tools import CreateFileTool  # noqa: F401
+    from mcp_server.tools.cycle_tools import ForceCycleTransitionTool, TransitionCycleTool  # noqa: F401
+    from mcp_server.tools.discovery_tools import GetWorkContextTool, SearchDocumentationTool  # noqa: F401
+    from mcp_server.tools.git_analysis_tools import GitDiffTool, GitListBranchesTool  # noqa: F401
+    from mcp_server.tools.git_fetch_tool import GitFetchTool  # noqa: F401
+    from mcp_server.tools.git_pull_tool import GitPullTool  # noqa: F401
+    from mcp_server.tools.git_tools import (  # noqa: F401
+        CreateBranchTool,
+        GetParentBranchTool,
+        GitCheckoutTool,
+        GitCommitTool,
+        GitDeleteBranchTool,
+        GitMergeTool,
+        GitPushTool,
+        GitRestoreTool,
+        GitStashTool,
+        GitStatusTool,
+    )
+    from mcp_server.tools.health_tools import HealthCheckTool  # noqa: F401
+    from mcp_server.tools.issue_tools import (  # noqa: F401
+        CloseIssueTool,
+        CreateIssueTool,
+        GetIssueTool,
+        ListIssuesTool,
+        UpdateIssueTool,
+    )
+    from mcp_server.tools.label_tools import (  # noqa: F401
+        AddLabelsTool,
+        CreateLabelTool,
+        DeleteLabelTool,
+        ListLabelsTool,
+        RemoveLabelsTool,
+    )
+    from mcp_server.tools.milestone_tools import (  # noqa: F401
+        CloseMilestoneTool,
+        CreateMilestoneTool,
+        ListMilestonesTool,
+    )
+    from mcp_server.tools.phase_tools import ForcePhaseTransitionTool, TransitionPhaseTool  # noqa: F401
+    from mcp_server.tools.pr_tools import ListPRsTool, MergePRTool, SubmitPRTool  # noqa: F401
+    from mcp_server.tools.project_tools import (  # noqa: F401
+        GetProjectPlanTool,
+        InitializeProjectTool,
+        SavePlanningDeliverablesTool,
+        UpdatePlanningDeliverablesTool,
+    )
+    from mcp_server.tools.quality_tools import RunQualityGatesTool  # noqa: F401
+    from mcp_server.tools.safe_edit_tool import SafeEditTool  # noqa: F401
+    from mcp_server.tools.scaffold_artifact import ScaffoldArtifactTool  # noqa: F401
+    from mcp_server.tools.template_validation_tool import TemplateValidationTool  # noqa: F401
+    from mcp_server.tools.test_tools import RunTestsTool  # noqa: F401
+    from mcp_server.tools.validation_tools import ValidateDTOTool, ValidationTool  # noqa: F401
 
 logger = get_logger("server")
 lifecycle_logger = get_logger("server_lifecycle")
@@ -125,7 +128,11 @@ class MCPServer:
     """Main MCP server class that handles resources and tools."""
 
     def __init__(self, settings: Settings | None = None) -> None:
-        """Initialize the MCP server with resources and tools."""
+        """Initialize the MCP server with resources and tools.
+
+        Only configuration is loaded here; managers and tools are constructed
+        on first use, and ``list_tools`` is served from cached descriptors.
+        """
         settings = settings or Settings.from_env()
         self._settings = settings
         server_name = settings.server.name
@@ -136,18 +143,8 @@ class MCPServer:
         # Log server startup
         lifecycle_logger.info("MCP server starting")
 
-        # Initialize template registry (Issue #72 Task 1.6)
         workspace_root = Path(settings.server.workspace_root)
         self._workspace_root = workspace_root
-        registry_path = workspace_root / ".st3" / "template_registry.json"
-
-        # Bootstrap registry file if missing
-        if not registry_path.exists():
-            registry_path.parent.mkdir(parents=True, exist_ok=True)
-            lifecycle_logger.info("Bootstrapping template registry: %s", registry_path)
-
-        self.template_registry = TemplateRegistry(registry_path=registry_path)
-        lifecycle_logger.info("Template registry initialized")
 
         explicit_config_root = settings.server.config_root
         if explicit_config_root is not None and not str(explicit_config_root).strip():
@@ -159,262 +156,513 @@ class MCPServer:
             required_files=("git.yaml", "workflows.yaml", "workphases.yaml"),
         )
 
-        config_loader = ConfigLoader(config_root=config_root)
-        git_config = config_loader.load_git_config()
-        workflow_config = config_loader.load_workflow_config()
-        workphases_config = config_loader.load_workphases_config()
-        workflow_config = ConfigLoader._inject_terminal_phase(  # pyright: ignore[reportPrivateUsage]
-            workflow_config, workphases_config
-        )
-        quality_config = config_loader.load_quality_config()
-        label_config = config_loader.load_label_config()
-        issue_config = config_loader.load_issue_config()
-        scope_config = config_loader.load_scope_config()
-        milestone_config = config_loader.load_milestone_config()
-        contributor_config = config_loader.load_contributor_config()
-        artifact_registry = config_loader.load_artifact_registry_config()
-        project_structure_config = config_loader.load_project_structure_config(
-            artifact_registry=artifact_registry
-        )
-        operation_policies_config = config_loader.load_operation_policies_config(
-            workflow_config=workflow_config
-        )
-        enforcement_config = config_loader.load_enforcement_config()
-        phase_contracts_config = config_loader.load_phase_contracts_config()
-        ConfigValidator().validate_startup(
-            policies=operation_policies_config,
-            workflow=workflow_config,
-            structure=project_structure_config,
-            artifact=artifact_registry,
-            phase_contracts=phase_contracts_config,
-            workphases=workphases_config,
+        # Validated configs come from the .st3/cache snapshot while every config
+        # file (and the config code) is unchanged; otherwise they are re-parsed.
+        self._configs = ConfigSnapshot(
+            ConfigLoader(config_root=config_root),
+            snapshot_path=workspace_root / ".st3" / "cache" / "config_snapshot.pickle",
+        ).load()
+
+        self.server = Server(server_name)
+
+        # Per-tool call counts and stage latencies, flushed next to the audit log
+        self.tool_metrics = ToolMetrics(flush_path=workspace_root / ".logs" / "tool_metrics.json")
+
+        # Core resources (always available)
+        self.resources: list[BaseResource] = [
+            StandardsResource(),
+            StatusResource(),
+            MetricsResource(self.tool_metrics),
+        ]
+
+        # Core tools (always available)
+        tool_specs = self._core_tool_specs()
+
+        # GitHub-dependent resources and additional tools (only if token is configured)
+        github_token = settings.github.token
+        if github_token:
+            from mcp_server.resources.github import GitHubIssuesResource  # noqa: PLC0415
+
+            self.resources.append(GitHubIssuesResource())
+            tool_specs += self._issue_tool_specs() + self._github_tool_specs()
+            logger.info("GitHub integration enabled")
+        else:
+            # Register issue tools without token so schemas are available; execution will error.
+            tool_specs += self._issue_tool_specs()
+            logger.info(
+                "GitHub token not configured - GitHub issue tools available but will "
+                "return error on use. Set GITHUB_TOKEN to enable full functionality."
+            )
+
+        self._tool_registry = ToolRegistry(
+            tool_specs,
+            cache_path=workspace_root / ".st3" / "cache" / "tool_descriptors.json",
         )
 
-        self.git_manager = GitManager(git_config=git_config, workphases_config=workphases_config)
-        self.project_manager = ProjectManager(
-            workspace_root=workspace_root,
-            workflow_config=workflow_config,
+        self.setup_handlers()
+
+    @property
+    def tools(self) -> list[BaseTool]:
+        """Every registered tool; accessing this constructs the ones not built yet."""
+        return self._tool_registry.tools()
+
+    @tools.setter
+    def tools(self, tools: list[BaseTool]) -> None:
+        self._tool_registry = ToolRegistry.from_tools(tools)
+
+    # ------------------------------------------------------------------
+    # Managers (constructed on first use)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def template_registry(self) -> TemplateRegistry:
+        from mcp_server.scaffolding.template_registry import TemplateRegistry  # noqa: PLC0415
+
+        registry_path = self._workspace_root / ".st3" / "template_registry.json"
+
+        # Bootstrap registry file if missing
+        if not registry_path.exists():
+            registry_path.parent.mkdir(parents=True, exist_ok=True)
+            lifecycle_logger.info("Bootstrapping template registry: %s", registry_path)
+
+        template_registry = TemplateRegistry(registry_path=registry_path)
+        lifecycle_logger.info("Template registry initialized")
+        return template_registry
+
+    @cached_property
+    def git_manager(self) -> GitManager:
+        from mcp_server.managers.git_manager import GitManager  # noqa: PLC0415
+
+        return GitManager(git_config=self._configs.git, workphases_config=self._configs.workphases)
+
+    @cached_property
+    def project_manager(self) -> ProjectManager:
+        from mcp_server.managers.project_manager import ProjectManager  # noqa: PLC0415
+
+        return ProjectManager(
+            workspace_root=self._workspace_root,
+            workflow_config=self._configs.workflow,
             git_manager=self.git_manager,
-            workphases_config=workphases_config,
+            workphases_config=self._configs.workphases,
         )
-        self.phase_contract_resolver = PhaseContractResolver(
+
+    @cached_property
+    def phase_contract_resolver(self) -> PhaseContractResolver:
+        from mcp_server.managers.phase_contract_resolver import (  # noqa: PLC0415
+            PhaseConfigContext,
+            PhaseContractResolver,
+        )
+
+        return PhaseContractResolver(
             PhaseConfigContext(
-                workphases=workphases_config,
-                phase_contracts=phase_contracts_config,
+                workphases=self._configs.workphases,
+                phase_contracts=self._configs.phase_contracts,
             )
         )
-        self.workflow_gate_runner = WorkflowGateRunner(
-            deliverable_checker=DeliverableChecker(workspace_root),
+
+    @cached_property
+    def workflow_gate_runner(self) -> WorkflowGateRunner:
+        from mcp_server.managers.deliverable_checker import DeliverableChecker  # noqa: PLC0415
+        from mcp_server.managers.workflow_gate_runner import WorkflowGateRunner  # noqa: PLC0415
+
+        return WorkflowGateRunner(
+            deliverable_checker=DeliverableChecker(self._workspace_root),
             phase_contract_resolver=self.phase_contract_resolver,
         )
-        self.state_reconstructor = StateReconstructor(
-            workspace_root=workspace_root,
-            git_config=git_config,
+
+    @cached_property
+    def state_reconstructor(self) -> StateReconstructor:
+        from mcp_server.core.phase_detection import ScopeDecoder  # noqa: PLC0415
+        from mcp_server.managers.state_reconstructor import StateReconstructor  # noqa: PLC0415
+
+        return StateReconstructor(
+            workspace_root=self._workspace_root,
+            git_config=self._configs.git,
             project_manager=self.project_manager,
-            scope_decoder=ScopeDecoder(workphases_config=workphases_config),
+            scope_decoder=ScopeDecoder(workphases_config=self._configs.workphases),
         )
-        self.phase_state_engine = PhaseStateEngine(
+
+    @cached_property
+    def phase_state_engine(self) -> PhaseStateEngine:
+        from mcp_server.core.phase_detection import ScopeDecoder  # noqa: PLC0415
+        from mcp_server.managers.phase_state_engine import PhaseStateEngine  # noqa: PLC0415
+        from mcp_server.managers.state_repository import FileStateRepository  # noqa: PLC0415
+
+        workspace_root = self._workspace_root
+        return PhaseStateEngine(
             workspace_root=workspace_root,
             project_manager=self.project_manager,
-            git_config=git_config,
-            workflow_config=workflow_config,
-            workphases_config=workphases_config,
+            git_config=self._configs.git,
+            workflow_config=self._configs.workflow,
+            workphases_config=self._configs.workphases,
             state_repository=FileStateRepository(state_file=workspace_root / ".st3" / "state.json"),
-            scope_decoder=ScopeDecoder(workphases_config=workphases_config),
+            scope_decoder=ScopeDecoder(workphases_config=self._configs.workphases),
             workflow_gate_runner=self.workflow_gate_runner,
             state_reconstructor=self.state_reconstructor,
         )
-        self.qa_manager = QAManager(
-            workspace_root=workspace_root,
-            quality_config=quality_config,
+
+    @cached_property
+    def gate_daemons(self) -> GateDaemonPool:
+        from mcp_server.managers.gate_daemon import GateDaemonPool  # noqa: PLC0415
+
+        return GateDaemonPool(self._workspace_root)
+
+    @cached_property
+    def qa_manager(self) -> QAManager:
+        from mcp_server.managers.qa_manager import QAManager  # noqa: PLC0415
+
+        return QAManager(
+            workspace_root=self._workspace_root,
+            quality_config=self._configs.quality,
+            gate_daemons=self.gate_daemons,
         )
-        self.github_manager = GitHubManager(
-            issue_config=issue_config,
-            label_config=label_config,
-            scope_config=scope_config,
-            milestone_config=milestone_config,
-            contributor_config=contributor_config,
-            git_config=git_config,
+
+    @cached_property
+    def github_manager(self) -> GitHubManager:
+        from mcp_server.managers.github_manager import GitHubManager  # noqa: PLC0415
+
+        configs = self._configs
+        return GitHubManager(
+            issue_config=configs.issue,
+            label_config=configs.label,
+            scope_config=configs.scope,
+            milestone_config=configs.milestone,
+            contributor_config=configs.contributor,
+            git_config=configs.git,
         )
-        self.artifact_manager = ArtifactManager(
-            workspace_root=workspace_root,
+
+    @cached_property
+    def artifact_manager(self) -> ArtifactManager:
+        from mcp_server.managers.artifact_manager import ArtifactManager  # noqa: PLC0415
+
+        return ArtifactManager(
+            workspace_root=self._workspace_root,
             template_registry=self.template_registry,
-            registry=artifact_registry,
-            project_structure_config=project_structure_config,
-        )
-        _merge_readiness_context = MergeReadinessContext(
-            terminal_phase=workphases_config.get_terminal_phase(),
-            pr_allowed_phase=phase_contracts_config.get_pr_allowed_phase(),
-            branch_local_artifacts=tuple(
-                phase_contracts_config.merge_policy.branch_local_artifacts
-            ),
+            registry=self._configs.artifact_registry,
+            project_structure_config=self._configs.project_structure,
         )
-        self.pr_status_cache = PRStatusCache(github_manager=self.github_manager)
-        self.enforcement_runner = EnforcementRunner(
-            workspace_root=workspace_root,
-            config=enforcement_config,
-            default_base_branch=git_config.default_base_branch,
+
+    @cached_property
+    def pr_status_cache(self) -> PRStatusCache:
+        from mcp_server.state.pr_status_cache import PRStatusCache  # noqa: PLC0415
+
+        return PRStatusCache(github_manager=self.github_manager)
+
+    @cached_property
+    def enforcement_runner(self) -> EnforcementRunner:
+        from mcp_server.managers.enforcement_runner import EnforcementRunner  # noqa: PLC0415
+
+        return EnforcementRunner(
+            workspace_root=self._workspace_root,
+            config=self._configs.enforcement,
+            default_base_branch=self._configs.git.default_base_branch,
             pr_status_reader=self.pr_status_cache,
         )
 
-        self.server = Server(server_name)
+    # ------------------------------------------------------------------
+    # Tool catalogue
+    # ------------------------------------------------------------------
 
-        # Core resources (always available)
-        self.resources = [
-            StandardsResource(),
-            StatusResource(),
-        ]
-
-        # Core tools (always available)
-        self.tools = [
+    def _core_tool_specs(self) -> list[ToolSpec[Any]]:
+        settings = self._settings
+        workspace_root = Path(settings.server.workspace_root)
+        workflow_config = self._configs.workflow
+        return [
             # Git tools
-            CreateBranchTool(manager=self.git_manager),
-            GitStatusTool(manager=self.git_manager),
-            GitCommitTool(
-                manager=self.git_manager,
-                phase_guard=build_phase_guard(Path(settings.server.workspace_root)),
-                commit_type_resolver=build_commit_type_resolver(
-                    self.phase_state_engine,
-                    self.phase_contract_resolver,
-                ),
-                state_engine=self.phase_state_engine,
-            ),
-            GitCheckoutTool(manager=self.git_manager, state_engine=self.phase_state_engine),
-            GitFetchTool(manager=self.git_manager),
-            GitPullTool(manager=self.git_manager, state_engine=self.phase_state_engine),
-            GitPushTool(manager=self.git_manager),
-            GitMergeTool(manager=self.git_manager),
-            GitDeleteBranchTool(manager=self.git_manager),
-            GitStashTool(manager=self.git_manager),
-            GitRestoreTool(manager=self.git_manager),
-            GitListBranchesTool(manager=self.git_manager),
-            GitDiffTool(manager=self.git_manager),
-            GetParentBranchTool(manager=self.git_manager, state_engine=self.phase_state_engine),
+            ToolSpec["CreateBranchTool"](
+                "mcp_server.tools.git_tools:CreateBranchTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitStatusTool"](
+                "mcp_server.tools.git_tools:GitStatusTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitCommitTool"](
+                "mcp_server.tools.git_tools:GitCommitTool", self._build_git_commit_tool
+            ),
+            ToolSpec["GitCheckoutTool"](
+                "mcp_server.tools.git_tools:GitCheckoutTool",
+                lambda cls: cls(manager=self.git_manager, state_engine=self.phase_state_engine),
+            ),
+            ToolSpec["GitFetchTool"](
+                "mcp_server.tools.git_fetch_tool:GitFetchTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitPullTool"](
+                "mcp_server.tools.git_pull_tool:GitPullTool",
+                lambda cls: cls(manager=self.git_manager, state_engine=self.phase_state_engine),
+            ),
+            ToolSpec["GitPushTool"](
+                "mcp_server.tools.git_tools:GitPushTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitMergeTool"](
+                "mcp_server.tools.git_tools:GitMergeTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitDeleteBranchTool"](
+                "mcp_server.tools.git_tools:GitDeleteBranchTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitStashTool"](
+                "mcp_server.tools.git_tools:GitStashTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitRestoreTool"](
+                "mcp_server.tools.git_tools:GitRestoreTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitListBranchesTool"](
+                "mcp_server.tools.git_analysis_tools:GitListBranchesTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GitDiffTool"](
+                "mcp_server.tools.git_analysis_tools:GitDiffTool",
+                lambda cls: cls(manager=self.git_manager),
+            ),
+            ToolSpec["GetParentBranchTool"](
+                "mcp_server.tools.git_tools:GetParentBranchTool",
+                lambda cls: cls(manager=self.git_manager, state_engine=self.phase_state_engine),
+            ),
             # Quality tools
-            RunQualityGatesTool(manager=self.qa_manager),
-            ValidationTool(manager=self.qa_manager),
-            ValidateDTOTool(),
-            SafeEditTool(),
-            TemplateValidationTool(),
+            ToolSpec["RunQualityGatesTool"](
+                "mcp_server.tools.quality_tools:RunQualityGatesTool",
+                lambda cls: cls(manager=self.qa_manager),
+            ),
+            ToolSpec["ValidationTool"](
+                "mcp_server.tools.validation_tools:ValidationTool",
+                lambda cls: cls(manager=self.qa_manager),
+            ),
+            ToolSpec["ValidateDTOTool"](
+                "mcp_server.tools.validation_tools:ValidateDTOTool", lambda cls: cls()
+            ),
+            ToolSpec["SafeEditTool"](
+                "mcp_server.tools.safe_edit_tool:SafeEditTool", lambda cls: cls()
+            ),
+            ToolSpec["TemplateValidationTool"](
+                "mcp_server.tools.template_validation_tool:TemplateValidationTool",
+                lambda cls: cls(),
+            ),
             # Development tools
-            HealthCheckTool(),
-            RestartServerTool(),
-            RunTestsTool(runner=PytestRunner(), settings=settings),
-            CreateFileTool(settings=settings),
+            ToolSpec["HealthCheckTool"](
+                "mcp_server.tools.health_tools:HealthCheckTool", lambda cls: cls()
+            ),
+            ToolSpec["RestartServerTool"](
+                "mcp_server.tools.admin_tools:RestartServerTool", lambda cls: cls()
+            ),
+            ToolSpec["RunTestsTool"](
+                "mcp_server.tools.test_tools:RunTestsTool", self._build_run_tests_tool
+            ),
+            ToolSpec["CreateFileTool"](
+                "mcp_server.tools.code_tools:CreateFileTool",
+                lambda cls: cls(settings=settings),
+            ),
             # Project tools (Phase 0.5)
-            InitializeProjectTool(
-                workspace_root=Path(settings.server.workspace_root),
-                workflow_config=workflow_config,
-                manager=self.project_manager,
-                git_manager=self.git_manager,
-                state_engine=self.phase_state_engine,
-            ),
-            GetProjectPlanTool(manager=self.project_manager),
-            SavePlanningDeliverablesTool(manager=self.project_manager),
-            UpdatePlanningDeliverablesTool(manager=self.project_manager),
+            ToolSpec["InitializeProjectTool"](
+                "mcp_server.tools.project_tools:InitializeProjectTool",
+                lambda cls: cls(
+                    workspace_root=workspace_root,
+                    workflow_config=workflow_config,
+                    manager=self.project_manager,
+                    git_manager=self.git_manager,
+                    state_engine=self.phase_state_engine,
+                ),
+            ),
+            ToolSpec["GetProjectPlanTool"](
+                "mcp_server.tools.project_tools:GetProjectPlanTool",
+                lambda cls: cls(manager=self.project_manager),
+            ),
+            ToolSpec["SavePlanningDeliverablesTool"](
+                "mcp_server.tools.project_tools:SavePlanningDeliverablesTool",
+                lambda cls: cls(manager=self.project_manager),
+            ),
+            ToolSpec["UpdatePlanningDeliverablesTool"](
+                "mcp_server.tools.project_tools:UpdatePlanningDeliverablesTool",
+                lambda cls: cls(manager=self.project_manager),
+            ),
             # Phase tools (Phase B)
-            TransitionPhaseTool(
-                workspace_root=Path(settings.server.workspace_root),
-                project_manager=self.project_manager,
-                state_engine=self.phase_state_engine,
+            ToolSpec["TransitionPhaseTool"](
+                "mcp_server.tools.phase_tools:TransitionPhaseTool",
+                lambda cls: cls(
+                    workspace_root=workspace_root,
+                    project_manager=self.project_manager,
+                    state_engine=self.phase_state_engine,
+                ),
             ),
-            ForcePhaseTransitionTool(
-                workspace_root=Path(settings.server.workspace_root),
-                project_manager=self.project_manager,
-                state_engine=self.phase_state_engine,
+            ToolSpec["ForcePhaseTransitionTool"](
+                "mcp_server.tools.phase_tools:ForcePhaseTransitionTool",
+                lambda cls: cls(
+                    workspace_root=workspace_root,
+                    project_manager=self.project_manager,
+                    state_engine=self.phase_state_engine,
+                ),
             ),
             # TDD Cycle tools (Issue #146)
-            TransitionCycleTool(
-                workspace_root=Path(settings.server.workspace_root),
-                project_manager=self.project_manager,
-                state_engine=self.phase_state_engine,
-                git_manager=self.git_manager,
-                gate_runner=self.workflow_gate_runner,
-            ),
-            ForceCycleTransitionTool(
-                workspace_root=Path(settings.server.workspace_root),
-                project_manager=self.project_manager,
-                state_engine=self.phase_state_engine,
-                git_manager=self.git_manager,
-                gate_runner=self.workflow_gate_runner,
+            ToolSpec["TransitionCycleTool"](
+                "mcp_server.tools.cycle_tools:TransitionCycleTool",
+                lambda cls: cls(
+                    workspace_root=workspace_root,
+                    project_manager=self.project_manager,
+                    state_engine=self.phase_state_engine,
+                    git_manager=self.git_manager,
+                    gate_runner=self.workflow_gate_runner,
+                ),
+            ),
+            ToolSpec["ForceCycleTransitionTool"](
+                "mcp_server.tools.cycle_tools:ForceCycleTransitionTool",
+                lambda cls: cls(
+                    workspace_root=workspace_root,
+                    project_manager=self.project_manager,
+                    state_engine=self.phase_state_engine,
+                    git_manager=self.git_manager,
+                    gate_runner=self.workflow_gate_runner,
+                ),
             ),
             # Scaffold tools (unified artifact scaffolding)
-            ScaffoldArtifactTool(manager=self.artifact_manager),
+            ToolSpec["ScaffoldArtifactTool"](
+                "mcp_server.tools.scaffold_artifact:ScaffoldArtifactTool",
+                lambda cls: cls(manager=self.artifact_manager),
+            ),
             # Discovery tools
-            SearchDocumentationTool(settings=settings),
-            GetWorkContextTool(
-                settings=settings,
-                git_manager=self.git_manager,
-                project_manager=self.project_manager,
-                state_engine=self.phase_state_engine,
-                github_manager=self.github_manager,
-                workphases_config=workphases_config,
+            ToolSpec["SearchDocumentationTool"](
+                "mcp_server.tools.discovery_tools:SearchDocumentationTool",
+                lambda cls: cls(settings=settings),
+            ),
+            ToolSpec["GetWorkContextTool"](
+                "mcp_server.tools.discovery_tools:GetWorkContextTool",
+                lambda cls: cls(
+                    settings=settings,
+                    git_manager=self.git_manager,
+                    project_manager=self.project_manager,
+                    state_engine=self.phase_state_engine,
+                    github_manager=self.github_manager,
+                    workphases_config=self._configs.workphases,
+                ),
             ),
         ]
 
-        # GitHub-dependent resources and additional tools (only if token is configured)
-        github_token = settings.github.token
-        if github_token:
-            self.resources.append(GitHubIssuesResource())
-            self.tools.extend(
-                [
-                    # GitHub Issue tools
-                    CreateIssueTool(
-                        manager=self.github_manager,
-                        issue_config=issue_config,
-                        milestone_config=milestone_config,
-                        workflow_config=workflow_config,
-                    ),
-                    ListIssuesTool(manager=self.github_manager),
-                    GetIssueTool(manager=self.github_manager),
-                    CloseIssueTool(manager=self.github_manager),
-                    UpdateIssueTool(manager=self.github_manager),
-                    # PR and Label tools (require token at init time)
-                    ListPRsTool(manager=self.github_manager, git_config=git_config),
-                    MergePRTool(
-                        manager=self.github_manager,
-                        git_config=git_config,
-                        pr_status_writer=self.pr_status_cache,
-                    ),
-                    SubmitPRTool(
-                        git_manager=self.git_manager,
-                        github_manager=self.github_manager,
-                        pr_status_writer=self.pr_status_cache,
-                        merge_readiness_context=_merge_readiness_context,
-                    ),
-                    AddLabelsTool(manager=self.github_manager, label_config=label_config),
-                    ListLabelsTool(manager=self.github_manager, label_config=label_config),
-                    CreateLabelTool(manager=self.github_manager, label_config=label_config),
-                    DeleteLabelTool(manager=self.github_manager, label_config=label_config),
-                    RemoveLabelsTool(manager=self.github_manager, label_config=label_config),
-                    ListMilestonesTool(),
-                    CreateMilestoneTool(),
-                    CloseMilestoneTool(),
-                ]
-            )
-            logger.info("GitHub integration enabled")
-        else:
-            # Register issue tools without token so schemas are available; execution will error.
-            self.tools.extend(
-                [
-                    CreateIssueTool(
-                        manager=self.github_manager,
-                        issue_config=issue_config,
-                        milestone_config=milestone_config,
-                        workflow_config=workflow_config,
-                    ),
-                    ListIssuesTool(manager=self.github_manager),
-                    GetIssueTool(manager=self.github_manager),
-                    CloseIssueTool(manager=self.github_manager),
-                    UpdateIssueTool(manager=self.github_manager),
-                ]
-            )
-            logger.info(
-                "GitHub token not configured - GitHub issue tools available but will "
-                "return error on use. Set GITHUB_TOKEN to enable full functionality."
-            )
+    def _issue_tool_specs(self) -> list[ToolSpec[Any]]:
+        configs = self._configs
+        return [
+            # GitHub Issue tools
+            ToolSpec["CreateIssueTool"](
+                "mcp_server.tools.issue_tools:CreateIssueTool",
+                lambda cls: cls(
+                    manager=self.github_manager,
+                    issue_config=configs.issue,
+                    milestone_config=configs.milestone,
+                    workflow_config=configs.workflow,
+                ),
+            ),
+            ToolSpec["ListIssuesTool"](
+                "mcp_server.tools.issue_tools:ListIssuesTool",
+                lambda cls: cls(manager=self.github_manager),
+            ),
+            ToolSpec["GetIssueTool"](
+                "mcp_server.tools.issue_tools:GetIssueTool",
+                lambda cls: cls(manager=self.github_manager),
+            ),
+            ToolSpec["CloseIssueTool"](
+                "mcp_server.tools.issue_tools:CloseIssueTool",
+                lambda cls: cls(manager=self.github_manager),
+            ),
+            ToolSpec["UpdateIssueTool"](
+                "mcp_server.tools.issue_tools:UpdateIssueTool",
+                lambda cls: cls(manager=self.github_manager),
+            ),
+        ]
 
-        self.setup_handlers()
+    def _github_tool_specs(self) -> list[ToolSpec[Any]]:
+        git_config = self._configs.git
+        label_config = self._configs.label
+        return [
+            # PR and Label tools (require token at init time)
+            ToolSpec["ListPRsTool"](
+                "mcp_server.tools.pr_tools:ListPRsTool",
+                lambda cls: cls(manager=self.github_manager, git_config=git_config),
+            ),
+            ToolSpec["MergePRTool"](
+                "mcp_server.tools.pr_tools:MergePRTool",
+                lambda cls: cls(
+                    manager=self.github_manager,
+                    git_config=git_config,
+                    pr_status_writer=self.pr_status_cache,
+                ),
+            ),
+            ToolSpec["SubmitPRTool"](
+                "mcp_server.tools.pr_tools:SubmitPRTool", self._build_submit_pr_tool
+            ),
+            ToolSpec["AddLabelsTool"](
+                "mcp_server.tools.label_tools:AddLabelsTool",
+                lambda cls: cls(manager=self.github_manager, label_config=label_config),
+            ),
+            ToolSpec["ListLabelsTool"](
+                "mcp_server.tools.label_tools:ListLabelsTool",
+                lambda cls: cls(manager=self.github_manager, label_config=label_config),
+            ),
+            ToolSpec["CreateLabelTool"](
+                "mcp_server.tools.label_tools:CreateLabelTool",
+                lambda cls: cls(manager=self.github_manager, label_config=label_config),
+            ),
+            ToolSpec["DeleteLabelTool"](
+                "mcp_server.tools.label_tools:DeleteLabelTool",
+                lambda cls: cls(manager=self.github_manager, label_config=label_config),
+            ),
+            ToolSpec["RemoveLabelsTool"](
+                "mcp_server.tools.label_tools:RemoveLabelsTool",
+                lambda cls: cls(manager=self.github_manager, label_config=label_config),
+            ),
+            ToolSpec["ListMilestonesTool"](
+                "mcp_server.tools.milestone_tools:ListMilestonesTool", lambda cls: cls()
+            ),
+            ToolSpec["CreateMilestoneTool"](
+                "mcp_server.tools.milestone_tools:CreateMilestoneTool", lambda cls: cls()
+            ),
+            ToolSpec["CloseMilestoneTool"](
+                "mcp_server.tools.milestone_tools:CloseMilestoneTool", lambda cls: cls()
+            ),
+        ]
+
+    def _build_git_commit_tool(self, cls: type[GitCommitTool]) -> GitCommitTool:
+        from mcp_server.tools.git_tools import (  # noqa: PLC0415
+            build_commit_type_resolver,
+            build_phase_guard,
+        )
+
+        return cls(
+            manager=self.git_manager,
+            phase_guard=build_phase_guard(Path(self._settings.server.workspace_root)),
+            commit_type_resolver=build_commit_type_resolver(
+                self.phase_state_engine,
+                self.phase_contract_resolver,
+            ),
+            state_engine=self.phase_state_engine,
+        )
+
+    def _build_run_tests_tool(self, cls: type[RunTestsTool]) -> RunTestsTool:
+        from mcp_server.managers.pytest_runner import PytestRunner  # noqa: PLC0415
+
+        return cls(runner=PytestRunner(), settings=self._settings)
+
+    def _build_submit_pr_tool(self, cls: type[SubmitPRTool]) -> SubmitPRTool:
+        from mcp_server.managers.phase_contract_resolver import (  # noqa: PLC0415
+            MergeReadinessContext,
+        )
+
+        phase_contracts_config = self._configs.phase_contracts
+        merge_readiness_context = MergeReadinessContext(
+            terminal_phase=self._configs.workphases.get_terminal_phase(),
+            pr_allowed_phase=phase_contracts_config.get_pr_allowed_phase(),
+            branch_local_artifacts=tuple(
+                phase_contracts_config.merge_policy.branch_local_artifacts
+            ),
+        )
+        return cls(
+            git_manager=self.git_manager,
+            github_manager=self.github_manager,
+            pr_status_writer=self.pr_status_cache,
+            merge_readiness_context=merge_readiness_context,
+        )
 
     def _validate_tool_arguments(
         self, tool: BaseTool, arguments: dict[str, Any] | None, call_id: str, name: str
@@ -517,6 +765,8 @@ class MCPServer:
         if event is None and tool_category is None:
             return None
 
+        from mcp_server.managers.enforcement_runner import EnforcementContext  # noqa: PLC0415
+
         enforcement_ctx = EnforcementContext(
             workspace_root=self._workspace_root,
             tool_name=tool.name,
@@ -552,17 +802,19 @@ class MCPServer:
             ]
 
         @self.server.read_resource()  # type: ignore[no-untyped-call, untyped-decorator]
-        async def handle_read_resource(uri: str) -> str:
+        async def handle_read_resource(uri: AnyUrl | str) -> str:
+            # The protocol layer passes an AnyUrl; resources match plain strings
+            uri_str = str(uri)
             for resource in self.resources:
-                if resource.matches(uri):
-                    return await resource.read(uri)
-            raise ValueError(f"Resource not found: {uri}")
+                if resource.matches(uri_str):
+                    return await resource.read(uri_str)
+            raise ValueError(f"Resource not found: {uri_str}")
 
         @self.server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
         async def handle_list_tools() -> list[Tool]:
             return [
-                Tool(name=t.name, description=t.description, inputSchema=t.input_schema)
-                for t in self.tools
+                Tool(name=d.name, description=d.description, inputSchema=d.input_schema)
+                for d in self._tool_registry.descriptors()
             ]
 
         @self.server.call_tool()  # type: ignore[untyped-decorator]
@@ -584,87 +836,97 @@ class MCPServer:
                 },
             )
 
-            for tool in self.tools:
-                if tool.name == name:
-                    try:
-                        # Validate arguments
-                        validated = self._validate_tool_arguments(tool, arguments, call_id, name)
-                        # Early return if validation failed
-                        if isinstance(validated, list):
-                            return validated
-
-                        note_context = NoteContext()
-
-                        pre_result = self._run_tool_enforcement(
-                            tool, "pre", validated, note_context=note_context
-                        )
-                        if pre_result is not None:
-                            return self._convert_tool_result_to_mcp_result(pre_result)
-
-                        # Execute tool
-                        raw_result = await tool.execute(validated, note_context)
-
-                        if not raw_result.is_error:
-                            post_result = self._run_tool_enforcement(
-                                tool,
-                                "post",
-                                validated,
-                                note_context=note_context,
-                                result=raw_result,
-                            )
-                            if post_result is not None:
-                                return self._convert_tool_result_to_mcp_result(post_result)
-
-                        # Render notes and convert result to MCP content
-                        result = note_context.render_to_response(raw_result)
-                        response_content = self._convert_tool_result_to_mcp_result(result)
-
-                        duration_ms = (time.perf_counter() - start_time) * 1000.0
-
-                        logger.debug(
-                            "Tool call completed",
-                            extra={
-                                "props": {
-                                    "call_id": call_id,
-                                    "tool_name": name,
-                                    "duration_ms": duration_ms,
-                                }
-                            },
-                        )
-                        return response_content
-                    except asyncio.CancelledError:
-                        duration_ms = (time.perf_counter() - start_time) * 1000.0
-                        logger.info(
-                            "Tool call cancelled",
-                            extra={
-                                "props": {
-                                    "call_id": call_id,
-                                    "tool_name": name,
-                                    "duration_ms": duration_ms,
-                                }
-                            },
-                        )
-                        raise
-                    except (KeyError, AttributeError, TypeError) as e:
-                        # Response processing error (dict access, attribute access, type issues)
-                        duration_ms = (time.perf_counter() - start_time) * 1000.0
-                        logger.error(
-                            "Response processing failed: %s",
-                            e,
-                            exc_info=True,
-                            extra={
-                                "props": {
-                                    "call_id": call_id,
-                                    "tool_name": name,
-                                    "duration_ms": duration_ms,
-                                    "error_type": type(e).__name__,
-                                }
-                            },
+            tool = self._tool_registry.get(name)
+            if tool is None:
+                raise ValueError(f"Tool not found: {name}")
+
+            metrics = self.tool_metrics
+            outcome: CallOutcome = "error"
+            try:
+                # Validate arguments
+                with metrics.stage(name, "validation"):
+                    validated = self._validate_tool_arguments(tool, arguments, call_id, name)
+                # Early return if validation failed
+                if isinstance(validated, list):
+                    return validated
+
+                note_context = NoteContext()
+
+                with metrics.stage(name, "pre_enforcement"):
+                    pre_result = self._run_tool_enforcement(
+                        tool, "pre", validated, note_context=note_context
+                    )
+                if pre_result is not None:
+                    return self._convert_tool_result_to_mcp_result(pre_result)
+
+                # Execute tool
+                with metrics.stage(name, "execute"):
+                    raw_result = await tool.execute(validated, note_context)
+
+                if not raw_result.is_error:
+                    with metrics.stage(name, "post_enforcement"):
+                        post_result = self._run_tool_enforcement(
+                            tool,
+                            "post",
+                            validated,
+                            note_context=note_context,
+                            result=raw_result,
                         )
-                        return [
-                            TextContent(type="text", text=f"Error processing tool response: {e!s}")
-                        ]
-            raise ValueError(f"Tool not found: {name}")
+                    if post_result is not None:
+                        return self._convert_tool_result_to_mcp_result(post_result)
+                    outcome = "ok"
+
+                # Render notes and convert result to MCP content
+                result = note_context.render_to_response(raw_result)
+                response_content = self._convert_tool_result_to_mcp_result(result)
+
+                duration_ms = (time.perf_counter() - start_time) * 1000.0
+
+                logger.debug(
+                    "Tool call completed",
+                    extra={
+                        "props": {
+                            "call_id": call_id,
+                            "tool_name": name,
+                            "duration_ms": duration_ms,
+                        }
+                    },
+                )
+                return response_content
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                duration_ms = (time.perf_counter() - start_time) * 1000.0
+                logger.info(
+                    "Tool call cancelled",
+                    extra={
+                        "props": {
+                            "call_id": call_id,
+                            "tool_name": name,
+                            "duration_ms": duration_ms,
+                        }
+                    },
+                )
+                raise
+            except (KeyError, AttributeError, TypeError) as e:
+                # Response processing error (dict access, attribute access, type issues)
+                duration_ms = (time.perf_counter() - start_time) * 1000.0
+                logger.error(
+                    "Response processing failed: %s",
+                    e,
+                    exc_info=True,
+                    extra={
+                        "props": {
+                            "call_id": call_id,
+                            "tool_name": name,
+                            "duration_ms": duration_ms,
+                            "error_type": type(e).__name__,
+                        }
+                    },
+                )
+                return [TextContent(type="text", text=f"Error processing tool response: {e!s}")]
+            finally:
+                metrics.record_call(name, (time.perf_counter() - start_time) * 1000.0, outcome)
+                metrics.maybe_flush()
 
     async def run(self) -> None:
         """Run the MCP server."""
@@ -677,6 +939,15 @@ class MCPServer:
         # and other CRLF issues in the JSON-RPC stream
         stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="\n"))
 
+        from mcp_server.scaffolding.jinja_environment import configure_bytecode_cache  # noqa: PLC0415
+
+        configure_bytecode_cache(
+            self._workspace_root, self._workspace_root / ".st3" / "cache" / "jinja"
+        )
+        threading.Thread(
+            target=self._precompile_templates, name="jinja-precompile", daemon=True
+        ).start()
+
         try:
             async with stdio_server(stdout=stdout) as (read_stream, write_stream):
                 await self.server.run(
@@ -686,10 +957,34 @@ class MCPServer:
             lifecycle_logger.info("MCP server interrupted by user")
         finally:
             lifecycle_logger.info("MCP server shutting down")
+            self.tool_metrics.flush()
+            self._close_gate_daemons()
 
     async def shutdown(self) -> None:
         """Shutdown the MCP server gracefully."""
         lifecycle_logger.info("MCP server shutting down")
+        self.tool_metrics.flush()
+        self._close_gate_daemons()
+
+    def _precompile_templates(self) -> None:
+        # Warm the shared Jinja environment so the first scaffold call renders from cache
+        try:
+            from mcp_server.scaffolding.jinja_environment import precompile_templates  # noqa: PLC0415
+            from mcp_server.utils.template_config import get_template_root  # noqa: PLC0415
+
+            start = time.perf_counter()
+            count = precompile_templates(get_template_root())
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Template precompilation failed: %s", e)
+            return
+        logger.info(
+            "Precompiled %d templates in %.0fms", count, (time.perf_counter() - start) * 1000.0
+        )
+
+    def _close_gate_daemons(self) -> None:
+        # Only a pool that was actually started needs stopping
+        if "gate_daemons" in self.__dict__:
+            self.gate_daemons.close()
 
 
 def main(settings: Settings | None = None) -> None:
@@ -43,16 +43,7 @@ class DocumentIndexer:
                 # Read file content
                 content = md_file.read_text(encoding="utf-8")
 
-                # Extract metadata
-                doc_entry = {
-                    "title": DocumentIndexer._extract_title(content, md_file.name),
-                    "path": str(md_file.relative_to(docs_path)),
-                    "content": content,
-                    "scope": DocumentIndexer._determine_scope(md_file, docs_path),
-                    "type": DocumentIndexer._determine_scope(md_file, docs_path),  # Alias for scope
-                }
-
-                index.append(doc_entry)
+                index.append(DocumentIndexer.build_entry(md_file, docs_path, content))
 
             except (OSError, UnicodeDecodeError):
                 # Skip files that can't be read
@@ -60,6 +51,27 @@ class DocumentIndexer:
 
         return index
 
+    @staticmethod
+    def build_entry(md_file: Path, docs_path: Path, content: str) -> dict[str, Any]:
+        """Build the index entry (title, path, content, scope) for one markdown file.
+
+        Args:
+            md_file: Markdown file under docs_path
+            docs_path: Root documentation directory
+            content: File content
+
+        Returns:
+            Document metadata dict as listed in build_index()
+        """
+        scope = DocumentIndexer._determine_scope(md_file, docs_path)
+        return {
+            "title": DocumentIndexer._extract_title(content, md_file.name),
+            "path": str(md_file.relative_to(docs_path)),
+            "content": content,
+            "scope": scope,
+            "type": scope,  # Alias for scope
+        }
+
     @staticmethod
     def get_index_statistics(index: list[dict[str, Any]]) -> dict[str, Any]:
         """Calculate statistics about documentation index.
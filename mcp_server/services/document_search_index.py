@@ -0,0 +1,274 @@
+# mcp_server/services/document_search_index.py
+"""
+DocumentSearchIndex - Persistent BM25 inverted index over docs/.
+
+Stateful counterpart of DocumentIndexer + SearchService: documents are
+tokenized once into per-term postings and kept in memory across queries.
+A freshness check only stats files (re-reading a document when its mtime/size
+changed and re-indexing it when its content hash changed), and ranking only
+touches the postings of the query terms.
+
+@layer: Backend (Services)
+@dependencies: [hashlib, json, math, re, threading, mcp_server.services.document_indexer,
+    mcp_server.services.search_service, mcp_server.utils.atomic_json_writer]
+@responsibilities:
+    - Tokenize markdown documents into field-weighted term frequencies
+    - Keep postings in sync with docs/ incrementally (mtime/size, then sha256)
+    - Rank multi-term queries with BM25
+    - Persist the tokenized index under .st3/ so restarts skip re-tokenizing
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from mcp_server.services.document_indexer import DocumentIndexer
+from mcp_server.services.search_service import SearchService
+from mcp_server.utils.atomic_json_writer import AtomicJsonWriter
+
+INDEX_SCHEMA_VERSION = 1
+
+# Field weights keep the SearchService ordering (title 3.0 > path 1.0 > content 0.5)
+_FIELD_WEIGHTS = {"title": 6, "path": 2, "content": 1}
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens; ``snake_case`` and paths split on separators."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class DocumentSearchIndex:
+    """In-memory inverted index over a docs directory, persisted as JSON.
+
+    Args:
+        docs_dir: Root documentation directory (scanned for ``*.md``).
+        cache_path: JSON file holding the tokenized index; ``None`` keeps it in memory only.
+        rescan_interval: Seconds during which repeated queries reuse the last
+            freshness scan instead of stat-ing every document again.
+    """
+
+    def __init__(
+        self,
+        docs_dir: Path,
+        cache_path: Path | None = None,
+        rescan_interval: float = 1.0,
+    ) -> None:
+        self.docs_dir = docs_dir
+        self._cache_path = cache_path
+        self._rescan_interval = rescan_interval
+        self._last_scan: float | None = None
+        self._lock = threading.RLock()
+        self._docs: dict[str, dict[str, Any]] = self._load()
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        for rel_path, doc in self._docs.items():
+            self._add_postings(rel_path, doc)
+
+    @property
+    def document_count(self) -> int:
+        return len(self._docs)
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Bring the index in line with docs/; return whether anything changed."""
+        with self._lock:
+            return self._refresh(force=force)
+
+    def _refresh(self, *, force: bool) -> bool:
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_scan is not None
+            and now - self._last_scan < self._rescan_interval
+        ):
+            return False
+
+        changed = False
+        seen: set[str] = set()
+        for md_file in self.docs_dir.rglob("*.md"):
+            rel_path = str(md_file.relative_to(self.docs_dir))
+            try:
+                stat = md_file.stat()
+            except OSError:
+                continue
+            seen.add(rel_path)
+            current = self._docs.get(rel_path)
+            if (
+                current is not None
+                and current["mtime_ns"] == stat.st_mtime_ns
+                and current["size"] == stat.st_size
+            ):
+                continue
+            changed |= self._reindex(md_file, rel_path, stat.st_mtime_ns, stat.st_size)
+
+        for rel_path in set(self._docs) - seen:
+            self._remove(rel_path)
+            changed = True
+
+        self._last_scan = time.monotonic()
+        if changed:
+            self._save()
+        return changed
+
+    def search(
+        self, query: str, max_results: int = 10, scope: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Rank documents for *query* with BM25 (terms are OR-ed, scores summed).
+
+        Returns:
+            SearchService-shaped results: ``title``, ``path``, ``scope``, ``type``
+            plus ``_relevance`` and ``_snippet``, sorted by relevance (descending).
+        """
+        with self._lock:
+            self._refresh(force=False)
+            return self._search(query, max_results, scope)
+
+    def _search(self, query: str, max_results: int, scope: str | None) -> list[dict[str, Any]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._docs:
+            return []
+
+        doc_count = len(self._docs)
+        avg_length = self._total_length / doc_count or 1.0
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for rel_path, tf in postings.items():
+                doc = self._docs[rel_path]
+                if scope and doc["scope"] != scope:
+                    continue
+                norm = _K1 * (1 - _B + _B * doc["length"] / avg_length)
+                scores[rel_path] = scores.get(rel_path, 0.0) + idf * tf * (_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:max_results]
+        return [self._result(rel_path, score, query, terms) for rel_path, score in ranked]
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _reindex(self, md_file: Path, rel_path: str, mtime_ns: int, size: int) -> bool:
+        try:
+            raw = md_file.read_bytes()
+            content = raw.decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            if rel_path in self._docs:
+                self._remove(rel_path)
+                return True
+            return False
+
+        digest = hashlib.sha256(raw).hexdigest()
+        current = self._docs.get(rel_path)
+        if current is not None and current["sha256"] == digest:
+            # Touched but unchanged: refresh the stat key, keep the postings
+            current["mtime_ns"] = mtime_ns
+            current["size"] = size
+            return True
+
+        if current is not None:
+            self._remove(rel_path)
+        entry = DocumentIndexer.build_entry(md_file, self.docs_dir, content)
+        title, scope = entry["title"], entry["scope"]
+        field_tokens = {
+            "title": tokenize(title),
+            "path": tokenize(rel_path),
+            "content": tokenize(content),
+        }
+        tf: Counter[str] = Counter()
+        for field_name, tokens in field_tokens.items():
+            weight = _FIELD_WEIGHTS[field_name]
+            for token in tokens:
+                tf[token] += weight
+        doc = {
+            "title": title,
+            "scope": scope,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha256": digest,
+            "length": sum(len(tokens) for tokens in field_tokens.values()),
+            "tf": dict(tf),
+        }
+        self._docs[rel_path] = doc
+        self._add_postings(rel_path, doc)
+        return True
+
+    def _add_postings(self, rel_path: str, doc: dict[str, Any]) -> None:
+        for term, tf in doc["tf"].items():
+            self._postings.setdefault(term, {})[rel_path] = tf
+        self._total_length += doc["length"]
+
+    def _remove(self, rel_path: str) -> None:
+        doc = self._docs.pop(rel_path)
+        for term in doc["tf"]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(rel_path, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= doc["length"]
+
+    def _result(self, rel_path: str, score: float, query: str, terms: list[str]) -> dict[str, Any]:
+        doc = self._docs[rel_path]
+        try:
+            content = (self.docs_dir / rel_path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            content = ""
+        # Snippet around the full phrase when present, else the first matching term
+        content_lower = content.lower()
+        anchor = next(
+            (t for t in [query, *terms] if t and t.lower() in content_lower),
+            query,
+        )
+        return {
+            "title": doc["title"],
+            "path": rel_path,
+            "scope": doc["scope"],
+            "type": doc["scope"],
+            "_relevance": score,
+            "_snippet": SearchService.extract_snippet(content, anchor),
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the persisted index; start empty when absent, malformed or outdated."""
+        if self._cache_path is None or not self._cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_SCHEMA_VERSION:
+            return {}
+        docs = data.get("documents")
+        return docs if isinstance(docs, dict) else {}
+
+    def _save(self) -> None:
+        if self._cache_path is None:
+            return
+        # On failure the index still works from memory; the next change retries the write
+        with contextlib.suppress(OSError):
+            AtomicJsonWriter().write_json(
+                self._cache_path,
+                {"version": INDEX_SCHEMA_VERSION, "documents": self._docs},
+                temp_name=f"{self._cache_path.name}.tmp",
+            )
@@ -1,6 +1,7 @@
 """Discovery tools for AI self-orientation."""
 
 # pyright: reportIncompatibleMethodOverride=false
+import asyncio
 import re
 from pathlib import Path
 from typing import Any
@@ -16,8 +17,7 @@ from mcp_server.managers.github_manager import GitHubManager
 from mcp_server.managers.phase_state_engine import PhaseStateEngine
 from mcp_server.managers.project_manager import ProjectManager
 from mcp_server.schemas import WorkphasesConfig
-from mcp_server.services.document_indexer import DocumentIndexer
-from mcp_server.services.search_service import SearchService
+from mcp_server.services.document_search_index import DocumentSearchIndex
 from mcp_server.tools.base import BaseTool
 from mcp_server.tools.tool_result import ToolResult
 
@@ -48,11 +48,21 @@ class SearchDocumentationTool(BaseTool):
     def __init__(self, settings: Settings) -> None:
         super().__init__()
         self._settings = settings
+        self._index: DocumentSearchIndex | None = None
+
+    def _search_index(self, workspace_root: Path) -> DocumentSearchIndex:
+        """Return the in-memory index for this workspace (loaded from .st3/ on first use)."""
+        docs_dir = workspace_root / "docs"
+        if self._index is None or self._index.docs_dir != docs_dir:
+            self._index = DocumentSearchIndex(
+                docs_dir, cache_path=workspace_root / ".st3" / "cache" / "docs_index.json"
+            )
+        return self._index
 
     async def execute(self, params: SearchDocumentationInput, context: NoteContext) -> ToolResult:
-        """Execute documentation search using DocumentIndexer + SearchService."""
-        # Build index from docs directory
-        docs_dir = Path(self._settings.server.workspace_root) / "docs"
+        """Execute documentation search against the persistent BM25 index."""
+        workspace_root = Path(self._settings.server.workspace_root)
+        docs_dir = workspace_root / "docs"
 
         if not docs_dir.exists():
             context.produce(RecoveryNote(message=f"Expected directory: {docs_dir}"))
@@ -60,14 +70,15 @@ class SearchDocumentationTool(BaseTool):
             context.produce(RecoveryNote(message="Add markdown files to document project"))
             raise ExecutionError("Documentation directory not found")
 
-        index = DocumentIndexer.build_index(docs_dir)
-
         # Map scope filter (None if 'all')
         scope_filter = None if params.scope == "all" else params.scope
 
-        # Search index
-        results = SearchService.search_index(
-            index=index, query=params.query, max_results=10, scope=scope_filter
+        # Search index (refreshes changed documents incrementally)
+        results = await asyncio.to_thread(
+            self._search_index(workspace_root).search,
+            params.query,
+            max_results=10,
+            scope=scope_filter,
         )
 
         if not results:
@@ -1,5 +1,6 @@
 """Quality tools."""
 
+import asyncio
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
@@ -94,9 +95,14 @@ class RunQualityGatesTool(BaseTool):
         """
         del context  # Not used
         effective_scope = self._effective_scope(params)
-        resolved_files = self.manager._resolve_scope(effective_scope, files=params.files)  # pyright: ignore[reportPrivateUsage]
+        # Scope resolution shells out to git; keep it off the event loop.
+        resolved_files = await asyncio.to_thread(
+            self.manager._resolve_scope,  # pyright: ignore[reportPrivateUsage]
+            effective_scope,
+            files=params.files,
+        )
 
-        result = self.manager.run_quality_gates(
+        result = await self.manager.run_quality_gates_async(
             resolved_files,
             effective_scope=effective_scope,
         )
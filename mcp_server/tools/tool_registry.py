@@ -0,0 +1,221 @@
+# mcp_server/tools/tool_registry.py
+"""
+Tool Registry - lazily constructed MCP tools behind cached descriptors.
+
+MCPServer registers each tool as a ToolSpec: the import path of its class plus
+a factory that wires the tool's dependencies. ``list_tools`` is answered from
+ToolDescriptors (name, description, input schema) persisted under
+``.st3/cache/`` and fingerprinted on the mcp_server sources, so a warm start
+imports no tool module and constructs no manager. A tool is imported and
+constructed on its first call. When the descriptors are missing or stale,
+every tool is constructed once to regenerate them.
+
+@layer: Backend (Tools)
+@dependencies: [hashlib, importlib, pydantic, threading,
+    mcp_server.utils.atomic_json_writer]
+@responsibilities:
+    - Hold the ordered tool catalogue as import paths plus factories
+    - Serve tool descriptors without importing tool modules
+    - Construct each tool on first use and reuse the instance
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import sys
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import pydantic
+
+from mcp_server.utils.atomic_json_writer import AtomicJsonWriter
+
+if TYPE_CHECKING:
+    from mcp_server.tools.base import BaseTool
+
+DESCRIPTOR_CACHE_VERSION = 1
+
+# Tool schemas are built from models anywhere in the package
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+ToolT = TypeVar("ToolT", bound="BaseTool")
+
+
+@dataclass(frozen=True)
+class ToolDescriptor:
+    """What ``list_tools`` reports for one tool."""
+
+    name: str
+    description: str
+    input_schema: dict[str, Any]
+
+    @classmethod
+    def of(cls, tool: BaseTool) -> ToolDescriptor:
+        return cls(name=tool.name, description=tool.description, input_schema=tool.input_schema)
+
+
+@dataclass(frozen=True)
+class ToolSpec(Generic[ToolT]):
+    """A registered tool: ``"package.module:ClassName"`` and a factory given that class.
+
+    Parametrize the spec with the tool class so the factory is checked against
+    its constructor, e.g. ``ToolSpec["GitPushTool"](target, factory)`` with the
+    class imported under ``TYPE_CHECKING`` only.
+    """
+
+    target: str
+    factory: Callable[[type[ToolT]], ToolT]
+
+    def build(self) -> ToolT:
+        """Import the tool class and construct it."""
+        module_name, _, class_name = self.target.partition(":")
+        tool_cls: type[ToolT] = getattr(importlib.import_module(module_name), class_name)
+        return self.factory(tool_cls)
+
+
+class ToolRegistry:
+    """Ordered tool catalogue whose instances are built on first use.
+
+    Args:
+        specs: Tools in ``list_tools`` order.
+        cache_path: JSON file holding the descriptors; ``None`` derives them
+            by constructing every tool.
+    """
+
+    def __init__(self, specs: Sequence[ToolSpec[Any]], cache_path: Path | None = None) -> None:
+        self._specs = list(specs)
+        self._cache_path = cache_path
+        self._descriptors: list[ToolDescriptor] | None = None
+        self._specs_by_name: dict[str, ToolSpec[Any]] = {}
+        self._instances: dict[str, BaseTool] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_tools(cls, tools: Iterable[BaseTool]) -> ToolRegistry:
+        """Registry over already constructed tools."""
+        registry = cls([])
+        tools = list(tools)
+        registry._descriptors = [ToolDescriptor.of(tool) for tool in tools]
+        registry._instances = {tool.name: tool for tool in tools}
+        return registry
+
+    def descriptors(self) -> list[ToolDescriptor]:
+        """Return the descriptors of every registered tool, in registration order."""
+        with self._lock:
+            if self._descriptors is None:
+                self._descriptors = self._load_descriptors()
+            return self._descriptors
+
+    def get(self, name: str) -> BaseTool | None:
+        """Return the tool called *name*, constructing it on first use."""
+        with self._lock:
+            tool = self._instances.get(name)
+            if tool is not None:
+                return tool
+            self.descriptors()
+            spec = self._specs_by_name.get(name)
+            if spec is None:
+                return None
+            built: BaseTool = spec.build()
+            self._instances[name] = built
+            return built
+
+    def tools(self) -> list[BaseTool]:
+        """Return every tool instance, constructing any not built yet."""
+        with self._lock:
+            tools = [self.get(descriptor.name) for descriptor in self.descriptors()]
+            return [tool for tool in tools if tool is not None]
+
+    @property
+    def constructed(self) -> list[str]:
+        """Names of the tools instantiated so far."""
+        with self._lock:
+            return list(self._instances)
+
+    # ------------------------------------------------------------------
+    # Descriptor cache
+    # ------------------------------------------------------------------
+
+    def fingerprint(self) -> str:
+        """Hash the registered targets, the package sources and the runtime versions."""
+        digest = hashlib.sha256()
+        digest.update(
+            f"{DESCRIPTOR_CACHE_VERSION}|{sys.version_info[:2]}|{pydantic.VERSION}".encode()
+        )
+        for spec in self._specs:
+            digest.update(spec.target.encode())
+        for path in sorted(_PACKAGE_ROOT.rglob("*.py")):
+            digest.update(path.relative_to(_PACKAGE_ROOT).as_posix().encode())
+            with contextlib.suppress(OSError):
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def _load_descriptors(self) -> list[ToolDescriptor]:
+        fingerprint = self.fingerprint() if self._cache_path is not None else ""
+        descriptors = self._read_cache(fingerprint) if self._cache_path is not None else None
+        if descriptors is None:
+            descriptors = []
+            for spec in self._specs:
+                tool = spec.build()
+                self._instances[tool.name] = tool
+                descriptors.append(ToolDescriptor.of(tool))
+            self._write_cache(fingerprint, descriptors)
+        self._specs_by_name = {
+            descriptor.name: spec for descriptor, spec in zip(descriptors, self._specs, strict=True)
+        }
+        return descriptors
+
+    def _read_cache(self, fingerprint: str) -> list[ToolDescriptor] | None:
+        """Read the persisted descriptors; None when absent, malformed or stale."""
+        assert self._cache_path is not None
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return None
+        entries = data.get("tools")
+        if not isinstance(entries, list) or len(entries) != len(self._specs):
+            return None
+        try:
+            return [
+                ToolDescriptor(
+                    name=entry["name"],
+                    description=entry["description"],
+                    input_schema=entry["input_schema"],
+                )
+                for entry in entries
+            ]
+        except (KeyError, TypeError):
+            return None
+
+    def _write_cache(self, fingerprint: str, descriptors: list[ToolDescriptor]) -> None:
+        if self._cache_path is None:
+            return
+        payload = {
+            "version": DESCRIPTOR_CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "tools": [
+                {
+                    "target": spec.target,
+                    "name": descriptor.name,
+                    "description": descriptor.description,
+                    "input_schema": descriptor.input_schema,
+                }
+                for spec, descriptor in zip(self._specs, descriptors, strict=True)
+            ],
+        }
+        # Descriptors were derived in memory; the next cold start retries the write
+        with contextlib.suppress(OSError, TypeError, ValueError):
+            AtomicJsonWriter().write_json(
+                self._cache_path,
+                payload,
+                temp_name=f"{self._cache_path.name}.{os.getpid()}.tmp",
+            )
@@ -49,7 +49,7 @@ class PythonValidator(BaseValidator):
         # Full QA mode with existing file (content=None, syntax_only=False)
         if content is None and not self.syntax_only:
             # Run quality gates directly on existing file
-            result = self._require_qa_manager().run_quality_gates([path])
+            result = await self._require_qa_manager().run_quality_gates_async([path])
             return self._parse_result(result, original_path=path, scanned_path=path)
 
         # Read content if not provided (syntax_only mode requires content)
@@ -100,7 +100,7 @@ class PythonValidator(BaseValidator):
             temp_file = temp_file_path
 
             # Run QA Manager
-            result = self._require_qa_manager().run_quality_gates([scan_path])
+            result = await self._require_qa_manager().run_quality_gates_async([scan_path])
 
             return self._parse_result(result, original_path=path, scanned_path=scan_path)
 
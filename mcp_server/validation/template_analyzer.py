@@ -3,7 +3,7 @@
 Template metadata analyzer for extracting validation rules from Jinja2 templates.
 
 @layer: Validation
-@dependencies: [jinja2, yaml]
+@dependencies: [jinja2, yaml, mcp_server.scaffolding.jinja_environment]
 """
 
 # Standard library
@@ -13,7 +13,9 @@ from typing import Any
 
 # Third-party
 import yaml
-from jinja2 import Environment, meta
+from jinja2 import meta
+
+from mcp_server.scaffolding.jinja_environment import get_environment
 
 
 class TemplateAnalyzer:
@@ -27,7 +29,7 @@ class TemplateAnalyzer:
             template_root: Root directory containing all templates.
         """
         self.template_root = Path(template_root)
-        self.env = Environment()
+        self.env = get_environment(self.template_root)
         self._metadata_cache: dict[Path, dict[str, Any]] = {}
 
     def extract_metadata(self, template_path: Path) -> dict[str, Any]:
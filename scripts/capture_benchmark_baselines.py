@@ -0,0 +1,32 @@
+"""Benchmark baseline capture script for backend core hot paths.
+
+Runs the benchmark suite in baseline-saving mode so the measured medians
+are written to tests/baselines/benchmarks/<module>.json. Regular benchmark
+runs (ST3_BENCHMARKS=1) then fail when a median regresses past the
+threshold.
+
+CRITICAL: Capture on an otherwise idle machine; baselines are only
+comparable on the hardware they were captured on.
+"""
+
+import os
+import subprocess
+import sys
+
+
+def capture_benchmark_baselines() -> int:
+    """Run tests/backend/benchmarks serially with ST3_BENCHMARK_SAVE=1."""
+    env = {**os.environ, "ST3_BENCHMARKS": "1", "ST3_BENCHMARK_SAVE": "1"}
+    print("Capturing backend benchmark baselines...")
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "tests/backend/benchmarks", "-n", "0", "-q"],
+        env=env,
+        check=False,
+    )
+    if result.returncode == 0:
+        print("\n✅ Benchmark baselines written to tests/baselines/benchmarks/")
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(capture_benchmark_baselines())
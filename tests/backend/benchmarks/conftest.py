@@ -0,0 +1,147 @@
+"""
+@module: tests.backend.benchmarks.conftest
+@layer: Test Infrastructure
+@dependencies: pytest, json, os, statistics, time, pathlib
+@responsibilities:
+  - Provide an offline, pytest-benchmark style `benchmark` fixture
+  - Compare results against JSON baselines in tests/baselines/benchmarks/
+  - (Re)write baselines when ST3_BENCHMARK_SAVE=1
+
+Benchmarks are timing-sensitive, so they only run when ST3_BENCHMARKS=1
+and should run without xdist:
+
+    ST3_BENCHMARKS=1 pytest tests/backend/benchmarks -n 0
+
+A benchmark fails when its median per-call time exceeds the baseline by
+more than ST3_BENCHMARK_THRESHOLD (default 0.30 = 30%). Benchmarks without
+a baseline entry only record their stats (user_properties) and pass.
+"""
+
+# Standard Library Imports
+import json
+import os
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Third-Party Imports
+import pytest
+
+BASELINE_DIR = Path(__file__).resolve().parents[2] / "baselines" / "benchmarks"
+
+_ENABLED = os.environ.get("ST3_BENCHMARKS") == "1"
+_SAVE = os.environ.get("ST3_BENCHMARK_SAVE") == "1"
+_THRESHOLD = float(os.environ.get("ST3_BENCHMARK_THRESHOLD", "0.30"))
+_ROUNDS = 7
+_MIN_ROUND_NS = 20_000_000  # calibrate loops so one round takes >= 20ms
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip benchmarks unless ST3_BENCHMARKS=1."""
+    del config
+    if _ENABLED:
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with ST3_BENCHMARKS=1")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip)
+
+
+class _BaselineStore:
+    """Per-module baseline files, merged and written at session end."""
+
+    def __init__(self) -> None:
+        self._loaded: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+
+    def _entries(self, module: str) -> dict[str, Any]:
+        if module not in self._loaded:
+            path = BASELINE_DIR / f"{module}.json"
+            self._loaded[module] = (
+                json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+            )
+        return self._loaded[module]
+
+    def get(self, module: str, name: str) -> dict[str, Any] | None:
+        return self._entries(module).get(name)
+
+    def put(self, module: str, name: str, stats: dict[str, Any]) -> None:
+        self._entries(module)[name] = stats
+        self._dirty.add(module)
+
+    def flush(self) -> None:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        for module in sorted(self._dirty):
+            content = json.dumps(self._loaded[module], indent=2, sort_keys=True)
+            (BASELINE_DIR / f"{module}.json").write_text(content + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines() -> Iterator[_BaselineStore]:
+    """Session-wide baseline store (written on teardown when saving)."""
+    store = _BaselineStore()
+    yield store
+    if _SAVE:
+        store.flush()
+
+
+def _measure(func: Callable[[], object]) -> dict[str, Any]:
+    """Calibrate loop count, then time _ROUNDS rounds (ns per call)."""
+    loops = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= _MIN_ROUND_NS or loops >= 1 << 20:
+            break
+        loops = loops * 10 if elapsed == 0 else max(loops * 2, loops * _MIN_ROUND_NS // elapsed + 1)
+
+    per_call = []
+    for _ in range(_ROUNDS):
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            func()
+        per_call.append((time.perf_counter_ns() - started) / loops)
+    return {
+        "loops": loops,
+        "rounds": _ROUNDS,
+        "min_ns": round(min(per_call), 1),
+        "median_ns": round(statistics.median(per_call), 1),
+        "mean_ns": round(statistics.fmean(per_call), 1),
+    }
+
+
+@pytest.fixture
+def benchmark(
+    request: pytest.FixtureRequest, benchmark_baselines: _BaselineStore
+) -> Callable[..., Any]:
+    """
+    Time a callable and check it against the stored baseline.
+
+    Usage mirrors pytest-benchmark: ``result = benchmark(func, *args)``.
+    """
+    module = Path(str(request.node.fspath)).stem
+    name = request.node.name
+
+    def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = func(*args, **kwargs)  # warm-up + return value for assertions
+        stats = _measure(lambda: func(*args, **kwargs))
+        request.node.user_properties.append(("benchmark", stats))
+
+        if _SAVE:
+            benchmark_baselines.put(module, name, stats)
+            return result
+        baseline = benchmark_baselines.get(module, name)
+        if baseline is not None:
+            limit = baseline["median_ns"] * (1 + _THRESHOLD)
+            assert stats["median_ns"] <= limit, (
+                f"{name} regressed: median {stats['median_ns']:.0f}ns > "
+                f"{limit:.0f}ns (baseline {baseline['median_ns']:.0f}ns "
+                f"+ {_THRESHOLD:.0%})"
+            )
+        return result
+
+    return run
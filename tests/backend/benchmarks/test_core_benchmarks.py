@@ -0,0 +1,162 @@
+# tests/backend/benchmarks/test_core_benchmarks.py
+"""
+Hot-path benchmarks for backend core.
+
+Covers EventBus publish fan-out, StrategyCache per-tick set/get, strategy
+DTO construction, ID generation and full FlowInitiator tick processing.
+Results are compared against tests/baselines/benchmarks/test_core_benchmarks.json
+(see tests/backend/benchmarks/conftest.py).
+
+@layer: Tests (Benchmark)
+@dependencies: [pytest, pydantic, backend.core, backend.dtos.strategy, backend.utils]
+"""
+
+# Standard library
+from datetime import UTC, datetime
+
+# Third-party
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+# Project modules
+from backend.core.enums import TradeStatus
+from backend.core.eventbus import EventBus
+from backend.core.flow_initiator import FlowInitiator
+from backend.core.interfaces.eventbus import ScopeLevel, SubscriptionScope
+from backend.core.strategy_cache import StrategyCache
+from backend.dtos.shared import Origin, OriginType
+from backend.dtos.shared.platform_data import PlatformDataDTO
+from backend.dtos.strategy.entry_plan import EntryPlan
+from backend.dtos.strategy.execution_plan import ExecutionPlan
+from backend.dtos.strategy.exit_plan import ExitPlan
+from backend.dtos.strategy.risk import Risk
+from backend.dtos.strategy.signal import Signal
+from backend.dtos.strategy.size_plan import SizePlan
+from backend.dtos.strategy.strategy_directive import StrategyDirective
+from backend.dtos.strategy.trade_plan import TradePlan
+from backend.utils import id_generators
+
+pytestmark = pytest.mark.benchmark
+
+ANCHOR = datetime(2025, 11, 9, 14, 30, tzinfo=UTC)
+
+
+class TickPayload(BaseModel):
+    """Representative provider payload."""
+
+    model_config = ConfigDict(frozen=True)
+
+    symbol: str
+    price: float
+
+
+class SignalContextDTO(BaseModel):
+    """Representative worker output stored in the cache."""
+
+    model_config = ConfigDict(frozen=True)
+
+    value: float
+
+
+def _first_valid_example(dto_type: type[BaseModel]) -> dict:
+    """First json_schema_extra example that validates (description keys dropped)."""
+    for example in dto_type.model_config["json_schema_extra"]["examples"]:
+        data = {key: value for key, value in example.items() if key != "description"}
+        try:
+            dto_type.model_validate(data)
+        except ValueError:
+            continue
+        return data
+    raise AssertionError(f"No valid example for {dto_type.__name__}")
+
+
+DTO_CASES: dict[str, tuple[type[BaseModel], dict]] = {
+    dto_type.__name__: (dto_type, _first_valid_example(dto_type))
+    for dto_type in (
+        Signal,
+        Risk,
+        StrategyDirective,
+        EntryPlan,
+        SizePlan,
+        ExitPlan,
+        ExecutionPlan,
+    )
+}
+DTO_CASES["TradePlan"] = (
+    TradePlan,
+    {
+        "plan_id": "TPL_20251109_143000_abc12345",
+        "strategy_instance_id": "STR_A",
+        "status": TradeStatus.ACTIVE,
+        "created_at": ANCHOR,
+    },
+)
+
+
+class _TickCache(StrategyCache):
+    """StrategyCache adapter for FlowInitiator's single-argument set_result_dto call."""
+
+    def set_result_dto(self, *args: object) -> None:  # type: ignore[override]
+        super().set_result_dto(None, args[-1])  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("subscribers", [1, 10, 100, 1000])
+def test_publish_fanout(benchmark, subscribers):
+    """EventBus.publish to N matching strategy subscribers."""
+    bus = EventBus()
+    scope = SubscriptionScope(ScopeLevel.STRATEGY, strategy_instance_id="STR_A")
+    received = [0]
+
+    def handler(_payload):
+        received[0] += 1
+
+    for _ in range(subscribers):
+        bus.subscribe("TICK", handler, scope)
+    payload = TickPayload(symbol="BTC_USDT", price=100.0)
+
+    benchmark(bus.publish, "TICK", payload, ScopeLevel.STRATEGY, "STR_A")
+    assert received[0] >= subscribers
+
+
+def test_cache_set_get_per_tick(benchmark):
+    """One tick: start run, store worker output, read required DTOs."""
+    cache = StrategyCache()
+    output = SignalContextDTO(value=1.0)
+
+    def tick():
+        cache.start_new_strategy_run({}, ANCHOR)
+        cache.set_result_dto(None, output)  # type: ignore[arg-type]
+        dtos = cache.get_required_dtos(None)  # type: ignore[arg-type]
+        cache.clear_cache()
+        return dtos
+
+    assert benchmark(tick) == {SignalContextDTO: output}
+
+
+@pytest.mark.parametrize("dto_name", sorted(DTO_CASES))
+def test_strategy_dto_construction(benchmark, dto_name):
+    """Validated construction of each strategy DTO."""
+    dto_type, data = DTO_CASES[dto_name]
+    assert isinstance(benchmark(dto_type.model_validate, data), dto_type)
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [id_generators.generate_tick_id, id_generators.generate_signal_id],
+    ids=["tick_id", "signal_id"],
+)
+def test_id_generation(benchmark, generator):
+    """Typed ID generation."""
+    assert "_" in benchmark(generator)
+
+
+def test_flow_initiator_tick(benchmark):
+    """Full FlowInitiator tick: PlatformDataDTO in, CONTINUE disposition out."""
+    initiator = FlowInitiator("flow_initiator_STR_A")
+    initiator.initialize(_TickCache(), dto_types={"tick": TickPayload})
+    data = PlatformDataDTO(
+        origin=Origin(id="TCK_20251109_143000_abc12345", type=OriginType.TICK),
+        timestamp=ANCHOR,
+        payload=TickPayload(symbol="BTC_USDT", price=100.0),
+    )
+    assert benchmark(initiator.on_data_ready, data).disposition == "CONTINUE"
@@ -0,0 +1,94 @@
+# tests/backend/benchmarks/test_startup.py
+"""
+Startup-time budgets for worker processes.
+
+Measures, in fresh interpreters, the ``python -X importtime`` cost of the
+modules a strategy worker imports at startup and the time until a spawned
+process-pool worker has imported them and answers. Both are checked
+against fixed budgets (overridable via environment variables) instead of
+machine-specific baselines.
+
+@layer: Tests (Benchmark)
+@dependencies: [pytest, subprocess, concurrent.futures, multiprocessing]
+"""
+
+# Standard library
+import importlib
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-party
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+WORKER_MODULES = (
+    "backend.core.flow_initiator",
+    "backend.core.eventbus",
+    "backend.core.strategy_cache",
+    "backend.dtos.strategy",
+)
+IMPORT_BUDGET_MS = float(os.environ.get("ST3_IMPORT_BUDGET_MS", "300"))
+WORKER_STARTUP_BUDGET_S = float(os.environ.get("ST3_WORKER_STARTUP_BUDGET_S", "0.75"))
+
+
+def _importtime(modules: tuple[str, ...]) -> list[tuple[int, int, int, str]]:
+    """Run -X importtime in a fresh interpreter → (self_us, cumulative_us, depth, name)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return entries
+
+
+def test_worker_import_time_budget():
+    """Test cumulative import time of worker modules stays within budget."""
+    entries = _importtime(WORKER_MODULES)
+    # Top-level entries after interpreter startup (site) belong to our import
+    start = max(i for i, entry in enumerate(entries) if entry[2] == 0 and entry[3] == "site")
+    total_ms = sum(entry[1] for entry in entries[start + 1 :] if entry[2] == 0) / 1000
+
+    slowest = sorted(entries[start + 1 :], reverse=True)[:10]
+    report = "\n".join(f"{s / 1000:8.1f}ms  {name}" for s, _c, _d, name in slowest)
+    assert total_ms <= IMPORT_BUDGET_MS, (
+        f"worker imports took {total_ms:.0f}ms > {IMPORT_BUDGET_MS:.0f}ms budget; "
+        f"slowest modules (self time):\n{report}"
+    )
+
+
+def test_dto_packages_import_lazily():
+    """Test DTO package imports do not pull in their model modules."""
+    entries = _importtime(("backend.dtos.strategy", "backend.dtos.execution"))
+    names = {entry[3] for entry in entries}
+    assert "backend.dtos.strategy.strategy_directive" not in names
+    assert "backend.dtos.execution.execution_command" not in names
+
+
+def test_process_pool_worker_startup_budget():
+    """Test a spawned pool worker imports the worker modules and answers in time."""
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=importlib.import_module,
+        initargs=("backend.core.flow_initiator",),
+    ) as pool:
+        assert pool.submit(os.getpid).result() != os.getpid()
+        elapsed = time.perf_counter() - started
+
+    assert elapsed <= WORKER_STARTUP_BUDGET_S, (
+        f"spawned worker ready after {elapsed:.2f}s > {WORKER_STARTUP_BUDGET_S:.2f}s budget"
+    )
@@ -21,6 +21,7 @@ from backend.core.interfaces.eventbus import (
     ScopeLevel,
     SubscriptionScope,
 )
+from backend.core.strategy_interner import ALL_STRATEGIES, StrategyIdInterner
 
 
 class TestSubscriptionScopeCreation:
@@ -121,6 +122,15 @@ class TestSubscriptionScopeFiltering:
         # Strategy events with empty filter → should filter all
         assert scope.should_receive_event(ScopeLevel.STRATEGY, "STR_A") is False
 
+    def test_target_strategy_ids_are_frozen(self):
+        """Test the target set is copied into a frozenset (mask cannot drift)."""
+        targets = {"STR_A"}
+        scope = SubscriptionScope(level=ScopeLevel.PLATFORM, target_strategy_ids=targets)
+        targets.add("STR_B")
+
+        assert scope.target_strategy_ids == frozenset({"STR_A"})
+        assert scope.should_receive_event(ScopeLevel.STRATEGY, "STR_B") is False
+
 
 class TestScopeLevelEnum:
     """Test ScopeLevel enum values."""
@@ -137,6 +147,31 @@ class TestScopeLevelEnum:
         assert ScopeLevel.PLATFORM != ScopeLevel.STRATEGY
 
 
+class TestSubscriptionScopeMask:
+    """Test bitmask encoding of SubscriptionScope."""
+
+    SCOPES = [
+        SubscriptionScope(ScopeLevel.STRATEGY, strategy_instance_id="STR_A"),
+        SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids=None),
+        SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids={"STR_B", "STR_C"}),
+        SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids=set()),
+    ]
+
+    @pytest.mark.parametrize("scope", SCOPES)
+    def test_mask_matches_should_receive_event(self, scope):
+        """Test mask & bit agrees with should_receive_event for strategy events."""
+        interner = StrategyIdInterner(["STR_A", "STR_B"])
+        mask = scope.strategy_mask(interner)
+        for strategy_id in ["STR_A", "STR_B", "STR_C", "STR_D"]:
+            expected = scope.should_receive_event(ScopeLevel.STRATEGY, strategy_id)
+            assert bool(mask & interner.bit(strategy_id)) is expected
+
+    def test_unrestricted_platform_mask(self):
+        """Test unrestricted platform scope encodes as ALL_STRATEGIES."""
+        scope = SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids=None)
+        assert scope.strategy_mask(StrategyIdInterner()) == ALL_STRATEGIES
+
+
 class TestIEventBusProtocol:
     """Test IEventBus protocol compliance (interface only)."""
 
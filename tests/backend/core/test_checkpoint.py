@@ -0,0 +1,232 @@
+# tests/backend/core/test_checkpoint.py
+"""
+Unit tests for strategy checkpoints.
+
+Tests copy-on-write capture, asynchronous binary writes, round-trip
+restore into StrategyCache and workers, pruning and corruption detection.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, datetime, decimal, pydantic, backend.core.checkpoint]
+"""
+
+# Standard library
+from datetime import UTC, datetime
+from decimal import Decimal
+
+# Third-party
+import pytest
+from pydantic import BaseModel
+
+# Project modules
+from backend.core.checkpoint import CheckpointError, CheckpointManager
+from backend.core.interfaces.worker import ICheckpointableWorker
+from backend.core.strategy_cache import StrategyCache
+from backend.dtos.execution.execution_group import ExecutionGroup, GroupStatus
+from backend.dtos.state.fill import Fill
+from backend.dtos.state.order import Order, OrderStatus, OrderType
+from backend.utils.clock import VirtualClock
+
+ANCHOR = datetime(2025, 11, 9, 14, 30, tzinfo=UTC)
+
+
+class TrendContextDTO(BaseModel):
+    """Frozen context DTO stored in the cache."""
+
+    model_config = {"frozen": True}
+
+    trend: str
+    strength: Decimal
+
+
+class EmaWorker:
+    """Stateful worker with a warm-up buffer."""
+
+    def __init__(self, name="ema_fast"):
+        self._name = name
+        self.prices: list[float] = []
+
+    @property
+    def name(self):
+        return self._name
+
+    def checkpoint_state(self):
+        return {"prices": list(self.prices)}
+
+    def restore_state(self, state):
+        self.prices = list(state["prices"])
+
+
+class StatelessWorker:
+    """Worker without declared state."""
+
+    name = "stateless"
+
+
+def _group():
+    return ExecutionGroup(
+        group_id="EXG_20251109_143000_abc12345",
+        parent_command_id="EXC_20251109_143000_abc12345",
+        execution_strategy="SINGLE",
+        order_ids=["ORD_20251109_143000_abc12345"],
+        status=GroupStatus.ACTIVE,
+        created_at=ANCHOR,
+        updated_at=ANCHOR,
+    )
+
+
+def _order():
+    return Order(
+        order_id="ORD_20251109_143000_abc12345",
+        parent_group_id="EXG_20251109_143000_abc12345",
+        symbol="BTC_USDT",
+        side="BUY",
+        order_type=OrderType.LIMIT,
+        quantity=Decimal("0.5"),
+        price=Decimal("50000"),
+        status=OrderStatus.OPEN,
+        created_at=ANCHOR,
+        updated_at=ANCHOR,
+    )
+
+
+def _fill():
+    return Fill(
+        fill_id="FIL_20251109_143000_abc12345",
+        parent_order_id="ORD_20251109_143000_abc12345",
+        filled_quantity=Decimal("0.25"),
+        fill_price=Decimal("50000"),
+        executed_at=ANCHOR,
+    )
+
+
+@pytest.fixture
+def cache():
+    """StrategyCache with an active run."""
+    strategy_cache = StrategyCache()
+    strategy_cache.start_new_strategy_run(
+        {TrendContextDTO: TrendContextDTO(trend="UP", strength=Decimal("0.8"))}, ANCHOR
+    )
+    return strategy_cache
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Checkpoint manager writing into tmp_path."""
+    checkpoints = CheckpointManager(tmp_path, interval_s=3600, keep=2)
+    yield checkpoints
+    checkpoints.close()
+
+
+class TestRoundTrip:
+    """Test checkpoint → load → restore."""
+
+    def test_round_trip(self, manager, cache):
+        """Test all state survives a round trip."""
+        worker = EmaWorker()
+        worker.prices = [1.0, 2.0, 3.0]
+        path = manager.checkpoint(
+            "STR_A", cache, [worker, StatelessWorker()], [_group()], [_order()], [_fill()], 42
+        ).result()
+        assert path.read_bytes()[:8] == b"ST3CKPT1"
+
+        checkpoint = manager.load_latest("STR_A")
+        assert checkpoint.anchor.timestamp == ANCHOR
+        assert checkpoint.journal_sequence == 42
+        assert checkpoint.execution_groups == (_group(),)
+        assert checkpoint.orders == (_order(),)
+        assert checkpoint.fills == (_fill(),)
+
+        restored_cache = StrategyCache()
+        restored_worker = EmaWorker()
+        checkpoint.restore_into(restored_cache, [restored_worker])
+        assert restored_cache.get_run_anchor().timestamp == ANCHOR
+        assert restored_cache.snapshot()[TrendContextDTO].strength == Decimal("0.8")
+        assert restored_worker.prices == [1.0, 2.0, 3.0]
+
+    def test_load_latest_without_checkpoint(self, manager):
+        """Test None when no checkpoint exists."""
+        assert manager.load_latest("STR_NONE") is None
+
+    def test_restore_requires_all_workers(self, manager, cache):
+        """Test restoring without a checkpointed worker fails loudly."""
+        manager.checkpoint("STR_A", cache, [EmaWorker()]).result()
+        with pytest.raises(CheckpointError, match="ema_fast"):
+            manager.load_latest("STR_A").restore_into(StrategyCache(), [])
+
+
+class TestCopyOnWrite:
+    """Test capture isolates the checkpoint from later mutation."""
+
+    def test_mutable_dtos_copied(self, manager, cache):
+        """Test mutating an Order after capture does not affect the checkpoint."""
+        order = _order()
+        group = _group()
+        future = manager.checkpoint("STR_A", cache, [], [group], [order])
+        order.status = OrderStatus.FILLED
+        group.order_ids.append("ORD_20251109_143001_def67890")
+        future.result()
+
+        checkpoint = manager.load_latest("STR_A")
+        assert checkpoint.orders[0].status == OrderStatus.OPEN
+        assert len(checkpoint.execution_groups[0].order_ids) == 1
+
+    def test_worker_is_stateless_check(self):
+        """Test protocol detection of checkpointable workers."""
+        assert isinstance(EmaWorker(), ICheckpointableWorker)
+        assert not isinstance(StatelessWorker(), ICheckpointableWorker)
+
+
+class TestScheduling:
+    """Test periodic checkpointing and pruning."""
+
+    def test_maybe_checkpoint_respects_interval(self, manager, cache):
+        """Test second call within interval is skipped."""
+        assert manager.maybe_checkpoint("STR_A", cache) is not None
+        assert manager.maybe_checkpoint("STR_A", cache) is None
+        manager.flush()
+
+    def test_interval_follows_injected_clock(self, cache, tmp_path):
+        """Test a VirtualClock drives the interval (no real waiting)."""
+        clock = VirtualClock(ANCHOR)
+        checkpoints = CheckpointManager(tmp_path, interval_s=60, clock=clock)
+        try:
+            assert checkpoints.maybe_checkpoint("STR_A", cache) is not None
+            clock.sleep(59)
+            assert checkpoints.maybe_checkpoint("STR_A", cache) is None
+            clock.sleep(1)
+            assert checkpoints.maybe_checkpoint("STR_A", cache) is not None
+        finally:
+            checkpoints.close()
+
+    def test_pruning_keeps_newest(self, manager, cache, tmp_path):
+        """Test only `keep` checkpoints are retained."""
+        for sequence in range(4):
+            manager.checkpoint("STR_A", cache, journal_sequence=sequence)
+        manager.flush()
+        assert len(list((tmp_path / "STR_A").glob("*.st3ckpt"))) == 2
+        assert manager.load_latest("STR_A").journal_sequence == 3
+
+    def test_unsafe_strategy_id_rejected(self, manager, cache):
+        """Test path traversal via strategy_id is rejected."""
+        with pytest.raises(ValueError, match="safe file name"):
+            manager.checkpoint("../evil", cache)
+
+
+class TestCorruption:
+    """Test integrity checks on load."""
+
+    def test_crc_mismatch(self, manager, cache):
+        """Test a flipped byte is detected."""
+        path = manager.checkpoint("STR_A", cache).result()
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with pytest.raises(CheckpointError, match="CRC"):
+            CheckpointManager.load(path)
+
+    def test_truncated(self, tmp_path):
+        """Test a truncated file is rejected."""
+        path = tmp_path / "bad.st3ckpt"
+        path.write_bytes(b"ST3")
+        with pytest.raises(CheckpointError, match="truncated"):
+            CheckpointManager.load(path)
@@ -20,6 +20,7 @@ from pydantic import BaseModel
 # Project modules
 from backend.core.eventbus import CriticalEventHandlerError, EventBus
 from backend.core.interfaces.eventbus import ScopeLevel, SubscriptionScope
+from backend.core.strategy_interner import StrategyIdInterner
 
 
 class EventPayloadDTO(BaseModel):
@@ -205,6 +206,67 @@ class TestStrategyScoping:
         assert len(received) == 1
 
 
+class TestSharedInterner:
+    """Test bitmask scope matching with a bootstrap interner."""
+
+    def test_selective_scope_with_shared_interner(self):
+        """Test selective platform scope routes via the shared interner."""
+        interner = StrategyIdInterner([f"STR_{i}" for i in range(100)])
+        bus = EventBus(interner=interner)
+        received = []
+        bus.subscribe(
+            "TICK",
+            lambda p: received.append(p.value),
+            SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids={"STR_7", "STR_99"}),
+        )
+
+        for i in range(100):
+            bus.publish(
+                "TICK", EventPayloadDTO(message="tick", value=i), ScopeLevel.STRATEGY, f"STR_{i}"
+            )
+
+        assert received == [7, 99]
+        assert len(interner) == 100
+
+    def test_strategy_unknown_at_bootstrap(self):
+        """Test strategies added after bootstrap are interned on subscribe."""
+        bus = EventBus(interner=StrategyIdInterner(["STR_A"]))
+        received = []
+        bus.subscribe(
+            "TICK",
+            received.append,
+            SubscriptionScope(ScopeLevel.STRATEGY, strategy_instance_id="STR_NEW"),
+        )
+        bus.publish("TICK", EventPayloadDTO(message="tick", value=1), ScopeLevel.STRATEGY, "STR_A")
+        bus.publish(
+            "TICK", EventPayloadDTO(message="tick", value=2), ScopeLevel.STRATEGY, "STR_NEW"
+        )
+        assert [p.value for p in received] == [2]
+
+    def test_publishing_unknown_strategy_does_not_intern(self):
+        """Test unknown publishers reach only unrestricted scopes and are not interned."""
+        interner = StrategyIdInterner(["STR_A"])
+        bus = EventBus(interner=interner)
+        unrestricted, selective = [], []
+        bus.subscribe(
+            "TICK", unrestricted.append, SubscriptionScope(ScopeLevel.PLATFORM, None, None)
+        )
+        bus.subscribe(
+            "TICK",
+            selective.append,
+            SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids={"STR_A"}),
+        )
+
+        for i in range(50):
+            bus.publish(
+                "TICK", EventPayloadDTO(message="tick", value=i), ScopeLevel.STRATEGY, f"TMP_{i}"
+            )
+
+        assert len(unrestricted) == 50
+        assert selective == []
+        assert len(interner) == 1
+
+
 class TestPlatformScoping:
     """Test platform-scoped subscription filtering."""
 
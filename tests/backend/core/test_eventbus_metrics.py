@@ -0,0 +1,208 @@
+# tests/backend/core/test_eventbus_metrics.py
+"""
+Unit tests for EventBus latency instrumentation.
+
+Tests the HDR-style histogram, the metrics registry, EventBus integration
+(opt-in recording, failure counters) and the file exporter.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, json, pydantic, backend.core.eventbus, backend.core.eventbus_metrics]
+"""
+
+# Standard library
+import json
+
+# Third-party
+import pytest
+from pydantic import BaseModel
+
+# Project modules
+from backend.core.eventbus import CriticalEventHandlerError, EventBus
+from backend.core.eventbus_metrics import (
+    EventBusMetrics,
+    EventBusMetricsExporter,
+    LatencyHistogram,
+    handler_name,
+)
+from backend.core.interfaces.eventbus import ScopeLevel, SubscriptionScope
+
+
+class EventPayloadDTO(BaseModel):
+    """Test DTO for event payloads."""
+
+    value: int
+
+
+PLATFORM_SCOPE = SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids=None)
+
+
+class TestLatencyHistogram:
+    """Test HDR-style histogram accuracy and bookkeeping."""
+
+    def test_empty_histogram(self):
+        """Test empty histogram reports zeros."""
+        hist = LatencyHistogram()
+        assert hist.count == 0
+        assert hist.percentile(0.99) == 0
+        assert hist.mean == 0.0
+
+    def test_small_values_are_exact(self):
+        """Test values below sub-bucket count are stored exactly."""
+        hist = LatencyHistogram()
+        for value in range(1, 101):
+            hist.record(value)
+        assert hist.percentile(0.5) == 50
+        assert hist.percentile(1.0) == 100
+        assert hist.min == 1
+
+    @pytest.mark.parametrize("value", [1_000, 123_456, 7_654_321, 150_000_000, 3 * 10**12])
+    def test_relative_error_bounded(self, value):
+        """Test large values stay within ~1.6% relative error."""
+        hist = LatencyHistogram()
+        hist.record(value)
+        hist.record(value * 2)
+        p50 = hist.percentile(0.5)
+        assert value <= p50 <= value * (1 + 1 / 64)
+
+    def test_percentile_clamped_to_max(self):
+        """Test percentile never exceeds observed max."""
+        hist = LatencyHistogram()
+        hist.record(1_000_001)
+        assert hist.percentile(0.999) == 1_000_001
+
+    def test_negative_clamped(self):
+        """Test negative samples are clamped to zero."""
+        hist = LatencyHistogram()
+        hist.record(-5)
+        assert hist.min == 0
+        assert hist.max == 0
+
+    def test_invalid_quantile(self):
+        """Test out-of-range quantile raises ValueError."""
+        with pytest.raises(ValueError, match="quantile"):
+            LatencyHistogram().percentile(1.5)
+
+    def test_invalid_precision(self):
+        """Test out-of-range precision raises ValueError."""
+        with pytest.raises(ValueError, match="precision_bits"):
+            LatencyHistogram(precision_bits=1)
+
+
+class TestEventBusInstrumentation:
+    """Test EventBus records metrics only when enabled."""
+
+    def test_disabled_by_default(self):
+        """Test EventBus without metrics has no registry."""
+        bus = EventBus()
+        assert bus.metrics is None
+        bus.subscribe("TICK", lambda _p: None, PLATFORM_SCOPE)
+        bus.publish("TICK", EventPayloadDTO(value=1), ScopeLevel.PLATFORM)
+
+    def test_records_per_handler(self):
+        """Test each subscription gets its own histogram entry."""
+        metrics = EventBusMetrics()
+        bus = EventBus(metrics=metrics)
+
+        def on_tick(_payload):
+            pass
+
+        sub_a = bus.subscribe("TICK", on_tick, PLATFORM_SCOPE)
+        sub_b = bus.subscribe("TICK", on_tick, PLATFORM_SCOPE)
+        for i in range(5):
+            bus.publish("TICK", EventPayloadDTO(value=i), ScopeLevel.PLATFORM)
+
+        stats_a = metrics.get_stats(("TICK", sub_a, handler_name(on_tick)))
+        stats_b = metrics.get_stats(("TICK", sub_b, handler_name(on_tick)))
+        assert stats_a is not None and stats_b is not None
+        assert stats_a.invocations == 5
+        assert stats_a.duration.count == 5
+        # Second handler waits for the first one
+        assert stats_b.queue_wait.total >= stats_a.queue_wait.total
+
+    def test_counts_failures(self):
+        """Test non-critical failures are counted and swallowed."""
+        metrics = EventBusMetrics()
+        bus = EventBus(metrics=metrics)
+
+        def failing(_payload):
+            raise RuntimeError("boom")
+
+        sub_id = bus.subscribe("TICK", failing, PLATFORM_SCOPE)
+        bus.publish("TICK", EventPayloadDTO(value=1), ScopeLevel.PLATFORM)
+
+        stats = metrics.get_stats(("TICK", sub_id, handler_name(failing)))
+        assert stats is not None
+        assert stats.failures == 1
+        assert stats.critical_failures == 0
+
+    def test_counts_critical_failures(self):
+        """Test critical failures are counted before the bus raises."""
+        metrics = EventBusMetrics()
+        bus = EventBus(metrics=metrics)
+
+        def failing(_payload):
+            raise RuntimeError("boom")
+
+        sub_id = bus.subscribe("TICK", failing, PLATFORM_SCOPE, is_critical=True)
+        with pytest.raises(CriticalEventHandlerError):
+            bus.publish("TICK", EventPayloadDTO(value=1), ScopeLevel.PLATFORM)
+
+        stats = metrics.get_stats(("TICK", sub_id, handler_name(failing)))
+        assert stats is not None
+        assert stats.critical_failures == 1
+
+
+class TestSnapshotAndExport:
+    """Test snapshot rendering and file export."""
+
+    @pytest.fixture
+    def metrics(self):
+        """Metrics registry with one recorded handler."""
+        registry = EventBusMetrics()
+        registry.record(("TICK", "SUB_1", 'Worker."on_tick"'), 1_000, 2_000_000)
+        registry.record(("TICK", "SUB_1", 'Worker."on_tick"'), 1_000, 4_000_000, failed=True)
+        return registry
+
+    def test_snapshot_structure(self, metrics):
+        """Test snapshot contains per-handler summaries."""
+        snapshot = metrics.snapshot()
+        (entry,) = snapshot["handlers"]
+        assert entry["invocations"] == 2
+        assert entry["failures"] == 1
+        assert entry["duration"]["count"] == 2
+        assert entry["duration"]["max_ns"] == 4_000_000
+        assert "p99_ns" in entry["duration"]
+        assert "p999_ns" in entry["queue_wait"]
+
+    def test_prometheus_format(self, metrics):
+        """Test Prometheus text output with escaped labels."""
+        text = metrics.to_prometheus()
+        assert "# TYPE eventbus_handler_duration_seconds summary" in text
+        assert 'handler="Worker.\\"on_tick\\""' in text
+        assert 'quantile="0.99"' in text
+        assert "eventbus_handler_failures_total{" in text
+
+    def test_reset(self, metrics):
+        """Test reset clears all handlers."""
+        metrics.reset()
+        assert metrics.snapshot()["handlers"] == []
+
+    def test_export_json(self, metrics, tmp_path):
+        """Test exporter writes JSON snapshot."""
+        target = tmp_path / "out" / "eventbus.json"
+        EventBusMetricsExporter(metrics, target).export()
+        data = json.loads(target.read_text(encoding="utf-8"))
+        assert data["handlers"][0]["subscription_id"] == "SUB_1"
+
+    def test_export_thread_final_write(self, metrics, tmp_path):
+        """Test start/stop writes a final prometheus snapshot."""
+        target = tmp_path / "eventbus.prom"
+        exporter = EventBusMetricsExporter(metrics, target, fmt="prometheus", interval_s=60)
+        exporter.start()
+        exporter.stop()
+        assert target.read_text(encoding="utf-8").startswith("# HELP")
+
+    def test_invalid_format(self, metrics, tmp_path):
+        """Test unknown format raises ValueError."""
+        with pytest.raises(ValueError, match="format"):
+            EventBusMetricsExporter(metrics, tmp_path / "x", fmt="xml")  # type: ignore[arg-type]
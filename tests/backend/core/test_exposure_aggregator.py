@@ -0,0 +1,194 @@
+# tests/backend/core/test_exposure_aggregator.py
+"""
+Unit tests for ExposureAggregator.
+
+Tests incremental net position / notional / open risk per (symbol,
+strategy), platform and base-asset totals, idempotent fills and EventBus
+wiring at PLATFORM scope.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, decimal, backend.core.exposure_aggregator]
+"""
+
+# Standard library
+from datetime import UTC, datetime
+from decimal import Decimal
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.core.enums import OrderStatus, OrderType
+from backend.core.eventbus import EventBus
+from backend.core.exposure_aggregator import (
+    ExposureAggregator,
+    ExposureSnapshot,
+    UnknownOrderError,
+)
+from backend.core.interfaces.eventbus import ScopeLevel, SubscriptionScope
+from backend.dtos.state.fill import Fill
+from backend.dtos.state.order import Order
+from backend.dtos.strategy.size_plan import SizePlan
+
+NOW = datetime(2025, 11, 9, 14, 30, tzinfo=UTC)
+
+
+def _order(order_id, symbol="BTC_USDT", side="BUY"):
+    return Order(
+        order_id=order_id,
+        parent_group_id="EXG_20251109_143000_abc12345",
+        symbol=symbol,
+        side=side,
+        order_type=OrderType.MARKET,
+        quantity=Decimal("1"),
+        status=OrderStatus.OPEN,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _fill(fill_id, order_id, quantity, price):
+    return Fill(
+        fill_id=fill_id,
+        parent_order_id=order_id,
+        filled_quantity=Decimal(quantity),
+        fill_price=Decimal(price),
+        executed_at=NOW,
+    )
+
+
+def _size_plan(plan_id, risk):
+    return SizePlan(
+        plan_id=plan_id,
+        position_size=Decimal("0.5"),
+        position_value=Decimal("25000"),
+        risk_amount=Decimal(risk),
+    )
+
+
+@pytest.fixture
+def exposure():
+    """Aggregator with one BUY (STR_A) and one SELL (STR_B) BTC_USDT order."""
+    aggregator = ExposureAggregator()
+    aggregator.track_order("STR_A", _order("ORD_20251109_143000_aaaaaaaa"))
+    aggregator.track_order("STR_B", _order("ORD_20251109_143000_bbbbbbbb", side="SELL"))
+    return aggregator
+
+
+class TestPositions:
+    """Test fill-driven net position and notional."""
+
+    def test_fills_update_cells_and_totals(self, exposure):
+        """Test per-strategy cells and the symbol total move together."""
+        exposure.on_fill(
+            _fill("FIL_20251109_143000_00000001", "ORD_20251109_143000_aaaaaaaa", "0.5", "50000")
+        )
+        exposure.on_fill(
+            _fill("FIL_20251109_143000_00000002", "ORD_20251109_143000_bbbbbbbb", "0.2", "51000")
+        )
+
+        assert exposure.strategy_exposure("BTC_USDT", "STR_A").net_quantity == Decimal("0.5")
+        assert exposure.strategy_exposure("BTC_USDT", "STR_B").net_quantity == Decimal("-0.2")
+        total = exposure.symbol_exposure("BTC_USDT")
+        assert total.net_quantity == Decimal("0.3")
+        assert total.notional == Decimal("0.3") * Decimal("51000")
+
+    def test_duplicate_fill_ignored(self, exposure):
+        """Test re-delivered fills are applied once."""
+        fill = _fill("FIL_20251109_143000_00000001", "ORD_20251109_143000_aaaaaaaa", "0.5", "50000")
+        exposure.on_fill(fill)
+        exposure.on_fill(fill)
+        assert exposure.symbol_exposure("BTC_USDT").net_quantity == Decimal("0.5")
+
+    def test_forget_order_drops_applied_fill_ids(self, exposure):
+        """Test applied fill IDs are released with their order."""
+        order_id = "ORD_20251109_143000_aaaaaaaa"
+        exposure.on_fill(_fill("FIL_20251109_143000_00000001", order_id, "0.5", "50000"))
+        exposure.forget_order(order_id)
+
+        assert order_id not in exposure._applied_fills
+        with pytest.raises(UnknownOrderError):
+            exposure.on_fill(_fill("FIL_20251109_143000_00000001", order_id, "0.5", "50000"))
+        assert exposure.symbol_exposure("BTC_USDT").net_quantity == Decimal("0.5")
+
+    def test_unknown_order_rejected(self, exposure):
+        """Test fills of untracked orders raise."""
+        with pytest.raises(UnknownOrderError):
+            exposure.on_fill(
+                _fill("FIL_20251109_143000_00000001", "ORD_20251109_143000_cccccccc", "1", "1")
+            )
+
+    def test_asset_exposure_across_quotes(self, exposure):
+        """Test base-asset totals span quote currencies and strategies."""
+        exposure.track_order("STR_C", _order("ORD_20251109_143000_dddddddd", symbol="BTC_EUR"))
+        exposure.on_fill(
+            _fill("FIL_20251109_143000_00000001", "ORD_20251109_143000_aaaaaaaa", "0.5", "50000")
+        )
+        exposure.on_fill(
+            _fill("FIL_20251109_143000_00000003", "ORD_20251109_143000_dddddddd", "0.25", "46000")
+        )
+        assert exposure.asset_net_quantity("BTC") == Decimal("0.75")
+        assert exposure.asset_net_quantity("ETH") == Decimal(0)
+
+    def test_mark_price_override(self, exposure):
+        """Test update_mark revalues notional."""
+        exposure.on_fill(
+            _fill("FIL_20251109_143000_00000001", "ORD_20251109_143000_aaaaaaaa", "2", "50000")
+        )
+        exposure.update_mark("BTC_USDT", Decimal("40000"))
+        assert exposure.symbol_exposure("BTC_USDT").notional == Decimal("80000")
+
+    def test_empty_queries(self):
+        """Test unknown symbols report zero exposure."""
+        assert ExposureAggregator().symbol_exposure("SOL_USDT") == ExposureSnapshot()
+
+
+class TestOpenRisk:
+    """Test SizePlan-driven open risk."""
+
+    def test_plans_add_replace_release(self, exposure):
+        """Test risk is added, replaced by plan_id and released."""
+        exposure.on_size_plan(
+            "STR_A", "BTC_USDT", _size_plan("SIZ_20251109_143000_aaaaaaaa", "1000")
+        )
+        exposure.on_size_plan(
+            "STR_B", "BTC_USDT", _size_plan("SIZ_20251109_143000_bbbbbbbb", "500")
+        )
+        assert exposure.symbol_exposure("BTC_USDT").open_risk == Decimal("1500")
+
+        exposure.on_size_plan(
+            "STR_A", "BTC_USDT", _size_plan("SIZ_20251109_143000_aaaaaaaa", "800")
+        )
+        assert exposure.strategy_exposure("BTC_USDT", "STR_A").open_risk == Decimal("800")
+        assert exposure.total_open_risk() == Decimal("1300")
+
+        exposure.release_plan("SIZ_20251109_143000_bbbbbbbb")
+        exposure.release_plan("SIZ_20251109_143000_bbbbbbbb")
+        assert exposure.total_open_risk() == Decimal("800")
+
+
+class TestEventBusWiring:
+    """Test the aggregator as a PLATFORM-scope subscriber."""
+
+    def test_receives_fills_from_all_strategies(self, exposure):
+        """Test on_fill can be subscribed directly at PLATFORM scope."""
+        bus = EventBus()
+        bus.subscribe(
+            "FILL_RECEIVED",
+            exposure.on_fill,
+            SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids=None),
+            is_critical=True,
+        )
+        bus.publish(
+            "FILL_RECEIVED",
+            _fill("FIL_20251109_143000_00000001", "ORD_20251109_143000_aaaaaaaa", "1", "50000"),
+            ScopeLevel.STRATEGY,
+            "STR_A",
+        )
+        bus.publish(
+            "FILL_RECEIVED",
+            _fill("FIL_20251109_143000_00000002", "ORD_20251109_143000_bbbbbbbb", "1", "50000"),
+            ScopeLevel.STRATEGY,
+            "STR_B",
+        )
+        assert exposure.symbol_exposure("BTC_USDT").net_quantity == Decimal(0)
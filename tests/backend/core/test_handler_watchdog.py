@@ -0,0 +1,251 @@
+# tests/backend/core/test_handler_watchdog.py
+"""
+Unit tests for HandlerWatchdog and EventBus deadline enforcement.
+
+Tests overrun detection, abandonment of hanging sync handlers, cancellation
+of async handlers, quarantine (auto-unsubscribe + event) and p99 reporting.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, asyncio, threading, pydantic, backend.core.eventbus,
+                backend.core.handler_watchdog]
+"""
+
+# Standard library
+import asyncio
+import threading
+import time
+
+# Third-party
+import pytest
+from pydantic import BaseModel
+
+# Project modules
+from backend.core.eventbus import EventBus
+from backend.core.handler_watchdog import HandlerWatchdog
+from backend.core.interfaces.eventbus import ScopeLevel, SubscriptionScope
+from backend.dtos.shared import STRATEGY_QUARANTINED_EVENT, StrategyQuarantined
+
+
+class EventPayloadDTO(BaseModel):
+    """Test DTO for event payloads."""
+
+    value: int
+
+
+STRATEGY_A = SubscriptionScope(ScopeLevel.STRATEGY, strategy_instance_id="STR_A")
+PLATFORM_SCOPE = SubscriptionScope(ScopeLevel.PLATFORM, target_strategy_ids=None)
+DEADLINE_NS = 20_000_000  # 20ms
+
+
+def _wait_until(condition, timeout=1.0):
+    """Poll until condition() holds (background worker bookkeeping)."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def release():
+    """Event that unblocks hanging handlers at teardown."""
+    gate = threading.Event()
+    yield gate
+    gate.set()
+
+
+@pytest.fixture
+def watchdog():
+    """Watchdog with a low overrun limit."""
+    dog = HandlerWatchdog(overrun_limit=2)
+    yield dog
+    dog.shutdown()
+
+
+class TestHandlerWatchdogSync:
+    """Test synchronous deadline enforcement."""
+
+    def test_on_time_handler(self, watchdog):
+        """Test fast handler yields an on-time verdict."""
+        received = []
+        verdict = watchdog.run("SUB_1", received.append, EventPayloadDTO(value=1), DEADLINE_NS)
+        assert not verdict.overran
+        assert received == [EventPayloadDTO(value=1)]
+        assert watchdog.report()["SUB_1"]["invocations"] == 1
+
+    def test_overrun_is_abandoned(self, watchdog, release):
+        """Test hanging handler is abandoned after its deadline."""
+        verdict = watchdog.run("SUB_1", lambda _p: release.wait(), EventPayloadDTO(value=1), 1)
+        assert verdict.overran
+        assert verdict.consecutive_overruns == 1
+        assert not verdict.quarantine
+
+    def test_quarantine_after_limit(self, watchdog, release):
+        """Test quarantine verdict after consecutive overruns (only once)."""
+        verdicts = [
+            watchdog.run("SUB_1", lambda _p: release.wait(), EventPayloadDTO(value=1), 1)
+            for _ in range(3)
+        ]
+        assert [v.quarantine for v in verdicts] == [False, True, False]
+        assert watchdog.report()["SUB_1"]["quarantined"] is True
+
+    def test_on_time_resets_streak(self, watchdog, release):
+        """Test an in-deadline call resets the overrun streak."""
+        first = threading.Event()
+        done = threading.Event()
+
+        def hang_once(_payload):
+            first.wait()
+            done.set()
+
+        watchdog.run("SUB_1", hang_once, EventPayloadDTO(value=1), 1)
+        first.set()
+        assert done.wait(1)
+        _wait_until(lambda: not watchdog._states["SUB_1"].abandoned_running)
+
+        watchdog.run("SUB_1", lambda _p: None, EventPayloadDTO(value=1), DEADLINE_NS)
+        verdict = watchdog.run("SUB_1", lambda _p: release.wait(), EventPayloadDTO(value=1), 1)
+        assert verdict.consecutive_overruns == 1
+
+    def test_hung_subscription_is_not_dispatched_again(self, watchdog, release):
+        """Test calls are skipped (as overruns) while an abandoned call still runs."""
+        calls = []
+
+        def hang(payload):
+            calls.append(payload.value)
+            release.wait()
+
+        verdicts = [watchdog.run("SUB_1", hang, EventPayloadDTO(value=i), 1) for i in range(3)]
+        assert calls == [0]
+        assert [v.overran for v in verdicts] == [True, True, True]
+
+    def test_queue_time_does_not_count_towards_deadline(self, release):
+        """Test abandoned workers are replaced so healthy handlers stay on time."""
+        dog = HandlerWatchdog(overrun_limit=5, max_workers=1)
+        try:
+            for i in range(3):
+                dog.run(f"HUNG_{i}", lambda _p: release.wait(), EventPayloadDTO(value=i), 1)
+            verdicts = [
+                dog.run("HEALTHY", lambda _p: None, EventPayloadDTO(value=i), DEADLINE_NS)
+                for i in range(5)
+            ]
+            assert not any(v.overran for v in verdicts)
+        finally:
+            dog.shutdown()
+
+    def test_handler_exception_propagates(self, watchdog):
+        """Test exceptions within the deadline propagate unchanged."""
+
+        def failing(_payload):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            watchdog.run("SUB_1", failing, EventPayloadDTO(value=1), DEADLINE_NS)
+
+    def test_invalid_overrun_limit(self):
+        """Test overrun_limit must be positive."""
+        with pytest.raises(ValueError, match="overrun_limit"):
+            HandlerWatchdog(overrun_limit=0)
+
+
+class TestHandlerWatchdogAsync:
+    """Test async deadline enforcement (cancellation)."""
+
+    def test_async_overrun_cancels(self, watchdog):
+        """Test overrunning coroutine is cancelled."""
+        cancelled = []
+
+        async def slow(_payload):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        verdict = asyncio.run(watchdog.run_async("SUB_1", slow, EventPayloadDTO(value=1), 1))
+        assert verdict.overran
+        assert cancelled == [True]
+
+    def test_async_on_time(self, watchdog):
+        """Test fast coroutine completes on time and is measured."""
+
+        async def fast(_payload):
+            return None
+
+        verdict = asyncio.run(
+            watchdog.run_async("SUB_1", fast, EventPayloadDTO(value=1), DEADLINE_NS)
+        )
+        assert not verdict.overran
+        assert watchdog.p99_ms("SUB_1") >= 0.0
+
+
+class TestEventBusDeadlines:
+    """Test EventBus integration with the watchdog."""
+
+    def test_deadline_requires_watchdog(self):
+        """Test deadline_ms without watchdog is rejected."""
+        with pytest.raises(ValueError, match="HandlerWatchdog"):
+            EventBus().subscribe("TICK", lambda _p: None, STRATEGY_A, deadline_ms=150)
+
+    def test_deadline_rejected_for_critical(self, watchdog):
+        """Test critical subscriptions cannot have a deadline."""
+        bus = EventBus(watchdog=watchdog)
+        with pytest.raises(ValueError, match="non-critical"):
+            bus.subscribe("TICK", lambda _p: None, PLATFORM_SCOPE, True, deadline_ms=150)
+
+    def test_hanging_handler_does_not_block_later_subscribers(self, watchdog, release):
+        """Test later subscribers still receive the event."""
+        bus = EventBus(watchdog=watchdog)
+        received = []
+        bus.subscribe("TICK", lambda _p: release.wait(), STRATEGY_A, deadline_ms=5)
+        bus.subscribe("TICK", received.append, PLATFORM_SCOPE)
+
+        bus.publish("TICK", EventPayloadDTO(value=1), ScopeLevel.STRATEGY, "STR_A")
+        assert len(received) == 1
+
+    def test_quarantine_unsubscribes_strategy_and_publishes(self, watchdog, release):
+        """Test repeated overruns remove the strategy and announce it."""
+        bus = EventBus(watchdog=watchdog)
+        notices = []
+        other = []
+        bus.subscribe(STRATEGY_QUARANTINED_EVENT, notices.append, PLATFORM_SCOPE)
+        slow_id = bus.subscribe("TICK", lambda _p: release.wait(), STRATEGY_A, deadline_ms=5)
+        sibling_id = bus.subscribe("FILL", other.append, STRATEGY_A)
+
+        for i in range(2):
+            bus.publish("TICK", EventPayloadDTO(value=i), ScopeLevel.STRATEGY, "STR_A")
+
+        assert len(notices) == 1
+        notice = notices[0]
+        assert isinstance(notice, StrategyQuarantined)
+        assert notice.strategy_instance_id == "STR_A"
+        assert set(notice.removed_subscription_ids) == {slow_id, sibling_id}
+        assert notice.consecutive_overruns == 2
+
+        bus.publish("FILL", EventPayloadDTO(value=9), ScopeLevel.STRATEGY, "STR_A")
+        assert other == []
+
+    def test_unsubscribe_drops_watchdog_state(self, watchdog):
+        """Test removed subscriptions no longer appear in the watchdog report."""
+        bus = EventBus(watchdog=watchdog)
+        sub_id = bus.subscribe("TICK", lambda _p: None, STRATEGY_A, deadline_ms=150)
+        bus.publish("TICK", EventPayloadDTO(value=1), ScopeLevel.STRATEGY, "STR_A")
+        assert sub_id in watchdog.report()
+
+        bus.unsubscribe(sub_id)
+
+        assert sub_id not in watchdog.report()
+
+    def test_quarantine_reports_p99_of_removed_subscription(self, watchdog, release):
+        """Test the notice carries the p99 measured before the state is dropped."""
+        bus = EventBus(watchdog=watchdog)
+        notices = []
+        bus.subscribe(STRATEGY_QUARANTINED_EVENT, notices.append, PLATFORM_SCOPE)
+        slow_id = bus.subscribe(
+            "TICK", lambda p: p.value and release.wait(), STRATEGY_A, deadline_ms=5
+        )
+
+        for i in range(3):
+            bus.publish("TICK", EventPayloadDTO(value=i), ScopeLevel.STRATEGY, "STR_A")
+
+        assert notices[0].p99_handler_ms > 0.0
+        assert slow_id not in watchdog.report()
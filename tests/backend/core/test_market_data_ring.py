@@ -0,0 +1,186 @@
+# tests/backend/core/test_market_data_ring.py
+"""
+Unit tests for the shared-memory MarketDataRing.
+
+Tests single-writer publish, multi-reader polling, lap detection, the
+seqlock protocol and lazy payload materialization.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, multiprocessing, struct, backend.core.market_data_ring]
+"""
+
+# Standard library
+import multiprocessing
+import struct
+from datetime import UTC, datetime
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.core.market_data_ring import (
+    LazyMarketData,
+    MarketDataReader,
+    MarketDataRecord,
+    MarketDataRing,
+    RingFormatError,
+)
+from backend.dtos.shared import MarketDataSnapshot, Origin, OriginType
+from backend.utils.shared_memory import create_shared_memory, destroy_shared_memory
+
+SYMBOLS = ["BTC_USDT", "ETH_USDT"]
+BASE_NS = 1_762_698_600_000_000_000  # 2025-11-09T14:30:00Z
+
+
+def _record(i, symbol_id=0):
+    price = 100.0 + i
+    return MarketDataRecord(
+        BASE_NS + i * 1_000_000_000, symbol_id, price, price, price, price, 1.0,
+        price - 0.5, 2.0, price + 0.5, 3.0,
+    )  # fmt: skip
+
+
+@pytest.fixture
+def ring():
+    """Small ring owned by the test process."""
+    owner = MarketDataRing(capacity=8)
+    yield owner
+    owner.unlink()
+
+
+class TestPublishAndPoll:
+    """Test basic publish / poll semantics."""
+
+    def test_reader_receives_records_after_attach(self, ring):
+        """Test readers see records published after attaching."""
+        ring.publish(_record(0))
+        reader = MarketDataReader.attach(ring.name)
+        ring.publish(_record(1))
+        ring.publish(_record(2))
+        assert list(reader.poll()) == [_record(1), _record(2)]
+        assert list(reader.poll()) == []
+        reader.close()
+
+    def test_multiple_readers_independent(self, ring):
+        """Test each reader keeps its own cursor."""
+        reader_a = MarketDataReader.attach(ring.name)
+        reader_b = MarketDataReader.attach(ring.name)
+        ring.publish(_record(0))
+        assert len(list(reader_a.poll())) == 1
+        ring.publish(_record(1))
+        assert len(list(reader_b.poll())) == 2
+        reader_a.close()
+        reader_b.close()
+
+    def test_from_start(self, ring):
+        """Test from_start replays retained history."""
+        for i in range(3):
+            ring.publish(_record(i))
+        reader = MarketDataReader.attach(ring.name, from_start=True)
+        assert [r.close for r in reader.poll()] == [100.0, 101.0, 102.0]
+        reader.close()
+
+    def test_max_records(self, ring):
+        """Test poll honours max_records."""
+        reader = MarketDataReader.attach(ring.name)
+        for i in range(5):
+            ring.publish(_record(i))
+        assert len(list(reader.poll(max_records=2))) == 2
+        assert reader.cursor == 2
+        reader.close()
+
+
+class TestLapDetection:
+    """Test slow readers skip overwritten records."""
+
+    def test_lapped_reader_skips_and_counts(self, ring):
+        """Test a lapped reader resumes at the oldest retained record."""
+        reader = MarketDataReader.attach(ring.name)
+        for i in range(20):
+            ring.publish(_record(i))
+        records = list(reader.poll())
+        assert [r.close for r in records] == [100.0 + i for i in range(12, 20)]
+        assert reader.dropped == 12
+        reader.close()
+
+    def test_read_overwritten_index_returns_none(self, ring):
+        """Test reading an overwritten index returns None."""
+        reader = MarketDataReader.attach(ring.name)
+        for i in range(9):
+            ring.publish(_record(i))
+        assert reader.read(0) is None
+        assert reader.read(8) == _record(8)
+        reader.close()
+
+
+class TestSeqlock:
+    """Test the per-slot sequence lock."""
+
+    def test_write_in_progress_is_not_returned(self, ring):
+        """Test an odd sequence (torn write) is never returned."""
+        reader = MarketDataReader.attach(ring.name)
+        ring.publish(_record(0))
+        # Simulate a writer stalled mid-write on slot 0
+        struct.pack_into("<Q", ring._shm.buf, 24, 1)
+        assert reader.read(0) is None
+        reader.close()
+
+    def test_unwritten_index_returns_none(self, ring):
+        """Test reading ahead of the writer returns None."""
+        reader = MarketDataReader.attach(ring.name)
+        assert reader.read(0) is None
+        reader.close()
+
+    def test_attach_rejects_foreign_block(self):
+        """Test attaching to a non-ring block raises RingFormatError."""
+        shm = create_shared_memory(128)
+        try:
+            with pytest.raises(RingFormatError):
+                MarketDataReader.attach(shm.name)
+        finally:
+            destroy_shared_memory(shm)
+
+
+def _child_reader(name, expected, queue):
+    reader = MarketDataReader.attach(name, from_start=True)
+    queue.put([r.close for r in reader.poll()][:expected])
+    reader.close()
+
+
+class TestCrossProcess:
+    """Test readers in other processes."""
+
+    @pytest.mark.slow
+    def test_child_process_reads_ring(self, ring):
+        """Test a forked/spawned process reads the same records."""
+        for i in range(4):
+            ring.publish(_record(i))
+        context = multiprocessing.get_context()
+        queue = context.Queue()
+        process = context.Process(target=_child_reader, args=(ring.name, 4, queue))
+        process.start()
+        closes = queue.get(timeout=30)
+        process.join(timeout=30)
+        assert closes == [100.0, 101.0, 102.0, 103.0]
+
+
+class TestLazyMarketData:
+    """Test lazy payload materialization."""
+
+    def test_payload_built_once(self):
+        """Test payload is materialized lazily and cached."""
+        view = LazyMarketData(_record(0, symbol_id=1), SYMBOLS)
+        assert view._payload is None
+        payload = view.payload
+        assert isinstance(payload, MarketDataSnapshot)
+        assert payload.symbol == "ETH_USDT"
+        assert payload.timestamp == datetime(2025, 11, 9, 14, 30, tzinfo=UTC)
+        assert view.payload is payload
+
+    def test_to_platform_data(self):
+        """Test wrapping in PlatformDataDTO."""
+        view = LazyMarketData(_record(0), SYMBOLS)
+        origin = Origin(id="TCK_20251109_143000_abc12345", type=OriginType.TICK)
+        platform_data = view.to_platform_data(origin)
+        assert platform_data.payload is view.payload
+        assert platform_data.timestamp == view.timestamp
@@ -0,0 +1,158 @@
+# tests/backend/core/test_ohlcv_cache.py
+"""
+Tests for CachedOhlcvProvider.
+
+Tests LRU collapsing of repeated window queries, sliding-window extension
+across ticks and point-in-time guards against the run anchor.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, datetime, backend.core.ohlcv_cache]
+"""
+
+# Standard library
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.core.interfaces.ohlcv_provider import PointInTimeViolationError
+from backend.core.interfaces.strategy_cache import NoActiveRunError
+from backend.core.ohlcv_cache import CachedOhlcvProvider
+from backend.core.strategy_cache import StrategyCache
+
+T0 = datetime(2025, 11, 9, 0, 0, tzinfo=UTC)
+HOUR = timedelta(hours=1)
+
+
+class Bar(NamedTuple):
+    """Minimal timestamped bar."""
+
+    timestamp: datetime
+    close: float
+
+
+class FakeProvider:
+    """In-memory provider that counts upstream calls."""
+
+    def __init__(self, count=50):
+        self.bars = [Bar(T0 + i * HOUR, 100.0 + i) for i in range(count)]
+        self.window_calls = 0
+        self.range_calls = 0
+        self.leak_future = False
+
+    def get_window(self, symbol, timeframe, end_time, lookback):
+        self.window_calls += 1
+        eligible = [b for b in self.bars if b.timestamp <= end_time]
+        if self.leak_future:
+            eligible = self.bars
+        return eligible[-lookback:]
+
+    def get_range(self, symbol, timeframe, after, end_time):
+        self.range_calls += 1
+        return [b for b in self.bars if after < b.timestamp <= end_time]
+
+
+@pytest.fixture
+def upstream():
+    """Fake upstream provider."""
+    return FakeProvider()
+
+
+class TestWindowCaching:
+    """Test LRU behaviour."""
+
+    def test_repeated_requests_fetch_once(self, upstream):
+        """Test identical requests within a tick hit upstream once."""
+        cache = CachedOhlcvProvider(upstream)
+        first = cache.get_window("BTC_USDT", "1h", T0 + 20 * HOUR, 10)
+        for _ in range(5):
+            assert cache.get_window("BTC_USDT", "1h", T0 + 20 * HOUR, 10) is first
+        assert upstream.window_calls == 1
+        assert cache.stats()["hits"] == 5
+
+    def test_window_contents(self, upstream):
+        """Test window ends at end_time and respects lookback."""
+        cache = CachedOhlcvProvider(upstream)
+        window = cache.get_window("BTC_USDT", "1h", T0 + 20 * HOUR, 3)
+        assert [b.close for b in window] == [118.0, 119.0, 120.0]
+
+    def test_lru_eviction(self, upstream):
+        """Test least recently used windows are evicted."""
+        cache = CachedOhlcvProvider(upstream, maxsize=2)
+        cache.get_window("BTC_USDT", "1h", T0, 5)
+        cache.get_window("ETH_USDT", "1h", T0, 5)
+        cache.get_window("SOL_USDT", "1h", T0, 5)
+        assert cache.stats()["size"] == 2
+
+    def test_invalid_arguments(self, upstream):
+        """Test lookback and maxsize must be positive."""
+        with pytest.raises(ValueError, match="maxsize"):
+            CachedOhlcvProvider(upstream, maxsize=0)
+        with pytest.raises(ValueError, match="lookback"):
+            CachedOhlcvProvider(upstream).get_window("BTC_USDT", "1h", T0, 0)
+
+
+class TestSlidingWindow:
+    """Test incremental extension across ticks."""
+
+    def test_next_tick_appends_new_bar(self, upstream):
+        """Test the next tick reuses the previous window plus one bar."""
+        cache = CachedOhlcvProvider(upstream)
+        cache.get_window("BTC_USDT", "1h", T0 + 20 * HOUR, 10)
+        window = cache.get_window("BTC_USDT", "1h", T0 + 21 * HOUR, 10)
+
+        assert upstream.window_calls == 1
+        assert upstream.range_calls == 1
+        assert window == tuple(upstream.get_window("BTC_USDT", "1h", T0 + 21 * HOUR, 10))
+        assert cache.stats()["slides"] == 1
+
+    def test_large_gap_replaces_window(self, upstream):
+        """Test a gap longer than lookback yields only the new bars."""
+        cache = CachedOhlcvProvider(upstream)
+        cache.get_window("BTC_USDT", "1h", T0 + 5 * HOUR, 3)
+        window = cache.get_window("BTC_USDT", "1h", T0 + 30 * HOUR, 3)
+        assert [b.close for b in window] == [128.0, 129.0, 130.0]
+
+    def test_short_history_grows(self, upstream):
+        """Test a window shorter than lookback grows as bars arrive."""
+        cache = CachedOhlcvProvider(upstream)
+        assert len(cache.get_window("BTC_USDT", "1h", T0 + 1 * HOUR, 10)) == 2
+        assert len(cache.get_window("BTC_USDT", "1h", T0 + 2 * HOUR, 10)) == 3
+
+    def test_earlier_end_time_fetches_full(self, upstream):
+        """Test going back in time does not slide."""
+        cache = CachedOhlcvProvider(upstream)
+        cache.get_window("BTC_USDT", "1h", T0 + 20 * HOUR, 5)
+        cache.get_window("BTC_USDT", "1h", T0 + 10 * HOUR, 5)
+        assert upstream.window_calls == 2
+
+
+class TestPointInTimeGuards:
+    """Test the cache never serves data newer than the anchor."""
+
+    def test_end_time_after_anchor_rejected(self, upstream):
+        """Test queries beyond the run anchor are rejected."""
+        strategy_cache = StrategyCache()
+        strategy_cache.start_new_strategy_run({}, T0 + 10 * HOUR)
+        cache = CachedOhlcvProvider(upstream, strategy_cache)
+        with pytest.raises(PointInTimeViolationError, match="after run anchor"):
+            cache.get_window("BTC_USDT", "1h", T0 + 11 * HOUR, 5)
+
+    def test_future_bars_from_upstream_rejected(self, upstream):
+        """Test upstream leaks of future bars are rejected and not cached."""
+        upstream.leak_future = True
+        cache = CachedOhlcvProvider(upstream)
+        with pytest.raises(PointInTimeViolationError, match="after end_time"):
+            cache.get_window("BTC_USDT", "1h", T0 + 10 * HOUR, 5)
+        assert cache.stats()["size"] == 0
+
+    def test_anchored_window(self, upstream):
+        """Test get_anchored_window uses the active anchor."""
+        strategy_cache = StrategyCache()
+        cache = CachedOhlcvProvider(upstream, strategy_cache)
+        with pytest.raises(NoActiveRunError):
+            cache.get_anchored_window("BTC_USDT", "1h", 3)
+        strategy_cache.start_new_strategy_run({}, T0 + 4 * HOUR)
+        assert cache.get_anchored_window("BTC_USDT", "1h", 3)[-1].timestamp == T0 + 4 * HOUR
@@ -0,0 +1,212 @@
+# tests/backend/core/test_pipeline_tracer.py
+"""
+Unit tests for PipelineTracer.
+
+Tests per-origin sampling, span recording through EventBus and
+FlowInitiator, and Chrome trace / speedscope export.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, json, threading, pydantic, backend.core.pipeline_tracer,
+                backend.core.eventbus, backend.core.flow_initiator]
+"""
+
+# Standard library
+import json
+import threading
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+# Third-party
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+# Project modules
+from backend.core.eventbus import EventBus
+from backend.core.flow_initiator import FlowInitiator
+from backend.core.interfaces.eventbus import ScopeLevel, SubscriptionScope
+from backend.core.interfaces.strategy_cache import IStrategyCache
+from backend.core.pipeline_tracer import PipelineTracer
+from backend.dtos.shared import Origin, OriginType
+from backend.dtos.shared.platform_data import PlatformDataDTO
+
+STRATEGY_A = SubscriptionScope(ScopeLevel.STRATEGY, strategy_instance_id="STR_A")
+
+
+class TickPayload(BaseModel):
+    """Mock provider payload."""
+
+    model_config = ConfigDict(frozen=True)
+
+    price: float
+
+
+class ContinuePayload(BaseModel):
+    """Payload without origin (continuation event)."""
+
+    value: int
+
+
+def _platform_data(origin_id="TCK_20251109_143000_abc12345"):
+    return PlatformDataDTO(
+        origin=Origin(id=origin_id, type=OriginType.TICK),
+        timestamp=datetime(2025, 11, 9, 14, 30, tzinfo=UTC),
+        payload=TickPayload(price=100.0),
+    )
+
+
+class TestSampling:
+    """Test per-origin sampling."""
+
+    def test_spans_outside_origin_are_noop(self):
+        """Test spans without an active origin are not recorded."""
+        tracer = PipelineTracer()
+        with tracer.span("orphan", "test"):
+            pass
+        assert tracer.spans() == []
+
+    def test_sampling_is_deterministic(self):
+        """Test the same origin gets the same decision, ~1 in N overall."""
+        tracer = PipelineTracer(sample_every=10)
+        ids = [f"TCK_20251109_143000_{i:08x}" for i in range(2000)]
+        decisions = [tracer.is_sampled(origin_id) for origin_id in ids]
+        assert decisions == [tracer.is_sampled(origin_id) for origin_id in ids]
+        assert 100 < sum(decisions) < 300
+
+    def test_unsampled_origin_records_nothing(self):
+        """Test spans inside an unsampled origin are dropped."""
+        tracer = PipelineTracer(sample_every=10)
+        origin_id = next(f"TCK_{i}" for i in range(1000) if not tracer.is_sampled(f"TCK_{i}"))
+        with tracer.origin(origin_id) as sampled, tracer.span("work", "test"):
+            pass
+        assert sampled is False
+        assert tracer.spans() == []
+
+    def test_nested_origin_keeps_outer(self):
+        """Test a nested origin() does not replace the active trace."""
+        tracer = PipelineTracer()
+        with tracer.origin("TCK_OUTER", "STR_A"), tracer.origin("TCK_INNER"):
+            with tracer.span("work", "test"):
+                pass
+        assert tracer.spans()[0].origin_id == "TCK_OUTER"
+        assert tracer.spans()[0].strategy_instance_id == "STR_A"
+
+    def test_invalid_arguments(self):
+        """Test sample_every and max_spans must be positive."""
+        with pytest.raises(ValueError, match="sample_every"):
+            PipelineTracer(sample_every=0)
+        with pytest.raises(ValueError, match="max_spans"):
+            PipelineTracer(max_spans=0)
+
+
+class TestEventBusTracing:
+    """Test EventBus integration."""
+
+    def test_publish_opens_origin_and_records_handlers(self):
+        """Test an origin-carrying publish traces nested publishes end to end."""
+        tracer = PipelineTracer()
+        bus = EventBus(tracer=tracer)
+
+        def on_tick(_payload):
+            bus.publish("CONTINUE", ContinuePayload(value=1), ScopeLevel.STRATEGY, "STR_A")
+
+        bus.subscribe("TICK", on_tick, STRATEGY_A)
+        bus.subscribe("CONTINUE", lambda _p: None, STRATEGY_A)
+        bus.publish("TICK", _platform_data(), ScopeLevel.STRATEGY, "STR_A")
+
+        spans = tracer.spans()
+        names = [(span.category, span.name) for span in spans]
+        assert ("eventbus", "TICK") in names
+        assert ("eventbus", "CONTINUE") in names
+        assert sum(category == "handler" for category, _ in names) == 2
+        assert {span.origin_id for span in spans} == {"TCK_20251109_143000_abc12345"}
+        assert {span.strategy_instance_id for span in spans} == {"STR_A"}
+
+    def test_publish_without_origin_is_not_traced(self):
+        """Test publishes outside any origin record nothing."""
+        tracer = PipelineTracer()
+        bus = EventBus(tracer=tracer)
+        bus.subscribe("CONTINUE", lambda _p: None, STRATEGY_A)
+        bus.publish("CONTINUE", ContinuePayload(value=1), ScopeLevel.STRATEGY, "STR_A")
+        assert tracer.spans() == []
+
+    def test_flow_initiator_span(self):
+        """Test FlowInitiator records a flow span for its origin."""
+        tracer = PipelineTracer()
+        initiator = FlowInitiator("flow_initiator_STR_A")
+        initiator.initialize(
+            Mock(spec=IStrategyCache), dto_types={"tick": TickPayload}, tracer=tracer
+        )
+        initiator.on_data_ready(_platform_data())
+
+        (span,) = tracer.spans()
+        assert span.category == "flow"
+        assert span.name == "flow_initiator_STR_A"
+        assert span.args == {"origin_type": "TICK"}
+
+
+class TestExport:
+    """Test trace file formats."""
+
+    @pytest.fixture
+    def tracer(self):
+        """Tracer with one nested pair of spans."""
+        tracer = PipelineTracer()
+        with tracer.origin("TCK_1", "STR_A"):
+            with tracer.span("outer", "eventbus"):
+                with tracer.span("inner", "handler", subscription_id="SUB_1"):
+                    pass
+        return tracer
+
+    def test_chrome_trace(self, tracer, tmp_path):
+        """Test Chrome trace events are complete X events with args."""
+        path = tracer.write(tmp_path / "trace.json", fmt="chrome")
+        document = json.loads(path.read_text(encoding="utf-8"))
+        events = document["traceEvents"]
+        assert {event["ph"] for event in events} == {"X"}
+        inner = next(event for event in events if event["name"] == "inner")
+        assert inner["args"] == {
+            "origin_id": "TCK_1",
+            "subscription_id": "SUB_1",
+            "strategy_instance_id": "STR_A",
+        }
+
+    def test_speedscope_events_are_nested(self, tracer, tmp_path):
+        """Test speedscope open/close events are properly nested."""
+        path = tracer.write(tmp_path / "trace.speedscope.json", fmt="speedscope")
+        document = json.loads(path.read_text(encoding="utf-8"))
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        (profile,) = document["profiles"]
+        sequence = [(event["type"], frames[event["frame"]]) for event in profile["events"]]
+        assert sequence == [
+            ("O", "eventbus:outer"),
+            ("O", "handler:inner"),
+            ("C", "handler:inner"),
+            ("C", "eventbus:outer"),
+        ]
+
+    def test_export_while_other_thread_records(self):
+        """Test exports snapshot the buffer instead of iterating it live."""
+        tracer = PipelineTracer(max_spans=500)
+        stop = threading.Event()
+
+        def record():
+            with tracer.origin("TCK_2", "STR_B"):
+                while not stop.is_set():
+                    with tracer.span("busy", "handler"):
+                        pass
+
+        worker = threading.Thread(target=record)
+        worker.start()
+        try:
+            for _ in range(200):
+                tracer.to_chrome_trace()
+                tracer.to_speedscope()
+        finally:
+            stop.set()
+            worker.join()
+        assert len(tracer.spans()) == 500
+
+    def test_unknown_format(self, tracer, tmp_path):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown trace format"):
+            tracer.write(tmp_path / "trace.txt", fmt="flamegraph")  # type: ignore[arg-type]
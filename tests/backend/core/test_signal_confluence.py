@@ -0,0 +1,137 @@
+# tests/backend/core/test_signal_confluence.py
+"""
+Unit tests for SignalConfluenceJoin.
+
+Tests K-of-N agreement within the window, heap-based expiry, per-symbol and
+per-direction isolation, late/out-of-order signals and the callback.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, datetime, backend.core.signal_confluence]
+"""
+
+# Standard library
+from datetime import UTC, datetime, timedelta
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.core.signal_confluence import SignalConfluence, SignalConfluenceJoin
+from backend.dtos.causality import CausalityChain
+from backend.dtos.shared import Origin, OriginType
+from backend.dtos.strategy.signal import Signal
+
+T0 = datetime(2025, 10, 27, 10, 0, tzinfo=UTC)
+DETECTORS = ["FVG_BREAKOUT", "MSS_REVERSAL", "EMA_CROSS"]
+
+
+def _signal(signal_type, minutes=0, symbol="BTC_USDT", direction="long"):
+    return Signal(
+        timestamp=T0 + timedelta(minutes=minutes),
+        symbol=symbol,
+        direction=direction,
+        signal_type=signal_type,
+    )
+
+
+@pytest.fixture
+def join():
+    """Two of three detectors within 15 minutes."""
+    return SignalConfluenceJoin(DETECTORS, required=2, window=timedelta(minutes=15))
+
+
+class TestConfiguration:
+    """Test constructor validation."""
+
+    @pytest.mark.parametrize("required", [0, 4])
+    def test_required_out_of_range(self, required):
+        """Test K must be within 1..N."""
+        with pytest.raises(ValueError, match="required"):
+            SignalConfluenceJoin(DETECTORS, required=required, window=timedelta(minutes=1))
+
+    def test_window_must_be_positive(self):
+        """Test zero window is rejected."""
+        with pytest.raises(ValueError, match="window"):
+            SignalConfluenceJoin(DETECTORS, required=2, window=timedelta(0))
+
+
+class TestJoin:
+    """Test confluence emission."""
+
+    def test_emits_when_k_detectors_agree(self, join):
+        """Test the K-th distinct detector completes the confluence."""
+        first = _signal("FVG_BREAKOUT")
+        assert join.on_signal(first) is None
+        second = _signal("EMA_CROSS", minutes=5)
+        confluence = join.on_signal(second)
+
+        assert isinstance(confluence, SignalConfluence)
+        assert confluence.symbol == "BTC_USDT"
+        assert confluence.direction == "long"
+        assert confluence.signal_ids == [first.signal_id, second.signal_id]
+        assert confluence.detectors == {"FVG_BREAKOUT", "EMA_CROSS"}
+        assert confluence.timestamp == second.timestamp
+
+    def test_same_detector_does_not_count_twice(self, join):
+        """Test repeated signals of one detector replace each other."""
+        join.on_signal(_signal("FVG_BREAKOUT"))
+        assert join.on_signal(_signal("FVG_BREAKOUT", minutes=1)) is None
+        assert join.pending("BTC_USDT", "long") == {"FVG_BREAKOUT"}
+
+    def test_signals_consumed_after_emission(self, join):
+        """Test one setup produces one confluence."""
+        join.on_signal(_signal("FVG_BREAKOUT"))
+        join.on_signal(_signal("EMA_CROSS", minutes=1))
+        assert join.pending("BTC_USDT", "long") == frozenset()
+        assert join.on_signal(_signal("MSS_REVERSAL", minutes=2)) is None
+
+    def test_expired_signals_do_not_count(self, join):
+        """Test signals older than the window are evicted."""
+        join.on_signal(_signal("FVG_BREAKOUT"))
+        assert join.on_signal(_signal("EMA_CROSS", minutes=15)) is None
+        assert join.pending("BTC_USDT", "long") == {"EMA_CROSS"}
+
+    def test_directions_and_symbols_are_isolated(self, join):
+        """Test disagreeing directions and other symbols never join."""
+        join.on_signal(_signal("FVG_BREAKOUT"))
+        assert join.on_signal(_signal("EMA_CROSS", direction="short")) is None
+        assert join.on_signal(_signal("MSS_REVERSAL", symbol="ETH_USDT")) is None
+
+    def test_unknown_detector_ignored(self, join):
+        """Test signal types outside the join are ignored."""
+        join.on_signal(_signal("FVG_BREAKOUT"))
+        assert join.on_signal(_signal("VOLUME_SPIKE")) is None
+
+    def test_late_signal_outside_window_ignored(self, join):
+        """Test out-of-order signals older than the window are dropped."""
+        join.on_signal(_signal("FVG_BREAKOUT", minutes=30))
+        assert join.on_signal(_signal("EMA_CROSS", minutes=10)) is None
+        assert join.pending("BTC_USDT", "long") == {"FVG_BREAKOUT"}
+
+    def test_late_signal_inside_window_joins(self, join):
+        """Test out-of-order signals within the window still count."""
+        join.on_signal(_signal("FVG_BREAKOUT", minutes=10))
+        confluence = join.on_signal(_signal("EMA_CROSS", minutes=0))
+        assert confluence is not None
+        assert [s.signal_type for s in confluence.signals] == ["EMA_CROSS", "FVG_BREAKOUT"]
+
+    def test_callback_and_causality(self):
+        """Test the callback receives the confluence and IDs extend a chain."""
+        emitted = []
+        join = SignalConfluenceJoin(
+            DETECTORS, required=3, window=timedelta(hours=1), on_confluence=emitted.append
+        )
+        for minutes, detector in enumerate(DETECTORS):
+            join.on_signal(_signal(detector, minutes=minutes))
+
+        assert len(emitted) == 1
+        chain = CausalityChain(
+            origin=Origin(id="TCK_20251027_100000_a1b2c3d4", type=OriginType.TICK)
+        ).extend(signal_ids=emitted[0].signal_ids)
+        assert list(chain.signal_ids) == emitted[0].signal_ids
+
+    def test_clear(self, join):
+        """Test clear drops buffered signals."""
+        join.on_signal(_signal("FVG_BREAKOUT"))
+        join.clear()
+        assert join.pending("BTC_USDT", "long") == frozenset()
@@ -239,6 +239,25 @@ class TestStrategyCache:
 
         assert "No active strategy run" in str(exc_info.value)
 
+    # --- snapshot Tests ---
+
+    def test_snapshot_returns_copy_of_current_cache(
+        self, cache, prefilled_strategy_cache, test_timestamp
+    ):
+        """Should return a copy that later writes do not affect."""
+        cache.start_new_strategy_run(prefilled_strategy_cache, test_timestamp)
+
+        snapshot = cache.snapshot()
+        cache.set_result_dto(MockWorker("test_worker"), MockDataDTO(data=42))
+
+        assert snapshot[MockContextDTO].value == "test_context"
+        assert MockDataDTO not in snapshot
+
+    def test_snapshot_raises_when_no_active_run(self, cache):
+        """Should raise NoActiveRunError when no run is active."""
+        with pytest.raises(NoActiveRunError):
+            cache.snapshot()
+
     # --- has_dto Tests ---
 
     def test_has_dto_returns_true_for_existing_dto(
@@ -0,0 +1,76 @@
+# tests/backend/core/test_strategy_interner.py
+"""
+Unit tests for StrategyIdInterner.
+
+Tests dense append-only interning, bit/mask encoding and decoding.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, backend.core.strategy_interner]
+"""
+
+# Standard library
+import threading
+
+# Project modules
+from backend.core.strategy_interner import ALL_STRATEGIES, StrategyIdInterner
+
+
+class TestInterning:
+    """Test dense index assignment."""
+
+    def test_bootstrap_ids_are_dense(self):
+        """Test bootstrap strategies get consecutive indexes."""
+        interner = StrategyIdInterner(["STR_A", "STR_B", "STR_A"])
+        assert interner.intern("STR_A") == 0
+        assert interner.intern("STR_B") == 1
+        assert len(interner) == 2
+
+    def test_unknown_ids_interned_lazily(self):
+        """Test new strategies get the next index and stay stable."""
+        interner = StrategyIdInterner(["STR_A"])
+        assert "STR_C" not in interner
+        assert interner.bit("STR_C") == 0b10
+        assert "STR_C" in interner
+        assert interner.intern("STR_C") == 1
+
+    def test_concurrent_interning_unique(self):
+        """Test concurrent interning never hands out an index twice."""
+        interner = StrategyIdInterner()
+        ids = [f"STR_{i}" for i in range(200)]
+
+        def worker():
+            for strategy_id in ids:
+                interner.intern(strategy_id)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(interner.intern(i) for i in ids) == list(range(200))
+
+    def test_lookup_bit_does_not_intern(self):
+        """Test lookup_bit only reports already interned IDs."""
+        interner = StrategyIdInterner(["STR_A", "STR_B"])
+        assert interner.lookup_bit("STR_B") == 0b10
+        assert interner.lookup_bit("STR_C") is None
+        assert "STR_C" not in interner
+
+
+class TestMasks:
+    """Test bitmask encoding."""
+
+    def test_mask_and_decode(self):
+        """Test masks round-trip to strategy IDs."""
+        interner = StrategyIdInterner(["STR_A", "STR_B", "STR_C"])
+        mask = interner.mask({"STR_A", "STR_C"})
+        assert mask == 0b101
+        assert interner.strategy_ids(mask) == ["STR_A", "STR_C"]
+        assert not mask & interner.bit("STR_B")
+
+    def test_all_strategies_matches_every_bit(self):
+        """Test ALL_STRATEGIES intersects every (future) strategy."""
+        interner = StrategyIdInterner(["STR_A"])
+        assert ALL_STRATEGIES & interner.bit("STR_Z")
+        assert interner.strategy_ids(ALL_STRATEGIES) == ["STR_A", "STR_Z"]
@@ -0,0 +1,51 @@
+# tests/backend/dtos/shared/test_market_data.py
+"""
+Tests for MarketDataSnapshot DTO - Fixed-layout market data payload.
+
+@layer: Tests
+@dependencies: [pytest, pydantic, backend.dtos.shared.market_data]
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from backend.dtos.shared.market_data import MarketDataSnapshot
+
+
+def _snapshot(**overrides):
+    data = {
+        "symbol": "BTC_USDT",
+        "timestamp": datetime(2025, 11, 9, 14, 30, tzinfo=UTC),
+        "open": 50000.0,
+        "high": 50120.5,
+        "low": 49980.0,
+        "close": 50100.0,
+        "volume": 12.5,
+        "bid_price": 50099.5,
+        "bid_size": 0.8,
+        "ask_price": 50100.5,
+        "ask_size": 1.2,
+    }
+    data.update(overrides)
+    return MarketDataSnapshot(**data)
+
+
+class TestMarketDataSnapshot:
+    """Test MarketDataSnapshot creation and validation."""
+
+    def test_create(self):
+        """Test creating a valid snapshot."""
+        assert _snapshot().close == 50100.0
+
+    def test_negative_price_rejected(self):
+        """Test prices must be non-negative."""
+        with pytest.raises(ValidationError):
+            _snapshot(close=-1.0)
+
+    def test_frozen(self):
+        """Test snapshot is immutable."""
+        snapshot = _snapshot()
+        with pytest.raises(ValidationError):
+            snapshot.close = 1.0  # type: ignore[misc]
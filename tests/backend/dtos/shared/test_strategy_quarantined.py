@@ -0,0 +1,60 @@
+# tests/backend/dtos/shared/test_strategy_quarantined.py
+"""
+Tests for StrategyQuarantined DTO - Watchdog quarantine notification.
+
+@layer: Tests
+@dependencies: [pytest, pydantic, backend.dtos.shared.strategy_quarantined]
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from backend.dtos.shared.strategy_quarantined import StrategyQuarantined
+
+
+def _notice(**overrides):
+    data = {
+        "strategy_instance_id": "STR_A",
+        "trigger_subscription_id": "SUB_1A2B3C4D5E6F",
+        "event_name": "TICK",
+        "handler": "SlowDetector.on_tick",
+        "removed_subscription_ids": ["SUB_1A2B3C4D5E6F"],
+        "consecutive_overruns": 3,
+        "deadline_ms": 150.0,
+        "p99_handler_ms": 412.7,
+        "quarantined_at": datetime(2025, 11, 9, 14, 30, tzinfo=UTC),
+    }
+    data.update(overrides)
+    return StrategyQuarantined(**data)
+
+
+class TestStrategyQuarantined:
+    """Test StrategyQuarantined creation and validation."""
+
+    def test_create(self):
+        """Test creating a valid notice."""
+        notice = _notice()
+        assert notice.strategy_instance_id == "STR_A"
+        assert notice.consecutive_overruns == 3
+
+    def test_platform_subscription_without_strategy(self):
+        """Test strategy_instance_id may be None."""
+        assert _notice(strategy_instance_id=None).strategy_instance_id is None
+
+    def test_frozen(self):
+        """Test notice is immutable."""
+        notice = _notice()
+        with pytest.raises(ValidationError):
+            notice.deadline_ms = 1.0  # type: ignore[misc]
+
+    def test_deadline_must_be_positive(self):
+        """Test deadline_ms must be > 0."""
+        with pytest.raises(ValidationError):
+            _notice(deadline_ms=0)
+
+    def test_extra_forbidden(self):
+        """Test unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            _notice(unexpected="x")
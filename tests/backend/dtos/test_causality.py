@@ -11,12 +11,13 @@ the entire pipeline for Journal reconstruction.
 
 # Standard Library Imports
 import json
+import tracemalloc
 
 # Third-Party Imports
 import pytest
 
 # Our Application Imports
-from backend.dtos.causality import CausalityChain
+from backend.dtos.causality import CausalityChain, IdTrail
 from backend.dtos.shared import Origin, OriginType
 
 
@@ -262,6 +263,97 @@ class TestCausalityChainModelCopyPattern:
         assert after_entry.entry_plan_id == "ENT_20251026_100003_def5e6f7"
 
 
+class TestCausalityChainExtend:
+    """Test suite for structural-sharing extend()."""
+
+    def test_extend_appends_and_sets(self):
+        """Test list fields are appended to and scalar fields set."""
+        chain = CausalityChain(origin=create_test_origin(), signal_ids=["SIG_1"])
+
+        extended = chain.extend(signal_ids="SIG_2", strategy_directive_id="STR_1")
+
+        assert extended.signal_ids == ["SIG_1", "SIG_2"]
+        assert extended.strategy_directive_id == "STR_1"
+        assert chain.signal_ids == ["SIG_1"]
+        assert chain.strategy_directive_id is None
+
+    def test_extend_shares_parent_structure(self):
+        """Test siblings extended from one parent share its nodes."""
+        parent = CausalityChain(origin=create_test_origin()).extend(order_ids="ORD_1")
+
+        fill_a = parent.extend(fill_ids="FIL_A")
+        fill_b = parent.extend(fill_ids=["FIL_B1", "FIL_B2"])
+
+        assert fill_a.order_ids is parent.order_ids
+        assert fill_a.fill_ids == ["FIL_A"]
+        assert fill_b.fill_ids == ["FIL_B1", "FIL_B2"]
+        assert fill_a.fill_ids._spine is parent.fill_ids._spine
+        assert fill_b.fill_ids._spine is not fill_a.fill_ids._spine
+        assert parent.fill_ids == []
+
+    def test_branch_does_not_leak_into_sibling(self):
+        """Test appending to an older trail copies instead of overwriting."""
+        root = IdTrail(["A"])
+        tip = root.append("B")
+
+        branch = root.append("C")
+
+        assert tip == ["A", "B"]
+        assert branch == ["A", "C"]
+        assert root == ["A"]
+        assert tip[-1] == "B"
+        with pytest.raises(IndexError):
+            root[1]
+
+    def test_read_per_step_chain_memory_stays_flat(self):
+        """Test dumping the chain after every fill keeps each ID stored once."""
+        chain = CausalityChain(origin=create_test_origin())
+        chains = []
+        tracemalloc.start()
+        try:
+            for i in range(3000):
+                chain = chain.extend(fill_ids=f"FIL_{i}")
+                chain.model_dump()
+                chains.append(chain)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert chains[0].fill_ids == ["FIL_0"]
+        assert len(chains[-1].fill_ids) == 3000
+        assert peak < 8 * 1024 * 1024
+
+    def test_many_fills_round_trip(self):
+        """Test long trails serialize as plain lists and validate back."""
+        chain = CausalityChain(origin=create_test_origin())
+        for i in range(500):
+            chain = chain.extend(fill_ids=f"FIL_{i}")
+
+        data = chain.model_dump()
+        restored = CausalityChain.model_validate_json(chain.model_dump_json())
+
+        assert data["fill_ids"] == [f"FIL_{i}" for i in range(500)]
+        assert isinstance(restored.fill_ids, IdTrail)
+        assert restored == chain
+
+    def test_extend_after_model_copy_with_plain_list(self):
+        """Test chains built via model_copy(update=list) can still be extended."""
+        chain = CausalityChain(origin=create_test_origin()).model_copy(
+            update={"risk_ids": ["RSK_1"]}
+        )
+        assert chain.extend(risk_ids="RSK_2").risk_ids == ["RSK_1", "RSK_2"]
+
+    def test_extend_rejects_invalid_fields(self):
+        """Test origin, unknown fields and non-string IDs are rejected."""
+        chain = CausalityChain(origin=create_test_origin())
+        with pytest.raises(ValueError, match="origin"):
+            chain.extend(origin="TCK_X")
+        with pytest.raises(ValueError, match="unknown_id"):
+            chain.extend(unknown_id="X")
+        with pytest.raises(ValueError, match="non-empty"):
+            chain.extend(fill_ids=[""])
+
+
 class TestCausalityChainSerialization:
     """Test suite for JSON/dict serialization."""
 
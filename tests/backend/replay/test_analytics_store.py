@@ -0,0 +1,169 @@
+# tests/backend/replay/test_analytics_store.py
+"""
+Unit tests for ColumnarAnalyticsSink column buffers and files.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, decimal, backend.replay.analytics_store, backend.dtos]
+"""
+
+# Standard library
+import importlib.util
+from array import array
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.core.enums import DirectiveScope
+from backend.dtos.causality import CausalityChain
+from backend.dtos.shared import Origin, OriginType
+from backend.dtos.state.fill import Fill
+from backend.dtos.strategy.strategy_directive import StrategyDirective
+from backend.replay.analytics_store import (
+    NULL_INT,
+    ColumnarAnalyticsSink,
+    ColumnFormatError,
+    ColumnTable,
+)
+
+EXECUTED_AT = datetime(2025, 11, 9, 14, 30, tzinfo=UTC)
+
+
+def _fill(i, commission=None):
+    return Fill(
+        fill_id=f"FIL_20251109_143000_{i:08x}",
+        parent_order_id="ORD_20251109_143000_aaaaaaaa",
+        filled_quantity=Decimal("0.125"),
+        fill_price=Decimal("50000.5") + i,
+        commission=commission,
+        executed_at=EXECUTED_AT + timedelta(seconds=i),
+    )
+
+
+def _directive(signal_ids):
+    return StrategyDirective(
+        strategy_planner_id="planner",
+        causality=CausalityChain(
+            origin=Origin(id="TCK_20251109_143000_abc12345", type=OriginType.TICK)
+        ).extend(signal_ids=signal_ids),
+        scope=DirectiveScope.NEW_TRADE,
+        confidence=Decimal("0.75"),
+    )
+
+
+class TestColumnEncoding:
+    """Test typed column buffers."""
+
+    def test_decimals_are_scaled_int64(self):
+        """Test Decimal fields become scaled int64 with NULL_INT for None."""
+        sink = ColumnarAnalyticsSink(decimal_scale=4)
+        sink.extend([_fill(0), _fill(1, commission=Decimal("0.00015"))])
+        table = sink.table(Fill)
+
+        assert table.column("fill_price") == array("q", [500005000, 500015000])
+        assert list(table.column("commission")) == [NULL_INT, 2]  # 1.5 rounds half-even
+        assert table.decimals("fill_price") == [Decimal("50000.5"), Decimal("50001.5")]
+        assert table.decimals("commission") == [None, Decimal("0.0002")]
+
+    def test_timestamps_and_categories(self):
+        """Test datetimes are epoch ns and strings are dictionary-encoded."""
+        sink = ColumnarAnalyticsSink()
+        sink.extend([_fill(0), _fill(1)])
+        table = sink.table(Fill)
+
+        assert table.column("executed_at")[1] - table.column("executed_at")[0] == 1_000_000_000
+        assert table.timestamps("executed_at")[0] == EXECUTED_AT
+        assert list(table.column("parent_order_id")) == [0, 0]
+        assert table.specs["parent_order_id"].dictionary == ["ORD_20251109_143000_aaaaaaaa"]
+
+    def test_nested_models_flattened(self):
+        """Test nested DTOs become dotted columns and lists JSON columns."""
+        sink = ColumnarAnalyticsSink()
+        sink.append(_directive(["SIG_20251109_143000_00000001"]))
+        sink.append(_directive([]))
+        table = sink.table(StrategyDirective)
+
+        assert table.values("causality.origin.id") == ["TCK_20251109_143000_abc12345"] * 2
+        assert table.values("causality.signal_ids") == [["SIG_20251109_143000_00000001"], []]
+        assert table.values("scope") == ["NEW_TRADE", "NEW_TRADE"]
+        assert table.values("entry_directive.symbol") == [None, None]
+        assert table.decimals("confidence") == [Decimal("0.75")] * 2
+
+    def test_tables_per_dto_class(self):
+        """Test each DTO class gets its own table."""
+        sink = ColumnarAnalyticsSink()
+        sink.extend([_fill(0), _directive([]), _fill(1)])
+        assert sink.rows(Fill) == 2
+        assert sink.rows(StrategyDirective) == 1
+
+    def test_overflow_leaves_no_partial_row(self):
+        """Test a value outside int64 is rejected before any column changes."""
+        sink = ColumnarAnalyticsSink(decimal_scale=14)
+        sink.append(_fill(0))
+        with pytest.raises(OverflowError, match="fill_price"):
+            sink.append(_fill(0).model_copy(update={"fill_price": Decimal("100000")}))
+        table = sink.table(Fill)
+        assert table.rows == 1
+        assert all(len(table.column(name)) == 1 for name in table.column_names)
+
+    def test_invalid_scale(self):
+        """Test decimal_scale outside int64 precision is rejected."""
+        with pytest.raises(ValueError, match="decimal_scale"):
+            ColumnarAnalyticsSink(decimal_scale=19)
+
+
+class TestFiles:
+    """Test column file write / read."""
+
+    def test_roundtrip_and_reset(self, tmp_path):
+        """Test write() persists tables, resets buffers and numbers parts."""
+        sink = ColumnarAnalyticsSink()
+        sink.extend(_fill(i, commission=Decimal("0.1")) for i in range(1000))
+        (path,) = sink.write(tmp_path)
+        assert path.name == "Fill.st3col"
+        assert sink.rows(Fill) == 0
+
+        table = ColumnTable.read(path)
+        assert table.dto == "Fill"
+        assert table.rows == 1000
+        assert sum(table.column("filled_quantity")) == 125 * 10**8
+        assert table.values("fill_id")[999] == "FIL_20251109_143000_000003e7"
+
+        sink.append(_fill(0))
+        assert [p.name for p in sink.write(tmp_path)] == ["Fill.1.st3col"]
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test reading a non-column file fails clearly."""
+        path = tmp_path / "bogus.st3col"
+        path.write_bytes(b"NOTACOLUMNFILE")
+        with pytest.raises(ColumnFormatError):
+            ColumnTable.read(path)
+
+    def test_rejects_truncated_file(self, tmp_path):
+        """Test truncated column data is detected."""
+        sink = ColumnarAnalyticsSink()
+        sink.append(_fill(0))
+        (path,) = sink.write(tmp_path)
+        path.write_bytes(path.read_bytes()[:-4])
+        with pytest.raises(ColumnFormatError, match="truncated"):
+            ColumnTable.read(path)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow (analytics extra) not installed"
+)
+class TestArrowExport:
+    """Test optional Arrow / Parquet export."""
+
+    def test_parquet_roundtrip(self, tmp_path):
+        """Test Parquet output keeps decimals and timestamps."""
+        import pyarrow.parquet as pq  # noqa: PLC0415 - optional dependency
+
+        sink = ColumnarAnalyticsSink()
+        sink.extend([_fill(0), _fill(1)])
+        path = sink.table(Fill).write_parquet(tmp_path / "fills.parquet")
+        loaded = pq.read_table(path)
+        assert loaded.column("fill_price").to_pylist()[1] == Decimal("50001.5")
+        assert loaded.column("executed_at").to_pylist()[0] == EXECUTED_AT
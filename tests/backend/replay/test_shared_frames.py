@@ -0,0 +1,79 @@
+# tests/backend/replay/test_shared_frames.py
+"""
+Unit tests for SharedBarFrame shared-memory bar storage.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, backend.replay.shared_frames, backend.utils.shared_memory]
+"""
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.replay.shared_frames import FrameFormatError, ReplayBar, SharedBarFrame
+from backend.utils.shared_memory import create_shared_memory, destroy_shared_memory
+
+
+def _bars(count):
+    return [
+        ReplayBar(1_700_000_000_000_000_000 + i, i % 3, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0)
+        for i in range(count)
+    ]
+
+
+class TestSharedBarFrame:
+    """Test create/attach/read/release of bar frames."""
+
+    def test_roundtrip(self):
+        """Test bars read back identically from an attached frame."""
+        bars = _bars(10_000)
+        with SharedBarFrame.create(bars) as frame:
+            attached = SharedBarFrame.attach(frame.name)
+            try:
+                assert len(attached) == 10_000
+                assert list(attached) == bars
+                assert attached[-1] == bars[-1]
+            finally:
+                attached.close()
+
+    def test_window_iteration(self):
+        """Test iter_bars honours [start, stop)."""
+        bars = _bars(50)
+        with SharedBarFrame.create(bars) as frame:
+            assert list(frame.iter_bars(10, 20)) == bars[10:20]
+            assert list(frame.iter_bars(45, 100)) == bars[45:]
+
+    def test_empty_frame(self):
+        """Test empty stream produces an empty frame."""
+        with SharedBarFrame.create([]) as frame:
+            assert len(frame) == 0
+            assert list(frame) == []
+
+    def test_index_out_of_range(self):
+        """Test out-of-range index raises IndexError."""
+        with SharedBarFrame.create(_bars(2)) as frame, pytest.raises(IndexError):
+            _ = frame[2]
+
+    def test_attached_cannot_unlink(self):
+        """Test only the owner may unlink."""
+        with SharedBarFrame.create(_bars(1)) as frame:
+            attached = SharedBarFrame.attach(frame.name)
+            with pytest.raises(PermissionError):
+                attached.unlink()
+            attached.close()
+
+    def test_attach_rejects_foreign_block(self):
+        """Test attaching to a non-frame block raises FrameFormatError."""
+        shm = create_shared_memory(64)
+        try:
+            with pytest.raises(FrameFormatError):
+                SharedBarFrame.attach(shm.name)
+        finally:
+            destroy_shared_memory(shm)
+
+    def test_unlinked_frame_cannot_be_attached(self):
+        """Test frame is destroyed when the owner exits its context."""
+        with SharedBarFrame.create(_bars(1)) as frame:
+            name = frame.name
+        with pytest.raises(FileNotFoundError):
+            SharedBarFrame.attach(name)
@@ -0,0 +1,86 @@
+# tests/backend/replay/test_sweep_runner.py
+"""
+Unit tests for ParameterSweepRunner.
+
+Strategies are module-level so they can be used by worker processes.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, backend.replay]
+"""
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.replay import ParameterSweepRunner, ReplayBar, SharedBarFrame
+
+
+class ThresholdStrategy:
+    """Counts bars whose close exceeds a threshold."""
+
+    def __init__(self, params):
+        self._threshold = params["threshold"]
+        if self._threshold < 0:
+            raise ValueError("negative threshold")
+        self._hits = 0
+        self._close_sum = 0.0
+
+    def on_bar(self, bar):
+        self._close_sum += bar.close
+        if bar.close > self._threshold:
+            self._hits += 1
+
+    def summary(self):
+        return {"hits": self._hits, "close_sum": self._close_sum}
+
+
+def build_threshold_strategy(params):
+    """Module-level factory (picklable)."""
+    return ThresholdStrategy(params)
+
+
+@pytest.fixture
+def frame():
+    """Shared frame with closes 0..99."""
+    bars = [ReplayBar(i, 0, 0.0, 0.0, 0.0, float(i), 1.0) for i in range(100)]
+    with SharedBarFrame.create(bars) as shared:
+        yield shared
+
+
+class TestParameterSweepRunner:
+    """Test in-process and multi-process sweeps."""
+
+    def test_in_process(self, frame):
+        """Test processes=1 runs inline and preserves order."""
+        runner = ParameterSweepRunner(frame, build_threshold_strategy, processes=1)
+        results = runner.run_all([{"threshold": 49.0}, {"threshold": 89.0}])
+        assert [r.metrics["hits"] for r in results] == [50.0, 10.0]
+        assert all(r.bars_processed == 100 for r in results)
+
+    @pytest.mark.slow
+    def test_multi_process_matches_in_process(self, frame):
+        """Test worker processes produce the same metrics."""
+        grid = [{"threshold": float(t)} for t in range(0, 100, 10)]
+        serial = ParameterSweepRunner(frame, build_threshold_strategy, processes=1).run_all(grid)
+        parallel = ParameterSweepRunner(
+            frame, build_threshold_strategy, processes=2, chunk_size=2
+        ).run_all(grid)
+        assert [r.metrics for r in parallel] == [r.metrics for r in serial]
+        assert [r.index for r in parallel] == list(range(len(grid)))
+
+    def test_failing_param_set_is_isolated(self, frame):
+        """Test one failing parameter set yields an error result only."""
+        runner = ParameterSweepRunner(frame, build_threshold_strategy, processes=1)
+        bad, good = runner.run_all([{"threshold": -1.0}, {"threshold": 0.0}])
+        assert not bad.ok
+        assert "negative threshold" in bad.error
+        assert good.ok
+
+    def test_empty_grid(self, frame):
+        """Test empty grid yields nothing."""
+        assert ParameterSweepRunner(frame, build_threshold_strategy).run_all([]) == []
+
+    def test_invalid_processes(self, frame):
+        """Test processes must be positive."""
+        with pytest.raises(ValueError, match="processes"):
+            ParameterSweepRunner(frame, build_threshold_strategy, processes=0)
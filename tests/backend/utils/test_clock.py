@@ -0,0 +1,154 @@
+# tests/backend/utils/test_clock.py
+"""
+Unit tests for the Clock abstraction.
+
+Tests WallClock, VirtualClock (monotonic advance, instant sleep,
+deterministic salts), process-wide installation and reproducible IDs and
+DTO timestamps under a VirtualClock.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, datetime, backend.utils.clock, backend.utils.id_generators]
+"""
+
+# Standard library
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.core.enums import DirectiveScope
+from backend.dtos.causality import CausalityChain
+from backend.dtos.shared import Origin, OriginType
+from backend.dtos.strategy.signal import Signal
+from backend.dtos.strategy.strategy_directive import StrategyDirective
+from backend.utils.clock import (
+    Clock,
+    VirtualClock,
+    WallClock,
+    get_clock,
+    set_clock,
+    use_clock,
+)
+from backend.utils.id_generators import extract_id_timestamp, generate_tick_id
+
+START = datetime(2025, 11, 9, 14, 30, tzinfo=UTC)
+
+
+class TestWallClock:
+    """Test the default clock."""
+
+    def test_default_clock_is_wall_clock(self):
+        """Test the process-wide default reads real time."""
+        clock = get_clock()
+        assert isinstance(clock, WallClock)
+        assert isinstance(clock, Clock)
+        assert abs(clock.now() - datetime.now(UTC)) < timedelta(seconds=5)
+
+    def test_tokens_are_random(self):
+        """Test wall-clock salts differ."""
+        assert WallClock().token() != WallClock().token()
+
+
+class TestVirtualClock:
+    """Test the replay clock."""
+
+    def test_advance_and_monotonic(self):
+        """Test time moves only when advanced."""
+        clock = VirtualClock(START)
+        assert clock.now() == START
+        assert clock.monotonic_ns() == 0
+        clock.advance(timedelta(milliseconds=1500))
+        assert clock.now() == START + timedelta(milliseconds=1500)
+        assert clock.monotonic_ns() == 1_500_000_000
+        assert clock.advance_to(START + timedelta(hours=1)) == START + timedelta(hours=1)
+
+    def test_never_moves_backwards(self):
+        """Test negative steps are rejected."""
+        clock = VirtualClock(START)
+        with pytest.raises(ValueError, match="backwards"):
+            clock.advance(timedelta(seconds=-1))
+        with pytest.raises(ValueError, match="backwards"):
+            clock.advance_to(START - timedelta(seconds=1))
+
+    def test_sleep_is_instant(self):
+        """Test sleep advances virtual time without blocking."""
+        clock = VirtualClock(START)
+        started = time.perf_counter()
+        clock.sleep(3600)
+        assert time.perf_counter() - started < 1
+        assert clock.now() == START + timedelta(hours=1)
+
+    def test_naive_start_taken_as_utc(self):
+        """Test naive datetimes are normalized to UTC."""
+        assert VirtualClock(datetime(2025, 1, 1)).now().tzinfo == UTC  # noqa: DTZ001
+
+    def test_tokens_are_seeded_counter(self):
+        """Test salts are deterministic per seed."""
+        clock = VirtualClock(START, seed="run")
+        assert [clock.token(), clock.token()] == ["run:0", "run:1"]
+
+
+class TestProcessWideClock:
+    """Test clock installation."""
+
+    def test_use_clock_restores_previous(self):
+        """Test use_clock installs and restores."""
+        previous = get_clock()
+        clock = VirtualClock(START)
+        with use_clock(clock):
+            assert get_clock() is clock
+        assert get_clock() is previous
+
+    def test_set_clock_returns_previous(self):
+        """Test set_clock hands back the replaced clock."""
+        clock = VirtualClock(START)
+        previous = set_clock(clock)
+        try:
+            assert get_clock() is clock
+        finally:
+            assert set_clock(previous) is clock
+
+
+class TestReplayDeterminism:
+    """Test time consumers are reproducible under a VirtualClock."""
+
+    @staticmethod
+    def _replay() -> str:
+        clock = VirtualClock(START, seed="replay")
+        outputs = []
+        with use_clock(clock):
+            for minute in range(3):
+                clock.advance_to(START + timedelta(minutes=minute))
+                origin = Origin(id=generate_tick_id(), type=OriginType.TICK)
+                signal = Signal(
+                    timestamp=clock.now(), symbol="BTC_USDT", direction="long", signal_type="X_UP"
+                )
+                directive = StrategyDirective(
+                    strategy_planner_id="planner",
+                    causality=CausalityChain(origin=origin).extend(signal_ids=[signal.signal_id]),
+                    scope=DirectiveScope.NEW_TRADE,
+                    confidence=Decimal("0.5"),
+                )
+                outputs.append(signal.model_dump_json() + directive.model_dump_json())
+        return "\n".join(outputs)
+
+    def test_replays_are_byte_identical(self):
+        """Test two replays produce identical IDs and timestamps."""
+        assert self._replay() == self._replay()
+
+    def test_ids_and_defaults_use_virtual_time(self):
+        """Test generated IDs and default timestamps carry virtual time."""
+        clock = VirtualClock(START)
+        with use_clock(clock):
+            tick_id = generate_tick_id()
+            directive = StrategyDirective(
+                strategy_planner_id="planner",
+                causality=CausalityChain(origin=Origin(id=tick_id, type=OriginType.TICK)),
+                scope=DirectiveScope.NEW_TRADE,
+                confidence=Decimal("0.5"),
+            )
+        assert extract_id_timestamp(tick_id) == START
+        assert directive.decision_timestamp == START
@@ -0,0 +1,80 @@
+# tests/backend/utils/test_lazy_import.py
+"""
+Unit tests for lazy package exports.
+
+Tests PEP 562 attribute resolution, caching and dir() of the lazily
+exporting DTO packages.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, importlib, backend.utils.lazy_import]
+"""
+
+# Standard library
+import importlib
+import subprocess
+import sys
+import types
+from collections import OrderedDict
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.utils.lazy_import import lazy_exports
+
+LAZY_PACKAGES = [
+    "backend.dtos.execution",
+    "backend.dtos.shared",
+    "backend.dtos.state",
+    "backend.dtos.strategy",
+]
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """Synthetic package lazily exporting OrderedDict from collections."""
+    module = types.ModuleType("lazy_pkg")
+    module.__getattr__, module.__dir__ = lazy_exports("lazy_pkg", {"OrderedDict": "collections"})
+    monkeypatch.setitem(sys.modules, "lazy_pkg", module)
+    return module
+
+
+class TestLazyExports:
+    """Test the lazy_exports helper."""
+
+    def test_resolves_and_caches(self, package):
+        """Test first access imports, then the value lives in the namespace."""
+        assert "OrderedDict" not in vars(package)
+        assert package.OrderedDict is OrderedDict
+        assert vars(package)["OrderedDict"] is OrderedDict
+
+    def test_unknown_name_raises(self, package):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="Missing"):
+            _ = package.Missing
+
+    def test_dir_lists_lazy_names(self, package):
+        """Test dir() includes names that were not loaded yet."""
+        assert "OrderedDict" in dir(package)
+
+
+class TestDtoPackages:
+    """Test the DTO packages' lazy re-exports."""
+
+    @pytest.mark.parametrize("name", LAZY_PACKAGES)
+    def test_all_exports_resolve(self, name):
+        """Test every name in __all__ resolves to an object."""
+        module = importlib.import_module(name)
+        for export in module.__all__:
+            assert getattr(module, export) is not None
+            assert export in dir(module)
+
+    def test_package_import_defers_models(self):
+        """Test importing a DTO package does not import its model modules."""
+        code = (
+            "import sys, backend.dtos.strategy as s; "
+            "assert 'backend.dtos.strategy.signal' not in sys.modules; "
+            "s.Signal; "
+            "assert 'backend.dtos.strategy.signal' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,63 @@
+# tests/backend/utils/test_shared_memory.py
+"""
+Unit tests for the shared memory helpers.
+
+Tests that attaching never keeps a resource tracker registration and that
+an open block's buffer is exposed as a plain memoryview.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, multiprocessing, backend.utils.shared_memory]
+"""
+
+# Standard library
+import os
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import patch
+
+# Third-party
+import pytest
+
+# Project modules
+from backend.utils.shared_memory import (
+    attach_shared_memory,
+    create_shared_memory,
+    destroy_shared_memory,
+    shared_buffer,
+)
+
+
+@pytest.mark.skipif(
+    os.name != "posix" or sys.version_info >= (3, 13),
+    reason="untracking by name is only needed on POSIX before Python 3.13",
+)
+def test_attach_unregisters_the_tracked_posix_name() -> None:
+    """Test an attacher drops the "/"-prefixed name the tracker registered."""
+    owner = create_shared_memory(16)
+    other = SharedMemory(create=True, size=16)
+    try:
+        with patch("multiprocessing.resource_tracker.unregister") as unregister:
+            attach_shared_memory(owner.name).close()
+            attached = attach_shared_memory(other.name)
+            attached.close()
+
+        unregister.assert_called_once_with(f"/{other.name}", "shared_memory")
+    finally:
+        destroy_shared_memory(owner)
+        other.close()
+        other.unlink()
+
+
+def test_shared_buffer_of_open_and_closed_block() -> None:
+    """Test the buffer is returned while open and rejected once closed."""
+    shm = create_shared_memory(16)
+    try:
+        buf = shared_buffer(shm)
+        buf[0] = 7
+        assert isinstance(buf, memoryview)
+        assert shm.buf is not None and shm.buf[0] == 7
+    finally:
+        destroy_shared_memory(shm)
+
+    with pytest.raises(AssertionError, match="closed"):
+        shared_buffer(shm)
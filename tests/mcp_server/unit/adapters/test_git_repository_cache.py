@@ -0,0 +1,117 @@
+# tests/mcp_server/unit/adapters/test_git_repository_cache.py
+"""Real-git unit tests for GitRepositoryCache.
+
+HEAD / branch / ref reads must agree with git itself without spawning it, and
+memoized commands must be re-run once a ref they depend on moves.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, git (GitPython), mcp_server.adapters.git_repository_cache]
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from git import Repo as GitRepo
+
+from mcp_server.adapters.git_repository_cache import GitRepositoryCache
+
+
+def _commit(repo: GitRepo, repo_dir: Path, name: str, message: str) -> str:
+    (repo_dir / name).write_text(f"# {name}\n", encoding="utf-8")
+    repo.index.add([name])
+    return repo.index.commit(message).hexsha
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> GitRepo:
+    repo = GitRepo.init(str(tmp_path))
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", "Test")
+        cw.set_value("user", "email", "test@example.com")
+    _commit(repo, tmp_path, "a.py", "first")
+    return repo
+
+
+class TestDirectReads:
+    """HEAD, branch and refs are read from .git without running git."""
+
+    def test_head_and_branch_match_git(self, repo: GitRepo, tmp_path: Path) -> None:
+        cache = GitRepositoryCache(tmp_path)
+
+        with patch("subprocess.run") as mock_run:
+            assert cache.head_sha() == repo.head.commit.hexsha
+            assert cache.current_branch() == repo.active_branch.name
+
+        mock_run.assert_not_called()
+
+    def test_detached_head_has_no_branch(self, repo: GitRepo, tmp_path: Path) -> None:
+        repo.git.checkout(repo.head.commit.hexsha)
+
+        assert GitRepositoryCache(tmp_path).current_branch() is None
+
+    def test_branch_fallback_timeout_means_no_branch(self, repo: GitRepo, tmp_path: Path) -> None:
+        del repo
+        # A HEAD this reader cannot interpret forces the git fallback
+        (tmp_path / ".git" / "HEAD").write_text("unreadable\n", encoding="utf-8")
+        cache = GitRepositoryCache(tmp_path)
+
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 2)) as mock_run:
+            assert cache.current_branch() is None
+
+        assert mock_run.call_args.kwargs["timeout"] == 2
+
+    def test_packed_and_loose_refs_resolve(self, repo: GitRepo, tmp_path: Path) -> None:
+        repo.git.branch("feature/x")
+        repo.git.pack_refs("--all")
+        repo.git.tag("v1.0")
+        cache = GitRepositoryCache(tmp_path)
+        head = repo.head.commit.hexsha
+
+        assert cache.resolve_ref("feature/x") == head
+        assert cache.resolve_ref("v1.0") == head
+        assert cache.resolve_ref("refs/heads/feature/x") == head
+        assert cache.resolve_ref("HEAD~1") is None
+        assert cache.resolve_ref("../../etc/passwd") is None
+
+    def test_outside_repository(self, tmp_path: Path) -> None:
+        cache = GitRepositoryCache(tmp_path / "nowhere")
+
+        assert cache.head_sha() is None
+        assert cache.current_branch() is None
+
+
+class TestMemoizedCommands:
+    """git() results are reused while the refs they depend on are unchanged."""
+
+    def test_result_is_reused_until_ref_moves(self, repo: GitRepo, tmp_path: Path) -> None:
+        cache = GitRepositoryCache(tmp_path)
+        args = ["log", "--pretty=%s"]
+
+        with patch("subprocess.run", wraps=subprocess.run) as spy:
+            first = cache.git(args, refs=("HEAD",))
+            second = cache.git(args, refs=("HEAD",))
+            assert spy.call_count == 1
+
+            _commit(repo, tmp_path, "b.py", "second")
+            third = cache.git(args, refs=("HEAD",))
+            assert spy.call_count == 2
+
+        assert second is first
+        assert third.stdout.splitlines() == ["second", "first"]
+
+    def test_unresolvable_refs_and_failures_are_not_cached(self, tmp_path: Path) -> None:
+        _ = GitRepo.init(str(tmp_path))
+        cache = GitRepositoryCache(tmp_path)
+
+        with patch("subprocess.run", wraps=subprocess.run) as spy:
+            cache.git(["log", "HEAD~1"], refs=("HEAD~1",))
+            cache.git(["log", "HEAD~1"], refs=("HEAD~1",))
+            cache.git(["log", "main"], refs=("main",))
+            cache.git(["log", "main"], refs=("main",))
+
+        assert spy.call_count == 4
+
+    def test_for_path_shares_one_instance(self, tmp_path: Path) -> None:
+        assert GitRepositoryCache.for_path(tmp_path) is GitRepositoryCache.for_path(str(tmp_path))
@@ -0,0 +1,98 @@
+# tests/mcp_server/unit/config/test_config_snapshot.py
+"""Unit tests for ConfigSnapshot (pickled startup config cache).
+
+The snapshot must reproduce a fresh load exactly, skip YAML parsing while its
+inputs are unchanged, and be rebuilt when a config file changes or the
+snapshot itself is unreadable.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, mcp_server.config.loader, mcp_server.config.snapshot]
+"""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server.config.loader import ConfigLoader
+from mcp_server.config.snapshot import ConfigSnapshot
+
+REPO_CONFIG_ROOT = Path(__file__).resolve().parents[4] / ".st3" / "config"
+
+
+@pytest.fixture
+def config_root(tmp_path: Path) -> Path:
+    root = tmp_path / ".st3" / "config"
+    shutil.copytree(REPO_CONFIG_ROOT, root)
+    return root
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "config_snapshot.pickle"
+
+
+def _snapshot(config_root: Path, snapshot_path: Path) -> ConfigSnapshot:
+    return ConfigSnapshot(ConfigLoader(config_root=config_root), snapshot_path=snapshot_path)
+
+
+class TestConfigSnapshot:
+    """Snapshot reuse and invalidation."""
+
+    def test_first_load_writes_snapshot_matching_fresh_load(
+        self, config_root: Path, snapshot_path: Path
+    ) -> None:
+        snapshot = _snapshot(config_root, snapshot_path)
+
+        configs = snapshot.load()
+
+        assert snapshot_path.exists()
+        assert configs == snapshot.load_fresh()
+
+    def test_unchanged_inputs_skip_yaml_loading(
+        self, config_root: Path, snapshot_path: Path
+    ) -> None:
+        first = _snapshot(config_root, snapshot_path).load()
+
+        with patch.object(ConfigLoader, "load_git_config", side_effect=AssertionError):
+            second = _snapshot(config_root, snapshot_path).load()
+
+        assert second == first
+
+    def test_edited_config_file_invalidates_snapshot(
+        self, config_root: Path, snapshot_path: Path
+    ) -> None:
+        _snapshot(config_root, snapshot_path).load()
+        git_yaml = config_root / "git.yaml"
+        git_yaml.write_text(
+            git_yaml.read_text(encoding="utf-8").replace(
+                "default_base_branch: main", "default_base_branch: develop"
+            ),
+            encoding="utf-8",
+        )
+
+        configs = _snapshot(config_root, snapshot_path).load()
+
+        assert configs.git.default_base_branch == "develop"
+
+    def test_corrupt_snapshot_falls_back_to_fresh_load(
+        self, config_root: Path, snapshot_path: Path
+    ) -> None:
+        snapshot_path.parent.mkdir(parents=True)
+        snapshot_path.write_bytes(b"not a pickle")
+        snapshot = _snapshot(config_root, snapshot_path)
+
+        configs = snapshot.load()
+
+        assert configs == snapshot.load_fresh()
+        assert snapshot_path.read_bytes() != b"not a pickle"
+
+    def test_failed_write_leaves_no_temp_file(self, config_root: Path, snapshot_path: Path) -> None:
+        snapshot = _snapshot(config_root, snapshot_path)
+
+        with patch("pickle.dump", side_effect=TypeError("cannot pickle")):
+            configs = snapshot.load()
+
+        assert configs == snapshot.load_fresh()
+        assert list(snapshot_path.parent.iterdir()) == []
@@ -768,3 +768,80 @@ class TestParsingStrategyMigration:
             assert gate.capabilities.parsing_strategy is not None, (
                 f"{gate_id} has no parsing_strategy declared; all active gates must have one"
             )
+
+
+def _gate_payload(name: str, **extra: object) -> dict[str, object]:
+    return {
+        "name": name,
+        "execution": {"command": [name.lower()], "timeout_seconds": 1},
+        "success": {"exit_codes_ok": [0]},
+        "capabilities": {"file_types": [".py"], "supports_autofix": False},
+        **extra,
+    }
+
+
+class TestGateSchedulingFields:
+    """Test depends_on / exclusive / max_parallel_gates scheduling settings."""
+
+    def test_scheduling_defaults_are_sequential_and_independent(self) -> None:
+        """Without scheduling keys gates run one at a time with no dependencies."""
+        config = QualityConfig.model_validate(
+            with_artifact_logging({"version": "1.0", "gates": {"a": _gate_payload("A")}})
+        )
+        assert config.max_parallel_gates == 1
+        assert config.gates["a"].depends_on == []
+        assert config.gates["a"].exclusive is False
+
+    def test_accepts_dependencies_between_catalog_gates(self) -> None:
+        """depends_on may reference any gate in the catalog."""
+        config = QualityConfig.model_validate(
+            with_artifact_logging(
+                {
+                    "version": "1.0",
+                    "max_parallel_gates": 4,
+                    "gates": {
+                        "fmt": _gate_payload("Fmt", exclusive=True),
+                        "lint": _gate_payload("Lint", depends_on=["fmt"]),
+                    },
+                }
+            )
+        )
+        assert config.max_parallel_gates == 4
+        assert config.gates["lint"].depends_on == ["fmt"]
+        assert config.gates["fmt"].exclusive is True
+
+    def test_rejects_unknown_dependency(self) -> None:
+        """depends_on must name a gate in the catalog."""
+        with pytest.raises(ValidationError, match="unknown gate"):
+            QualityConfig.model_validate(
+                with_artifact_logging(
+                    {
+                        "version": "1.0",
+                        "gates": {"lint": _gate_payload("Lint", depends_on=["missing"])},
+                    }
+                )
+            )
+
+    def test_rejects_dependency_cycle(self) -> None:
+        """A dependency cycle would deadlock the scheduler and is rejected."""
+        with pytest.raises(ValidationError, match="cycle"):
+            QualityConfig.model_validate(
+                with_artifact_logging(
+                    {
+                        "version": "1.0",
+                        "gates": {
+                            "a": _gate_payload("A", depends_on=["b"]),
+                            "b": _gate_payload("B", depends_on=["a"]),
+                        },
+                    }
+                )
+            )
+
+    def test_rejects_non_positive_parallelism(self) -> None:
+        """max_parallel_gates must be at least 1."""
+        with pytest.raises(ValidationError):
+            QualityConfig.model_validate(
+                with_artifact_logging(
+                    {"version": "1.0", "max_parallel_gates": 0, "gates": {"a": _gate_payload("A")}}
+                )
+            )
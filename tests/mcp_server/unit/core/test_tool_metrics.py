@@ -0,0 +1,91 @@
+# tests/mcp_server/unit/core/test_tool_metrics.py
+"""Unit tests for ToolMetrics (per-tool counters and latency histograms).
+
+@layer: Tests (Unit)
+@dependencies: [pytest, mcp_server.core.tool_metrics, mcp_server.resources.metrics]
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_server.core.tool_metrics import LatencyHistogram, ToolMetrics
+from mcp_server.resources.metrics import MetricsResource
+
+
+class TestLatencyHistogram:
+    """Bucketed latency recording."""
+
+    def test_buckets_and_quantiles(self) -> None:
+        histogram = LatencyHistogram()
+        for duration_ms in (0.5, 3.0, 3.0, 40.0, 90000.0):
+            histogram.observe(duration_ms)
+
+        data = histogram.to_dict()
+
+        assert data["count"] == 5
+        assert data["buckets"][0] == 1
+        assert data["buckets"][1] == 2
+        assert data["buckets"][-1] == 1
+        assert data["p50_ms"] == 5.0
+        assert data["p95_ms"] == 90000.0
+        assert data["max_ms"] == 90000.0
+
+
+class TestToolMetrics:
+    """Call outcomes, stage timings and flushing."""
+
+    def test_records_outcomes_and_stages(self) -> None:
+        metrics = ToolMetrics()
+        with metrics.stage("git_status", "execute"):
+            pass
+        metrics.record_call("git_status", 2.0, "ok")
+        metrics.record_call("git_status", 4.0, "error")
+        metrics.record_call("git_status", 1.0, "cancelled")
+
+        tool = metrics.snapshot()["tools"]["git_status"]
+
+        assert (tool["calls"], tool["errors"], tool["cancelled"]) == (3, 1, 1)
+        assert list(tool["stages"]) == ["execute", "total"]
+        assert tool["stages"]["total"]["sum_ms"] == 7.0
+
+    def test_stage_is_recorded_when_block_raises(self) -> None:
+        metrics = ToolMetrics()
+
+        with pytest.raises(RuntimeError), metrics.stage("scaffold_artifact", "execute"):
+            raise RuntimeError("boom")
+
+        stages = metrics.snapshot()["tools"]["scaffold_artifact"]["stages"]
+        assert stages["execute"]["count"] == 1
+
+    def test_snapshot_lists_slowest_tools_first(self) -> None:
+        metrics = ToolMetrics()
+        metrics.record_call("fast", 1.0, "ok")
+        metrics.record_call("slow", 900.0, "ok")
+
+        assert list(metrics.snapshot()["tools"]) == ["slow", "fast"]
+
+    def test_flush_respects_interval_and_dirty_state(self, tmp_path: Path) -> None:
+        flush_path = tmp_path / ".logs" / "tool_metrics.json"
+        metrics = ToolMetrics(flush_path=flush_path, flush_interval=3600)
+        metrics.record_call("git_status", 2.0, "ok")
+
+        assert metrics.maybe_flush() is False
+        assert metrics.flush() is True
+        assert metrics.flush() is False
+
+        data = json.loads(flush_path.read_text(encoding="utf-8"))
+        assert data["tools"]["git_status"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_resource_reads_snapshot() -> None:
+    metrics = ToolMetrics()
+    metrics.record_call("git_status", 2.0, "ok")
+    resource = MetricsResource(metrics)
+
+    data = json.loads(await resource.read("st3://metrics"))
+
+    assert resource.matches("st3://metrics")
+    assert data["tools"]["git_status"]["calls"] == 1
@@ -13,6 +13,7 @@ import pytest
 
 from mcp_server.core.operation_notes import NoteContext
 from mcp_server.managers.pytest_runner import PytestRunner
+from mcp_server.managers.qa_manager import QAManager
 from mcp_server.tools.code_tools import CreateFileInput, CreateFileTool
 
 # Git Tools
@@ -91,9 +92,9 @@ def make_mock_label_config() -> MagicMock:
 
 
 def make_mock_qa_manager() -> MagicMock:
-    manager = MagicMock()
+    manager = MagicMock(spec=QAManager)
     manager._resolve_scope.return_value = ["test.py"]
-    manager.run_quality_gates.return_value = {
+    manager.run_quality_gates_async.return_value = {
         "overall_pass": True,
         "summary": {
             "passed": 1,
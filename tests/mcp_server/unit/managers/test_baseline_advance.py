@@ -50,7 +50,11 @@ def _stub_single_gate_config() -> MagicMock:
     gate.name = "Gate 1: Stub"
     gate.scope = None
     gate.capabilities.file_types = [".py"]
+    gate.capabilities.cacheable = False
+    gate.depends_on = []
+    gate.exclusive = False
     cfg.gates = {"gate1_stub": gate}
+    cfg.max_parallel_gates = 1
     cfg.artifact_logging.enabled = False
     cfg.artifact_logging.output_dir = "temp/qa_logs"
     cfg.artifact_logging.max_files = 10
@@ -240,6 +244,7 @@ class TestFailureAccumulation:
         # active_gates=[] would trigger early-return before the state-update block.
         cfg.active_gates = ["unknown_gate_not_in_catalog"]
         cfg.gates = {}  # empty catalog → gate not found → passed=False → overall_pass=False
+        cfg.max_parallel_gates = 1
         cfg.artifact_logging.enabled = False
         cfg.artifact_logging.output_dir = "temp/qa_logs"
         cfg.artifact_logging.max_files = 10
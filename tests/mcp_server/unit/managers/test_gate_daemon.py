@@ -0,0 +1,243 @@
+# tests/mcp_server/unit/managers/test_gate_daemon.py
+"""
+Warm dmypy backend for mypy quality gates.
+
+Runs the real dmypy client and server (mypy is a dev dependency) in tmp_path,
+so the tests exercise server startup, warm re-checks and exit-code mapping.
+
+@layer: Tests (Unit)
+@dependencies: pytest, asyncio, json, subprocess, sys, pathlib,
+    mcp_server.managers.gate_daemon, mcp_server.managers.qa_manager
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server.config.schemas import DaemonConfig
+from mcp_server.config.schemas.quality_config import QualityConfig
+from mcp_server.managers.gate_daemon import (
+    DmypyGateDaemon,
+    GateDaemonError,
+    GateDaemonPool,
+    dmypy_command,
+)
+from mcp_server.managers.qa_manager import QAManager
+
+MYPY = [sys.executable, "-m", "mypy", "--strict", "--no-error-summary"]
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "mod.py").write_text('x: int = "a"\n', encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def pool(workspace: Path) -> Iterator[GateDaemonPool]:
+    daemons = GateDaemonPool(workspace)
+    yield daemons
+    daemons.close()
+
+
+def _server_pid(workspace: Path, gate_id: str) -> int:
+    status = workspace / ".st3" / "cache" / "dmypy" / f"{gate_id}.json"
+    return int(json.loads(status.read_text(encoding="utf-8"))["pid"])
+
+
+def _quality_config(command: list[str]) -> QualityConfig:
+    return QualityConfig.model_validate(
+        {
+            "version": "1.0",
+            "active_gates": ["types"],
+            "artifact_logging": {"enabled": False, "output_dir": "temp/qa_logs"},
+            "gates": {
+                "types": {
+                    "name": "Gate 4: Types",
+                    "execution": {
+                        "command": command,
+                        "timeout_seconds": 60,
+                        "daemon": {"backend": "dmypy"},
+                    },
+                    "success": {"exit_codes_ok": [0]},
+                    "capabilities": {
+                        "file_types": [".py"],
+                        "supports_autofix": False,
+                        "parsing_strategy": "text_violations",
+                        "text_violations": {
+                            "pattern": (
+                                r"^(?P<file>[^:]+):(?P<line>\d+): "
+                                r"(?P<severity>error|warning|note): "
+                                r"(?P<message>.+?)(?:\s+\[(?P<rule>[^\]]+)\])?$"
+                            ),
+                            "severity_default": "error",
+                        },
+                    },
+                }
+            },
+        }
+    )
+
+
+class TestDmypyCommand:
+    """Gate commands map onto the dmypy client."""
+
+    def test_module_invocation(self) -> None:
+        assert dmypy_command(MYPY) == (
+            [sys.executable, "-m", "mypy.dmypy"],
+            ["--strict", "--no-error-summary"],
+        )
+
+    def test_console_script(self) -> None:
+        assert dmypy_command(["/venv/bin/mypy", "--strict"]) == (
+            [str(Path("/venv/bin/dmypy"))],
+            ["--strict"],
+        )
+        assert dmypy_command(["mypy"]) == (["dmypy"], [])
+
+    def test_other_tools_are_rejected(self) -> None:
+        with pytest.raises(GateDaemonError, match="Not a mypy command"):
+            dmypy_command([sys.executable, "-m", "ruff", "check"])
+
+
+class TestDmypyGateDaemon:
+    """A warm server answers exactly like the mypy CLI."""
+
+    def test_output_matches_cli_and_server_stays_warm(
+        self, workspace: Path, pool: GateDaemonPool
+    ) -> None:
+        daemon = pool.get("types", MYPY, DaemonConfig())
+        cli = subprocess.run([*MYPY, "mod.py"], capture_output=True, text=True, check=False)
+
+        first = daemon.check(["mod.py"], timeout=60, cwd=None)
+        pid = _server_pid(workspace, "types")
+        (workspace / "mod.py").write_text("x: int = 1\n", encoding="utf-8")
+        second = daemon.check(["mod.py"], timeout=60, cwd=None)
+
+        assert first[:2] == (cli.returncode, cli.stdout)
+        assert first[0] == 1
+        assert "mod.py:1: error: Incompatible types in assignment" in first[1]
+        assert second[:2] == (0, "")
+        assert _server_pid(workspace, "types") == pid
+
+    def test_notes_only_output_passes_like_mypy(
+        self, workspace: Path, pool: GateDaemonPool
+    ) -> None:
+        # warn_unused_configs notes make a warm ``dmypy run`` exit 1; mypy exits 0
+        (workspace / "pyproject.toml").write_text(
+            "[tool.mypy]\nwarn_unused_configs = true\n\n"
+            '[[tool.mypy.overrides]]\nmodule = ["tests.*"]\nignore_missing_imports = true\n',
+            encoding="utf-8",
+        )
+        (workspace / "mod.py").write_text("x: int = 1\n", encoding="utf-8")
+        daemon = pool.get(
+            "types", [sys.executable, "-m", "mypy", "--no-error-summary"], DaemonConfig()
+        )
+
+        daemon.check(["mod.py"], timeout=60, cwd=None)
+        returncode, stdout, _ = daemon.check(["mod.py"], timeout=60, cwd=None)
+
+        assert returncode == 0
+        assert "note: unused section(s)" in stdout
+
+    def test_blocking_errors_exit_2_like_mypy(self, workspace: Path, pool: GateDaemonPool) -> None:
+        (workspace / "mod.py").write_text("def f(:\n", encoding="utf-8")
+        daemon = pool.get("types", MYPY, DaemonConfig())
+
+        returncode, stdout, _ = daemon.check(["mod.py"], timeout=60, cwd=None)
+
+        assert returncode == 2
+        assert "[syntax]" in stdout
+
+    def test_stop_shuts_the_server_down(self, workspace: Path, pool: GateDaemonPool) -> None:
+        daemon = pool.get("types", MYPY, DaemonConfig())
+        daemon.check(["mod.py"], timeout=60, cwd=None)
+
+        daemon.stop()
+
+        assert not (workspace / ".st3" / "cache" / "dmypy" / "types.json").exists()
+
+
+class TestGateDaemonPool:
+    """One warm server per gate, replaced when its command or settings change."""
+
+    def test_daemon_is_reused_while_command_is_unchanged(self, pool: GateDaemonPool) -> None:
+        first = pool.get("types", MYPY, DaemonConfig())
+
+        assert pool.get("types", MYPY, DaemonConfig()) is first
+        assert pool.get("types", [*MYPY, "--warn-unreachable"], DaemonConfig()) is not first
+        assert pool.get("other", MYPY, DaemonConfig()) is not first
+
+    def test_settings_change_stops_the_old_server(
+        self, workspace: Path, pool: GateDaemonPool
+    ) -> None:
+        first = pool.get("types", MYPY, DaemonConfig())
+        first.check(["mod.py"], timeout=60, cwd=None)
+
+        pool.get("types", MYPY, DaemonConfig(idle_timeout_seconds=60))
+
+        assert not (workspace / ".st3" / "cache" / "dmypy" / "types.json").exists()
+
+
+class TestQAManagerDaemonBackend:
+    """Gates with execution.daemon are served by the pool when one is injected."""
+
+    def test_gate_is_served_by_warm_daemon(self, workspace: Path, pool: GateDaemonPool) -> None:
+        manager = QAManager(
+            workspace_root=workspace, quality_config=_quality_config(MYPY), gate_daemons=pool
+        )
+        check = DmypyGateDaemon.check
+
+        with patch.object(DmypyGateDaemon, "check", autospec=True, side_effect=check) as spy:
+            first = manager.run_quality_gates(["mod.py"], effective_scope="files")
+            pid = _server_pid(workspace, "types")
+            second = manager.run_quality_gates(["mod.py"], effective_scope="files")
+
+        assert spy.call_count == 2
+        assert _server_pid(workspace, "types") == pid
+        for result in (first, second):
+            gate = result["gates"][0]
+            assert gate["passed"] is False
+            assert [(i["line"], i["rule"]) for i in gate["issues"]] == [(1, "assignment")]
+
+    def test_async_gate_is_served_by_daemon(self, workspace: Path, pool: GateDaemonPool) -> None:
+        (workspace / "mod.py").write_text("x: int = 1\n", encoding="utf-8")
+        manager = QAManager(
+            workspace_root=workspace, quality_config=_quality_config(MYPY), gate_daemons=pool
+        )
+
+        with patch.object(manager, "_run_gate_process") as mock_process:
+            result = asyncio.run(
+                manager.run_quality_gates_async(["mod.py"], effective_scope="files")
+            )
+
+        mock_process.assert_not_called()
+        assert result["gates"][0]["passed"] is True
+
+    def test_non_mypy_gate_falls_back_to_cli(self, workspace: Path, pool: GateDaemonPool) -> None:
+        manager = QAManager(
+            workspace_root=workspace,
+            quality_config=_quality_config(["pyright", "--outputjson"]),
+            gate_daemons=pool,
+        )
+
+        with (
+            patch("subprocess.run") as mock_run,
+            patch.object(manager, "_collect_environment_metadata", return_value={}),
+        ):
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = ""
+            mock_run.return_value.stderr = ""
+            result = manager.run_quality_gates(["mod.py"], effective_scope="files")
+
+        assert mock_run.call_args.args[0][-1] == "mod.py"
+        assert result["gates"][0]["passed"] is True
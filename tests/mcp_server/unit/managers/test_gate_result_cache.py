@@ -0,0 +1,190 @@
+# tests/mcp_server/unit/managers/test_gate_result_cache.py
+"""
+Content-hash incremental result cache for quality gates.
+
+@layer: Tests (Unit)
+@dependencies: pytest, json, pathlib, mcp_server.managers.gate_result_cache,
+    mcp_server.managers.qa_manager
+"""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server.config.schemas.quality_config import QualityConfig, QualityGate
+from mcp_server.managers.gate_result_cache import GateResultCache
+from mcp_server.managers.qa_manager import QAManager
+from tests.mcp_server.test_support import make_qa_manager
+
+
+def _lint_gate(**capabilities: object) -> dict[str, Any]:
+    return {
+        "name": "Gate 1: Lint",
+        "execution": {"command": ["python", "-m", "ruff", "check"], "timeout_seconds": 60},
+        "success": {"exit_codes_ok": [0]},
+        "capabilities": {
+            "file_types": [".py"],
+            "supports_autofix": False,
+            "parsing_strategy": "json_violations",
+            "json_violations": {
+                "field_map": {"file": "filename", "rule": "code", "message": "message"}
+            },
+            **capabilities,
+        },
+    }
+
+
+def _config(*, cacheable: bool = True) -> QualityConfig:
+    return QualityConfig.model_validate(
+        {
+            "version": "1.0",
+            "active_gates": ["lint"],
+            "artifact_logging": {"enabled": False, "output_dir": "temp/qa_logs"},
+            "gates": {"lint": _lint_gate(cacheable=cacheable)},
+        }
+    )
+
+
+def _proc(violations: list[dict[str, str]], returncode: int | None = None) -> MagicMock:
+    proc = MagicMock()
+    proc.returncode = (1 if violations else 0) if returncode is None else returncode
+    proc.stdout = json.dumps(violations)
+    proc.stderr = ""
+    return proc
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "clean.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "dirty.py").write_text("import os\n", encoding="utf-8")
+    return tmp_path
+
+
+def _manager(workspace: Path, config: QualityConfig) -> QAManager:
+    manager = make_qa_manager(workspace, quality_config=config)
+    manager._tool_version = MagicMock(return_value="ruff 0.9.0")  # type: ignore[method-assign]
+    return manager
+
+
+def _run(manager: QAManager, proc: MagicMock) -> tuple[dict[str, Any], MagicMock]:
+    with (
+        patch("subprocess.run", return_value=proc) as mock_run,
+        patch.object(manager, "_collect_environment_metadata", return_value={}),
+    ):
+        result = manager.run_quality_gates(["clean.py", "dirty.py"], effective_scope="files")
+    return result, mock_run
+
+
+UNUSED_IMPORT = {"filename": "dirty.py", "code": "F401", "message": "`os` imported but unused"}
+
+
+class TestGateResultCache:
+    """Unit behaviour of the persistent cache."""
+
+    def test_lookup_hits_only_unchanged_files(self, workspace: Path) -> None:
+        gate = QualityGate.model_validate(_lint_gate())
+        cache = GateResultCache(workspace / "cache.json", workspace)
+        fingerprint = cache.fingerprint("lint", gate, "ruff 0.9.0")
+
+        first = cache.lookup("lint", fingerprint, ["clean.py", "dirty.py"])
+        assert first.misses == ["clean.py", "dirty.py"]
+        cache.store("lint", first, {"clean.py": [], "dirty.py": [{"message": "m"}]})
+        cache.save()
+
+        (workspace / "clean.py").write_text("x = 2\n", encoding="utf-8")
+        reloaded = GateResultCache(workspace / "cache.json", workspace)
+        second = reloaded.lookup("lint", fingerprint, ["clean.py", "dirty.py"])
+        assert second.hits == {"dirty.py": [{"message": "m"}]}
+        assert second.misses == ["clean.py"]
+
+    def test_fingerprint_changes_with_gate_config_and_tool_version(self) -> None:
+        gate = QualityGate.model_validate(_lint_gate())
+        other = QualityGate.model_validate(
+            {
+                **_lint_gate(),
+                "execution": {"command": ["ruff", "check", "--select=E"], "timeout_seconds": 60},
+            }
+        )
+        base = GateResultCache.fingerprint("lint", gate, "ruff 0.9.0")
+        assert base != GateResultCache.fingerprint("lint", other, "ruff 0.9.0")
+        assert base != GateResultCache.fingerprint("lint", gate, "ruff 0.9.1")
+        assert base != GateResultCache.fingerprint("lint2", gate, "ruff 0.9.0")
+
+    def test_stale_fingerprint_misses_everything(self, workspace: Path) -> None:
+        cache = GateResultCache(workspace / "cache.json", workspace)
+        lookup = cache.lookup("lint", "fp-old", ["clean.py"])
+        cache.store("lint", lookup, {"clean.py": []})
+
+        assert cache.lookup("lint", "fp-new", ["clean.py"]).misses == ["clean.py"]
+
+    def test_malformed_cache_file_starts_empty(self, workspace: Path) -> None:
+        (workspace / "cache.json").write_text("{not json", encoding="utf-8")
+        cache = GateResultCache(workspace / "cache.json", workspace)
+
+        assert cache.lookup("lint", "fp", ["clean.py"]).misses == ["clean.py"]
+
+
+class TestQAManagerResultCache:
+    """run_quality_gates only re-runs files whose cached result is stale."""
+
+    def test_second_run_is_served_from_cache(self, workspace: Path) -> None:
+        manager = _manager(workspace, _config())
+        first, first_run = _run(manager, _proc([UNUSED_IMPORT]))
+        second, second_run = _run(manager, _proc([]))
+
+        assert first_run.call_count == 1
+        assert second_run.call_count == 0
+        assert second["gates"][0]["issues"] == first["gates"][0]["issues"]
+        assert second["gates"][0]["passed"] is False
+        assert second["gates"][0]["score"] == "Fail (1 violations)"
+        assert second["gates"][0]["cache"] == {"hits": 2, "misses": 0}
+        assert (workspace / ".st3" / "cache" / "quality_gates.json").exists()
+
+    def test_only_changed_files_are_passed_to_the_tool(self, workspace: Path) -> None:
+        manager = _manager(workspace, _config())
+        _run(manager, _proc([UNUSED_IMPORT]))
+        (workspace / "clean.py").write_text("y = 2\n", encoding="utf-8")
+
+        result, mock_run = _run(manager, _proc([]))
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[-1] == "clean.py"
+        assert "dirty.py" not in cmd
+        gate = result["gates"][0]
+        assert gate["cache"] == {"hits": 1, "misses": 1}
+        assert [issue["rule"] for issue in gate["issues"]] == ["F401"]
+        assert gate["passed"] is False
+        assert result["summary"]["failed"] == 1
+
+    def test_fixed_file_is_rechecked(self, workspace: Path) -> None:
+        manager = _manager(workspace, _config())
+        _run(manager, _proc([UNUSED_IMPORT]))
+        (workspace / "dirty.py").write_text("x = 3\n", encoding="utf-8")
+
+        result, _mock_run = _run(manager, _proc([]))
+
+        assert result["gates"][0]["passed"] is True
+        assert result["overall_pass"] is True
+
+    def test_crashed_tool_output_is_not_cached(self, workspace: Path) -> None:
+        manager = _manager(workspace, _config())
+        _run(manager, _proc([], returncode=2))
+
+        _result, mock_run = _run(manager, _proc([]))
+
+        assert mock_run.call_count == 1
+
+    def test_gates_without_cacheable_always_run(self, workspace: Path) -> None:
+        manager = _manager(workspace, _config(cacheable=False))
+        _run(manager, _proc([]))
+
+        _result, mock_run = _run(manager, _proc([]))
+
+        assert mock_run.call_count == 1
@@ -11,9 +11,14 @@ Tests according to TDD principles with comprehensive coverage.
 # Suppress Pydantic FieldInfo false positives
 
 # Standard library
+import asyncio
 import json
+import os
 import subprocess
+import sys
 import tempfile
+import threading
+import time
 import typing
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -25,6 +30,7 @@ import yaml  # type: ignore[import-untyped]
 from mcp_server.config.schemas.quality_config import (
     CapabilitiesMetadata,
     ExecutionConfig,
+    QualityConfig,
     QualityGate,
     SuccessCriteria,
 )
@@ -1588,3 +1594,275 @@ class TestTruncationFullLogPath:
             output = result.get("output", {})
             assert output.get("truncated") is False
             assert "full_log_path" not in output
+
+
+class TestParallelGateExecution:
+    """Test concurrent gate scheduling (max_parallel_gates, depends_on, exclusive)."""
+
+    @staticmethod
+    def _config(max_parallel_gates: int, **gate_extras: dict[str, object]) -> QualityConfig:
+        gate_ids = ["gate_a", "gate_b", "gate_c", "gate_d"]
+        return QualityConfig.model_validate(
+            {
+                "version": "1.0",
+                "active_gates": gate_ids,
+                "max_parallel_gates": max_parallel_gates,
+                "artifact_logging": {"enabled": False, "output_dir": "temp/qa_logs"},
+                "gates": {
+                    gate_id: {
+                        "name": gate_id,
+                        "execution": {"command": ["tool"], "timeout_seconds": 60},
+                        "success": {"exit_codes_ok": [0]},
+                        "capabilities": {"file_types": [".py"], "supports_autofix": False},
+                        **gate_extras.get(gate_id, {}),
+                    }
+                    for gate_id in gate_ids
+                },
+            }
+        )
+
+    @staticmethod
+    def _run(
+        config: QualityConfig, tmp_path: Path, durations: dict[str, float] | None = None
+    ) -> tuple[dict[str, typing.Any], list[tuple[str, str]], int]:
+        """Run gates with a fake _execute_gate; return (results, events, max_concurrency)."""
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n", encoding="utf-8")
+        manager = make_qa_manager(quality_config=config)
+        events: list[tuple[str, str]] = []
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_execute(
+            gate: QualityGate, _files: list[str], gate_number: int, gate_id: str | None = None
+        ) -> dict[str, typing.Any]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                events.append(("start", gate.name))
+            time.sleep((durations or {}).get(gate.name, 0.05))
+            with lock:
+                active -= 1
+                events.append(("end", gate.name))
+            return {
+                "gate_number": gate_number,
+                "id": gate_number,
+                "name": gate.name,
+                "passed": True,
+                "status": "passed",
+                "score": "Pass",
+                "issues": [],
+                "duration_ms": 50,
+            }
+
+        with patch.object(manager, "_execute_gate", side_effect=fake_execute):
+            result = manager.run_quality_gates([str(target)], effective_scope="files")
+        return result, events, peak
+
+    def test_sequential_by_default(self, tmp_path: Path) -> None:
+        """max_parallel_gates=1 runs one gate at a time in active_gates order."""
+        result, events, peak = self._run(self._config(1), tmp_path)
+
+        assert peak == 1
+        assert [name for kind, name in events if kind == "start"] == [
+            "gate_a",
+            "gate_b",
+            "gate_c",
+            "gate_d",
+        ]
+        assert result["summary"]["passed"] == 4
+
+    def test_independent_gates_overlap_and_keep_result_order(self, tmp_path: Path) -> None:
+        """Gates run concurrently but results stay in active_gates order."""
+        durations = {"gate_a": 0.2, "gate_b": 0.05, "gate_c": 0.05, "gate_d": 0.05}
+        result, events, peak = self._run(self._config(4), tmp_path, durations)
+
+        assert peak > 1
+        assert events.index(("end", "gate_b")) < events.index(("end", "gate_a"))
+        assert [gate["name"] for gate in result["gates"]] == [
+            "gate_a",
+            "gate_b",
+            "gate_c",
+            "gate_d",
+        ]
+        assert result["summary"]["passed"] == 4
+
+    def test_timings_total_is_wall_clock(self, tmp_path: Path) -> None:
+        """timings.total is elapsed run time, not the sum of overlapping gates."""
+        durations = dict.fromkeys(["gate_a", "gate_b", "gate_c", "gate_d"], 0.2)
+        result, _events, _peak = self._run(self._config(4), tmp_path, durations)
+
+        timings = result["timings"]
+        assert all(timings[str(number)] == 50 for number in range(1, 5))
+        assert 200 <= timings["total"] < 800
+
+    def test_depends_on_waits_for_dependency(self, tmp_path: Path) -> None:
+        """A gate starts only after every gate in depends_on has finished."""
+        config = self._config(4, gate_a={"depends_on": ["gate_c"]})
+        _result, events, _peak = self._run(config, tmp_path)
+
+        assert events.index(("end", "gate_c")) < events.index(("start", "gate_a"))
+
+    def test_exclusive_gate_runs_alone(self, tmp_path: Path) -> None:
+        """An exclusive gate never overlaps with other gates."""
+        config = self._config(4, gate_b={"exclusive": True})
+        _result, events, _peak = self._run(config, tmp_path)
+
+        start, end = events.index(("start", "gate_b")), events.index(("end", "gate_b"))
+        assert end == start + 1
+        assert events.index(("end", "gate_a")) < start
+        assert end < events.index(("start", "gate_c"))
+
+
+class TestAsyncQualityGates:
+    """Test run_quality_gates_async (asyncio subprocesses, cancellation)."""
+
+    @staticmethod
+    def _manager(script: str, timeout_seconds: int = 60) -> QAManager:
+        config = QualityConfig.model_validate(
+            {
+                "version": "1.0",
+                "active_gates": ["gate_py"],
+                "artifact_logging": {"enabled": False, "output_dir": "temp/qa_logs"},
+                "gates": {
+                    "gate_py": {
+                        "name": "Gate: Script",
+                        "execution": {
+                            "command": [sys.executable, "-c", script],
+                            "timeout_seconds": timeout_seconds,
+                        },
+                        "success": {"exit_codes_ok": [0]},
+                        "capabilities": {"file_types": [".py"], "supports_autofix": False},
+                    }
+                },
+            }
+        )
+        return make_qa_manager(quality_config=config)
+
+    @staticmethod
+    def _target(tmp_path: Path) -> str:
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n", encoding="utf-8")
+        return str(target)
+
+    @pytest.mark.asyncio
+    async def test_async_run_matches_sync_schema(self, tmp_path: Path) -> None:
+        """Exit-code gate result carries the same fields as the sync path."""
+        manager = self._manager("import sys; sys.exit(0)")
+
+        result = await manager.run_quality_gates_async(
+            [self._target(tmp_path)], effective_scope="files"
+        )
+
+        gate = result["gates"][0]
+        assert result["version"] == "2.0"
+        assert result["overall_pass"] is True
+        assert gate["status"] == "passed"
+        assert gate["command"]["exit_code"] == 0
+        assert isinstance(gate["duration_ms"], int)
+        assert "total" in result["timings"]
+
+    def test_manager_survives_consecutive_event_loops(self, tmp_path: Path) -> None:
+        """Each asyncio.run gets a semaphore bound to its own loop."""
+        manager = self._manager("import time; time.sleep(0.1)")
+        target = self._target(tmp_path)
+
+        async def two_runs() -> list[dict[str, typing.Any]]:
+            # Concurrent runs contend for the semaphore, binding it to the loop
+            return await asyncio.gather(
+                manager.run_quality_gates_async([target], effective_scope="files"),
+                manager.run_quality_gates_async([target], effective_scope="files"),
+            )
+
+        for _ in range(2):
+            assert all(result["overall_pass"] for result in asyncio.run(two_runs()))
+
+    @pytest.mark.asyncio
+    async def test_async_failure_captures_output(self, tmp_path: Path) -> None:
+        """Non-zero exit fails the gate and keeps stdout/stderr details."""
+        manager = self._manager("import sys; print('bad thing'); sys.exit(3)")
+
+        result = await manager.run_quality_gates_async(
+            [self._target(tmp_path)], effective_scope="files"
+        )
+
+        gate = result["gates"][0]
+        assert gate["passed"] is False
+        assert gate["score"] == "Fail (exit=3)"
+        assert "bad thing" in gate["output"]["stdout"]
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_kills_gate(self, tmp_path: Path) -> None:
+        """A gate exceeding timeout_seconds is reported as Timeout."""
+        manager = self._manager("import time; time.sleep(30)", timeout_seconds=1)
+
+        result = await manager.run_quality_gates_async(
+            [self._target(tmp_path)], effective_scope="files"
+        )
+
+        assert result["gates"][0]["score"] == "Timeout"
+        assert result["timings"]["total"] < 10_000
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, tmp_path: Path) -> None:
+        """Other coroutines keep running while a gate process executes."""
+        manager = self._manager("import time; time.sleep(0.5)")
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await manager.run_quality_gates_async([self._target(tmp_path)], effective_scope="files")
+        finally:
+            ticker_task.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_child_process(self, tmp_path: Path) -> None:
+        """Cancelling the awaiting task terminates the running gate process."""
+        pid_file = tmp_path / "gate.pid"
+        script = (
+            "import os, sys, time; "
+            f"open({str(pid_file)!r}, 'w').write(str(os.getpid())); "
+            "time.sleep(30)"
+        )
+        manager = self._manager(script)
+        task = asyncio.create_task(
+            manager.run_quality_gates_async([self._target(tmp_path)], effective_scope="files")
+        )
+        for _ in range(500):
+            if pid_file.exists() and pid_file.read_text():
+                break
+            await asyncio.sleep(0.01)
+        pid = int(pid_file.read_text())
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.asyncio
+    async def test_missing_tool_reports_not_found(self, tmp_path: Path) -> None:
+        """A missing executable yields the same Not Found result as the sync path."""
+        manager = self._manager("")
+        gate = manager._require_quality_config().gates["gate_py"]
+        missing = gate.model_copy(
+            update={
+                "execution": gate.execution.model_copy(update={"command": ["st3-no-such-tool-xyz"]})
+            }
+        )
+
+        result = await manager._execute_gate_async(missing, [self._target(tmp_path)], 1)
+
+        assert result["score"] == "Not Found"
+        assert result["passed"] is False
@@ -0,0 +1,98 @@
+# tests/mcp_server/unit/scaffolding/test_jinja_environment.py
+"""Unit tests for the shared, bytecode-cached Jinja environments.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, mcp_server.scaffolding.jinja_environment]
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mcp_server.scaffolding.jinja_environment import (
+    configure_bytecode_cache,
+    get_environment,
+    precompile_templates,
+)
+from mcp_server.scaffolding.renderer import JinjaRenderer
+from mcp_server.validation.template_analyzer import TemplateAnalyzer
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Iterator[Path]:
+    configure_bytecode_cache(tmp_path)
+    templates = tmp_path / ".st3" / "templates"
+    (templates / "concrete").mkdir(parents=True)
+    (templates / "base.jinja2").write_text("{% block body %}{% endblock %}\n", encoding="utf-8")
+    (templates / "concrete" / "greet.jinja2").write_text(
+        '{% extends "base.jinja2" %}{% block body %}Hello {{ name }}{% endblock %}\n',
+        encoding="utf-8",
+    )
+    yield templates
+    configure_bytecode_cache(None)
+
+
+class TestSharedEnvironment:
+    """One environment per template root, backed by a bytecode cache."""
+
+    def test_callers_share_one_environment_per_root(self, workspace: Path) -> None:
+        renderer = JinjaRenderer(template_dir=workspace)
+
+        assert JinjaRenderer(template_dir=workspace).env is renderer.env
+        assert TemplateAnalyzer(workspace).env is renderer.env
+        assert renderer.env.loader.searchpath == [str(workspace.resolve())]  # type: ignore[union-attr]
+
+    def test_precompile_fills_bytecode_cache(self, workspace: Path) -> None:
+        assert precompile_templates(workspace) == 2
+
+        cache_files = list((workspace.parent / "cache" / "jinja").iterdir())
+        assert len(cache_files) == 2
+        assert JinjaRenderer(template_dir=workspace).render("concrete/greet.jinja2", name="x") == (
+            "Hello x"
+        )
+
+    def test_edited_template_is_recompiled(self, workspace: Path) -> None:
+        renderer = JinjaRenderer(template_dir=workspace)
+        assert renderer.render("concrete/greet.jinja2", name="x") == "Hello x"
+
+        template = workspace / "concrete" / "greet.jinja2"
+        template.write_text(
+            '{% extends "base.jinja2" %}{% block body %}Bye {{ name }}{% endblock %}\n',
+            encoding="utf-8",
+        )
+        mtime = template.stat().st_mtime + 5
+        os.utime(template, (mtime, mtime))
+
+        assert renderer.render("concrete/greet.jinja2", name="x") == "Bye x"
+
+    def test_roots_outside_workspace_skip_disk_cache(self, tmp_path: Path) -> None:
+        outside = tmp_path / "templates"
+        outside.mkdir()
+        configure_bytecode_cache(tmp_path / "workspace")
+        try:
+            assert get_environment(outside).bytecode_cache is None
+        finally:
+            configure_bytecode_cache(None)
+
+    def test_cache_follows_configured_workspace_not_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
+        templates = tmp_path / "workspace" / ".st3" / "templates"
+        templates.mkdir(parents=True)
+        (templates / "plain.jinja2").write_text("plain\n", encoding="utf-8")
+        configure_bytecode_cache(tmp_path / "workspace")
+        try:
+            assert precompile_templates(templates) == 1
+        finally:
+            configure_bytecode_cache(None)
+
+        assert len(list((tmp_path / "workspace" / ".st3" / "cache" / "jinja").iterdir())) == 1
+        assert not (elsewhere / ".st3").exists()
+
+    def test_unconfigured_environment_is_memory_only(self, tmp_path: Path) -> None:
+        assert get_environment(tmp_path).bytecode_cache is None
@@ -0,0 +1,125 @@
+"""Unit tests for DocumentSearchIndex (persistent BM25 documentation index).
+
+@layer: Tests (Unit)
+@dependencies: [pytest, mcp_server.services.document_search_index]
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mcp_server.services.document_search_index import DocumentSearchIndex, tokenize
+
+
+@pytest.fixture
+def docs_dir(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    (docs / "architecture").mkdir(parents=True)
+    (docs / "development").mkdir()
+    (docs / "architecture" / "workers.md").write_text(
+        "# Worker Architecture\n\nWorkers consume events from the event bus.\n"
+    )
+    (docs / "development" / "python_guide.md").write_text(
+        "# Python Guide\n\nPython coding standards. Python typing rules.\n"
+    )
+    (docs / "readme.md").write_text("# Overview\n\nProject overview with DTO validation rules.\n")
+    return docs
+
+
+def _paths(results: list[dict[str, object]]) -> list[object]:
+    return [r["path"] for r in results]
+
+
+class TestTokenize:
+    """Tokenizer behaviour."""
+
+    def test_splits_snake_case_and_paths(self) -> None:
+        assert tokenize("development/python_guide.md") == ["development", "python", "guide", "md"]
+
+    def test_lowercases(self) -> None:
+        assert tokenize("DTO Validation") == ["dto", "validation"]
+
+
+class TestSearch:
+    """BM25 ranking over the in-memory postings."""
+
+    def test_title_match_outranks_content_match(self, docs_dir: Path) -> None:
+        (docs_dir / "notes.md").write_text("# Notes\n\nSometimes mentions python once.\n")
+        index = DocumentSearchIndex(docs_dir)
+
+        results = index.search("python")
+
+        assert _paths(results)[0] == os.path.join("development", "python_guide.md")
+        assert results[0]["_relevance"] > results[1]["_relevance"]
+
+    def test_multi_term_query_combines_terms(self, docs_dir: Path) -> None:
+        index = DocumentSearchIndex(docs_dir)
+
+        results = index.search("worker events")
+
+        assert _paths(results) == [os.path.join("architecture", "workers.md")]
+
+    def test_scope_filter(self, docs_dir: Path) -> None:
+        index = DocumentSearchIndex(docs_dir)
+
+        results = index.search("rules", scope="development")
+
+        assert _paths(results) == [os.path.join("development", "python_guide.md")]
+        assert results[0]["type"] == "development"
+
+    def test_snippet_falls_back_to_a_matching_term(self, docs_dir: Path) -> None:
+        index = DocumentSearchIndex(docs_dir)
+
+        results = index.search("validation nonexistentword")
+
+        assert "validation" in str(results[0]["_snippet"])
+
+    def test_no_match_returns_empty(self, docs_dir: Path) -> None:
+        assert DocumentSearchIndex(docs_dir).search("xyznonexistent") == []
+
+
+class TestIncrementalRefresh:
+    """Changes on disk are picked up without re-tokenizing unchanged documents."""
+
+    def test_edited_added_and_removed_documents(self, docs_dir: Path) -> None:
+        index = DocumentSearchIndex(docs_dir, rescan_interval=0)
+        assert index.search("kafka") == []
+
+        (docs_dir / "readme.md").write_text("# Overview\n\nKafka adapter notes, longer now.\n")
+        (docs_dir / "new.md").write_text("# Kafka Setup\n")
+        (docs_dir / "architecture" / "workers.md").unlink()
+
+        assert set(_paths(index.search("kafka"))) == {"readme.md", "new.md"}
+        assert index.search("worker") == []
+        assert index.document_count == 3
+
+    def test_rescan_interval_reuses_last_scan(self, docs_dir: Path) -> None:
+        index = DocumentSearchIndex(docs_dir, rescan_interval=3600)
+        index.search("python")
+        (docs_dir / "new.md").write_text("# Kafka Setup\n")
+
+        assert index.search("kafka") == []
+        assert index.refresh(force=True) is True
+        assert _paths(index.search("kafka")) == ["new.md"]
+
+    def test_persisted_index_is_reused_after_restart(self, docs_dir: Path, tmp_path: Path) -> None:
+        cache = tmp_path / ".st3" / "cache" / "docs_index.json"
+        DocumentSearchIndex(docs_dir, cache_path=cache).refresh()
+        assert cache.exists()
+
+        reloaded = DocumentSearchIndex(docs_dir, cache_path=cache)
+
+        assert reloaded.document_count == 3
+        assert reloaded.refresh() is False
+        assert _paths(reloaded.search("worker"))[0] == os.path.join("architecture", "workers.md")
+
+    def test_malformed_cache_is_rebuilt(self, docs_dir: Path, tmp_path: Path) -> None:
+        cache = tmp_path / "docs_index.json"
+        cache.write_text("{not json")
+
+        index = DocumentSearchIndex(docs_dir, cache_path=cache)
+
+        assert index.document_count == 0
+        assert index.refresh() is True
+        assert index.document_count == 3
@@ -17,7 +17,14 @@ from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from mcp.types import CallToolRequest, CallToolRequestParams
+from mcp.types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    ReadResourceRequest,
+    ReadResourceRequestParams,
+    TextResourceContents,
+)
+from pydantic import AnyUrl
 
 from mcp_server.core.exceptions import ConfigError
 from mcp_server.core.operation_notes import NoteContext
@@ -208,6 +215,50 @@ class TestServerToolRegistration:
         assert done_props["call_id"] == start_props["call_id"]
         assert "duration_ms" in done_props
 
+    @pytest.mark.asyncio
+    async def test_call_tool_records_stage_metrics_resource(self) -> None:
+        """call_tool handler should record per-stage latencies served by st3://metrics."""
+
+        class DummyTool(BaseTool):
+            """Dummy tool whose second call fails."""
+
+            name = "dummy_tool"
+            description = "Dummy tool"
+            args_model = None
+            calls = 0
+
+            async def execute(self, params: Any, context: NoteContext) -> ToolResult:  # noqa: ANN401
+                del params, context
+                DummyTool.calls += 1
+                if DummyTool.calls > 1:
+                    return ToolResult.error("failed")
+                return ToolResult.text("ok")
+
+        with patch("mcp_server.server.Settings") as mock_settings_cls:
+            _patch_server_settings(mock_settings_cls)
+
+            server = MCPServer()
+            server.tools = [DummyTool()]
+
+            call_handler = server.server.request_handlers[CallToolRequest]
+            request = CallToolRequest(params=CallToolRequestParams(name="dummy_tool", arguments={}))
+            await call_handler(request)
+            await call_handler(request)
+
+            read_handler = server.server.request_handlers[ReadResourceRequest]
+            response = await read_handler(
+                ReadResourceRequest(params=ReadResourceRequestParams(uri=AnyUrl("st3://metrics")))
+            )
+
+        contents = response.root.contents[0]
+        assert isinstance(contents, TextResourceContents)
+        metrics = json.loads(contents.text)["tools"]["dummy_tool"]
+        assert (metrics["calls"], metrics["errors"]) == (2, 1)
+        assert metrics["stages"]["validation"]["count"] == 2
+        assert metrics["stages"]["execute"]["count"] == 2
+        assert metrics["stages"]["post_enforcement"]["count"] == 1
+        assert metrics["stages"]["total"]["count"] == 2
+
     @pytest.mark.asyncio
     async def test_call_tool_pre_enforcement_blocks_invalid_create_branch_base(
         self,
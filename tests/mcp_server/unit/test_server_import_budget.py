@@ -0,0 +1,94 @@
+# tests/mcp_server/unit/test_server_import_budget.py
+"""Startup budget tests for the MCP server.
+
+Importing the server and answering list_tools must not load managers, tool
+modules or the GitHub client; those are constructed on first tool call.
+
+@layer: Tests (Unit)
+@dependencies: [pytest, subprocess, mcp_server.server]
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mcp.types import ListToolsRequest
+
+from mcp_server.server import MCPServer
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Modules the server itself needs before it can answer a request
+_ALLOWED_TOOL_MODULES = {
+    "mcp_server.tools",
+    "mcp_server.tools.base",
+    "mcp_server.tools.tool_registry",
+    "mcp_server.tools.tool_result",
+}
+_DEFERRED_PREFIXES = ("mcp_server.managers", "mcp_server.scaffolding", "github", "jinja2")
+
+# Number of mcp_server modules a bare server import may load (81 at the time of writing)
+_MAX_MCP_SERVER_MODULES = 100
+
+
+def _imported_modules() -> list[str]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, mcp_server.server; print(json.dumps(sorted(sys.modules)))",
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return json.loads(result.stdout)
+
+
+def _settings(workspace_root: Path) -> MagicMock:
+    settings = MagicMock()
+    settings.server.name = "test-server"
+    settings.server.workspace_root = str(workspace_root)
+    settings.server.config_root = str(workspace_root / ".st3")
+    settings.github.token = None
+    settings.logging.level = "INFO"
+    settings.logging.audit_log = str(workspace_root / ".logs" / "mcp_audit.log")
+    return settings
+
+
+class TestServerImportBudget:
+    """The server module stays cheap to import."""
+
+    def test_import_does_not_load_managers_or_tools(self) -> None:
+        modules = _imported_modules()
+
+        tool_modules = {m for m in modules if m.startswith("mcp_server.tools")}
+        assert tool_modules <= _ALLOWED_TOOL_MODULES
+        assert not [m for m in modules if m.startswith(_DEFERRED_PREFIXES)]
+        assert len([m for m in modules if m.startswith("mcp_server")]) <= _MAX_MCP_SERVER_MODULES
+
+
+class TestWarmStart:
+    """With cached descriptors, list_tools constructs nothing."""
+
+    @pytest.mark.asyncio
+    async def test_list_tools_from_cache_builds_no_tool_or_manager(self, tmp_path: Path) -> None:
+        shutil.copytree(REPO_ROOT / ".st3" / "config", tmp_path / ".st3" / "config")
+        with patch("mcp_server.managers.github_manager.GitHubAdapter"):
+            cold = MCPServer(settings=_settings(tmp_path))
+            expected = [d.name for d in cold._tool_registry.descriptors()]
+
+        server = MCPServer(settings=_settings(tmp_path))
+        handler = server.server.request_handlers[ListToolsRequest]
+        response = await handler(ListToolsRequest(method="tools/list"))
+
+        assert [tool.name for tool in response.root.tools] == expected
+        assert server._tool_registry.constructed == []
+        assert "git_manager" not in server.__dict__
+        assert "github_manager" not in server.__dict__
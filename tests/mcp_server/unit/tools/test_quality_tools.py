@@ -44,9 +44,9 @@ class TestRunQualityGatesTool:
     @pytest.mark.asyncio
     async def test_no_files_triggers_project_level(self) -> None:
         """Test scope='project' resolves to empty list and is forwarded to manager."""
-        mock_manager = MagicMock()
+        mock_manager = MagicMock(spec=QAManager)
         mock_manager._resolve_scope.return_value = []
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager.run_quality_gates_async.return_value = {
             "version": "2.0",
             "mode": "project-level",
             "files": [],
@@ -74,7 +74,7 @@ class TestRunQualityGatesTool:
         text = _summary_text(result)
         assert "Quality gates" in text
         mock_manager._resolve_scope.assert_called_once_with("project", files=None)
-        mock_manager.run_quality_gates.assert_called_once_with(
+        mock_manager.run_quality_gates_async.assert_called_once_with(
             [],
             effective_scope="project",
         )
@@ -82,8 +82,8 @@ class TestRunQualityGatesTool:
     @pytest.mark.asyncio
     async def test_quality_gates_passed(self) -> None:
         """Test clean quality pass returns ✅ summary line."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = {
             "summary": {
                 "passed": 1,
                 "failed": 0,
@@ -114,8 +114,8 @@ class TestRunQualityGatesTool:
     @pytest.mark.asyncio
     async def test_quality_gates_failed_with_issues(self) -> None:
         """Test failed quality gates returns ❌ summary line."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = {
             "summary": {
                 "passed": 0,
                 "failed": 1,
@@ -154,8 +154,8 @@ class TestRunQualityGatesTool:
     @pytest.mark.asyncio
     async def test_quality_gates_failed_prints_hints(self) -> None:
         """Test gate with hints — summary line is still returned."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = {
             "summary": {
                 "passed": 0,
                 "failed": 1,
@@ -188,8 +188,8 @@ class TestRunQualityGatesTool:
     @pytest.mark.asyncio
     async def test_quality_gates_issues_missing_fields(self) -> None:
         """Test result with empty issues dict — summary line is returned without crash."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = {
             "summary": {
                 "passed": 0,
                 "failed": 1,
@@ -220,8 +220,8 @@ class TestRunQualityGatesTool:
     @pytest.mark.asyncio
     async def test_response_is_native_json_object(self) -> None:
         """Tool returns text summary at content[0], compact JSON at content[1]."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = {
             "version": "2.0",
             "mode": "file-specific",
             "files": ["foo.py"],
@@ -371,9 +371,9 @@ class TestRunQualityGatesInputC28:
     @pytest.mark.asyncio
     async def test_execute_scope_files_passes_list_to_manager(self) -> None:
         """execute(scope='files', files=[...]) passes the list verbatim to run_quality_gates."""
-        mock_manager = MagicMock()
+        mock_manager = MagicMock(spec=QAManager)
         mock_manager._resolve_scope.return_value = ["src/foo.py"]
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager.run_quality_gates_async.return_value = {
             "summary": {
                 "passed": 1,
                 "failed": 0,
@@ -389,7 +389,7 @@ class TestRunQualityGatesInputC28:
             RunQualityGatesInput(scope="files", files=["src/foo.py"]), NoteContext()
         )
 
-        mock_manager.run_quality_gates.assert_called_once_with(
+        mock_manager.run_quality_gates_async.assert_called_once_with(
             ["src/foo.py"],
             effective_scope="files",
         )
@@ -405,11 +405,14 @@ class TestRunQualityGatesScopeGuardC41:
         gate = SimpleNamespace(
             name="Gate 1: Stub",
             scope=None,
-            capabilities=SimpleNamespace(file_types=[".py"]),
+            capabilities=SimpleNamespace(file_types=[".py"], cacheable=False),
+            depends_on=[],
+            exclusive=False,
         )
         return SimpleNamespace(
             active_gates=["gate1_stub"],
             gates={"gate1_stub": gate},
+            max_parallel_gates=1,
             artifact_logging=SimpleNamespace(
                 enabled=False,
                 output_dir="temp/qa_logs",
@@ -427,7 +430,7 @@ class TestRunQualityGatesScopeGuardC41:
             patch.object(manager, "_resolve_scope", return_value=["backend/__init__.py"]),
             patch.object(
                 manager,
-                "_execute_gate",
+                "_execute_gate_async",
                 return_value={
                     "gate_number": 1,
                     "name": "Gate 1: Stub",
@@ -459,7 +462,7 @@ class TestRunQualityGatesScopeGuardC41:
             patch.object(manager, "_resolve_scope", return_value=["backend/__init__.py"]),
             patch.object(
                 manager,
-                "_execute_gate",
+                "_execute_gate_async",
                 return_value={
                     "gate_number": 1,
                     "name": "Gate 1: Stub",
@@ -487,11 +490,14 @@ class TestRunQualityGatesFailedSubsetC42:
         gate = SimpleNamespace(
             name="Gate 1: Stub",
             scope=None,
-            capabilities=SimpleNamespace(file_types=[".py"]),
+            capabilities=SimpleNamespace(file_types=[".py"], cacheable=False),
+            depends_on=[],
+            exclusive=False,
         )
         return SimpleNamespace(
             active_gates=["gate1_stub"],
             gates={"gate1_stub": gate},
+            max_parallel_gates=1,
             artifact_logging=SimpleNamespace(
                 enabled=False,
                 output_dir="temp/qa_logs",
@@ -511,7 +517,7 @@ class TestRunQualityGatesFailedSubsetC42:
             patch("pathlib.Path.exists", return_value=True),
             patch.object(
                 manager,
-                "_execute_gate",
+                "_execute_gate_async",
                 return_value={
                     "gate_number": 1,
                     "name": "Gate 1: Stub",
@@ -550,7 +556,7 @@ class TestRunQualityGatesFailedSubsetC42:
             patch("pathlib.Path.exists", return_value=True),
             patch.object(
                 manager,
-                "_execute_gate",
+                "_execute_gate_async",
                 return_value={
                     "gate_number": 1,
                     "name": "Gate 1: Stub",
@@ -589,7 +595,7 @@ class TestEffectiveScopePropagationC43:
         files_arg: list[str] | None,
         resolved: list[str],
     ) -> None:
-        mock_manager = MagicMock()
+        mock_manager = MagicMock(spec=QAManager)
         mock_manager._resolve_scope.return_value = resolved
         manager_result = {
             "summary": {
@@ -602,7 +608,7 @@ class TestEffectiveScopePropagationC43:
             "overall_pass": True,
             "gates": [],
         }
-        mock_manager.run_quality_gates.return_value = manager_result
+        mock_manager.run_quality_gates_async.return_value = manager_result
         tool = RunQualityGatesTool(manager=mock_manager)
 
         params = RunQualityGatesInput(scope=scope, files=files_arg)
@@ -610,7 +616,7 @@ class TestEffectiveScopePropagationC43:
             await tool.execute(params, NoteContext())
 
         mock_manager._resolve_scope.assert_called_once_with(scope, files=files_arg)
-        mock_manager.run_quality_gates.assert_called_once_with(
+        mock_manager.run_quality_gates_async.assert_called_once_with(
             resolved,
             effective_scope=scope,
         )
@@ -626,13 +632,13 @@ class TestScopeSwitchInvariantsC43:
 
     @pytest.mark.asyncio
     async def test_auto_files_auto_sequence_preserves_scope_intent(self) -> None:
-        mock_manager = MagicMock()
+        mock_manager = MagicMock(spec=QAManager)
         mock_manager._resolve_scope.side_effect = [
             ["changed_auto.py"],
             ["target_file.py"],
             ["changed_auto_2.py"],
         ]
-        mock_manager.run_quality_gates.return_value = {
+        mock_manager.run_quality_gates_async.return_value = {
             "summary": {
                 "passed": 1,
                 "failed": 0,
@@ -651,6 +657,15 @@ class TestScopeSwitchInvariantsC43:
         )
         await tool.execute(RunQualityGatesInput(scope="auto"), NoteContext())
 
-        assert mock_manager.run_quality_gates.call_args_list[0].kwargs["effective_scope"] == "auto"
-        assert mock_manager.run_quality_gates.call_args_list[1].kwargs["effective_scope"] == "files"
-        assert mock_manager.run_quality_gates.call_args_list[2].kwargs["effective_scope"] == "auto"
+        assert (
+            mock_manager.run_quality_gates_async.call_args_list[0].kwargs["effective_scope"]
+            == "auto"
+        )
+        assert (
+            mock_manager.run_quality_gates_async.call_args_list[1].kwargs["effective_scope"]
+            == "files"
+        )
+        assert (
+            mock_manager.run_quality_gates_async.call_args_list[2].kwargs["effective_scope"]
+            == "auto"
+        )
@@ -0,0 +1,125 @@
+# tests/mcp_server/unit/tools/test_tool_registry.py
+"""Unit tests for ToolRegistry (lazy tools behind cached descriptors).
+
+@layer: Tests (Unit)
+@dependencies: [pytest, pydantic, mcp_server.tools.tool_registry]
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_server.core.operation_notes import NoteContext
+from mcp_server.tools.base import BaseTool
+from mcp_server.tools.tool_registry import ToolDescriptor, ToolRegistry, ToolSpec
+from mcp_server.tools.tool_result import ToolResult
+
+
+class EchoInput(BaseModel):
+    """Input for EchoTool."""
+
+    text: str
+
+
+class EchoTool(BaseTool):
+    """Tool whose constructions are counted."""
+
+    name = "echo"
+    description = "Echo text"
+    args_model = EchoInput
+    built = 0
+
+    def __init__(self, prefix: str = "") -> None:
+        type(self).built += 1
+        self.prefix = prefix
+
+    async def execute(self, params: EchoInput, context: NoteContext) -> ToolResult:
+        del context
+        return ToolResult.text(self.prefix + params.text)
+
+
+class PingTool(BaseTool):
+    """Tool without arguments."""
+
+    name = "ping"
+    description = "Ping"
+
+    async def execute(self, params: Any, context: NoteContext) -> ToolResult:  # noqa: ANN401
+        del params, context
+        return ToolResult.text("pong")
+
+
+_MODULE = __name__
+
+
+@pytest.fixture(autouse=True)
+def _reset_counter() -> None:
+    EchoTool.built = 0
+
+
+def _specs() -> list[ToolSpec[Any]]:
+    return [
+        ToolSpec[EchoTool](f"{_MODULE}:EchoTool", lambda cls: cls(prefix="> ")),
+        ToolSpec[PingTool](f"{_MODULE}:PingTool", lambda cls: cls()),
+    ]
+
+
+class TestToolRegistry:
+    """Descriptor caching and on-demand construction."""
+
+    def test_cold_start_builds_tools_and_writes_descriptors(self, tmp_path: Path) -> None:
+        cache = tmp_path / "tool_descriptors.json"
+        registry = ToolRegistry(_specs(), cache_path=cache)
+
+        descriptors = registry.descriptors()
+
+        assert [d.name for d in descriptors] == ["echo", "ping"]
+        assert descriptors[0].input_schema == EchoInput.model_json_schema()
+        assert registry.constructed == ["echo", "ping"]
+        assert json.loads(cache.read_text(encoding="utf-8"))["tools"][0]["target"] == (
+            f"{_MODULE}:EchoTool"
+        )
+
+    def test_warm_start_constructs_only_called_tools(self, tmp_path: Path) -> None:
+        cache = tmp_path / "tool_descriptors.json"
+        ToolRegistry(_specs(), cache_path=cache).descriptors()
+        EchoTool.built = 0
+        registry = ToolRegistry(_specs(), cache_path=cache)
+
+        assert [d.name for d in registry.descriptors()] == ["echo", "ping"]
+        assert registry.constructed == []
+
+        tool = registry.get("echo")
+
+        assert isinstance(tool, EchoTool)
+        assert tool.prefix == "> "
+        assert registry.get("echo") is tool
+        assert EchoTool.built == 1
+        assert registry.constructed == ["echo"]
+
+    def test_stale_cache_is_regenerated(self, tmp_path: Path) -> None:
+        cache = tmp_path / "tool_descriptors.json"
+        ToolRegistry(_specs(), cache_path=cache).descriptors()
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        data["fingerprint"] = "outdated"
+        data["tools"][1]["description"] = "stale"
+        cache.write_text(json.dumps(data), encoding="utf-8")
+
+        registry = ToolRegistry(_specs(), cache_path=cache)
+
+        assert registry.descriptors()[1].description == "Ping"
+        assert registry.constructed == ["echo", "ping"]
+
+    def test_unknown_tool_returns_none(self) -> None:
+        assert ToolRegistry(_specs()).get("missing") is None
+
+    def test_from_tools_wraps_instances(self) -> None:
+        tool = PingTool()
+        registry = ToolRegistry.from_tools([tool])
+
+        assert registry.get("ping") is tool
+        assert registry.tools() == [tool]
+        assert registry.descriptors() == [ToolDescriptor.of(tool)]
@@ -19,6 +19,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from mcp_server.core.operation_notes import NoteContext
+from mcp_server.managers.qa_manager import QAManager
 from mcp_server.tools.quality_tools import RunQualityGatesInput, RunQualityGatesTool
 
 
@@ -62,8 +63,8 @@ class TestToolResultContentContract:
     @pytest.mark.asyncio
     async def test_content_has_exactly_two_items(self) -> None:
         """ToolResult must contain exactly two content items."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = _make_qg_result()
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = _make_qg_result()
         tool = RunQualityGatesTool(manager=mock_manager)
 
         result = await tool.execute(
@@ -75,8 +76,8 @@ class TestToolResultContentContract:
     @pytest.mark.asyncio
     async def test_content_zero_is_text(self) -> None:
         """content[0] must be type='text' (human-readable summary line)."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = _make_qg_result()
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = _make_qg_result()
         tool = RunQualityGatesTool(manager=mock_manager)
 
         result = await tool.execute(
@@ -90,8 +91,8 @@ class TestToolResultContentContract:
     @pytest.mark.asyncio
     async def test_content_one_is_json(self) -> None:
         """content[1] must be type='json' (compact structured payload)."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = _make_qg_result()
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = _make_qg_result()
         tool = RunQualityGatesTool(manager=mock_manager)
 
         result = await tool.execute(
@@ -105,8 +106,10 @@ class TestToolResultContentContract:
     @pytest.mark.asyncio
     async def test_text_item_contains_summary_line(self) -> None:
         """content[0].text must be the one-line summary from _format_summary_line."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = _make_qg_result(passed=1, failed=0, skipped=0)
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = _make_qg_result(
+            passed=1, failed=0, skipped=0
+        )
         tool = RunQualityGatesTool(manager=mock_manager)
 
         result = await tool.execute(
@@ -122,8 +125,8 @@ class TestToolResultContentContract:
     @pytest.mark.asyncio
     async def test_json_item_has_compact_schema(self) -> None:
         """content[1].json must have compact schema: {'gates': [...]}."""
-        mock_manager = MagicMock()
-        mock_manager.run_quality_gates.return_value = _make_qg_result()
+        mock_manager = MagicMock(spec=QAManager)
+        mock_manager.run_quality_gates_async.return_value = _make_qg_result()
         # C36: _build_compact_result is now an instance method; configure mock
         # return value so this test verifies the tool-response contract, not
         # the internals of _build_compact_result.
@@ -153,11 +156,11 @@ class TestToolResultContentContract:
     @pytest.mark.asyncio
     async def test_compact_json_gate_has_no_debug_fields(self) -> None:
         """content[1].json gates must not contain debug fields like command or duration_ms."""
-        mock_manager = MagicMock()
+        mock_manager = MagicMock(spec=QAManager)
         result_data = _make_qg_result()
         result_data["gates"][0]["command"] = {"executable": "ruff"}
         result_data["gates"][0]["duration_ms"] = 145
-        mock_manager.run_quality_gates.return_value = result_data
+        mock_manager.run_quality_gates_async.return_value = result_data
         tool = RunQualityGatesTool(manager=mock_manager)
 
         result = await tool.execute(
@@ -29,7 +29,9 @@ class TestPythonValidator:
     @pytest.fixture
     def validator(self) -> Generator[PythonValidator, None, None]:
         """Fixture for PythonValidator with mocked QAManager."""
-        with patch("mcp_server.validation.python_validator.QAManager") as mock_qa_cls:
+        with patch(
+            "mcp_server.validation.python_validator.QAManager", autospec=True
+        ) as mock_qa_cls:
             val = PythonValidator(qa_manager=mock_qa_cls.return_value)
             yield val
 
@@ -39,7 +41,7 @@ class TestPythonValidator:
         # Setup
         path = "test_file.py"
         # Type ignore explanation: Mock object dynamic attributes
-        validator.qa_manager.run_quality_gates.return_value = {  # type: ignore
+        validator.qa_manager.run_quality_gates_async.return_value = {  # type: ignore
             "overall_pass": True,
             "gates": [
                 {"name": "Linting", "passed": True, "score": "10.00/10", "issues": []},
@@ -56,7 +58,7 @@ class TestPythonValidator:
         assert result.score == 10.0
         assert not result.issues
         # Type ignore explanation: Mock object assertion
-        validator.qa_manager.run_quality_gates.assert_called_once_with([path])  # type: ignore
+        validator.qa_manager.run_quality_gates_async.assert_called_once_with([path])  # type: ignore
 
     @pytest.mark.asyncio
     async def test_validate_content_with_issues(self, validator: PythonValidator) -> None:
@@ -67,7 +69,7 @@ class TestPythonValidator:
 
         # Mocking temp file creation is tricky, but validate uses mkstemp.
         # We rely on validate passing the temp file path to qa_manager.
-        validator.qa_manager.run_quality_gates.return_value = {  # type: ignore
+        validator.qa_manager.run_quality_gates_async.return_value = {  # type: ignore
             "overall_pass": False,
             "gates": [
                 {
@@ -92,9 +94,9 @@ class TestPythonValidator:
 
         # Verify it called QA with a temp file, not the original path
         # Type ignore explanation: Mock object assertion
-        call_args = validator.qa_manager.run_quality_gates.call_args  # type: ignore
+        call_args = validator.qa_manager.run_quality_gates_async.call_args  # type: ignore
         assert call_args is not None
-        # run_quality_gates takes a list of files as first arg
+        # run_quality_gates_async takes a list of files as first arg
         files_arg = call_args[0][0]
         assert isinstance(files_arg, list)
         scanned_path = files_arg[0]
@@ -118,7 +120,7 @@ class TestPythonValidator:
             mock_mkstemp.return_value = (123, temp_path)
 
             # Mock QA to fail on the temp path
-            validator.qa_manager.run_quality_gates.return_value = {  # type: ignore
+            validator.qa_manager.run_quality_gates_async.return_value = {  # type: ignore
                 "overall_pass": False,
                 "gates": [
                     {